@@ -23,8 +23,9 @@ import logging
 import time
 import sqlite3
 import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Callable, Any, Optional, Dict, List
+from typing import Callable, Any, Optional, Dict, List, Tuple
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.sqlite import SqliteSaver
 from langchain_core.runnables import RunnableConfig
@@ -46,27 +47,53 @@ except ImportError:
 # Import Observer para processamento em background (Épico 12.1)
 try:
     from core.agents.observer.nodes import process_turn as observer_process_turn
+    from core.agents.observer.embeddings import preload_embedding_model
+    from core.agents.observer.worker_pool import get_observer_worker_pool
+    from core.agents.observer.metrics_tiers import SOLIDEZ_MATURITY_THRESHOLD, tier_event_metadata
     OBSERVER_AVAILABLE = True
 except ImportError:
     OBSERVER_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
-# Timeout para processamento do Observer em background (Épico 12.1)
-OBSERVER_TIMEOUT_SECONDS = 5.0
-
 # === OBSERVER CALLBACK ASSÍNCRONO (Épico 12.1) ===
 
+# Último cognitive_model aplicado pelo Observer por sessão (turno, modelo).
+# O state capturado no submit pode não ter o resultado de um job que
+# terminou depois; o job parte sempre do modelo aplicado mais recente.
+MAX_APPLIED_MODEL_SESSIONS = 256
+_applied_cognitive_models: "OrderedDict[str, Tuple[int, Dict[str, Any]]]" = OrderedDict()
+_applied_cognitive_models_lock = threading.Lock()
+
+def _remember_applied_model(session_id: str, turn_number: int, cognitive_model: Dict[str, Any]) -> None:
+    """Registra o cognitive_model aplicado por um job do Observer."""
+    with _applied_cognitive_models_lock:
+        _applied_cognitive_models[session_id] = (turn_number, cognitive_model)
+        _applied_cognitive_models.move_to_end(session_id)
+        while len(_applied_cognitive_models) > MAX_APPLIED_MODEL_SESSIONS:
+            _applied_cognitive_models.popitem(last=False)
+
+def _latest_cognitive_model(session_id: str, fallback: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Modelo aplicado mais recente da sessão (ou o do state capturado)."""
+    with _applied_cognitive_models_lock:
+        applied = _applied_cognitive_models.get(session_id)
+    return applied[1] if applied is not None else fallback
+
 def _create_observer_callback(state: MultiAgentState, result: Dict[str, Any]) -> None:
     """
     Executa Observer em background após turno do Orquestrador (Épico 12.1).
 
-    Esta função cria uma thread daemon que processa o turno através do Observer,
-    atualizando o cognitive_model no state sem bloquear a resposta ao usuário.
+    Esta função enfileira o turno no pool compartilhado do Observer
+    (core/agents/observer/worker_pool.py), que processa o turno e atualiza o
+    cognitive_model no state sem bloquear a resposta ao usuário.
 
     Comportamento:
-    - Executa em thread separada (daemon=True para não bloquear shutdown)
-    - Timeout de OBSERVER_TIMEOUT_SECONDS (5s) para não travar sistema
+    - Workers daemon em número fixo (OBSERVER_MAX_WORKERS)
+    - Um processamento por sessão: turno novo substitui o pendente e cancela
+      o em andamento (resultado obsoleto é descartado); as mensagens desses
+      turnos são processadas junto com a do turno novo, a partir do último
+      cognitive_model aplicado
+    - Timeout de OBSERVER_TIMEOUT_SECONDS: resultado tardio é descartado
     - Publica evento cognitive_model_updated via EventBus
     - Falhas são silenciosas (não quebram fluxo principal)
 
@@ -113,24 +140,40 @@ def _create_observer_callback(state: MultiAgentState, result: Dict[str, Any]) ->
     # Cognitive model anterior (se existir)
     previous_cognitive_model = state.get("cognitive_model")
 
-    def _run_observer():
-        """Thread interna que executa o Observer."""
+    def _run_observer(job):
+        """Job executado por um worker do pool do Observer."""
         try:
             logger.info(f"👁️ Observer iniciando processamento em background (session: {session_id}, turno: {turn_count})")
             start_time = time.time()
 
-            # Processar turno via Observer
+            # Mensagens de turnos descartados/cancelados desde o último
+            # resultado aplicado entram junto com a deste turno
+            turn_inputs = [text for text in job.payloads if text] or [user_input]
+            if len(turn_inputs) > 1:
+                logger.info(f"👁️ Observer processando {len(turn_inputs)} mensagens acumuladas (session: {session_id})")
+
+            # Processar turno via Observer (efeitos colaterais suspensos se
+            # o job ficar obsoleto durante o processamento)
             observer_result = observer_process_turn(
-                user_input=user_input,
+                user_input="\n\n".join(turn_inputs),
                 conversation_history=conversation_history,
-                previous_cognitive_model=previous_cognitive_model,
+                previous_cognitive_model=_latest_cognitive_model(session_id, previous_cognitive_model),
                 session_id=session_id,
                 turn_number=turn_count,
-                idea_id=idea_id
+                idea_id=idea_id,
+                should_stop=job.should_stop
             )
 
             processing_time = (time.time() - start_time) * 1000  # em ms
 
+            # Turno mais recente na fila ou timeout: resultado obsoleto
+            if job.should_stop():
+                logger.info(
+                    f"👁️ Observer descartou turno {turn_count} após {processing_time:.0f}ms "
+                    f"({'cancelado' if job.cancelled else 'timeout'}, session: {session_id})"
+                )
+                return
+
             # Extrair cognitive_model atualizado
             cognitive_model = observer_result.get("cognitive_model", {})
             metrics = observer_result.get("metrics", {})
@@ -140,6 +183,7 @@ def _create_observer_callback(state: MultiAgentState, result: Dict[str, Any]) ->
             # O state do LangGraph pode não ser atualizado imediatamente,
             # mas o cognitive_model estará disponível no próximo turno
             result["cognitive_model"] = cognitive_model
+            _remember_applied_model(session_id, turn_count, cognitive_model)
 
             logger.info(
                 f"👁️ Observer concluído em {processing_time:.0f}ms "
@@ -161,9 +205,12 @@ def _create_observer_callback(state: MultiAgentState, result: Dict[str, Any]) ->
                         concepts_count=len(cognitive_model.get("concepts_detected", [])),
                         open_questions_count=len(cognitive_model.get("open_questions", [])),
                         contradictions_count=len(cognitive_model.get("contradictions", [])),
-                        is_mature=metrics.get("solidez", 0.0) > 0.70,
+                        is_mature=metrics.get("solidez", 0.0) > SOLIDEZ_MATURITY_THRESHOLD,
                         metadata={
                             "processing_time_ms": processing_time,
+                            "queue_wait_ms": (job.wait_seconds or 0.0) * 1000,
+                            "metrics_cached": observer_result.get("metrics_cached", False),
+                            **tier_event_metadata(observer_result.get("metrics_tier")),
                             "observer_version": "12.1"
                         }
                     )
@@ -175,10 +222,9 @@ def _create_observer_callback(state: MultiAgentState, result: Dict[str, Any]) ->
             logger.error(f"❌ Erro ao executar Observer em background: {e}")
             # Silencioso: não propaga erro para não quebrar fluxo principal
 
-    # Executar em thread separada (daemon = True para não bloquear shutdown)
-    thread = threading.Thread(target=_run_observer, daemon=True, name=f"observer-{session_id}-{turn_count}")
-    thread.start()
-    logger.debug(f"👁️ Observer thread iniciada (session: {session_id}, turno: {turn_count})")
+    # Enfileirar no pool compartilhado (coalesce por sessão)
+    get_observer_worker_pool().submit(session_id, turn_count, _run_observer, payload=user_input)
+    logger.debug(f"👁️ Observer enfileirado (session: {session_id}, turno: {turn_count})")
 
 # === INSTRUMENTAÇÃO COM EVENTBUS (Épico 5.1) ===
 
@@ -247,7 +293,9 @@ def instrument_node(node_func: Callable, agent_name: str) -> Callable:
                     agent_name=agent_name,
                     metadata={
                         "stage": state.get("current_stage", "unknown"),
-                        "reasoning": f"Iniciando processamento do agente {agent_name}"  # Épico 8.1
+                        "reasoning": f"Iniciando processamento do agente {agent_name}",  # Épico 8.1
+                        # Fronteira de turno para os agregados incrementais do EventBus
+                        "turn_number": _get_turn_number(state)
                     }
                 )
                 logger.info(f"✅ Evento agent_started publicado para {agent_name} (session: {session_id})")
@@ -335,6 +383,21 @@ def instrument_node(node_func: Callable, agent_name: str) -> Callable:
 
     return wrapper
 
+def _get_turn_number(state: MultiAgentState) -> int:
+    """
+    Calcula o número do turno atual (mensagens do usuário no histórico).
+
+    Mesmo critério usado pelo orchestrator nos eventos do Observer (Épico 13.5).
+
+    Args:
+        state (MultiAgentState): Estado do grafo
+
+    Returns:
+        int: Número do turno (>= 1)
+    """
+    messages = state.get("messages", [])
+    return max(1, len([m for m in messages if m.__class__.__name__ == "HumanMessage"]))
+
 def _extract_summary(agent_name: str, state: MultiAgentState) -> str:
     """
     Extrai resumo da ação do agente baseado no resultado.
@@ -566,6 +629,11 @@ def create_multi_agent_graph():
     """
     logger.info("=== CRIANDO SUPER-GRAFO MULTI-AGENTE COM LOOP DE REFINAMENTO ===")
 
+    # Modo pré-carregado: modelo de embeddings do Observer carrega em background
+    # antes do primeiro turno (OBSERVER_EMBEDDING_PRELOAD)
+    if OBSERVER_AVAILABLE:
+        preload_embedding_model()
+
     # Validar configurações dos agentes (Épico 6, Funcionalidade 6.1)
     logger.info("Validando configurações dos agentes...")
     try:
@@ -28,10 +28,15 @@ Modulos:
 - state: ObserverState - Estado interno do processamento
 - nodes: process_turn - Processamento de turnos via LLM
 - extractors: Extratores semanticos via LLM
-- metrics: Calculo de solidez e completude
+- metrics: Calculo de solidez, completude e maturidade (separado ou fundido)
+- metrics_cache: Memo de metricas por hash do conteudo (LRU por sessao + SQLite)
+- metrics_tiers: Decisao local com escalonamento para o LLM
 - prompts: Prompts de extracao via LLM
 - catalog: ConceptCatalog - Persistencia ChromaDB + SQLite
 - embeddings: Geracao de embeddings semanticos
+- embedding_cache: Cache de embeddings (LRU em memoria + SQLite)
+- embedding_model: Carregamento unico e warmup do modelo de embeddings
+- worker_pool: Pool de workers com fila coalescente por sessao
 - concept_pipeline: Pipeline de deteccao e persistencia de conceitos
 - clarification: Consultas inteligentes e perguntas de esclarecimento
 - clarification_prompts: Prompts para esclarecimento
@@ -64,7 +69,14 @@ from .state import (
     create_initial_observer_state
 )
 from .nodes import process_turn, ObserverProcessor
-from .metrics import calculate_solidez, calculate_completude, calculate_metrics, evaluate_maturity
+from .metrics import (
+    calculate_solidez,
+    calculate_completude,
+    calculate_metrics,
+    evaluate_maturity,
+    evaluate_metrics_fused,
+    evaluate_argument
+)
 from .extractors import (
     extract_claims,
     extract_concepts,
@@ -86,13 +98,34 @@ from .embeddings import (
     generate_embeddings_batch,
     calculate_similarity,
     get_embedding_dimensions,
-    get_model_name
+    get_model_name,
+    get_embedding_cache_stats,
+    get_embedding_model_stats,
+    warmup_embedding_model,
+    normalize_rows,
+    similarity_matrix,
+    top_k_similar
 )
 from .concept_pipeline import (
     persist_concepts,
     persist_concepts_batch,
     ConceptPersistResult
 )
+from .metrics_cache import (
+    MetricsCache,
+    get_metrics_cache,
+    make_metrics_key
+)
+from .metrics_tiers import (
+    structural_signature,
+    decide_metrics_tier,
+    get_metrics_tier_stats
+)
+from .worker_pool import (
+    ObserverWorkerPool,
+    get_observer_worker_pool,
+    get_observer_worker_stats
+)
 from .clarification import (
     identify_clarification_needs,
     generate_contradiction_question,
@@ -121,6 +154,8 @@ __all__ = [
     "calculate_completude",
     "calculate_metrics",
     "evaluate_maturity",
+    "evaluate_metrics_fused",
+    "evaluate_argument",
 
     # Extratores
     "extract_claims",
@@ -144,12 +179,33 @@ __all__ = [
     "calculate_similarity",
     "get_embedding_dimensions",
     "get_model_name",
+    "get_embedding_cache_stats",
+    "get_embedding_model_stats",
+    "warmup_embedding_model",
+    "normalize_rows",
+    "similarity_matrix",
+    "top_k_similar",
 
     # Pipeline de Conceitos
     "persist_concepts",
     "persist_concepts_batch",
     "ConceptPersistResult",
 
+    # Memo de metricas
+    "MetricsCache",
+    "get_metrics_cache",
+    "make_metrics_key",
+
+    # Metricas em niveis
+    "structural_signature",
+    "decide_metrics_tier",
+    "get_metrics_tier_stats",
+
+    # Pool de workers
+    "ObserverWorkerPool",
+    "get_observer_worker_pool",
+    "get_observer_worker_stats",
+
     # Clarification - Consultas Inteligentes
     "identify_clarification_needs",
     "generate_contradiction_question",
@@ -21,6 +21,7 @@ import logging
 from typing import Optional, Dict, Any, List, TYPE_CHECKING
 
 from .state import ObserverInsight
+from .metrics_tiers import heuristic_completude, heuristic_solidez
 
 if TYPE_CHECKING:
     from core.agents.models.cognitive_model import CognitiveModel
@@ -381,50 +382,7 @@ class ObservadorAPI:
             - Proposicoes solidas (solidez >= 0.6) contribuem positivamente
             - Proposicoes frageis (solidez < 0.6) contribuem negativamente
         """
-        claim = self._cognitive_model.get("claim", "")
-        proposicoes = self._cognitive_model.get("proposicoes", [])
-        open_questions = self._cognitive_model.get("open_questions", [])
-        contradictions = self._cognitive_model.get("contradictions", [])
-
-        # Se nao tem claim, solidez = 0
-        if not claim:
-            return 0.0
-
-        # Separar proposicoes por solidez
-        solid_props = []
-        fragile_props = []
-        for p in proposicoes:
-            if isinstance(p, dict):
-                solidez = p.get("solidez")
-                if solidez is not None and solidez >= 0.6:
-                    solid_props.append(p)
-                elif solidez is not None and solidez < 0.6:
-                    fragile_props.append(p)
-
-        # Calcular score
-        score = 0.0
-
-        # Claim definido: base 20%
-        score += 0.20
-
-        # Proposicoes solidas: cada uma adiciona ate 15% (max 45%)
-        score += min(0.45, len(solid_props) * 0.15)
-
-        # Proposicoes frageis: cada uma subtrai 5% (max -25%)
-        score -= min(0.25, len(fragile_props) * 0.05)
-
-        # Open questions: cada uma subtrai 5% (max -15%)
-        score -= min(0.15, len(open_questions) * 0.05)
-
-        # Contradictions: cada uma subtrai 10% (max -30%)
-        score -= min(0.30, len(contradictions) * 0.10)
-
-        # Bonus: claim longo (> 50 chars) adiciona 5%
-        if len(claim) > 50:
-            score += 0.05
-
-        # Garantir range 0-1
-        return max(0.0, min(1.0, score))
+        return heuristic_solidez(self._cognitive_model)
 
     def get_completude(self) -> float:
         """
@@ -441,21 +399,7 @@ class ObservadorAPI:
             >>> print(f"Completude: {completude:.0%}")
             Completude: 80%
         """
-        proposicoes = self._cognitive_model.get("proposicoes", [])
-        open_questions = self._cognitive_model.get("open_questions", [])
-
-        # Contar proposicoes solidas (solidez >= 0.6)
-        solid_count = sum(
-            1 for p in proposicoes
-            if isinstance(p, dict) and p.get("solidez") is not None and p.get("solidez") >= 0.6
-        )
-
-        total_elements = solid_count + len(open_questions)
-        if total_elements == 0:
-            return 0.0
-
-        # Completude = proposicoes solidas / total elementos
-        return solid_count / total_elements
+        return heuristic_completude(self._cognitive_model)
 
     def get_concepts(self) -> list[str]:
         """
@@ -2,29 +2,30 @@
 Catalogo de Conceitos do Observador.
 
 Este modulo implementa a persistencia de conceitos usando:
-- ChromaDB: Vetores semanticos para busca por similaridade
+- Indice vetorial: Vetores semanticos para busca por similaridade
+  (ChromaDB por padrao ou NumPy em processo, ver vector_index)
 - SQLite: Metadados estruturados (label, essence, variations)
 
-Arquitetura hibrida permite busca semantica rapida (ChromaDB)
+Arquitetura hibrida permite busca semantica rapida (indice vetorial)
 com metadados ricos e relacionamentos (SQLite).
 
 """
 
 import logging
 import sqlite3
+import threading
 import json
 import uuid
 import os
+import weakref
+import unicodedata
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
-import chromadb
-from chromadb.config import Settings
-from pathlib import Path
-
-from .embeddings import generate_embedding, calculate_similarity
+from .embeddings import generate_embedding, generate_embeddings_batch, calculate_similarity
+from .vector_index import VECTOR_BACKEND_CHROMA, VectorIndex, create_vector_index
 
 logger = logging.getLogger(__name__)
 
@@ -59,10 +60,39 @@ _project_root = _get_project_root()
 DEFAULT_CHROMA_PATH = str(_project_root / "data" / "chroma")
 DEFAULT_SQLITE_PATH = str(_project_root / "data" / "concepts.db")
 
+# Backend do indice vetorial: "chroma" (padrao) ou "numpy" (ver vector_index)
+DEFAULT_VECTOR_BACKEND = os.getenv("OBSERVER_VECTOR_BACKEND", VECTOR_BACKEND_CHROMA)
+
+# Espera maxima por lock do SQLite (outro processo ou checkpoint do WAL)
+SQLITE_BUSY_TIMEOUT_MS = 5000
+
 # Thresholds de similaridade
 SIMILARITY_THRESHOLD_SAME = 0.80  # >= 0.80: mesmo conceito
 SIMILARITY_THRESHOLD_AUTO = 0.90  # >= 0.90: adiciona variation automaticamente
 
+# Default de save_concept(known_match=...): chamador nao buscou, buscar pelo label
+_SEARCH_BY_LABEL = object()
+
+def normalize_label(label: str) -> str:
+    """
+    Normaliza label para o indice de busca exata (fast path).
+
+    Remove acentos, aplica case-folding e colapsa espacos.
+
+    Args:
+        label: Label ou variacao (ex: "  Cooperação ").
+
+    Returns:
+        Label normalizado (ex: "cooperacao").
+
+    Example:
+        >>> normalize_label("Cooperação  entre Agentes")
+        'cooperacao entre agentes'
+    """
+    decomposed = unicodedata.normalize("NFKD", label)
+    without_accents = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(without_accents.casefold().split())
+
 @dataclass
 class Concept:
     """Representa um conceito no catalogo."""
@@ -101,16 +131,60 @@ class SimilarConcept:
             "similarity": self.similarity
         }
 
+class _ReaderHolder:
+    """Conexao de leitura de uma thread; coletada quando a thread termina."""
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+def _close_reader(conn: sqlite3.Connection, readers: Set[sqlite3.Connection], readers_lock: threading.Lock) -> None:
+    """Fecha conexao de leitura de thread encerrada (se close() ainda nao fechou)."""
+    with readers_lock:
+        if conn not in readers:
+            return
+        readers.discard(conn)
+    conn.close()
+
+def _open_connection(sqlite_path: str, busy_timeout_ms: int = SQLITE_BUSY_TIMEOUT_MS) -> sqlite3.Connection:
+    """
+    Abre conexao SQLite do catalogo em modo WAL.
+
+    WAL permite leitores concorrentes com um escritor; busy_timeout faz
+    escritas concorrentes (outro processo) esperarem em vez de falhar com
+    "database is locked".
+
+    Args:
+        sqlite_path: Caminho do banco.
+        busy_timeout_ms: Espera maxima por lock.
+
+    Returns:
+        Conexao com row_factory sqlite3.Row.
+    """
+    conn = sqlite3.connect(sqlite_path, check_same_thread=False, timeout=busy_timeout_ms / 1000)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+    return conn
+
 class ConceptCatalog:
     """
-    Catalogo de conceitos com persistencia hibrida ChromaDB + SQLite.
+    Catalogo de conceitos com persistencia hibrida indice vetorial + SQLite.
 
-    ChromaDB armazena vetores semanticos para busca por similaridade.
+    O indice vetorial (ChromaDB por padrao, ou NumPy em processo) armazena
+    vetores semanticos para busca por similaridade.
     SQLite armazena metadados estruturados e relacionamentos.
 
+    Seguro para uso entre threads (Streamlit + threads do Observador): o
+    SQLite roda em modo WAL, escritas passam por uma unica conexao
+    serializada por lock e leituras usam uma conexao por thread.
+
     Attributes:
         chroma_path: Caminho para persistencia do ChromaDB.
         sqlite_path: Caminho para banco SQLite.
+        vector_backend: Backend do indice vetorial ("chroma" ou "numpy").
 
     Example:
         >>> catalog = ConceptCatalog()
@@ -126,7 +200,10 @@ class ConceptCatalog:
     def __init__(
         self,
         chroma_path: str = DEFAULT_CHROMA_PATH,
-        sqlite_path: str = DEFAULT_SQLITE_PATH
+        sqlite_path: str = DEFAULT_SQLITE_PATH,
+        vector_backend: Optional[str] = None,
+        vector_path: Optional[str] = None,
+        vector_index: Optional[VectorIndex] = None
     ):
         """
         Inicializa o catalogo de conceitos.
@@ -134,9 +211,18 @@ class ConceptCatalog:
         Args:
             chroma_path: Caminho para persistencia do ChromaDB.
             sqlite_path: Caminho para banco SQLite.
+            vector_backend: "chroma" ou "numpy". Default: OBSERVER_VECTOR_BACKEND
+                ou "chroma".
+            vector_path: Diretorio do indice NumPy. Default: "vectors" ao
+                lado de chroma_path.
+            vector_index: Indice ja construido (ignora vector_backend).
         """
         self.chroma_path = chroma_path
         self.sqlite_path = sqlite_path
+        self.vector_backend = (vector_backend or DEFAULT_VECTOR_BACKEND).lower()
+        self.vector_path = vector_path or os.path.join(
+            os.path.dirname(chroma_path) or ".", "vectors"
+        )
 
         # Garantir que diretorios existam
         # ChromaDB precisa que o diretório pai exista
@@ -144,44 +230,46 @@ class ConceptCatalog:
         if chroma_dir and chroma_dir != ".":
             os.makedirs(chroma_dir, exist_ok=True)
         # Para ChromaDB, também criar o diretório final se necessário
-        os.makedirs(chroma_path, exist_ok=True)
+        if self.vector_backend == VECTOR_BACKEND_CHROMA:
+            os.makedirs(chroma_path, exist_ok=True)
         
         sqlite_dir = os.path.dirname(sqlite_path) or "."
         if sqlite_dir and sqlite_dir != ".":
             os.makedirs(sqlite_dir, exist_ok=True)
 
-        # Inicializar ChromaDB
-        self._init_chromadb()
+        # Contadores do fast path por label normalizado (ver get_stats);
+        # atualizados por varias threads de leitura
+        self._label_lookups = 0
+        self._label_hits = 0
+        self._label_stats_lock = threading.Lock()
+
+        # Inicializar indice vetorial
+        if vector_index is not None:
+            self._index = vector_index
+        elif self.vector_backend == VECTOR_BACKEND_CHROMA:
+            self._index = create_vector_index(self.vector_backend, chroma_path)
+        else:
+            self._index = create_vector_index(self.vector_backend, self.vector_path)
 
         # Inicializar SQLite
         self._init_sqlite()
 
         logger.info(
             f"ConceptCatalog inicializado "
-            f"(chroma={chroma_path}, sqlite={sqlite_path})"
+            f"(vectors={self.vector_backend}, chroma={chroma_path}, sqlite={sqlite_path})"
         )
 
-    def _init_chromadb(self) -> None:
-        """Inicializa cliente e collection do ChromaDB."""
-        self._chroma_client = chromadb.PersistentClient(
-            path=self.chroma_path,
-            settings=Settings(anonymized_telemetry=False)
-        )
-
-        self._collection = self._chroma_client.get_or_create_collection(
-            name="concepts",
-            metadata={
-                "description": "Biblioteca global de conceitos",
-                "hnsw:space": "cosine"  # Usar distancia cosseno (mais intuitivo)
-            }
-        )
-
-        logger.debug(f"ChromaDB collection 'concepts' inicializada")
-
     def _init_sqlite(self) -> None:
         """Inicializa banco SQLite com schema."""
-        self._conn = sqlite3.connect(self.sqlite_path, check_same_thread=False)
-        self._conn.row_factory = sqlite3.Row
+        # Conexao de escrita (unica, serializada por _write_lock)
+        self._write_lock = threading.RLock()
+        self._conn = _open_connection(self.sqlite_path)
+
+        # Conexoes de leitura, uma por thread (fechadas quando a thread
+        # termina ou em close())
+        self._local = threading.local()
+        self._readers: Set[sqlite3.Connection] = set()
+        self._readers_lock = threading.Lock()
 
         # Criar tabelas
         self._conn.executescript("""
@@ -193,7 +281,8 @@ class ConceptCatalog:
                 variations TEXT,  -- JSON array
                 chroma_id TEXT,
                 created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                normalized_label TEXT  -- normalize_label(label)
             );
 
             -- Tabela de variacoes (normalizacao)
@@ -202,6 +291,7 @@ class ConceptCatalog:
                 concept_id TEXT NOT NULL,
                 variation TEXT NOT NULL,
                 created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                normalized_variation TEXT,  -- normalize_label(variation)
                 FOREIGN KEY (concept_id) REFERENCES concepts(id),
                 UNIQUE(concept_id, variation)
             );
@@ -225,24 +315,80 @@ class ConceptCatalog:
                 ON idea_concepts(concept_id);
         """)
 
+        self._migrate_normalized_labels()
+
         self._conn.commit()
-        logger.debug("SQLite schema inicializado")
+        logger.debug("SQLite schema inicializado (WAL)")
+
+    def _read_conn(self) -> sqlite3.Connection:
+        """
+        Retorna a conexao de leitura da thread atual (criada sob demanda).
+
+        A conexao fica num holder em threading.local: quando a thread termina
+        (ex: threads observer-{session}-{turn}), o holder e coletado e o
+        finalizer fecha a conexao, sem acumular conexoes de threads mortas.
+        """
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            conn = _open_connection(self.sqlite_path)
+            holder = _ReaderHolder(conn)
+            self._local.holder = holder
+            with self._readers_lock:
+                self._readers.add(conn)
+            weakref.finalize(holder, _close_reader, conn, self._readers, self._readers_lock)
+        return holder.conn
+
+    def _migrate_normalized_labels(self) -> None:
+        """Adiciona e preenche colunas normalizadas em bancos antigos."""
+        for table, column, source, key in (
+            ("concepts", "normalized_label", "label", "id"),
+            ("concept_variations", "normalized_variation", "variation", "id"),
+        ):
+            columns = {row["name"] for row in self._conn.execute(f"PRAGMA table_info({table})")}
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} TEXT")
+
+            pending = self._conn.execute(
+                f"SELECT {key}, {source} FROM {table} WHERE {column} IS NULL"
+            ).fetchall()
+            if pending:
+                self._conn.executemany(
+                    f"UPDATE {table} SET {column} = ? WHERE {key} = ?",
+                    [(normalize_label(row[source]), row[key]) for row in pending]
+                )
+                logger.info(f"{len(pending)} linhas de {table} normalizadas para o fast path")
+
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_concepts_normalized_label ON concepts(normalized_label)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_concept_variations_normalized "
+            "ON concept_variations(normalized_variation)"
+        )
 
     def save_concept(
         self,
         label: str,
         essence: Optional[str] = None,
-        embedding: Optional[List[float]] = None
+        embedding: Optional[List[float]] = None,
+        known_match: Any = _SEARCH_BY_LABEL
     ) -> str:
         """
         Salva um conceito no catalogo (ChromaDB + SQLite).
 
         Se o conceito ja existir (similaridade >= 0.80), adiciona como variation.
+        Labels que ja existem (como label ou variation, apos normalize_label)
+        retornam o conceito existente sem gerar embedding nem consultar o
+        ChromaDB.
 
         Args:
             label: Label do conceito (ex: "Cooperacao").
             essence: Descricao da essencia (opcional).
             embedding: Vetor semantico (gera automaticamente se nao fornecido).
+            known_match: Resultado de find_similar_by_vector() ja feito pelo
+                chamador (SimilarConcept, ou None se nao houve match acima de
+                SIMILARITY_THRESHOLD_SAME). Evita nova busca e novo embedding.
+                Se omitido, busca pelo label.
 
         Returns:
             ID do conceito (novo ou existente).
@@ -254,19 +400,43 @@ class ConceptCatalog:
             ... )
             >>> print(concept_id)
             'a1b2c3d4-...'
+            >>> # Embed-once: um embedding e uma busca por conceito
+            >>> embedding = generate_embedding("colaboracao")
+            >>> similar = catalog.find_similar_by_vector(embedding, top_k=1,
+            ...     threshold=SIMILARITY_THRESHOLD_SAME)
+            >>> catalog.save_concept("colaboracao", embedding=embedding,
+            ...     known_match=similar[0] if similar else None)
         """
+        # Fast path: label (ou variacao) ja conhecido, sem modelo nem HNSW
+        if known_match is _SEARCH_BY_LABEL:
+            existing = self.find_concept_by_label(label)
+            if existing is not None:
+                # Hit sem escrita quando o texto ja e o label ou uma variation
+                if label != existing.label and label not in existing.variations:
+                    self.add_variation(existing.id, label)
+                logger.debug(f"Label '{label}' resolvido pelo indice normalizado ({existing.id})")
+                return existing.id
+
+        label_embedding = None
+
         # Gerar embedding se nao fornecido
         if embedding is None:
-            embedding = generate_embedding(label)
-
-        # Buscar conceitos similares
-        similar = self.find_similar_concepts(label, top_k=1, threshold=SIMILARITY_THRESHOLD_SAME)
+            embedding = label_embedding = generate_embedding(label)
+
+        # Buscar conceitos similares (se o chamador ainda nao buscou)
+        if known_match is _SEARCH_BY_LABEL:
+            if label_embedding is None:
+                label_embedding = generate_embedding(label)
+            similar = self.find_similar_by_vector(
+                label_embedding, top_k=1, threshold=SIMILARITY_THRESHOLD_SAME
+            )
+            known_match = similar[0] if similar else None
 
-        if similar and similar[0].similarity >= SIMILARITY_THRESHOLD_SAME:
+        if known_match is not None and known_match.similarity >= SIMILARITY_THRESHOLD_SAME:
             # Conceito ja existe, adicionar variation
-            existing_id = similar[0].concept.id
+            existing_id = known_match.concept.id
 
-            if similar[0].similarity >= SIMILARITY_THRESHOLD_AUTO:
+            if known_match.similarity >= SIMILARITY_THRESHOLD_AUTO:
                 # Automatico: adiciona variation sem perguntar
                 self.add_variation(existing_id, label)
                 logger.info(f"Variation '{label}' adicionada ao conceito {existing_id}")
@@ -276,7 +446,7 @@ class ConceptCatalog:
                 self.add_variation(existing_id, label)
                 logger.info(
                     f"Variation '{label}' adicionada ao conceito {existing_id} "
-                    f"(similaridade {similar[0].similarity:.2f})"
+                    f"(similaridade {known_match.similarity:.2f})"
                 )
 
             return existing_id
@@ -284,8 +454,8 @@ class ConceptCatalog:
         # Conceito novo
         concept_id = str(uuid.uuid4())
 
-        # Salvar no ChromaDB
-        self._collection.add(
+        # Salvar no indice vetorial
+        self._index.add(
             ids=[concept_id],
             embeddings=[embedding],
             metadatas=[{
@@ -295,14 +465,14 @@ class ConceptCatalog:
         )
 
         # Salvar no SQLite
-        cursor = self._conn.execute(
-            """
-            INSERT INTO concepts (id, label, essence, variations, chroma_id)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (concept_id, label, essence, json.dumps([]), concept_id)
-        )
-        self._conn.commit()
+        with self._write_lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO concepts (id, label, essence, variations, chroma_id, normalized_label)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (concept_id, label, essence, json.dumps([]), concept_id, normalize_label(label))
+            )
 
         logger.info(f"Novo conceito criado: '{label}' (id={concept_id})")
 
@@ -334,45 +504,194 @@ class ConceptCatalog:
         # Gerar embedding da query
         query_embedding = generate_embedding(query)
 
-        # Buscar no ChromaDB
-        # Garantir que count() retorna um int (pode ser None ou MagicMock em testes)
-        try:
-            collection_count = self._collection.count()
-            if not isinstance(collection_count, int):
-                collection_count = 0
-        except (AttributeError, TypeError):
-            collection_count = 0
-        
-        n_results = min(top_k, max(collection_count, 1))
-        results = self._collection.query(
-            query_embeddings=[query_embedding],
-            n_results=n_results,
-            include=["metadatas", "distances"]
+        return self.find_similar_by_vector(query_embedding, top_k=top_k, threshold=threshold)
+
+    def find_similar_concepts_many(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        threshold: float = 0.0,
+        hydrate: bool = True
+    ) -> List[List[SimilarConcept]]:
+        """
+        Busca conceitos similares para varios textos de uma vez.
+
+        Um forward pass em lote (generate_embeddings_batch), uma query
+        multi-vetor no ChromaDB e uma consulta no SQLite para todos os hits.
+
+        Args:
+            queries: Textos para buscar.
+            top_k: Numero maximo de resultados por texto.
+            threshold: Similaridade minima (0.0 a 1.0).
+            hydrate: Ver find_similar_by_vectors().
+
+        Returns:
+            Uma lista de SimilarConcept por texto (mesma ordem).
+
+        Example:
+            >>> results = catalog.find_similar_concepts_many(["colaboracao", "LLMs"], top_k=1)
+            >>> results[0][0].concept.label
+            'Cooperacao'
+        """
+        if not queries:
+            return []
+
+        query_embeddings = generate_embeddings_batch(queries, as_numpy=True)
+
+        return self.find_similar_by_vectors(
+            query_embeddings, top_k=top_k, threshold=threshold, hydrate=hydrate
         )
 
-        similar_concepts = []
-
-        if results["ids"] and results["ids"][0]:
-            for i, concept_id in enumerate(results["ids"][0]):
-                # ChromaDB com hnsw:space=cosine retorna distancia cosseno
-                # Distancia cosseno: 0 = identico, 1 = ortogonal, 2 = oposto
-                # Similaridade = 1 - distancia
-                distance = results["distances"][0][i]
-                similarity = 1 - distance
-                similarity = max(0.0, min(1.0, similarity))
-
-                if similarity >= threshold:
-                    # Buscar metadados completos no SQLite
-                    concept = self.get_concept_by_id(concept_id)
-                    if concept:
-                        similar_concepts.append(
-                            SimilarConcept(concept=concept, similarity=similarity)
-                        )
+    def find_similar_by_vector(
+        self,
+        query_embedding: List[float],
+        top_k: int = 5,
+        threshold: float = 0.0
+    ) -> List[SimilarConcept]:
+        """
+        Busca conceitos similares a partir de um embedding ja calculado.
+
+        Permite ao chamador reutilizar o mesmo vetor na busca e no
+        save_concept() (sem novo forward pass do modelo).
+
+        Args:
+            query_embedding: Vetor da query (mesma dimensao do catalogo).
+            top_k: Numero maximo de resultados.
+            threshold: Similaridade minima (0.0 a 1.0).
+
+        Returns:
+            Lista de SimilarConcept ordenada por similaridade (descendente).
+
+        Example:
+            >>> embedding = generate_embedding("colaboracao")
+            >>> catalog.find_similar_by_vector(embedding, top_k=1)[0].concept.label
+            'Cooperacao'
+        """
+        return self.find_similar_by_vectors([query_embedding], top_k=top_k, threshold=threshold)[0]
+
+    def find_similar_by_vectors(
+        self,
+        query_embeddings: List[List[float]],
+        top_k: int = 5,
+        threshold: float = 0.0,
+        hydrate: bool = True
+    ) -> List[List[SimilarConcept]]:
+        """
+        Busca conceitos similares para varios embeddings numa unica query.
+
+        Os conceitos encontrados sao carregados do SQLite numa unica consulta
+        (get_concepts_by_ids), independente do numero de hits.
+
+        Args:
+            query_embeddings: Vetores das queries (mesma dimensao do catalogo).
+            top_k: Numero maximo de resultados por query.
+            threshold: Similaridade minima (0.0 a 1.0).
+            hydrate: Se False, monta os Concepts apenas com id, label e
+                essence dos metadados do ChromaDB (sem ler o SQLite; sem
+                variations nem timestamps).
+
+        Returns:
+            Uma lista de SimilarConcept por query (mesma ordem), cada uma
+            ordenada por similaridade (descendente).
+
+        Example:
+            >>> vectors = generate_embeddings_batch(["colaboracao", "LLMs"])
+            >>> [len(r) for r in catalog.find_similar_by_vectors(vectors, top_k=1)]
+            [1, 0]
+        """
+        if len(query_embeddings) == 0:
+            return []
+
+        # Buscar no indice vetorial (similaridade cosseno em [0, 1])
+        results = self._index.query(list(query_embeddings), top_k)
+
+        # Hits acima do threshold: (linha da query, id, similaridade, metadados)
+        hits = [
+            (row, concept_id, similarity, metadata)
+            for row, query_hits in enumerate(results)
+            for concept_id, similarity, metadata in query_hits
+            if similarity >= threshold
+        ]
+
+        if hydrate:
+            # Buscar metadados completos no SQLite (uma consulta para todos os hits)
+            concepts = self.get_concepts_by_ids([concept_id for _, concept_id, _, _ in hits])
+        else:
+            concepts = {
+                concept_id: Concept(
+                    id=concept_id,
+                    label=metadata.get("label", ""),
+                    essence=metadata.get("essence") or None,
+                    chroma_id=concept_id
+                )
+                for _, concept_id, _, metadata in hits
+            }
+
+        all_similar: List[List[SimilarConcept]] = [[] for _ in query_embeddings]
+        for row, concept_id, similarity, _ in hits:
+            concept = concepts.get(concept_id)
+            if concept and row < len(all_similar):
+                all_similar[row].append(SimilarConcept(concept=concept, similarity=similarity))
 
         # Ordenar por similaridade (descendente)
-        similar_concepts.sort(key=lambda x: x.similarity, reverse=True)
+        for similar_concepts in all_similar:
+            similar_concepts.sort(key=lambda x: x.similarity, reverse=True)
 
-        return similar_concepts
+        return all_similar
+
+    def add_concepts(
+        self,
+        concepts: List[Tuple[str, Optional[str], List[float]]]
+    ) -> List[str]:
+        """
+        Cria varios conceitos novos de uma vez, sem deduplicacao.
+
+        Um unico add no indice vetorial e um executemany no SQLite (uma
+        transacao). O chamador e responsavel por ja ter verificado
+        similaridade (ver concept_pipeline.persist_concepts_batch).
+
+        Args:
+            concepts: Tuplas (label, essence, embedding).
+
+        Returns:
+            IDs dos conceitos criados, na mesma ordem.
+
+        Example:
+            >>> ids = catalog.add_concepts([("Cooperacao", None, vec1), ("LLMs", None, vec2)])
+            >>> len(ids)
+            2
+        """
+        if not concepts:
+            return []
+
+        concept_ids = [str(uuid.uuid4()) for _ in concepts]
+
+        # Salvar no indice vetorial
+        self._index.add(
+            ids=concept_ids,
+            embeddings=[embedding for _, _, embedding in concepts],
+            metadatas=[
+                {"label": label, "essence": essence or ""}
+                for label, essence, _ in concepts
+            ]
+        )
+
+        # Salvar no SQLite
+        with self._write_lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO concepts (id, label, essence, variations, chroma_id, normalized_label)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (concept_id, label, essence, json.dumps([]), concept_id, normalize_label(label))
+                    for concept_id, (label, essence, _) in zip(concept_ids, concepts)
+                ]
+            )
+
+        logger.info(f"{len(concept_ids)} conceitos novos criados em lote")
+
+        return concept_ids
 
     def add_variation(self, concept_id: str, variation: str) -> bool:
         """
@@ -390,32 +709,34 @@ class ConceptCatalog:
             True
         """
         try:
-            # Adicionar na tabela de variacoes
-            self._conn.execute(
-                """
-                INSERT OR IGNORE INTO concept_variations (concept_id, variation)
-                VALUES (?, ?)
-                """,
-                (concept_id, variation)
-            )
+            # Lock cobre o read-modify-write do JSON de variacoes
+            with self._write_lock:
+                # Adicionar na tabela de variacoes
+                self._conn.execute(
+                    """
+                    INSERT OR IGNORE INTO concept_variations (concept_id, variation, normalized_variation)
+                    VALUES (?, ?, ?)
+                    """,
+                    (concept_id, variation, normalize_label(variation))
+                )
 
-            # Atualizar JSON de variacoes no conceito
-            concept = self.get_concept_by_id(concept_id)
-            if concept:
-                variations = concept.variations or []
-                if variation not in variations:
-                    variations.append(variation)
-
-                    self._conn.execute(
-                        """
-                        UPDATE concepts
-                        SET variations = ?, updated_at = ?
-                        WHERE id = ?
-                        """,
-                        (json.dumps(variations), datetime.now(timezone.utc).isoformat(), concept_id)
-                    )
+                # Atualizar JSON de variacoes no conceito
+                concept = self.get_concept_by_id(concept_id)
+                if concept:
+                    variations = concept.variations or []
+                    if variation not in variations:
+                        variations.append(variation)
+
+                        self._conn.execute(
+                            """
+                            UPDATE concepts
+                            SET variations = ?, updated_at = ?
+                            WHERE id = ?
+                            """,
+                            (json.dumps(variations), datetime.now(timezone.utc).isoformat(), concept_id)
+                        )
 
-            self._conn.commit()
+                self._conn.commit()
 
             logger.debug(f"Variation '{variation}' adicionada ao conceito {concept_id}")
             return True
@@ -440,14 +761,14 @@ class ConceptCatalog:
             True
         """
         try:
-            self._conn.execute(
-                """
-                INSERT OR IGNORE INTO idea_concepts (idea_id, concept_id)
-                VALUES (?, ?)
-                """,
-                (idea_id, concept_id)
-            )
-            self._conn.commit()
+            with self._write_lock, self._conn:
+                self._conn.execute(
+                    """
+                    INSERT OR IGNORE INTO idea_concepts (idea_id, concept_id)
+                    VALUES (?, ?)
+                    """,
+                    (idea_id, concept_id)
+                )
 
             logger.debug(f"Link criado: idea={idea_id} <-> concept={concept_id}")
             return True
@@ -456,6 +777,35 @@ class ConceptCatalog:
             logger.debug(f"Link ja existe: idea={idea_id} <-> concept={concept_id}")
             return False
 
+    def link_idea_concepts(self, idea_id: str, concept_ids: List[str]) -> int:
+        """
+        Cria links N:N entre uma Idea e varios Concepts numa transacao.
+
+        Args:
+            idea_id: ID da Idea.
+            concept_ids: IDs dos Concepts (repetidos sao ignorados).
+
+        Returns:
+            Numero de links novos criados.
+        """
+        unique_ids = list(dict.fromkeys(concept_ids))
+        if not unique_ids:
+            return 0
+
+        with self._write_lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                """
+                INSERT OR IGNORE INTO idea_concepts (idea_id, concept_id)
+                VALUES (?, ?)
+                """,
+                [(idea_id, concept_id) for concept_id in unique_ids]
+            )
+            created = self._conn.total_changes - before
+
+        logger.debug(f"{created} links criados para idea={idea_id}")
+        return created
+
     def get_concept_by_id(self, concept_id: str) -> Optional[Concept]:
         """
         Busca conceito por ID.
@@ -466,7 +816,7 @@ class ConceptCatalog:
         Returns:
             Concept ou None se nao encontrado.
         """
-        cursor = self._conn.execute(
+        cursor = self._read_conn().execute(
             """
             SELECT id, label, essence, variations, chroma_id, created_at, updated_at
             FROM concepts
@@ -489,6 +839,111 @@ class ConceptCatalog:
 
         return None
 
+    def get_concepts_by_ids(self, concept_ids: List[str]) -> Dict[str, Concept]:
+        """
+        Busca varios conceitos por ID numa unica consulta.
+
+        Args:
+            concept_ids: IDs dos conceitos (repetidos sao ignorados).
+
+        Returns:
+            Dict {id: Concept} apenas com os IDs encontrados.
+
+        Example:
+            >>> concepts = catalog.get_concepts_by_ids(["uuid-1", "uuid-2"])
+            >>> concepts["uuid-1"].label
+            'Cooperacao'
+        """
+        unique_ids = list(dict.fromkeys(concept_ids))
+        concepts: Dict[str, Concept] = {}
+
+        # Limite de variaveis por statement do SQLite
+        for start in range(0, len(unique_ids), 500):
+            chunk = unique_ids[start:start + 500]
+            cursor = self._read_conn().execute(
+                f"""
+                SELECT id, label, essence, variations, chroma_id, created_at, updated_at
+                FROM concepts
+                WHERE id IN ({",".join("?" * len(chunk))})
+                """,
+                chunk
+            )
+
+            for row in cursor.fetchall():
+                concepts[row["id"]] = Concept(
+                    id=row["id"],
+                    label=row["label"],
+                    essence=row["essence"],
+                    variations=json.loads(row["variations"]) if row["variations"] else [],
+                    chroma_id=row["chroma_id"],
+                    created_at=row["created_at"],
+                    updated_at=row["updated_at"]
+                )
+
+        return concepts
+
+    def find_concepts_by_labels(self, labels: List[str]) -> List[Optional[Concept]]:
+        """
+        Resolve labels pelo indice normalizado (label ou variation existente).
+
+        Uma consulta SQLite para o lote; nao usa o modelo de embeddings nem o
+        ChromaDB. Hits contam para label_hit_rate em get_stats().
+
+        Args:
+            labels: Labels a resolver.
+
+        Returns:
+            Lista alinhada com labels: Concept existente ou None.
+
+        Example:
+            >>> catalog.find_concepts_by_labels(["COOPERAÇÃO", "inedito"])
+            [Concept(label='Cooperacao', ...), None]
+        """
+        normalized = [normalize_label(label) for label in labels]
+        unique = list(dict.fromkeys(normalized))
+        concept_by_key: Dict[str, str] = {}
+
+        # Limite de variaveis por statement do SQLite (duas listas por chunk)
+        for start in range(0, len(unique), 400):
+            chunk = unique[start:start + 400]
+            placeholders = ",".join("?" * len(chunk))
+            # Label do proprio conceito tem prioridade sobre variations
+            rows = self._read_conn().execute(
+                f"""
+                SELECT normalized_label AS key, id AS concept_id, 0 AS priority
+                FROM concepts WHERE normalized_label IN ({placeholders})
+                UNION ALL
+                SELECT normalized_variation, concept_id, 1
+                FROM concept_variations WHERE normalized_variation IN ({placeholders})
+                ORDER BY priority
+                """,
+                chunk + chunk
+            ).fetchall()
+            for row in rows:
+                concept_by_key.setdefault(row["key"], row["concept_id"])
+
+        concepts = self.get_concepts_by_ids(list(concept_by_key.values())) if concept_by_key else {}
+        results = [concepts.get(concept_by_key.get(key, "")) for key in normalized]
+
+        hits = sum(1 for concept in results if concept is not None)
+        with self._label_stats_lock:
+            self._label_lookups += len(labels)
+            self._label_hits += hits
+
+        return results
+
+    def find_concept_by_label(self, label: str) -> Optional[Concept]:
+        """
+        Resolve um label pelo indice normalizado (ver find_concepts_by_labels).
+
+        Args:
+            label: Label a resolver (ex: "cooperação").
+
+        Returns:
+            Concept existente ou None.
+        """
+        return self.find_concepts_by_labels([label])[0]
+
     def get_concept_by_label(self, label: str) -> Optional[Concept]:
         """
         Busca conceito por label exato.
@@ -499,7 +954,7 @@ class ConceptCatalog:
         Returns:
             Concept ou None se nao encontrado.
         """
-        cursor = self._conn.execute(
+        cursor = self._read_conn().execute(
             """
             SELECT id, label, essence, variations, chroma_id, created_at, updated_at
             FROM concepts
@@ -532,7 +987,7 @@ class ConceptCatalog:
         Returns:
             Lista de Concepts.
         """
-        cursor = self._conn.execute(
+        cursor = self._read_conn().execute(
             """
             SELECT c.id, c.label, c.essence, c.variations, c.chroma_id,
                    c.created_at, c.updated_at
@@ -567,7 +1022,7 @@ class ConceptCatalog:
         Returns:
             Lista de Concepts.
         """
-        cursor = self._conn.execute(
+        cursor = self._read_conn().execute(
             """
             SELECT id, label, essence, variations, chroma_id, created_at, updated_at
             FROM concepts
@@ -591,11 +1046,210 @@ class ConceptCatalog:
 
         return concepts
 
+    def iter_concepts(self, chunk_size: int = 500, after_id: Optional[str] = None) -> Iterator[List[Concept]]:
+        """
+        Percorre todos os conceitos em blocos, ordenados por ID.
+
+        Paginacao por chave (id > ultimo id do bloco anterior): memoria
+        constante e retomada a partir de qualquer ID.
+
+        Args:
+            chunk_size: Conceitos por bloco.
+            after_id: Comeca apos este ID (retomada). Default: do inicio.
+
+        Yields:
+            Listas de Concepts (no maximo chunk_size cada).
+
+        Example:
+            >>> for chunk in catalog.iter_concepts(chunk_size=1000):
+            ...     vectors = generate_embeddings_batch([c.label for c in chunk])
+        """
+        last_id = after_id or ""
+        while True:
+            rows = self._read_conn().execute(
+                """
+                SELECT id, label, essence, variations, chroma_id, created_at, updated_at
+                FROM concepts
+                WHERE id > ?
+                ORDER BY id
+                LIMIT ?
+                """,
+                (last_id, chunk_size)
+            ).fetchall()
+            if not rows:
+                return
+
+            yield [
+                Concept(
+                    id=row["id"],
+                    label=row["label"],
+                    essence=row["essence"],
+                    variations=json.loads(row["variations"]) if row["variations"] else [],
+                    chroma_id=row["chroma_id"],
+                    created_at=row["created_at"],
+                    updated_at=row["updated_at"]
+                )
+                for row in rows
+            ]
+            last_id = rows[-1]["id"]
+
+    def import_concepts(self, concepts: List[Concept]) -> List[str]:
+        """
+        Insere conceitos preservando IDs, variacoes e timestamps (uma transacao).
+
+        IDs que ja existem sao ignorados. Nao toca o indice vetorial (ver
+        catalog_maintenance.import_bundle).
+
+        Args:
+            concepts: Concepts a inserir (ex: lidos de um bundle exportado).
+
+        Returns:
+            IDs efetivamente inseridos.
+        """
+        if not concepts:
+            return []
+
+        now = datetime.now(timezone.utc).isoformat()
+        inserted = []
+        with self._write_lock, self._conn:
+            for concept in concepts:
+                cursor = self._conn.execute(
+                    """
+                    INSERT OR IGNORE INTO concepts
+                        (id, label, essence, variations, chroma_id, created_at, updated_at, normalized_label)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        concept.id, concept.label, concept.essence,
+                        json.dumps(concept.variations or []), concept.id,
+                        concept.created_at or now, concept.updated_at or now,
+                        normalize_label(concept.label)
+                    )
+                )
+                if cursor.rowcount > 0:
+                    inserted.append(concept.id)
+
+            inserted_ids = set(inserted)
+            self._conn.executemany(
+                """
+                INSERT OR IGNORE INTO concept_variations (concept_id, variation, normalized_variation)
+                VALUES (?, ?, ?)
+                """,
+                [
+                    (concept.id, variation, normalize_label(variation))
+                    for concept in concepts if concept.id in inserted_ids
+                    for variation in concept.variations or []
+                ]
+            )
+
+        logger.info(f"{len(inserted)} conceitos importados ({len(concepts) - len(inserted)} ja existiam)")
+        return inserted
+
+    @property
+    def vector_index(self) -> VectorIndex:
+        """Indice vetorial em uso (manutencao offline, ver catalog_maintenance)."""
+        return self._index
+
     def count_concepts(self) -> int:
         """Retorna numero total de conceitos no catalogo."""
-        cursor = self._conn.execute("SELECT COUNT(*) FROM concepts")
+        cursor = self._read_conn().execute("SELECT COUNT(*) FROM concepts")
         return cursor.fetchone()[0]
 
+    def merge_concepts(self, canonical_id: str, duplicate_ids: List[str]) -> Dict[str, int]:
+        """
+        Funde conceitos duplicados num conceito canonico (uma transacao).
+
+        Labels e variations dos duplicados viram variations do canonico,
+        links com ideas sao movidos e os duplicados sao removidos do SQLite
+        e do indice vetorial.
+
+        Args:
+            canonical_id: Conceito que permanece.
+            duplicate_ids: Conceitos absorvidos (canonical_id e ignorado).
+
+        Returns:
+            Dict com merged, variations_added e links_moved.
+
+        Example:
+            >>> catalog.merge_concepts("uuid-cooperacao", ["uuid-colaboracao"])
+            {'merged': 1, 'variations_added': 1, 'links_moved': 3}
+        """
+        duplicate_ids = [cid for cid in dict.fromkeys(duplicate_ids) if cid != canonical_id]
+        if not duplicate_ids:
+            return {"merged": 0, "variations_added": 0, "links_moved": 0}
+
+        placeholders = ",".join("?" for _ in duplicate_ids)
+        with self._write_lock, self._conn:
+            canonical = self._conn.execute(
+                "SELECT label, variations FROM concepts WHERE id = ?", (canonical_id,)
+            ).fetchone()
+            if canonical is None:
+                raise ValueError(f"Conceito canonico nao encontrado: {canonical_id}")
+
+            # Labels e variations dos duplicados (ordem preservada, sem o label canonico)
+            absorbed = [
+                row["label"] for row in self._conn.execute(
+                    f"SELECT label FROM concepts WHERE id IN ({placeholders})", duplicate_ids
+                )
+            ] + [
+                row["variation"] for row in self._conn.execute(
+                    f"SELECT variation FROM concept_variations WHERE concept_id IN ({placeholders}) ORDER BY id",
+                    duplicate_ids
+                )
+            ]
+
+            variations = json.loads(canonical["variations"]) if canonical["variations"] else []
+            new_variations = [
+                v for v in dict.fromkeys(absorbed)
+                if v != canonical["label"] and v not in variations
+            ]
+
+            self._conn.executemany(
+                """
+                INSERT OR IGNORE INTO concept_variations (concept_id, variation, normalized_variation)
+                VALUES (?, ?, ?)
+                """,
+                [(canonical_id, v, normalize_label(v)) for v in new_variations]
+            )
+            self._conn.execute(
+                "UPDATE concepts SET variations = ?, updated_at = ? WHERE id = ?",
+                (
+                    json.dumps(variations + new_variations),
+                    datetime.now(timezone.utc).isoformat(),
+                    canonical_id
+                )
+            )
+
+            # Mover links (ideas ja ligadas ao canonico nao duplicam)
+            before = self._conn.total_changes
+            self._conn.execute(
+                f"""
+                INSERT OR IGNORE INTO idea_concepts (idea_id, concept_id, created_at)
+                SELECT idea_id, ?, created_at FROM idea_concepts
+                WHERE concept_id IN ({placeholders})
+                """,
+                [canonical_id] + duplicate_ids
+            )
+            links_moved = self._conn.total_changes - before
+
+            for table, column in (
+                ("idea_concepts", "concept_id"),
+                ("concept_variations", "concept_id"),
+                ("concepts", "id"),
+            ):
+                cursor = self._conn.execute(
+                    f"DELETE FROM {table} WHERE {column} IN ({placeholders})", duplicate_ids
+                )
+            merged = cursor.rowcount
+
+        try:
+            self._index.delete(duplicate_ids)
+        except Exception as e:
+            logger.warning(f"Erro ao remover duplicados do indice vetorial: {e}")
+
+        logger.info(f"{merged} conceitos fundidos em {canonical_id}")
+        return {"merged": merged, "variations_added": len(new_variations), "links_moved": links_moved}
+
     def delete_concept(self, concept_id: str) -> bool:
         """
         Remove um conceito do catalogo.
@@ -606,30 +1260,30 @@ class ConceptCatalog:
         Returns:
             True se removeu, False se nao existia.
         """
-        # Remover do ChromaDB
+        # Remover do indice vetorial
         try:
-            self._collection.delete(ids=[concept_id])
+            self._index.delete([concept_id])
         except Exception as e:
-            logger.warning(f"Erro ao remover do ChromaDB: {e}")
+            logger.warning(f"Erro ao remover do indice vetorial: {e}")
 
-        # Remover variacoes
-        self._conn.execute(
-            "DELETE FROM concept_variations WHERE concept_id = ?",
-            (concept_id,)
-        )
+        with self._write_lock, self._conn:
+            # Remover variacoes
+            self._conn.execute(
+                "DELETE FROM concept_variations WHERE concept_id = ?",
+                (concept_id,)
+            )
 
-        # Remover links com ideas
-        self._conn.execute(
-            "DELETE FROM idea_concepts WHERE concept_id = ?",
-            (concept_id,)
-        )
+            # Remover links com ideas
+            self._conn.execute(
+                "DELETE FROM idea_concepts WHERE concept_id = ?",
+                (concept_id,)
+            )
 
-        # Remover conceito
-        cursor = self._conn.execute(
-            "DELETE FROM concepts WHERE id = ?",
-            (concept_id,)
-        )
-        self._conn.commit()
+            # Remover conceito
+            cursor = self._conn.execute(
+                "DELETE FROM concepts WHERE id = ?",
+                (concept_id,)
+            )
 
         deleted = cursor.rowcount > 0
         if deleted:
@@ -642,7 +1296,9 @@ class ConceptCatalog:
         Retorna estatisticas do catalogo.
 
         Returns:
-            Dict com contagens de conceitos, variacoes e links.
+            Dict com contagens de conceitos, variacoes e links, e contadores
+            do fast path por label normalizado (label_lookups, label_hits,
+            label_hit_rate).
 
         Example:
             >>> stats = catalog.get_stats()
@@ -651,36 +1307,48 @@ class ConceptCatalog:
         """
         concepts_count = self.count_concepts()
 
-        variations_cursor = self._conn.execute(
+        variations_cursor = self._read_conn().execute(
             "SELECT COUNT(*) FROM concept_variations"
         )
         variations_count = variations_cursor.fetchone()[0]
 
-        links_cursor = self._conn.execute(
+        links_cursor = self._read_conn().execute(
             "SELECT COUNT(*) FROM idea_concepts"
         )
         links_count = links_cursor.fetchone()[0]
 
         # Garantir que count() retorna um int
         try:
-            chroma_count = self._collection.count()
-            if not isinstance(chroma_count, int):
-                chroma_count = 0
+            vector_count = self._index.count()
+            if not isinstance(vector_count, int):
+                vector_count = 0
         except (AttributeError, TypeError):
-            chroma_count = 0
+            vector_count = 0
+
+        with self._label_stats_lock:
+            label_lookups, label_hits = self._label_lookups, self._label_hits
 
         return {
             "concepts": concepts_count,
             "variations": variations_count,
             "idea_links": links_count,
-            "chroma_vectors": chroma_count
+            "chroma_vectors": vector_count,
+            "vector_backend": self.vector_backend,
+            "label_lookups": label_lookups,
+            "label_hits": label_hits,
+            "label_hit_rate": label_hits / label_lookups if label_lookups else 0.0
         }
 
     def close(self) -> None:
         """Fecha conexoes."""
         if hasattr(self, "_conn"):
-            self._conn.close()
-            logger.debug("SQLite connection fechada")
+            with self._readers_lock:
+                for reader in self._readers:
+                    reader.close()
+                self._readers.clear()
+            with self._write_lock:
+                self._conn.close()
+            logger.debug("SQLite connections fechadas")
 
 # Singleton global para acesso facil
 _catalog_instance: Optional[ConceptCatalog] = None
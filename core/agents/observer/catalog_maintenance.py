@@ -0,0 +1,575 @@
+"""
+Manutencao offline do Catalogo de Conceitos.
+
+Operacoes em massa que nao passam por save_concept() (um conceito por
+vez, com busca de similaridade):
+
+- rebuild_index: reconstroi o indice vetorial a partir do SQLite (indice
+  corrompido, troca de modelo ou de backend). Le o SQLite em blocos,
+  gera embeddings em lote numa pool de threads e faz upsert em massa,
+  com checkpoint para retomada.
+- export_bundle / import_bundle: copia compacta do catalogo
+- import_labels: carga de vocabulario semente (com deduplicacao via
+  persist_concepts_batch)
+- consolidate_concepts: funde quase-duplicatas acumuladas (a deduplicacao
+  na insercao compara apenas com o vizinho mais proximo da epoca)
+
+Bundle ({dir}/):
+    manifest.json    formato, modelo, dimensoes, quantidade
+    concepts.jsonl   um Concept.to_dict() por linha (sem chroma_id)
+    vectors.npy      float32 (quantidade x dimensoes); linha i = linha i do JSONL
+
+CLI: scripts/core/catalog_maintenance.py
+
+"""
+
+import json
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .catalog import SIMILARITY_THRESHOLD_SAME, Concept, ConceptCatalog
+from .concept_pipeline import persist_concepts_batch
+from .embeddings import generate_embeddings_batch, get_model_name, normalize_rows, similarity_matrix
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FORMAT = 1
+BUNDLE_MANIFEST = "manifest.json"
+BUNDLE_CONCEPTS = "concepts.jsonl"
+BUNDLE_VECTORS = "vectors.npy"
+
+# progress(processados, total)
+ProgressCallback = Callable[[int, int], None]
+
+def _metadata(concept: Concept) -> Dict[str, Any]:
+    return {"label": concept.label, "essence": concept.essence or ""}
+
+def _report(processed: int, started: float, **extra) -> Dict[str, Any]:
+    seconds = time.perf_counter() - started
+    return {
+        "processed": processed,
+        "seconds": seconds,
+        "per_second": processed / seconds if seconds else 0.0,
+        **extra
+    }
+
+def get_checkpoint_path(catalog: ConceptCatalog) -> Path:
+    """
+    Retorna o checkpoint padrao de rebuild_index ({sqlite_path}.rebuild.json).
+
+    Args:
+        catalog: Catalogo reconstruido.
+
+    Returns:
+        Path do checkpoint.
+    """
+    return Path(f"{catalog.sqlite_path}.rebuild.json")
+
+def rebuild_index(
+    catalog: ConceptCatalog,
+    batch_size: int = 256,
+    workers: int = 2,
+    resume: bool = False,
+    checkpoint_path: Optional[Path] = None,
+    progress: Optional[ProgressCallback] = None
+) -> Dict[str, Any]:
+    """
+    Reconstroi o indice vetorial a partir dos conceitos do SQLite.
+
+    Blocos sao embedados em paralelo (ate 2 x workers em voo) e gravados
+    em ordem; apos cada bloco o ultimo ID gravado vai para o checkpoint.
+    Sem resume, o indice e esvaziado antes de comecar.
+
+    Args:
+        catalog: Catalogo a reconstruir.
+        batch_size: Conceitos por bloco (leitura, embedding e upsert).
+        workers: Threads gerando embeddings.
+        resume: Continua do checkpoint (se existir) sem esvaziar o indice.
+        checkpoint_path: Default: get_checkpoint_path(catalog).
+        progress: Chamado apos cada bloco com (processados, total).
+
+    Returns:
+        Dict com processed, total, resumed_from, seconds e per_second.
+
+    Example:
+        >>> rebuild_index(catalog, batch_size=512, workers=4)
+        {'processed': 12000, 'total': 12000, 'resumed_from': None, ...}
+    """
+    checkpoint_path = Path(checkpoint_path or get_checkpoint_path(catalog))
+    started = time.perf_counter()
+    total = catalog.count_concepts()
+
+    after_id = None
+    processed = 0
+    if resume and checkpoint_path.exists():
+        checkpoint = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+        after_id = checkpoint.get("last_id")
+        processed = checkpoint.get("processed", 0)
+        logger.info(f"Retomando reconstrucao apos {after_id} ({processed}/{total})")
+    else:
+        catalog.vector_index.reset()
+
+    def embed(chunk: List[Concept]) -> np.ndarray:
+        return generate_embeddings_batch([concept.label for concept in chunk], as_numpy=True)
+
+    def write(chunk: List[Concept], vectors: np.ndarray) -> None:
+        nonlocal processed
+        catalog.vector_index.upsert(
+            ids=[concept.id for concept in chunk],
+            embeddings=vectors,
+            metadatas=[_metadata(concept) for concept in chunk]
+        )
+        processed += len(chunk)
+        checkpoint_path.write_text(
+            json.dumps({"last_id": chunk[-1].id, "processed": processed}),
+            encoding="utf-8"
+        )
+        if progress:
+            progress(processed, total)
+
+    chunks = catalog.iter_concepts(chunk_size=batch_size, after_id=after_id)
+
+    # Primeiro bloco na thread atual: carrega o modelo antes da pool
+    first = next(chunks, None)
+    if first:
+        write(first, embed(first))
+
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="catalog-rebuild") as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append((chunk, pool.submit(embed, chunk)))
+                if len(pending) >= 2 * max(1, workers):
+                    done_chunk, future = pending.popleft()
+                    write(done_chunk, future.result())
+            while pending:
+                done_chunk, future = pending.popleft()
+                write(done_chunk, future.result())
+
+    if checkpoint_path.exists():
+        checkpoint_path.unlink()
+
+    report = _report(processed, started, total=total, resumed_from=after_id)
+    logger.info(
+        f"Indice reconstruido: {processed} conceitos em {report['seconds']:.1f}s "
+        f"({report['per_second']:.0f}/s)"
+    )
+    return report
+
+def export_bundle(
+    catalog: ConceptCatalog,
+    bundle_dir: Path,
+    batch_size: int = 1000,
+    progress: Optional[ProgressCallback] = None
+) -> Dict[str, Any]:
+    """
+    Exporta o catalogo (conceitos + vetores) para um bundle.
+
+    Vetores vem do indice vetorial; conceitos sem vetor no indice sao
+    embedados novamente.
+
+    Args:
+        catalog: Catalogo de origem.
+        bundle_dir: Diretorio do bundle (criado se necessario).
+        batch_size: Conceitos por bloco.
+        progress: Chamado apos cada bloco com (exportados, total).
+
+    Returns:
+        Dict com processed, reembedded, seconds e per_second.
+    """
+    bundle_dir = Path(bundle_dir)
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+    total = catalog.count_concepts()
+
+    processed = 0
+    reembedded = 0
+    dims = None
+    vectors_file = None
+    with open(bundle_dir / BUNDLE_CONCEPTS, "w", encoding="utf-8") as concepts_file:
+        for chunk in catalog.iter_concepts(chunk_size=batch_size):
+            # Conceitos criados durante a exportacao ficam de fora
+            chunk = chunk[:total - processed]
+            if not chunk:
+                break
+
+            stored = catalog.vector_index.get_embeddings([concept.id for concept in chunk])
+            missing = [concept for concept in chunk if concept.id not in stored]
+            if missing:
+                stored.update(zip(
+                    [concept.id for concept in missing],
+                    generate_embeddings_batch([concept.label for concept in missing])
+                ))
+                reembedded += len(missing)
+
+            vectors = np.asarray([stored[concept.id] for concept in chunk], dtype=np.float32)
+            if vectors_file is None:
+                dims = vectors.shape[1]
+                vectors_file = np.lib.format.open_memmap(
+                    bundle_dir / BUNDLE_VECTORS, mode="w+", dtype=np.float32, shape=(total, dims)
+                )
+            vectors_file[processed:processed + len(chunk)] = vectors
+
+            for concept in chunk:
+                record = concept.to_dict()
+                record.pop("chroma_id", None)
+                concepts_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+            processed += len(chunk)
+            if progress:
+                progress(processed, total)
+
+    if vectors_file is not None:
+        vectors_file.flush()
+        del vectors_file
+
+    manifest = {
+        "format": BUNDLE_FORMAT,
+        "model": get_model_name(),
+        "dims": dims,
+        # Conceitos removidos durante a exportacao: linhas finais ficam zeradas
+        "count": processed,
+        "exported_at": datetime.now(timezone.utc).isoformat()
+    }
+    (bundle_dir / BUNDLE_MANIFEST).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+    report = _report(processed, started, reembedded=reembedded)
+    logger.info(f"Catalogo exportado para {bundle_dir}: {processed} conceitos")
+    return report
+
+def _read_bundle_concepts(path: Path) -> Iterable[Concept]:
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                yield Concept(
+                    id=record["id"],
+                    label=record["label"],
+                    essence=record.get("essence"),
+                    variations=record.get("variations") or [],
+                    created_at=record.get("created_at"),
+                    updated_at=record.get("updated_at")
+                )
+
+def import_bundle(
+    catalog: ConceptCatalog,
+    bundle_dir: Path,
+    batch_size: int = 1000,
+    reembed: bool = False,
+    progress: Optional[ProgressCallback] = None
+) -> Dict[str, Any]:
+    """
+    Importa um bundle exportado (merge por ID; IDs existentes sao ignorados).
+
+    Vetores do bundle sao reaproveitados quando o modelo e o mesmo do
+    ambiente atual; caso contrario (ou com reembed) os labels sao
+    embedados novamente.
+
+    Args:
+        catalog: Catalogo de destino.
+        bundle_dir: Diretorio do bundle.
+        batch_size: Conceitos por bloco.
+        reembed: Ignora os vetores do bundle.
+        progress: Chamado apos cada bloco com (lidos, total).
+
+    Returns:
+        Dict com processed, imported, skipped, reembedded, seconds e per_second.
+
+    Raises:
+        ValueError: Se o formato do bundle nao for suportado.
+    """
+    bundle_dir = Path(bundle_dir)
+    manifest = json.loads((bundle_dir / BUNDLE_MANIFEST).read_text(encoding="utf-8"))
+    if manifest.get("format") != BUNDLE_FORMAT:
+        raise ValueError(f"Formato de bundle nao suportado: {manifest.get('format')}")
+
+    total = manifest.get("count", 0)
+    vectors = None
+    if not reembed and total:
+        if manifest.get("model") == get_model_name():
+            vectors = np.load(bundle_dir / BUNDLE_VECTORS, mmap_mode="r")
+        else:
+            logger.warning(
+                f"Bundle gerado com {manifest.get('model')}, modelo atual {get_model_name()}: "
+                f"embeddings serao regenerados"
+            )
+
+    started = time.perf_counter()
+    processed = imported = reembedded = 0
+    chunk: List[Concept] = []
+
+    def flush(chunk: List[Concept]) -> None:
+        nonlocal processed, imported, reembedded
+        inserted = set(catalog.import_concepts(chunk))
+        new = [(offset, concept) for offset, concept in enumerate(chunk) if concept.id in inserted]
+        if new:
+            if vectors is not None:
+                chunk_vectors = [vectors[processed + offset].tolist() for offset, _ in new]
+            else:
+                chunk_vectors = generate_embeddings_batch([concept.label for _, concept in new])
+                reembedded += len(new)
+            catalog.vector_index.upsert(
+                ids=[concept.id for _, concept in new],
+                embeddings=chunk_vectors,
+                metadatas=[_metadata(concept) for _, concept in new]
+            )
+        processed += len(chunk)
+        imported += len(new)
+        if progress:
+            progress(processed, total)
+
+    for concept in _read_bundle_concepts(bundle_dir / BUNDLE_CONCEPTS):
+        chunk.append(concept)
+        if len(chunk) >= batch_size:
+            flush(chunk)
+            chunk = []
+    if chunk:
+        flush(chunk)
+
+    report = _report(processed, started, imported=imported, skipped=processed - imported, reembedded=reembedded)
+    logger.info(f"Bundle {bundle_dir} importado: {imported} novos, {processed - imported} ja existiam")
+    return report
+
+def import_labels(
+    catalog: ConceptCatalog,
+    labels: Iterable[str],
+    batch_size: int = 256,
+    progress: Optional[ProgressCallback] = None
+) -> Dict[str, Any]:
+    """
+    Carrega vocabulario semente (um label por item) com deduplicacao.
+
+    Cada bloco passa por persist_concepts_batch: labels ja conhecidos ou
+    similares viram variations em vez de conceitos novos.
+
+    Args:
+        catalog: Catalogo de destino.
+        labels: Labels (linhas vazias sao ignoradas).
+        batch_size: Labels por bloco.
+        progress: Chamado apos cada bloco com (processados, 0).
+
+    Returns:
+        Dict com processed, new_count, merged_count, seconds e per_second.
+    """
+    started = time.perf_counter()
+    processed = new_count = merged_count = 0
+    chunk: List[str] = []
+
+    def flush(chunk: List[str]) -> None:
+        nonlocal processed, new_count, merged_count
+        result = persist_concepts_batch(chunk, catalog=catalog)
+        processed += result["total"]
+        new_count += result["new_count"]
+        merged_count += result["merged_count"]
+        if progress:
+            progress(processed, 0)
+
+    for label in labels:
+        label = label.strip()
+        if label:
+            chunk.append(label)
+        if len(chunk) >= batch_size:
+            flush(chunk)
+            chunk = []
+    if chunk:
+        flush(chunk)
+
+    return _report(processed, started, new_count=new_count, merged_count=merged_count)
+
+def _load_vectors(catalog: ConceptCatalog, batch_size: int) -> Tuple[List[Concept], np.ndarray]:
+    """Carrega conceitos e matriz normalizada (vetores ausentes no indice sao embedados)."""
+    concepts: List[Concept] = []
+    blocks = []
+    for chunk in catalog.iter_concepts(chunk_size=batch_size):
+        stored = catalog.vector_index.get_embeddings([concept.id for concept in chunk])
+        missing = [concept for concept in chunk if concept.id not in stored]
+        if missing:
+            stored.update(zip(
+                [concept.id for concept in missing],
+                generate_embeddings_batch([concept.label for concept in missing])
+            ))
+        concepts.extend(chunk)
+        blocks.append(np.asarray([stored[concept.id] for concept in chunk], dtype=np.float32))
+
+    if not blocks:
+        return concepts, np.zeros((0, 0), dtype=np.float32)
+
+    return concepts, normalize_rows(np.vstack(blocks))
+
+def find_duplicate_clusters(matrix: np.ndarray, threshold: float, block_size: int = 1024) -> List[List[int]]:
+    """
+    Agrupa linhas com similaridade cosseno >= threshold (single-linkage).
+
+    Os clusters sao componentes conexos: A~B e B~C juntam A, B e C mesmo
+    que A e C fiquem abaixo do threshold. Servem como candidatos;
+    consolidate_concepts os reparte em grupos centrados no canonico
+    (ver split_by_canonical).
+
+    A matriz de similaridade e calculada em blocos (block_size x
+    block_size), entao a memoria extra fica limitada a um bloco mesmo com
+    dezenas de milhares de conceitos.
+
+    Args:
+        matrix: Vetores normalizados (n x dims).
+        threshold: Similaridade minima para ligar dois conceitos.
+        block_size: Lado do bloco.
+
+    Returns:
+        Clusters com 2+ indices de linha, cada um em ordem crescente.
+
+    Example:
+        >>> find_duplicate_clusters(np.array([[1, 0], [0.99, 0.1], [0, 1]]), 0.8)
+        [[0, 1]]
+    """
+    n = matrix.shape[0]
+    parent = list(range(n))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for row_start in range(0, n, block_size):
+        rows = matrix[row_start:row_start + block_size]
+        for col_start in range(row_start, n, block_size):
+            tile = similarity_matrix(rows, matrix[col_start:col_start + block_size])
+            pairs_i, pairs_j = np.nonzero(tile >= threshold)
+            if col_start == row_start:
+                # Bloco diagonal: apenas pares i < j
+                upper = pairs_i < pairs_j
+                pairs_i, pairs_j = pairs_i[upper], pairs_j[upper]
+            for i, j in zip(pairs_i, pairs_j):
+                root_i, root_j = find(row_start + int(i)), find(col_start + int(j))
+                if root_i != root_j:
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    clusters: Dict[int, List[int]] = {}
+    for i in range(n):
+        clusters.setdefault(find(i), []).append(i)
+    return [members for members in clusters.values() if len(members) > 1]
+
+def split_by_canonical(
+    members: Sequence[int],
+    matrix: np.ndarray,
+    threshold: float
+) -> List[Tuple[int, List[int]]]:
+    """
+    Reparte um cluster candidato em grupos centrados no canonico.
+
+    O primeiro membro restante (em ordem de prioridade) vira canonico e
+    absorve apenas os membros com similaridade >= threshold a ele; os
+    demais seguem para a proxima rodada, com o proprio canonico. Evita o
+    encadeamento do single-linkage (A~B~C sem A~C).
+
+    Args:
+        members: Indices de linha do cluster, em ordem de prioridade para
+            canonico (ex: mais antigo primeiro).
+        matrix: Vetores normalizados (n x dims).
+        threshold: Similaridade minima ao canonico.
+
+    Returns:
+        Pares (canonico, duplicados) apenas para grupos com 2+ membros.
+
+    Example:
+        >>> split_by_canonical([0, 1, 2], np.array([[1, 0], [0.8, 0.6], [0.28, 0.96]]), 0.8)
+        [(0, [1])]
+    """
+    remaining = list(members)
+    groups = []
+    while len(remaining) > 1:
+        canonical, candidates = remaining[0], remaining[1:]
+        similarities = matrix[candidates] @ matrix[canonical]
+        duplicates = [i for i, similarity in zip(candidates, similarities) if similarity >= threshold]
+        if duplicates:
+            groups.append((canonical, duplicates))
+        taken = set(duplicates)
+        remaining = [i for i in candidates if i not in taken]
+    return groups
+
+def consolidate_concepts(
+    catalog: ConceptCatalog,
+    threshold: float = SIMILARITY_THRESHOLD_SAME,
+    dry_run: bool = False,
+    block_size: int = 1024,
+    batch_size: int = 1000
+) -> Dict[str, Any]:
+    """
+    Funde clusters de quase-duplicatas num conceito canonico.
+
+    O canonico de cada cluster e o conceito mais antigo (created_at, depois
+    ID), como na deduplicacao por insercao. So sao fundidos conceitos com
+    similaridade >= threshold ao canonico: cadeias A~B~C sem A~C ficam
+    separadas (C pode formar outro grupo com seu proprio canonico). Cada
+    grupo e fundido numa transacao (ConceptCatalog.merge_concepts).
+
+    Args:
+        catalog: Catalogo a consolidar.
+        threshold: Similaridade minima. Default: SIMILARITY_THRESHOLD_SAME.
+        dry_run: Apenas relata os clusters, sem alterar o catalogo.
+        block_size: Lado do bloco da matriz de similaridade.
+        batch_size: Conceitos por bloco na leitura do SQLite.
+
+    Returns:
+        Dict com concepts, clusters (canonical, duplicates com similarity
+        ao canonico), merged, variations_added, links_moved, dry_run e
+        seconds.
+
+    Example:
+        >>> report = consolidate_concepts(catalog, dry_run=True)
+        >>> report["clusters"][0]["canonical"]["label"]
+        'Cooperacao'
+    """
+    started = time.perf_counter()
+    concepts, matrix = _load_vectors(catalog, batch_size)
+    clusters = find_duplicate_clusters(matrix, threshold, block_size=block_size)
+
+    report: Dict[str, Any] = {
+        "concepts": len(concepts),
+        "clusters": [],
+        "merged": 0,
+        "variations_added": 0,
+        "links_moved": 0,
+        "dry_run": dry_run
+    }
+    groups = [
+        group
+        for members in clusters
+        for group in split_by_canonical(
+            sorted(members, key=lambda i: (concepts[i].created_at or "", concepts[i].id)),
+            matrix,
+            threshold
+        )
+    ]
+    for canonical_row, duplicate_rows in groups:
+        similarities = matrix[duplicate_rows] @ matrix[canonical_row]
+
+        canonical = concepts[canonical_row]
+        report["clusters"].append({
+            "canonical": {"id": canonical.id, "label": canonical.label},
+            "duplicates": [
+                {"id": concepts[i].id, "label": concepts[i].label, "similarity": float(similarity)}
+                for i, similarity in zip(duplicate_rows, similarities)
+            ]
+        })
+
+        if not dry_run:
+            result = catalog.merge_concepts(canonical.id, [concepts[i].id for i in duplicate_rows])
+            for key in ("merged", "variations_added", "links_moved"):
+                report[key] += result[key]
+
+    if dry_run:
+        report["merged"] = sum(len(cluster["duplicates"]) for cluster in report["clusters"])
+
+    report["seconds"] = time.perf_counter() - started
+    logger.info(
+        f"Consolidacao{' (dry-run)' if dry_run else ''}: {len(clusters)} clusters, "
+        f"{report['merged']} conceitos fundidos de {len(concepts)}"
+    )
+    return report
@@ -7,20 +7,28 @@ e persistência no catálogo (ChromaDB + SQLite).
 Fluxo:
 1. extract_concepts() retorna List[str] de conceitos
 2. persist_concepts() processa cada conceito:
-   - Gera embedding
-   - Salva no catálogo (com deduplicação automática)
+   - Label já conhecido (normalizado) resolve direto, sem embedding
+   - Gera embedding (uma única vez por conceito)
+   - Busca similar pelo vetor (find_similar_by_vector)
+   - Salva no catálogo reaproveitando vetor e match (sem nova busca)
    - Opcionalmente linka a uma Idea
+3. persist_concepts_batch() faz o mesmo para o lote inteiro: embeddings
+   em lote, uma query multi-vetor, dedup intra-lote via NumPy e inserção
+   dos novos conceitos em uma única escrita
 
 """
 
 import logging
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 
-from .embeddings import generate_embedding
+import numpy as np
+
+from .embeddings import generate_embedding, generate_embeddings_batch, normalize_rows, similarity_matrix
 from .catalog import (
     ConceptCatalog,
     get_concept_catalog,
+    normalize_label,
     SIMILARITY_THRESHOLD_SAME
 )
 
@@ -56,8 +64,9 @@ def persist_concepts(
 
     Para cada conceito:
     1. Gera embedding via sentence-transformers
-    2. Chama catalog.save_concept() (deduplicação automática)
-    3. Se idea_id fornecido, cria link N:N
+    2. Busca conceito similar pelo vetor (uma query no ChromaDB)
+    3. Chama catalog.save_concept() com embedding e match já calculados
+    4. Se idea_id fornecido, cria link N:N
 
     Args:
         concepts: Lista de conceitos extraídos (strings).
@@ -121,9 +130,29 @@ def _persist_single_concept(
     Returns:
         ConceptPersistResult com informações da persistência.
     """
-    # 1. Verificar se conceito similar já existe
-    similar = catalog.find_similar_concepts(
-        query=concept_label,
+    # 0. Fast path: label (ou variation) já conhecido, sem modelo nem HNSW
+    existing = catalog.find_concept_by_label(concept_label)
+    if existing is not None:
+        # Sem escrita quando o texto ja e o label ou uma variation registrada
+        if concept_label != existing.label and concept_label not in existing.variations:
+            catalog.add_variation(existing.id, concept_label)
+        if idea_id:
+            catalog.link_idea_concept(idea_id, existing.id)
+        logger.debug(f"Conceito '{concept_label}' resolvido pelo label normalizado ({existing.id})")
+        return ConceptPersistResult(
+            concept_id=existing.id,
+            label=concept_label,
+            is_new=False,
+            similarity=1.0,
+            merged_with=existing.label
+        )
+
+    # 1. Gerar embedding (único forward pass do modelo para este conceito)
+    embedding = generate_embedding(concept_label)
+
+    # 2. Verificar se conceito similar já existe
+    similar = catalog.find_similar_by_vector(
+        embedding,
         top_k=1,
         threshold=SIMILARITY_THRESHOLD_SAME
     )
@@ -132,14 +161,12 @@ def _persist_single_concept(
     similarity = similar[0].similarity if similar else None
     merged_with = similar[0].concept.label if similar else None
 
-    # 2. Gerar embedding
-    embedding = generate_embedding(concept_label)
-
-    # 3. Salvar no catálogo (save_concept já faz deduplicação)
+    # 3. Salvar no catálogo reaproveitando vetor e resultado da busca
     concept_id = catalog.save_concept(
         label=concept_label,
         essence=None,  # Pode ser extraído pelo LLM no futuro
-        embedding=embedding
+        embedding=embedding,
+        known_match=similar[0] if similar else None
     )
 
     # 4. Linkar à Idea (se fornecido)
@@ -175,6 +202,18 @@ def persist_concepts_batch(
     Útil para integração com process_turn() onde queremos
     apenas o resumo, não detalhes de cada conceito.
 
+    Processa o lote inteiro de uma vez:
+    0. Labels já conhecidos (find_concepts_by_labels) e repetições no lote
+       são resolvidos sem embedding
+    1. Embeddings de todos os labels com generate_embeddings_batch()
+    2. Uma única query multi-vetor no ChromaDB (match no catálogo)
+    3. Duplicatas dentro do lote resolvidas por matriz de similaridade
+       NumPy (um conceito se funde ao anterior do lote mais similar, se
+       >= SIMILARITY_THRESHOLD_SAME e mais similar que o match do catálogo)
+    4. Conceitos novos em um collection.add e um executemany no SQLite
+
+    O resultado equivale a chamar persist_concepts() conceito a conceito.
+
     Args:
         concepts: Lista de conceitos.
         idea_id: ID da Idea (opcional).
@@ -192,13 +231,129 @@ def persist_concepts_batch(
         >>> print(result["new_count"])
         1
     """
-    results = persist_concepts(
-        concepts=concepts,
-        idea_id=idea_id,
-        catalog=catalog
+    if not concepts:
+        logger.debug("Nenhum conceito para persistir")
+        return {"concept_ids": [], "new_count": 0, "merged_count": 0, "total": 0, "details": []}
+
+    if catalog is None:
+        catalog = get_concept_catalog()
+
+    results: List[Optional[ConceptPersistResult]] = [None] * len(concepts)
+
+    # 0. Fast path: labels já conhecidos (label ou variation normalizados)
+    #    e repetições dentro do lote não passam pelo modelo nem pelo HNSW
+    known = catalog.find_concepts_by_labels(concepts)
+    pending: List[int] = []
+    first_by_label: Dict[str, int] = {}
+    label_twins: Dict[int, int] = {}
+    already_stored: Set[int] = set()
+    for index, label in enumerate(concepts):
+        if known[index] is not None:
+            if label in known[index].variations:
+                already_stored.add(index)
+            results[index] = ConceptPersistResult(
+                concept_id=known[index].id,
+                label=label,
+                is_new=False,
+                similarity=1.0,
+                merged_with=known[index].label
+            )
+            continue
+        key = normalize_label(label)
+        if key in first_by_label:
+            label_twins[index] = first_by_label[key]
+        else:
+            first_by_label[key] = index
+            pending.append(index)
+
+    # 1-2. Um forward pass em lote e uma query multi-vetor
+    embeddings = generate_embeddings_batch([concepts[index] for index in pending], as_numpy=True)
+    catalog_matches = catalog.find_similar_by_vectors(
+        embeddings,
+        top_k=1,
+        threshold=SIMILARITY_THRESHOLD_SAME
     )
+    batch_similarity = similarity_matrix(normalize_rows(embeddings)) if pending else None
+
+    # 3. Resolver cada conceito: match no catálogo, conceito anterior do lote
+    #    ou novo. merged_into guarda o índice do conceito novo do lote.
+    new_positions: List[int] = []
+    merged_into: Dict[int, int] = {}
+
+    for position, index in enumerate(pending):
+        label = concepts[index]
+        match = catalog_matches[position][0] if catalog_matches[position] else None
+        best_similarity = match.similarity if match else 0.0
+
+        batch_target = None
+        if new_positions:
+            candidates = batch_similarity[position, new_positions]
+            best = int(np.argmax(candidates))
+            candidate_similarity = float(min(1.0, candidates[best]))
+            if candidate_similarity >= SIMILARITY_THRESHOLD_SAME and candidate_similarity > best_similarity:
+                batch_target = pending[new_positions[best]]
+                best_similarity = candidate_similarity
+
+        if batch_target is not None:
+            merged_into[index] = batch_target
+            results[index] = ConceptPersistResult(
+                concept_id="",  # preenchido após add_concepts
+                label=label,
+                is_new=False,
+                similarity=best_similarity,
+                merged_with=concepts[batch_target]
+            )
+        elif match is not None:
+            results[index] = ConceptPersistResult(
+                concept_id=match.concept.id,
+                label=label,
+                is_new=False,
+                similarity=match.similarity,
+                merged_with=match.concept.label
+            )
+        else:
+            new_positions.append(position)
+
+    # 4. Conceitos novos: um add no ChromaDB + uma transação no SQLite
+    new_indexes = [pending[position] for position in new_positions]
+    new_ids = catalog.add_concepts([
+        (concepts[pending[position]], None, embeddings[position]) for position in new_positions
+    ])
+    for index, concept_id in zip(new_indexes, new_ids):
+        results[index] = ConceptPersistResult(
+            concept_id=concept_id,
+            label=concepts[index],
+            is_new=True
+        )
+    for index, target in merged_into.items():
+        results[index].concept_id = results[target].concept_id
+
+    # Repetições do lote seguem o conceito da primeira ocorrência
+    for index, twin in label_twins.items():
+        twin_result = results[twin]
+        results[index] = ConceptPersistResult(
+            concept_id=twin_result.concept_id,
+            label=concepts[index],
+            is_new=False,
+            similarity=1.0,
+            merged_with=twin_result.label if twin_result.is_new else twin_result.merged_with
+        )
 
-    new_count = sum(1 for r in results if r.is_new)
+    # Variations dos conceitos merged (no catálogo ou no próprio lote);
+    # variations já registradas não geram escrita
+    for index, result in enumerate(results):
+        if not result.is_new and result.label != result.merged_with and index not in already_stored:
+            catalog.add_variation(result.concept_id, result.label)
+
+    if idea_id:
+        catalog.link_idea_concepts(idea_id, [r.concept_id for r in results])
+
+    new_count = len(new_indexes)
+
+    logger.info(
+        f"Conceitos persistidos em lote: {len(results)} total "
+        f"({new_count} novos, {len(results) - new_count} merged)"
+    )
 
     return {
         "concept_ids": [r.concept_id for r in results],
@@ -0,0 +1,315 @@
+"""
+Cache de embeddings em dois niveis para o Observador.
+
+Labels de conceitos se repetem muito entre sessoes ("cooperacao", "LLMs"),
+e cada forward pass do SentenceTransformer custa dezenas de ms. Este modulo
+guarda vetores por conteudo:
+
+- Nivel 1: LRU em memoria (OrderedDict), limitado por numero de vetores
+- Nivel 2: SQLite (modo WAL) com vetores float32 em BLOB, limitado por
+  bytes; ao exceder o limite, remove os menos acessados recentemente
+
+Chave: sha256(modelo + texto normalizado). Normalizacao (NFC + espacos
+colapsados) nao altera o resultado do modelo, entao o vetor em cache e o
+mesmo que o modelo geraria.
+
+Contadores (memory_hits, disk_hits, misses, evictions) em get_stats().
+
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Limites padrao: ~4k vetores em memoria (~6MB a 384 dims) e 256MB em disco
+DEFAULT_MAX_MEMORY_ITEMS = 4096
+DEFAULT_MAX_DISK_BYTES = 256 * 1024 * 1024
+
+# Apos evictar, o disco fica nesta fracao do limite (evita evictar a cada put)
+_EVICTION_TARGET_RATIO = 0.9
+
+CACHE_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    dims INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    last_access REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_embeddings_last_access
+    ON embeddings(last_access);
+"""
+
+def normalize_text(text: str) -> str:
+    """
+    Normaliza texto para chave de cache (NFC + espacos colapsados).
+
+    Args:
+        text: Texto original.
+
+    Returns:
+        Texto normalizado (o mesmo enviado ao modelo).
+
+    Example:
+        >>> normalize_text("  cooperacao   entre agentes ")
+        'cooperacao entre agentes'
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+def make_cache_key(model_name: str, text: str) -> str:
+    """
+    Calcula chave de cache para (modelo, texto normalizado).
+
+    Args:
+        model_name: Nome do modelo de embeddings.
+        text: Texto ja normalizado.
+
+    Returns:
+        Hash sha256 hexadecimal.
+    """
+    return hashlib.sha256(f"{model_name}\0{text}".encode("utf-8")).hexdigest()
+
+class EmbeddingCache:
+    """
+    Cache de embeddings com LRU em memoria e armazenamento SQLite em disco.
+
+    Thread-safe; varios processos podem compartilhar o mesmo arquivo (WAL).
+
+    Attributes:
+        db_path: Arquivo SQLite do nivel 2 (None = apenas memoria).
+        max_memory_items: Maximo de vetores no LRU em memoria.
+        max_disk_bytes: Maximo de bytes de vetores em disco.
+
+    Example:
+        >>> cache = EmbeddingCache(Path("data/embedding_cache.db"))
+        >>> cache.put_many("all-MiniLM-L6-v2", [("cooperacao", vector)])
+        >>> cache.get_many("all-MiniLM-L6-v2", ["cooperacao"])[0] is not None
+        True
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        max_memory_items: int = DEFAULT_MAX_MEMORY_ITEMS,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES
+    ):
+        self.db_path = Path(db_path) if db_path is not None else None
+        self.max_memory_items = max_memory_items
+        self.max_disk_bytes = max_disk_bytes
+
+        self._lock = threading.RLock()
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_bytes = 0
+        if self.db_path is not None:
+            self._conn = self._open(self.db_path)
+            self._disk_bytes = self._count_disk_bytes()
+
+    @staticmethod
+    def _open(db_path: Path) -> sqlite3.Connection:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None, timeout=5.0)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.executescript(CACHE_SCHEMA_SQL)
+        return conn
+
+    def _count_disk_bytes(self) -> int:
+        row = self._conn.execute("SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings").fetchone()
+        return row[0]
+
+    def close(self) -> None:
+        """Fecha a conexao SQLite."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        """Insere no LRU em memoria, evictando o menos recente."""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def get_many(self, model_name: str, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """
+        Busca vetores em cache (memoria, depois disco).
+
+        Args:
+            model_name: Nome do modelo de embeddings.
+            texts: Textos ja normalizados.
+
+        Returns:
+            Lista alinhada com texts: vetor float32 ou None (miss).
+        """
+        keys = [make_cache_key(model_name, text) for text in texts]
+        results: List[Optional[np.ndarray]] = [None] * len(keys)
+
+        with self._lock:
+            disk_lookup: Dict[str, List[int]] = {}
+            for index, key in enumerate(keys):
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    results[index] = vector
+                else:
+                    disk_lookup.setdefault(key, []).append(index)
+
+            if disk_lookup and self._conn is not None:
+                found = self._load_from_disk(list(disk_lookup))
+                for key, vector in found.items():
+                    self._remember(key, vector)
+                    for index in disk_lookup.pop(key):
+                        results[index] = vector
+                        self._stats["disk_hits"] += 1
+
+            self._stats["misses"] += sum(len(indexes) for indexes in disk_lookup.values())
+
+        return results
+
+    def get(self, model_name: str, text: str) -> Optional[np.ndarray]:
+        """
+        Busca um vetor em cache.
+
+        Args:
+            model_name: Nome do modelo de embeddings.
+            text: Texto ja normalizado.
+
+        Returns:
+            Vetor float32 ou None.
+        """
+        return self.get_many(model_name, [text])[0]
+
+    def _load_from_disk(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        found: Dict[str, np.ndarray] = {}
+        # Limite de variaveis por statement do SQLite
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+            ).fetchall()
+            for key, blob in rows:
+                found[key] = np.frombuffer(blob, dtype=np.float32)
+        if found:
+            placeholders = ",".join("?" * len(found))
+            self._conn.execute(
+                f"UPDATE embeddings SET last_access = ? WHERE key IN ({placeholders})",
+                [time.time(), *found]
+            )
+        return found
+
+    def put_many(self, model_name: str, items: Sequence[Tuple[str, Any]]) -> None:
+        """
+        Armazena vetores nos dois niveis.
+
+        Args:
+            model_name: Nome do modelo de embeddings.
+            items: Pares (texto normalizado, vetor).
+        """
+        rows = []
+        with self._lock:
+            for text, vector in items:
+                key = make_cache_key(model_name, text)
+                array = np.asarray(vector, dtype=np.float32)
+                self._remember(key, array)
+                rows.append((key, model_name, array.shape[0], array.tobytes(), time.time()))
+
+            if not rows or self._conn is None:
+                return
+
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, model, dims, vector, last_access) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+
+            self._disk_bytes += sum(len(row[3]) for row in rows)
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict_disk()
+
+    def put(self, model_name: str, text: str, vector: Any) -> None:
+        """
+        Armazena um vetor nos dois niveis.
+
+        Args:
+            model_name: Nome do modelo de embeddings.
+            text: Texto ja normalizado.
+            vector: Vetor (lista ou array).
+        """
+        self.put_many(model_name, [(text, vector)])
+
+    def _evict_disk(self) -> None:
+        """Remove os vetores acessados ha mais tempo ate caber no limite."""
+        # Recontar: outros processos podem ter inserido ou evictado
+        self._disk_bytes = self._count_disk_bytes()
+        excess = self._disk_bytes - int(self.max_disk_bytes * _EVICTION_TARGET_RATIO)
+        if excess <= 0:
+            return
+
+        freed = 0
+        victims = []
+        for key, size in self._conn.execute(
+            "SELECT key, LENGTH(vector) FROM embeddings ORDER BY last_access"
+        ):
+            victims.append(key)
+            freed += size
+            if freed >= excess:
+                break
+
+        for start in range(0, len(victims), 500):
+            chunk = victims[start:start + 500]
+            self._conn.execute(
+                f"DELETE FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})", chunk
+            )
+        self._disk_bytes -= freed
+        self._stats["evictions"] += len(victims)
+        logger.debug(f"Cache de embeddings: {len(victims)} vetores removidos do disco")
+
+    def clear(self) -> None:
+        """Esvazia os dois niveis e zera contadores."""
+        with self._lock:
+            self._memory.clear()
+            self._stats = {name: 0 for name in self._stats}
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM embeddings")
+                self._disk_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna contadores do cache.
+
+        Returns:
+            Dict com memory_hits, disk_hits, misses, evictions, hit_rate,
+            memory_items, disk_bytes e disk_path.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+            stats["hit_rate"] = (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+            stats["memory_items"] = len(self._memory)
+            stats["disk_bytes"] = self._disk_bytes
+            stats["disk_path"] = str(self.db_path) if self.db_path is not None else None
+        return stats
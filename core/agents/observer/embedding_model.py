@@ -0,0 +1,256 @@
+"""
+Gerenciador do modelo de embeddings do Observador.
+
+O SentenceTransformer leva segundos para carregar e era carregado no
+primeiro uso, geralmente dentro da primeira thread de background do
+Observador; duas threads concorrentes podiam carregar o modelo duas vezes.
+EmbeddingModelManager centraliza o carregamento:
+
+- get() com double-checked lock: um unico carregamento mesmo com varias
+  threads disputando o primeiro uso
+- warmup(): carregamento explicito (em background por padrao), chamado no
+  inicio da aplicacao (Streamlit, CLI) antes do primeiro turno
+- Modo pre-carregado (OBSERVER_EMBEDDING_PRELOAD): warmup automatico ao
+  criar o grafo multi-agente, para qualquer ponto de entrada
+
+Configuracao por ambiente (from_env):
+    - OBSERVER_EMBEDDING_MODEL_PATH: diretorio local do modelo (evita
+      depender do layout do cache do Hugging Face Hub)
+    - OBSERVER_EMBEDDING_DEVICE: "cpu", "cuda", "mps" (default: automatico)
+    - OBSERVER_EMBEDDING_BATCH_SIZE: lote do encode (default: 32)
+    - OBSERVER_EMBEDDING_PRELOAD: "true" ativa o modo pre-carregado
+
+"""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 32
+
+# Texto curto codificado no warmup (inicializa kernels/tokenizer)
+_WARMUP_TEXT = "warmup"
+
+def _load_sentence_transformer(source: str, device: Optional[str]) -> Any:
+    """Loader padrao: SentenceTransformer de nome ou diretorio local."""
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(source, device=device)
+
+def is_preload_enabled() -> bool:
+    """
+    Indica se o modo pre-carregado esta ativo (OBSERVER_EMBEDDING_PRELOAD).
+
+    Returns:
+        True para "1", "true", "yes" ou "on".
+    """
+    return os.getenv("OBSERVER_EMBEDDING_PRELOAD", "").strip().lower() in ("1", "true", "yes", "on")
+
+class EmbeddingModelManager:
+    """
+    Carregamento unico e thread-safe do modelo de embeddings.
+
+    Args:
+        model_name: Nome do modelo no Hugging Face Hub.
+        model_path: Diretorio local com o modelo; usado no lugar do nome
+            quando existe.
+        device: Dispositivo do modelo (None = escolha do sentence-transformers).
+        batch_size: Tamanho do lote passado ao encode.
+        loader: Funcao (source, device) -> modelo; default carrega
+            SentenceTransformer (injetavel em testes).
+
+    Example:
+        >>> manager = EmbeddingModelManager(device="cpu", batch_size=64)
+        >>> manager.warmup()  # thread em background
+        >>> vectors = manager.encode(["cooperacao", "LLMs"])
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        model_path: Optional[str] = None,
+        device: Optional[str] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        loader: Optional[Callable[[str, Optional[str]], Any]] = None
+    ):
+        self.model_name = model_name
+        self.model_path = model_path
+        self.device = device
+        self.batch_size = max(1, int(batch_size))
+        self._loader = loader or _load_sentence_transformer
+
+        self._model = None
+        self._lock = threading.Lock()
+        self._loaded = threading.Event()
+        self._warmup_thread: Optional[threading.Thread] = None
+        self._load_seconds: Optional[float] = None
+        self._load_count = 0
+        self._last_error: Optional[str] = None
+
+    @classmethod
+    def from_env(cls, model_name: str, **kwargs) -> "EmbeddingModelManager":
+        """
+        Cria gerenciador configurado pelas variaveis OBSERVER_EMBEDDING_*.
+
+        Args:
+            model_name: Nome do modelo no Hugging Face Hub.
+            **kwargs: Sobrescrevem os valores do ambiente (ex: loader).
+
+        Returns:
+            EmbeddingModelManager configurado.
+        """
+        batch_size = os.getenv("OBSERVER_EMBEDDING_BATCH_SIZE")
+        settings = {
+            "model_path": os.getenv("OBSERVER_EMBEDDING_MODEL_PATH") or None,
+            "device": os.getenv("OBSERVER_EMBEDDING_DEVICE") or None,
+            "batch_size": int(batch_size) if batch_size else DEFAULT_BATCH_SIZE,
+        }
+        settings.update(kwargs)
+        return cls(model_name, **settings)
+
+    @property
+    def source(self) -> str:
+        """Diretorio local (se existir) ou nome do modelo no Hub."""
+        if self.model_path:
+            if Path(self.model_path).is_dir():
+                return self.model_path
+            logger.warning(
+                f"Diretorio do modelo nao encontrado ({self.model_path}); usando {self.model_name}"
+            )
+        return self.model_name
+
+    @property
+    def identity(self) -> str:
+        """
+        Identifica o modelo efetivamente carregado (chave de cache e manifesto).
+
+        Nome do Hub quando o modelo vem do Hub; caminho absoluto do diretorio
+        local quando OBSERVER_EMBEDDING_MODEL_PATH aponta para um modelo
+        existente, para que vetores de modelos diferentes nunca se misturem.
+        """
+        if self.model_path and Path(self.model_path).is_dir():
+            return str(Path(self.model_path).resolve())
+        return self.model_name
+
+    @property
+    def is_loaded(self) -> bool:
+        """True se o modelo ja foi carregado."""
+        return self._loaded.is_set()
+
+    def get(self) -> Any:
+        """
+        Retorna o modelo, carregando-o na primeira chamada.
+
+        Threads que chegam durante o carregamento aguardam o lock e recebem
+        a mesma instancia.
+
+        Returns:
+            Modelo com metodo encode().
+        """
+        if self._model is not None:
+            return self._model
+
+        with self._lock:
+            if self._model is None:
+                source = self.source
+                logger.info(f"Carregando modelo de embeddings: {source} (device={self.device or 'auto'})")
+                start = time.perf_counter()
+                try:
+                    model = self._loader(source, self.device)
+                except Exception as e:
+                    self._last_error = str(e)
+                    raise
+                self._load_seconds = time.perf_counter() - start
+                self._load_count += 1
+                self._last_error = None
+                self._model = model
+                self._loaded.set()
+                logger.info(f"Modelo carregado: {source} ({self._load_seconds:.2f}s)")
+
+        return self._model
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Codifica textos com o batch_size configurado.
+
+        Args:
+            texts: Textos a codificar.
+
+        Returns:
+            Matriz (len(texts) x dims).
+        """
+        return self.get().encode(
+            texts,
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
+
+    def warmup(self, background: bool = True) -> Optional[threading.Thread]:
+        """
+        Carrega o modelo e codifica um texto curto antes do primeiro uso.
+
+        Idempotente: chamadas repetidas reutilizam a mesma thread. Falhas
+        (ex: sentence-transformers ausente) sao registradas em log; o
+        proximo get() tenta carregar novamente.
+
+        Args:
+            background: Executa em thread daemon e retorna imediatamente.
+
+        Returns:
+            Thread do warmup (background=True) ou None.
+        """
+        if not background:
+            self._warmup()
+            return None
+
+        with self._lock:
+            if self._warmup_thread is None:
+                self._warmup_thread = threading.Thread(
+                    target=self._warmup, daemon=True, name="embedding-warmup"
+                )
+                self._warmup_thread.start()
+            return self._warmup_thread
+
+    def _warmup(self) -> None:
+        try:
+            self.encode([_WARMUP_TEXT])
+        except Exception as e:
+            logger.warning(f"Warmup do modelo de embeddings falhou: {e}")
+
+    def wait_until_loaded(self, timeout: Optional[float] = None) -> bool:
+        """
+        Aguarda o carregamento (ex: iniciado por warmup()).
+
+        Args:
+            timeout: Segundos maximos de espera (None = sem limite).
+
+        Returns:
+            True se o modelo esta carregado.
+        """
+        return self._loaded.wait(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estado do modelo (carregado, tempo de carga, configuracao).
+
+        Returns:
+            Dict com loaded, load_count, load_seconds, source, device,
+            batch_size e last_error.
+        """
+        return {
+            "loaded": self.is_loaded,
+            "load_count": self._load_count,
+            "load_seconds": self._load_seconds,
+            "source": self.model_path or self.model_name,
+            "device": self.device,
+            "batch_size": self.batch_size,
+            "last_error": self._last_error,
+        }
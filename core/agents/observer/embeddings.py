@@ -10,43 +10,196 @@ Modelo: all-MiniLM-L6-v2
 - Performance: ~50ms por texto
 - Gratuito e local (nao requer API)
 
+Cache:
+    generate_embedding e generate_embeddings_batch consultam um
+    EmbeddingCache (LRU em memoria + SQLite em disco, ver embedding_cache.py)
+    antes de chamar o modelo. Vetores sao indexados pela identidade do
+    modelo carregado (get_model_name). Configuracao por ambiente:
+    - OBSERVER_EMBEDDING_CACHE_PATH: arquivo do nivel em disco
+      (default: data/embedding_cache.db; "none" = apenas memoria)
+    - OBSERVER_EMBEDDING_CACHE_MAX_MB: limite do nivel em disco (default: 256)
+
+Similaridade em lote:
+    normalize_rows, similarity_matrix e top_k_similar operam sobre matrizes
+    float32 (linhas normalizadas): comparar um vetor contra N custa um
+    matmul em vez de N chamadas a calculate_similarity. Chamadores internos
+    usam generate_embeddings_batch(..., as_numpy=True) para evitar a ida e
+    volta por listas Python.
+
+Modelo:
+    Carregado uma unica vez por EmbeddingModelManager (embedding_model.py),
+    com lock, device/batch_size/diretorio local configuraveis e
+    warmup_embedding_model() para carregar no inicio da aplicacao.
+
 """
 
 import logging
-from typing import List, Optional
-from functools import lru_cache
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .embedding_cache import EmbeddingCache, DEFAULT_MAX_DISK_BYTES, normalize_text
+from .embedding_model import EmbeddingModelManager, is_preload_enabled
 
 logger = logging.getLogger(__name__)
 
 # Modelo recomendado para embeddings semanticos
 DEFAULT_MODEL = "all-MiniLM-L6-v2"
 
-# Cache para o modelo (carrega apenas uma vez)
+# Arquivo padrao do cache em disco (ao lado de data/concepts.db)
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent.parent.parent / "data" / "embedding_cache.db"
+
+# Modelo injetado (ex: testes); quando None, o gerenciador carrega o modelo
 _embedding_model = None
 
+# Gerenciador do modelo (criado no primeiro uso, ver get_embedding_model_manager)
+_model_manager: Optional[EmbeddingModelManager] = None
+_model_manager_lock = threading.Lock()
+
+# Cache de vetores (criado no primeiro uso, ver get_embedding_cache)
+_embedding_cache: Optional[EmbeddingCache] = None
+
+def get_embedding_model_manager() -> EmbeddingModelManager:
+    """
+    Retorna o gerenciador do modelo de embeddings (criado no primeiro uso).
+
+    Returns:
+        EmbeddingModelManager configurado por OBSERVER_EMBEDDING_MODEL_PATH,
+        OBSERVER_EMBEDDING_DEVICE e OBSERVER_EMBEDDING_BATCH_SIZE.
+    """
+    global _model_manager
+
+    if _model_manager is None:
+        with _model_manager_lock:
+            if _model_manager is None:
+                _model_manager = EmbeddingModelManager.from_env(DEFAULT_MODEL)
+
+    return _model_manager
+
+def set_embedding_model_manager(manager: Optional[EmbeddingModelManager]) -> None:
+    """
+    Substitui o gerenciador do modelo de embeddings.
+
+    Args:
+        manager: Novo gerenciador, ou None para recriar a partir do
+            ambiente no proximo uso.
+    """
+    global _model_manager
+    _model_manager = manager
+
+def warmup_embedding_model(background: bool = True) -> Optional[threading.Thread]:
+    """
+    Carrega o modelo de embeddings antes do primeiro turno.
+
+    Chamado no inicio da aplicacao (Streamlit, CLI) para que a primeira
+    thread do Observador nao pague o carregamento. Idempotente.
+
+    Args:
+        background: Executa em thread daemon e retorna imediatamente.
+
+    Returns:
+        Thread do warmup (background=True) ou None.
+
+    Example:
+        >>> warmup_embedding_model()  # no inicio do app
+        <Thread(embedding-warmup, started daemon ...)>
+    """
+    if _embedding_model is not None:
+        return None
+    return get_embedding_model_manager().warmup(background=background)
+
+def preload_embedding_model() -> Optional[threading.Thread]:
+    """
+    Inicia o warmup se o modo pre-carregado estiver ativo.
+
+    Returns:
+        Thread do warmup, ou None se OBSERVER_EMBEDDING_PRELOAD nao estiver
+        ativo.
+    """
+    if not is_preload_enabled():
+        return None
+    return warmup_embedding_model(background=True)
+
+def get_embedding_model_stats() -> Dict[str, Any]:
+    """
+    Retorna estado do modelo de embeddings (carregado, tempo de carga).
+
+    Returns:
+        Dict de EmbeddingModelManager.get_stats().
+    """
+    return get_embedding_model_manager().get_stats()
+
 def _get_model():
     """
     Retorna instancia do modelo de embeddings (singleton).
 
-    Carrega o modelo apenas uma vez e reutiliza nas chamadas subsequentes.
+    Usa o modelo injetado em _embedding_model, se houver; senao delega ao
+    gerenciador (carregamento unico e thread-safe).
+    """
+    if _embedding_model is not None:
+        return _embedding_model
+    return get_embedding_model_manager().get()
+
+def _encode(texts: List[str]) -> np.ndarray:
+    """Codifica textos no modelo injetado ou via gerenciador (batch_size/device)."""
+    if _embedding_model is not None:
+        return _embedding_model.encode(texts)
+    return get_embedding_model_manager().encode(texts)
+
+def get_embedding_cache() -> EmbeddingCache:
+    """
+    Retorna o cache de embeddings global (criado no primeiro uso).
+
+    Returns:
+        EmbeddingCache configurado por OBSERVER_EMBEDDING_CACHE_PATH e
+        OBSERVER_EMBEDDING_CACHE_MAX_MB.
+    """
+    global _embedding_cache
+
+    if _embedding_cache is None:
+        path_setting = os.getenv("OBSERVER_EMBEDDING_CACHE_PATH", str(DEFAULT_CACHE_PATH))
+        db_path = None if path_setting.lower() in ("", "none") else Path(path_setting)
+        max_mb = os.getenv("OBSERVER_EMBEDDING_CACHE_MAX_MB")
+        max_disk_bytes = int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_DISK_BYTES
+        try:
+            _embedding_cache = EmbeddingCache(db_path, max_disk_bytes=max_disk_bytes)
+        except Exception as e:
+            # Disco indisponivel nao deve impedir a geracao de embeddings
+            logger.warning(f"Cache de embeddings em disco indisponivel ({e}); usando apenas memoria")
+            _embedding_cache = EmbeddingCache(None)
+
+    return _embedding_cache
+
+def set_embedding_cache(cache: Optional[EmbeddingCache]) -> None:
     """
-    global _embedding_model
+    Substitui o cache de embeddings global.
 
-    if _embedding_model is None:
-        from sentence_transformers import SentenceTransformer
+    Args:
+        cache: Novo cache, ou None para recriar a partir do ambiente no
+            proximo uso.
+    """
+    global _embedding_cache
+    _embedding_cache = cache
 
-        logger.info(f"Carregando modelo de embeddings: {DEFAULT_MODEL}")
-        _embedding_model = SentenceTransformer(DEFAULT_MODEL)
-        logger.info(f"Modelo carregado: {DEFAULT_MODEL} (384 dimensoes)")
+def get_embedding_cache_stats() -> Dict[str, Any]:
+    """
+    Retorna contadores do cache de embeddings (hits, misses, evictions).
 
-    return _embedding_model
+    Returns:
+        Dict de EmbeddingCache.get_stats().
+    """
+    return get_embedding_cache().get_stats()
 
-def generate_embedding(text: str) -> List[float]:
+def generate_embedding(text: str, as_numpy: bool = False) -> Union[List[float], np.ndarray]:
     """
     Gera embedding semantico para um texto.
 
     Args:
         text: Texto para gerar embedding (ex: "cooperacao", "LLMs").
+        as_numpy: Retorna np.ndarray float32 em vez de lista.
 
     Returns:
         Lista de floats representando o vetor semantico (384 dimensoes).
@@ -58,22 +211,23 @@ def generate_embedding(text: str) -> List[float]:
         >>> print(type(embedding[0]))
         <class 'float'>
     """
-    model = _get_model()
-
-    # Gerar embedding
-    embedding = model.encode(text)
-
-    # Converter para lista de floats (compativel com ChromaDB)
-    return embedding.tolist()
+    return generate_embeddings_batch([text], as_numpy=as_numpy)[0]
 
-def generate_embeddings_batch(texts: List[str]) -> List[List[float]]:
+def generate_embeddings_batch(
+    texts: List[str],
+    as_numpy: bool = False
+) -> Union[List[List[float]], np.ndarray]:
     """
     Gera embeddings para multiplos textos em lote.
 
-    Mais eficiente que chamar generate_embedding() para cada texto.
+    Mais eficiente que chamar generate_embedding() para cada texto: textos
+    em cache nao passam pelo modelo e os demais (sem repeticao) sao
+    codificados numa unica chamada.
 
     Args:
         texts: Lista de textos para gerar embeddings.
+        as_numpy: Retorna matriz float32 (len(texts) x 384) em vez de
+            lista de listas (sem conversao para objetos Python).
 
     Returns:
         Lista de embeddings (cada um com 384 dimensoes).
@@ -86,15 +240,30 @@ def generate_embeddings_batch(texts: List[str]) -> List[List[float]]:
         384
     """
     if not texts:
-        return []
-
-    model = _get_model()
-
-    # Gerar embeddings em lote
-    embeddings = model.encode(texts)
-
-    # Converter para lista de listas
-    return [emb.tolist() for emb in embeddings]
+        return np.zeros((0, get_embedding_dimensions()), dtype=np.float32) if as_numpy else []
+
+    cache = get_embedding_cache()
+    model_name = get_model_name()
+    normalized = [normalize_text(text) for text in texts]
+    vectors = cache.get_many(model_name, normalized)
+
+    missing = list(dict.fromkeys(
+        text for text, vector in zip(normalized, vectors) if vector is None
+    ))
+    if missing:
+        # Gerar embeddings em lote apenas para os textos fora do cache
+        encoded = dict(zip(missing, _encode(missing)))
+        cache.put_many(model_name, list(encoded.items()))
+        vectors = [
+            vector if vector is not None else encoded[text]
+            for text, vector in zip(normalized, vectors)
+        ]
+
+    if as_numpy:
+        return np.asarray(vectors, dtype=np.float32)
+
+    # Converter para lista de listas (compativel com ChromaDB)
+    return [vector.tolist() for vector in vectors]
 
 def calculate_similarity(embedding1: List[float], embedding2: List[float]) -> float:
     """
@@ -114,8 +283,6 @@ def calculate_similarity(embedding1: List[float], embedding2: List[float]) -> fl
         >>> print(f"Similaridade: {similarity:.2f}")
         Similaridade: 0.87
     """
-    import numpy as np
-
     # Converter para numpy arrays
     vec1 = np.array(embedding1)
     vec2 = np.array(embedding2)
@@ -132,6 +299,91 @@ def calculate_similarity(embedding1: List[float], embedding2: List[float]) -> fl
 
     return float(similarity)
 
+def normalize_rows(vectors: Union[Sequence[Sequence[float]], np.ndarray]) -> np.ndarray:
+    """
+    Converte vetores para matriz float32 com linhas de norma 1.
+
+    Linhas nulas ficam nulas (similaridade 0 com qualquer vetor).
+
+    Args:
+        vectors: Vetor unico ou lista/matriz de vetores.
+
+    Returns:
+        Matriz float32 (n x dims).
+
+    Example:
+        >>> normalize_rows([[3.0, 4.0]])
+        array([[0.6, 0.8]], dtype=float32)
+    """
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+def similarity_matrix(a: np.ndarray, b: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Similaridade cosseno entre todas as linhas de a e de b.
+
+    As linhas devem estar normalizadas (normalize_rows): a similaridade e
+    o produto interno, um unico matmul.
+
+    Args:
+        a: Matriz float32 (n x dims), linhas normalizadas.
+        b: Matriz float32 (m x dims), linhas normalizadas. Default: a.
+
+    Returns:
+        Matriz float32 (n x m).
+
+    Example:
+        >>> vectors = normalize_rows(generate_embeddings_batch(labels, as_numpy=True))
+        >>> similarity_matrix(vectors).shape
+        (len(labels), len(labels))
+    """
+    return a @ (a if b is None else b).T
+
+def top_k_similar(query: np.ndarray, matrix: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Indices e similaridades das k linhas de matrix mais similares a query.
+
+    Selecao parcial (argpartition) e ordenacao apenas dos k escolhidos.
+
+    Args:
+        query: Vetor (dims,) ou matriz de queries (q x dims), normalizados.
+        matrix: Matriz (n x dims), linhas normalizadas.
+        k: Numero de resultados (limitado a n).
+
+    Returns:
+        (indices, similaridades) em ordem decrescente de similaridade; com
+        formato (k,) para query unica ou (q x k) para varias queries.
+
+    Example:
+        >>> indices, scores = top_k_similar(vectors[0], vectors, k=3)
+        >>> int(indices[0])
+        0
+    """
+    single = query.ndim == 1
+    scores = similarity_matrix(query.reshape(1, -1) if single else query, matrix)
+
+    k = min(k, matrix.shape[0])
+    if k <= 0:
+        empty = np.zeros((scores.shape[0], 0))
+        indices, top_scores = empty.astype(np.intp), empty.astype(np.float32)
+    else:
+        if k < matrix.shape[0]:
+            candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            candidates = np.broadcast_to(np.arange(matrix.shape[0]), scores.shape)
+        candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1, kind="stable")
+        indices = np.take_along_axis(candidates, order, axis=1)
+        top_scores = np.take_along_axis(candidate_scores, order, axis=1)
+
+    if single:
+        return indices[0], top_scores[0]
+    return indices, top_scores
+
 def get_embedding_dimensions() -> int:
     """
     Retorna numero de dimensoes do modelo de embeddings.
@@ -143,9 +395,15 @@ def get_embedding_dimensions() -> int:
 
 def get_model_name() -> str:
     """
-    Retorna nome do modelo de embeddings em uso.
+    Retorna identidade do modelo de embeddings em uso.
+
+    Chave do cache de vetores e do manifesto de bundles: vem do gerenciador
+    (EmbeddingModelManager.identity), entao um modelo local configurado em
+    OBSERVER_EMBEDDING_MODEL_PATH nao reutiliza vetores de DEFAULT_MODEL.
+    Um modelo injetado (_embedding_model, testes) usa a identidade do
+    gerenciador.
 
     Returns:
-        Nome do modelo.
+        Nome do modelo no Hub ou caminho do diretorio local.
     """
-    return DEFAULT_MODEL
+    return get_embedding_model_manager().identity
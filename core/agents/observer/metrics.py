@@ -13,10 +13,28 @@ FILOSOFIA:
 - Proposicoes tem SOLIDEZ (nao sao "verdadeiras" ou "falsas")
 - Sistema mapeia SUSTENTACAO, nao julga verdade
 
+CONCORRENCIA:
+- calculate_metrics avalia solidez e completude (chamadas LLM
+  independentes) em paralelo num executor compartilhado: a latencia e a da
+  chamada mais lenta, nao a soma
+- evaluate_maturity depende de solidez/completude e continua sequencial
+- OBSERVER_CONCURRENT_METRICS=false volta ao modo sequencial;
+  OBSERVER_METRICS_WORKERS limita as chamadas simultaneas (default: 4)
+
+MODOS (observer_config.metrics_mode em config/agents/observer.yaml):
+- "separate" (padrao): tres chamadas (solidez, completude, maturidade)
+- "fused": uma chamada com resposta estruturada para as tres dimensoes
+  (evaluate_metrics_fused); claim, proposicoes, contradicoes e questoes
+  abertas sao enviados uma unica vez. Em caso de falha, volta ao modo
+  "separate". Comparacao offline: scripts/core/compare_metrics_modes.py
+
 """
 
 import logging
 import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 
 from langchain_anthropic import ChatAnthropic
@@ -26,15 +44,69 @@ from .prompts import (
     EVALUATE_SOLIDEZ_PROMPT,
     EVALUATE_COMPLETUDE_PROMPT,
     EVALUATE_MATURITY_PROMPT,
+    EVALUATE_FUSED_PROMPT,
     RECOMMENDED_MODEL,
     METRICS_TEMPERATURE,
-    MAX_METRICS_TOKENS
+    MAX_METRICS_TOKENS,
+    MAX_FUSED_METRICS_TOKENS
 )
 from core.utils.config import invoke_with_retry, create_anthropic_client
 from core.utils.json_parser import extract_json_from_llm_response
 
 logger = logging.getLogger(__name__)
 
+# Modos de avaliacao (observer_config.metrics_mode)
+METRICS_MODE_SEPARATE = "separate"
+METRICS_MODE_FUSED = "fused"
+METRICS_MODES = (METRICS_MODE_SEPARATE, METRICS_MODE_FUSED)
+
+# Chamadas LLM de metricas simultaneas (todas as sessoes)
+DEFAULT_METRICS_WORKERS = 4
+
+# Executor compartilhado (criado no primeiro uso, ver _get_metrics_executor)
+_metrics_executor: Optional[ThreadPoolExecutor] = None
+_metrics_executor_lock = threading.Lock()
+
+def _get_metrics_executor() -> ThreadPoolExecutor:
+    """Retorna o executor das chamadas de metricas (OBSERVER_METRICS_WORKERS)."""
+    global _metrics_executor
+
+    if _metrics_executor is None:
+        with _metrics_executor_lock:
+            if _metrics_executor is None:
+                workers = int(os.getenv("OBSERVER_METRICS_WORKERS", DEFAULT_METRICS_WORKERS))
+                _metrics_executor = ThreadPoolExecutor(
+                    max_workers=max(1, workers), thread_name_prefix="observer-metrics"
+                )
+
+    return _metrics_executor
+
+def _concurrent_metrics_enabled() -> bool:
+    """Modo concorrente de calculate_metrics (OBSERVER_CONCURRENT_METRICS, default true)."""
+    return os.getenv("OBSERVER_CONCURRENT_METRICS", "true").strip().lower() not in ("0", "false", "no", "off")
+
+def get_metrics_mode() -> str:
+    """
+    Retorna o modo de avaliacao configurado em observer.yaml.
+
+    Returns:
+        observer_config.metrics_mode ("separate" ou "fused"); "separate"
+        se ausente, invalido ou se a configuracao nao puder ser lida.
+    """
+    from core.agents.memory.config_loader import load_agent_config
+
+    try:
+        observer_config = load_agent_config("observer").get("observer_config") or {}
+    except Exception as e:
+        logger.warning(f"observer.yaml indisponivel ({e}); metricas em modo '{METRICS_MODE_SEPARATE}'")
+        return METRICS_MODE_SEPARATE
+
+    mode = observer_config.get("metrics_mode", METRICS_MODE_SEPARATE)
+    if mode not in METRICS_MODES:
+        logger.warning(f"metrics_mode invalido em observer.yaml: {mode!r}; usando '{METRICS_MODE_SEPARATE}'")
+        return METRICS_MODE_SEPARATE
+    return mode
+
 def _get_metrics_llm() -> ChatAnthropic:
     """
     Retorna instancia do LLM para avaliacao de metricas.
@@ -100,6 +172,73 @@ def _extract_proposicoes_with_solidez(proposicoes: List[Dict[str, Any]]) -> List
         })
     return formatted
 
+# Prefixo de analysis/reason das avaliacoes conservadoras (fallback de erro)
+EVALUATION_ERROR_PREFIX = "Erro na avaliacao"
+
+def _clamp(value: Any) -> float:
+    """Converte para float no range 0-1."""
+    return max(0.0, min(1.0, float(value)))
+
+def _parse_solidez(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Valida resposta de solidez do LLM."""
+    return {
+        "solidez": _clamp(data.get("solidez", 0.0)),
+        "analysis": data.get("analysis", "Analise nao disponivel"),
+        "strengths": data.get("strengths", []),
+        "weaknesses": data.get("weaknesses", []),
+        "critical_gaps": data.get("critical_gaps", [])
+    }
+
+def _solidez_fallback(error: Exception) -> Dict[str, Any]:
+    """Avaliacao conservadora de solidez em caso de erro."""
+    return {
+        "solidez": 0.1,
+        "analysis": f"{EVALUATION_ERROR_PREFIX}: {str(error)}",
+        "strengths": [],
+        "weaknesses": ["Avaliacao nao concluida"],
+        "critical_gaps": ["Erro no processamento LLM"]
+    }
+
+def _parse_completude(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Valida resposta de completude do LLM."""
+    return {
+        "completude": _clamp(data.get("completude", 0.0)),
+        "analysis": data.get("analysis", "Analise nao disponivel"),
+        "developed_aspects": data.get("developed_aspects", []),
+        "missing_aspects": data.get("missing_aspects", []),
+        "next_steps_suggested": data.get("next_steps_suggested", [])
+    }
+
+def _completude_fallback(error: Exception) -> Dict[str, Any]:
+    """Avaliacao conservadora de completude em caso de erro."""
+    return {
+        "completude": 0.1,
+        "analysis": f"{EVALUATION_ERROR_PREFIX}: {str(error)}",
+        "developed_aspects": [],
+        "missing_aspects": ["Avaliacao nao concluida"],
+        "next_steps_suggested": ["Resolver erro no processamento"]
+    }
+
+def _parse_maturity(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Valida resposta de maturidade do LLM."""
+    return {
+        "is_mature": data.get("is_mature", False),
+        "confidence": _clamp(data.get("confidence", 0.5)),
+        "reason": data.get("reason", "Avaliacao nao disponivel"),
+        "blocking_issues": data.get("blocking_issues", []),
+        "recommendation": data.get("recommendation", "Continuar desenvolvimento")
+    }
+
+def _maturity_fallback(error: Exception) -> Dict[str, Any]:
+    """Avaliacao conservadora de maturidade em caso de erro."""
+    return {
+        "is_mature": False,
+        "confidence": 0.3,
+        "reason": f"{EVALUATION_ERROR_PREFIX}: {str(error)}",
+        "blocking_issues": ["Erro no processamento LLM"],
+        "recommendation": "Resolver erro antes de continuar"
+    }
+
 def calculate_solidez(
     claim: str,
     proposicoes: List[Dict[str, Any]],
@@ -166,21 +305,10 @@ def calculate_solidez(
 
         # Parse JSON
         data = extract_json_from_llm_response(response.content)
-
-        # Extrair e validar resultado
-        solidez = float(data.get("solidez", 0.0))
-        solidez = max(0.0, min(1.0, solidez))  # Garantir range 0-1
-
-        result = {
-            "solidez": solidez,
-            "analysis": data.get("analysis", "Analise nao disponivel"),
-            "strengths": data.get("strengths", []),
-            "weaknesses": data.get("weaknesses", []),
-            "critical_gaps": data.get("critical_gaps", [])
-        }
+        result = _parse_solidez(data)
 
         logger.info(
-            f"Solidez avaliada via LLM: {solidez:.2f} "
+            f"Solidez avaliada via LLM: {result['solidez']:.2f} "
             f"(strengths={len(result['strengths'])}, "
             f"weaknesses={len(result['weaknesses'])})"
         )
@@ -190,13 +318,7 @@ def calculate_solidez(
     except Exception as e:
         logger.error(f"Erro ao avaliar solidez via LLM: {e}")
         # Retorna avaliacao conservadora em caso de erro
-        return {
-            "solidez": 0.1,
-            "analysis": f"Erro na avaliacao: {str(e)}",
-            "strengths": [],
-            "weaknesses": ["Avaliacao nao concluida"],
-            "critical_gaps": ["Erro no processamento LLM"]
-        }
+        return _solidez_fallback(e)
 
 def calculate_completude(
     claims: List[str],
@@ -261,21 +383,10 @@ def calculate_completude(
 
         # Parse JSON
         data = extract_json_from_llm_response(response.content)
-
-        # Extrair e validar resultado
-        completude = float(data.get("completude", 0.0))
-        completude = max(0.0, min(1.0, completude))  # Garantir range 0-1
-
-        result = {
-            "completude": completude,
-            "analysis": data.get("analysis", "Analise nao disponivel"),
-            "developed_aspects": data.get("developed_aspects", []),
-            "missing_aspects": data.get("missing_aspects", []),
-            "next_steps_suggested": data.get("next_steps_suggested", [])
-        }
+        result = _parse_completude(data)
 
         logger.info(
-            f"Completude avaliada via LLM: {completude:.2f} "
+            f"Completude avaliada via LLM: {result['completude']:.2f} "
             f"(developed={len(result['developed_aspects'])}, "
             f"missing={len(result['missing_aspects'])})"
         )
@@ -285,13 +396,7 @@ def calculate_completude(
     except Exception as e:
         logger.error(f"Erro ao avaliar completude via LLM: {e}")
         # Retorna avaliacao conservadora em caso de erro
-        return {
-            "completude": 0.1,
-            "analysis": f"Erro na avaliacao: {str(e)}",
-            "developed_aspects": [],
-            "missing_aspects": ["Avaliacao nao concluida"],
-            "next_steps_suggested": ["Resolver erro no processamento"]
-        }
+        return _completude_fallback(e)
 
 def calculate_metrics(
     claim: str,
@@ -301,7 +406,8 @@ def calculate_metrics(
     contradictions: List[Dict[str, Any]],
     context: Optional[Dict[str, Any]] = None,
     solid_grounds: Optional[List[Dict[str, Any]]] = None,
-    llm: Optional[ChatAnthropic] = None
+    llm: Optional[ChatAnthropic] = None,
+    concurrent: Optional[bool] = None
 ) -> Dict[str, Any]:
     """
     Calcula todas as metricas do CognitiveModel via LLM.
@@ -309,7 +415,9 @@ def calculate_metrics(
     Epico 11.4: Recebe proposicoes unificadas ao inves de fundamentos/assumptions.
 
     Funcao de conveniencia que avalia solidez e completude
-    em chamadas LLM separadas para analise mais precisa.
+    em chamadas LLM separadas para analise mais precisa. No modo
+    concorrente as duas chamadas rodam em paralelo; cada uma mantem seu
+    proprio fallback conservador em caso de erro.
 
     Args:
         claim: Afirmacao central.
@@ -320,6 +428,8 @@ def calculate_metrics(
         context: Contexto do argumento.
         solid_grounds: Evidencias bibliograficas.
         llm: Instancia do LLM (opcional).
+        concurrent: Avalia solidez e completude em paralelo (default:
+            OBSERVER_CONCURRENT_METRICS, ativo).
 
     Returns:
         Dict com:
@@ -342,23 +452,40 @@ def calculate_metrics(
     if llm is None:
         llm = _get_metrics_llm()
 
-    # Avaliar solidez
-    solidez_result = calculate_solidez(
-        claim=claim,
-        proposicoes=proposicoes,
-        contradictions=contradictions,
-        solid_grounds=solid_grounds,
-        llm=llm
-    )
+    if concurrent is None:
+        concurrent = _concurrent_metrics_enabled()
 
-    # Avaliar completude
-    completude_result = calculate_completude(
-        claims=claims,
-        proposicoes=proposicoes,
-        open_questions=open_questions,
-        context=context,
-        llm=llm
-    )
+    solidez_kwargs = {
+        "claim": claim,
+        "proposicoes": proposicoes,
+        "contradictions": contradictions,
+        "solid_grounds": solid_grounds,
+        "llm": llm
+    }
+    completude_kwargs = {
+        "claims": claims,
+        "proposicoes": proposicoes,
+        "open_questions": open_questions,
+        "context": context,
+        "llm": llm
+    }
+
+    solidez_future = None
+    if concurrent:
+        try:
+            solidez_future = _get_metrics_executor().submit(calculate_solidez, **solidez_kwargs)
+        except RuntimeError as e:
+            # Executor encerrado (ex: shutdown do interpretador): modo sequencial
+            logger.warning(f"Metricas em modo sequencial: {e}")
+
+    if solidez_future is None:
+        solidez_result = calculate_solidez(**solidez_kwargs)
+
+    # Modo concorrente: completude na thread atual enquanto solidez roda no executor
+    completude_result = calculate_completude(**completude_kwargs)
+
+    if solidez_future is not None:
+        solidez_result = solidez_future.result()
 
     return {
         "solidez": solidez_result["solidez"],
@@ -443,18 +570,7 @@ def evaluate_maturity(
 
         # Parse JSON
         data = extract_json_from_llm_response(response.content)
-
-        # Extrair resultado
-        result = {
-            "is_mature": data.get("is_mature", False),
-            "confidence": float(data.get("confidence", 0.5)),
-            "reason": data.get("reason", "Avaliacao nao disponivel"),
-            "blocking_issues": data.get("blocking_issues", []),
-            "recommendation": data.get("recommendation", "Continuar desenvolvimento")
-        }
-
-        # Garantir confidence no range 0-1
-        result["confidence"] = max(0.0, min(1.0, result["confidence"]))
+        result = _parse_maturity(data)
 
         logger.info(
             f"Maturidade avaliada via LLM: is_mature={result['is_mature']}, "
@@ -466,10 +582,207 @@ def evaluate_maturity(
     except Exception as e:
         logger.error(f"Erro ao avaliar maturidade via LLM: {e}")
         # Retorna avaliacao conservadora em caso de erro
-        return {
-            "is_mature": False,
-            "confidence": 0.3,
-            "reason": f"Erro na avaliacao: {str(e)}",
-            "blocking_issues": ["Erro no processamento LLM"],
-            "recommendation": "Resolver erro antes de continuar"
-        }
+        return _maturity_fallback(e)
+
+def evaluate_metrics_fused(
+    claim: str,
+    claims: List[str],
+    proposicoes: List[Dict[str, Any]],
+    open_questions: List[str],
+    contradictions: List[Dict[str, Any]],
+    context: Optional[Dict[str, Any]] = None,
+    solid_grounds: Optional[List[Dict[str, Any]]] = None,
+    llm: Optional[ChatAnthropic] = None
+) -> Dict[str, Any]:
+    """
+    Avalia solidez, completude e maturidade numa unica chamada LLM.
+
+    Mesmo conteudo das tres chamadas separadas, enviado uma so vez, com
+    resposta JSON estruturada por dimensao. Os resultados passam pelas
+    mesmas validacoes de calculate_solidez, calculate_completude e
+    evaluate_maturity.
+
+    Args:
+        claim: Afirmacao central.
+        claims: Lista de claims extraidos.
+        proposicoes: Lista de proposicoes (dicts com 'texto' e 'solidez').
+        open_questions: Lista de questoes abertas.
+        contradictions: Lista de contradicoes.
+        context: Contexto do argumento.
+        solid_grounds: Evidencias bibliograficas.
+        llm: Instancia do LLM (opcional; default com MAX_FUSED_METRICS_TOKENS).
+
+    Returns:
+        Dict com:
+        - metrics: mesmo formato de calculate_metrics
+        - maturity: mesmo formato de evaluate_maturity
+
+    Raises:
+        ValueError: Se a resposta nao trouxer as tres dimensoes.
+        Exception: Erros da chamada LLM (sem fallback; ver evaluate_argument).
+
+    Example:
+        >>> result = evaluate_metrics_fused(
+        ...     claim="LLMs aumentam produtividade",
+        ...     claims=["LLMs aumentam produtividade"],
+        ...     proposicoes=[{"texto": "Equipes usam LLMs", "solidez": 0.8}],
+        ...     open_questions=["Como medir?"],
+        ...     contradictions=[]
+        ... )
+        >>> print(result["metrics"]["solidez"], result["maturity"]["is_mature"])
+        0.4 False
+    """
+    if llm is None:
+        llm = create_anthropic_client(
+            model=RECOMMENDED_MODEL,
+            temperature=METRICS_TEMPERATURE,
+            max_tokens=MAX_FUSED_METRICS_TOKENS
+        )
+
+    proposicoes_formatted = _extract_proposicoes_with_solidez(proposicoes)
+
+    prompt = EVALUATE_FUSED_PROMPT.format(
+        claim=claim or "(claim nao definido)",
+        claims=json.dumps(claims, ensure_ascii=False) if claims else "(nenhum)",
+        fundamentos=json.dumps(proposicoes_formatted, ensure_ascii=False) if proposicoes_formatted else "(nenhuma)",
+        contradictions=json.dumps(contradictions, ensure_ascii=False) if contradictions else "(nenhuma)",
+        open_questions=json.dumps(open_questions, ensure_ascii=False) if open_questions else "(nenhuma)",
+        context=json.dumps(context, ensure_ascii=False) if context else "(nao definido)",
+        solid_grounds=json.dumps(solid_grounds, ensure_ascii=False) if solid_grounds else "(nenhuma)"
+    )
+
+    messages = [HumanMessage(content=prompt)]
+    response = invoke_with_retry(llm=llm, messages=messages, agent_name="observer_metrics_fused")
+    data = extract_json_from_llm_response(response.content)
+
+    sections = {name: data.get(name) for name in ("solidez", "completude", "maturity")}
+    missing = [name for name, section in sections.items() if not isinstance(section, dict)]
+    if missing:
+        raise ValueError(f"Resposta fundida sem secoes: {', '.join(missing)}")
+
+    solidez_result = _parse_solidez(sections["solidez"])
+    completude_result = _parse_completude(sections["completude"])
+    maturity = _parse_maturity(sections["maturity"])
+
+    logger.info(
+        f"Metricas fundidas via LLM: solidez={solidez_result['solidez']:.2f}, "
+        f"completude={completude_result['completude']:.2f}, is_mature={maturity['is_mature']}"
+    )
+
+    return {
+        "metrics": {
+            "solidez": solidez_result["solidez"],
+            "completude": completude_result["completude"],
+            "solidez_details": solidez_result,
+            "completude_details": completude_result
+        },
+        "maturity": maturity
+    }
+
+def evaluate_argument(
+    claim: str,
+    claims: List[str],
+    proposicoes: List[Dict[str, Any]],
+    open_questions: List[str],
+    contradictions: List[Dict[str, Any]],
+    context: Optional[Dict[str, Any]] = None,
+    solid_grounds: Optional[List[Dict[str, Any]]] = None,
+    llm: Optional[ChatAnthropic] = None,
+    mode: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Avalia metricas e maturidade no modo configurado (ponto de entrada do turno).
+
+    Args:
+        claim: Afirmacao central.
+        claims: Lista de claims extraidos.
+        proposicoes: Lista de proposicoes (dicts com 'texto' e 'solidez').
+        open_questions: Lista de questoes abertas.
+        contradictions: Lista de contradicoes.
+        context: Contexto do argumento.
+        solid_grounds: Evidencias bibliograficas.
+        llm: Instancia do LLM (opcional).
+        mode: "separate" ou "fused" (default: get_metrics_mode()).
+
+    Returns:
+        Dict com:
+        - metrics: formato de calculate_metrics
+        - maturity: formato de evaluate_maturity
+        - mode: modo efetivamente usado ("separate" apos fallback)
+
+    Example:
+        >>> result = evaluate_argument(
+        ...     claim="LLMs aumentam produtividade",
+        ...     claims=["LLMs aumentam produtividade"],
+        ...     proposicoes=[],
+        ...     open_questions=[],
+        ...     contradictions=[],
+        ...     mode="fused"
+        ... )
+        >>> result["mode"]
+        'fused'
+    """
+    if mode is None:
+        mode = get_metrics_mode()
+
+    if mode == METRICS_MODE_FUSED:
+        try:
+            result = evaluate_metrics_fused(
+                claim=claim,
+                claims=claims,
+                proposicoes=proposicoes,
+                open_questions=open_questions,
+                contradictions=contradictions,
+                context=context,
+                solid_grounds=solid_grounds,
+                llm=llm
+            )
+            return {**result, "mode": METRICS_MODE_FUSED}
+        except Exception as e:
+            logger.warning(f"Avaliacao fundida falhou ({e}); usando chamadas separadas")
+
+    metrics = calculate_metrics(
+        claim=claim,
+        claims=claims,
+        proposicoes=proposicoes,
+        open_questions=open_questions,
+        contradictions=contradictions,
+        context=context,
+        solid_grounds=solid_grounds,
+        llm=llm
+    )
+    maturity = evaluate_maturity(
+        solidez=metrics["solidez"],
+        completude=metrics["completude"],
+        open_questions=open_questions,
+        contradictions=contradictions,
+        claims=claims,
+        proposicoes=proposicoes,
+        llm=llm
+    )
+    return {"metrics": metrics, "maturity": maturity, "mode": METRICS_MODE_SEPARATE}
+
+def is_evaluation_complete(evaluation: Dict[str, Any]) -> bool:
+    """
+    Indica se a avaliacao veio inteira do LLM (nenhuma parte em fallback).
+
+    Avaliacoes com fallback nao devem ser memoizadas: o erro pode ser
+    transitorio e o proximo turno com o mesmo conteudo deve tentar de novo.
+
+    Args:
+        evaluation: Resultado de evaluate_argument.
+
+    Returns:
+        True se solidez, completude e maturidade foram avaliadas pelo LLM.
+
+    Example:
+        >>> is_evaluation_complete(evaluate_argument(...))
+        True
+    """
+    metrics = evaluation.get("metrics", {})
+    texts = (
+        metrics.get("solidez_details", {}).get("analysis", ""),
+        metrics.get("completude_details", {}).get("analysis", ""),
+        evaluation.get("maturity", {}).get("reason", ""),
+    )
+    return not any(str(text).startswith(EVALUATION_ERROR_PREFIX) for text in texts)
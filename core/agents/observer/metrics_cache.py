@@ -0,0 +1,325 @@
+"""
+Memoizacao das metricas do Observador por conteudo.
+
+Turnos que nao alteram o CognitiveModel (conversa casual, esclarecimentos
+sem conteudo novo) produziam as mesmas entradas de solidez, completude e
+maturidade, e o Observador pagava as chamadas LLM de novo. Este modulo
+guarda o resultado de evaluate_argument por hash canonico dos campos que
+entram nos prompts:
+
+- Nivel 1: LRU em memoria por sessao (limite de entradas por sessao e de
+  sessoes; a sessao acessada ha mais tempo sai primeiro)
+- Nivel 2 (opcional): SQLite (modo WAL) com o mesmo limite por sessao
+
+Chave: sha256 do JSON canonico (chaves ordenadas) de claim, claims,
+proposicoes, open_questions, contradictions, context, solid_grounds, modo
+de avaliacao e modelo. Qualquer mudanca nesses campos gera nova avaliacao.
+
+Configuracao por ambiente (get_metrics_cache):
+    - OBSERVER_METRICS_CACHE_PATH: arquivo do nivel em disco (default:
+      "none" = apenas memoria)
+    - OBSERVER_METRICS_CACHE_SIZE: entradas por sessao (default: 16)
+
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ITEMS_PER_SESSION = 16
+DEFAULT_MAX_SESSIONS = 256
+
+# Incrementar quando o formato do resultado memoizado mudar
+CACHE_FORMAT_VERSION = 1
+
+CACHE_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS metrics_memo (
+    session_id TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (session_id, key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_metrics_memo_access
+    ON metrics_memo(session_id, last_access);
+"""
+
+def _canonical_default(value: Any) -> Any:
+    """Serializa objetos Pydantic (ex: Proposicao) e demais tipos."""
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    return str(value)
+
+def make_metrics_key(mode: str, model_name: str, **fields: Any) -> str:
+    """
+    Calcula chave de memoizacao para as entradas de uma avaliacao.
+
+    Args:
+        mode: Modo de avaliacao ("separate" ou "fused").
+        model_name: Modelo LLM das metricas.
+        **fields: Campos enviados aos prompts (claim, claims, proposicoes...).
+
+    Returns:
+        Hash sha256 hexadecimal.
+
+    Example:
+        >>> make_metrics_key("separate", "claude-haiku", claim="X", claims=[]) == \\
+        ...     make_metrics_key("separate", "claude-haiku", claims=[], claim="X")
+        True
+    """
+    payload = {"version": CACHE_FORMAT_VERSION, "mode": mode, "model": model_name, "fields": fields}
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=_canonical_default)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+class MetricsCache:
+    """
+    Memo de avaliacoes por sessao, com LRU em memoria e SQLite opcional.
+
+    Thread-safe (workers do Observador processam sessoes em paralelo).
+    Erros do SQLite nunca chegam ao turno: o nivel em disco e desligado
+    (warning) e o memo segue apenas em memoria.
+
+    Attributes:
+        db_path: Arquivo SQLite do nivel 2 (None = apenas memoria).
+        max_items_per_session: Maximo de avaliacoes guardadas por sessao.
+        max_sessions: Maximo de sessoes no nivel em memoria.
+
+    Example:
+        >>> cache = MetricsCache()
+        >>> cache.put("session-1", key, {"metrics": {...}, "maturity": {...}})
+        >>> cache.get("session-1", key)["metrics"]["solidez"]
+        0.45
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        max_items_per_session: int = DEFAULT_MAX_ITEMS_PER_SESSION,
+        max_sessions: int = DEFAULT_MAX_SESSIONS
+    ):
+        self.db_path = Path(db_path) if db_path is not None else None
+        self.max_items_per_session = max(1, max_items_per_session)
+        self.max_sessions = max(1, max_sessions)
+
+        self._lock = threading.RLock()
+        self._sessions: "OrderedDict[str, OrderedDict[str, str]]" = OrderedDict()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "disk_errors": 0}
+
+        self._conn: Optional[sqlite3.Connection] = None
+        if self.db_path is not None:
+            self._conn = self._open(self.db_path)
+
+    @staticmethod
+    def _open(db_path: Path) -> sqlite3.Connection:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None, timeout=5.0)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.executescript(CACHE_SCHEMA_SQL)
+        return conn
+
+    def close(self) -> None:
+        """Fecha a conexao SQLite."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _disable_disk(self, error: sqlite3.Error) -> None:
+        """Desliga o nivel em disco apos erro do SQLite (chamado sob _lock)."""
+        logger.warning(f"Memo de metricas em disco falhou ({error}); usando apenas memoria")
+        self._stats["disk_errors"] += 1
+        try:
+            self._conn.close()
+        except sqlite3.Error:
+            pass
+        self._conn = None
+
+    def _remember(self, session_id: str, key: str, value: str) -> None:
+        """Insere no LRU da sessao, evictando entradas e sessoes antigas."""
+        entries = self._sessions.get(session_id)
+        if entries is None:
+            entries = self._sessions[session_id] = OrderedDict()
+        self._sessions.move_to_end(session_id)
+
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > self.max_items_per_session:
+            entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+        while len(self._sessions) > self.max_sessions:
+            _, evicted = self._sessions.popitem(last=False)
+            self._stats["evictions"] += len(evicted)
+
+    def get(self, session_id: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Busca avaliacao memoizada (memoria, depois disco).
+
+        Args:
+            session_id: Sessao do turno.
+            key: Chave de make_metrics_key.
+
+        Returns:
+            Resultado de evaluate_argument ou None (miss).
+        """
+        with self._lock:
+            entries = self._sessions.get(session_id)
+            if entries is not None and key in entries:
+                entries.move_to_end(key)
+                self._sessions.move_to_end(session_id)
+                self._stats["memory_hits"] += 1
+                return json.loads(entries[key])
+
+            row = None
+            if self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT value FROM metrics_memo WHERE session_id = ? AND key = ?",
+                        (session_id, key)
+                    ).fetchone()
+                    if row is not None:
+                        self._conn.execute(
+                            "UPDATE metrics_memo SET last_access = ? WHERE session_id = ? AND key = ?",
+                            (time.time(), session_id, key)
+                        )
+                except sqlite3.Error as e:
+                    self._disable_disk(e)
+            if row is not None:
+                self._remember(session_id, key, row[0])
+                self._stats["disk_hits"] += 1
+                return json.loads(row[0])
+
+            self._stats["misses"] += 1
+            return None
+
+    def put(self, session_id: str, key: str, value: Dict[str, Any]) -> None:
+        """
+        Armazena avaliacao nos dois niveis.
+
+        Args:
+            session_id: Sessao do turno.
+            key: Chave de make_metrics_key.
+            value: Resultado de evaluate_argument (serializavel em JSON).
+        """
+        serialized = json.dumps(value, ensure_ascii=False, default=_canonical_default)
+
+        with self._lock:
+            self._remember(session_id, key, serialized)
+            if self._conn is None:
+                return
+
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO metrics_memo (session_id, key, value, last_access) "
+                        "VALUES (?, ?, ?, ?)",
+                        (session_id, key, serialized, time.time())
+                    )
+                    # Mesmo limite por sessao no disco (remove as menos acessadas)
+                    cursor = self._conn.execute(
+                        "DELETE FROM metrics_memo WHERE session_id = ? AND key NOT IN ("
+                        "SELECT key FROM metrics_memo WHERE session_id = ? "
+                        "ORDER BY last_access DESC LIMIT ?)",
+                        (session_id, session_id, self.max_items_per_session)
+                    )
+                    self._conn.execute("COMMIT")
+                except sqlite3.Error:
+                    if self._conn.in_transaction:
+                        self._conn.execute("ROLLBACK")
+                    raise
+            except sqlite3.Error as e:
+                self._disable_disk(e)
+                return
+            self._stats["evictions"] += max(cursor.rowcount, 0)
+
+    def clear(self, session_id: Optional[str] = None) -> None:
+        """
+        Esvazia o memo (de uma sessao ou inteiro) e, sem sessao, zera contadores.
+
+        Args:
+            session_id: Sessao a limpar (None = todas).
+        """
+        with self._lock:
+            if session_id is None:
+                self._sessions.clear()
+                self._stats = {name: 0 for name in self._stats}
+            else:
+                self._sessions.pop(session_id, None)
+            if self._conn is not None:
+                try:
+                    if session_id is None:
+                        self._conn.execute("DELETE FROM metrics_memo")
+                    else:
+                        self._conn.execute("DELETE FROM metrics_memo WHERE session_id = ?", (session_id,))
+                except sqlite3.Error as e:
+                    self._disable_disk(e)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna contadores do memo.
+
+        Returns:
+            Dict com memory_hits, disk_hits, misses, evictions, disk_errors,
+            hit_rate, sessions, memory_items e disk_path (None sem nivel em
+            disco ou apos erro do SQLite).
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+            stats["hit_rate"] = (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+            stats["sessions"] = len(self._sessions)
+            stats["memory_items"] = sum(len(entries) for entries in self._sessions.values())
+            stats["disk_path"] = str(self.db_path) if self._conn is not None else None
+        return stats
+
+# Memo global (criado no primeiro uso, ver get_metrics_cache)
+_metrics_cache: Optional[MetricsCache] = None
+_metrics_cache_lock = threading.Lock()
+
+def get_metrics_cache() -> MetricsCache:
+    """
+    Retorna o memo de metricas global (criado no primeiro uso).
+
+    Returns:
+        MetricsCache configurado por OBSERVER_METRICS_CACHE_PATH e
+        OBSERVER_METRICS_CACHE_SIZE.
+    """
+    global _metrics_cache
+
+    if _metrics_cache is None:
+        with _metrics_cache_lock:
+            if _metrics_cache is None:
+                path_setting = os.getenv("OBSERVER_METRICS_CACHE_PATH", "none")
+                db_path = None if path_setting.lower() in ("", "none") else Path(path_setting)
+                size = int(os.getenv("OBSERVER_METRICS_CACHE_SIZE", DEFAULT_MAX_ITEMS_PER_SESSION))
+                try:
+                    _metrics_cache = MetricsCache(db_path, max_items_per_session=size)
+                except Exception as e:
+                    # Disco indisponivel nao deve impedir o calculo das metricas
+                    logger.warning(f"Memo de metricas em disco indisponivel ({e}); usando apenas memoria")
+                    _metrics_cache = MetricsCache(None, max_items_per_session=size)
+
+    return _metrics_cache
+
+def set_metrics_cache(cache: Optional[MetricsCache]) -> None:
+    """
+    Substitui o memo de metricas global.
+
+    Args:
+        cache: Novo memo, ou None para recriar a partir do ambiente no
+            proximo uso.
+    """
+    global _metrics_cache
+    _metrics_cache = cache
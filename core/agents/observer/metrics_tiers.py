@@ -0,0 +1,396 @@
+"""
+Metricas do Observador em niveis: decisao local com escalonamento para o LLM.
+
+A maioria dos turnos nao muda nenhuma decisao que depende das metricas
+(maturidade, snapshot automatico), mas o Observador pagava a avaliacao LLM
+em todos. Com o escalonamento habilitado, cada turno compara a estrutura
+do CognitiveModel com a do turno da ultima avaliacao LLM da sessao
+(microssegundos, sem LLM) e so escalona para a avaliacao completa quando:
+
+- no_baseline: a sessao ainda nao tem avaliacao LLM completa
+- periodic: passaram escalate_every_n_turns turnos desde a ultima
+- maturity_candidate: a ultima avaliacao LLM considerou o argumento maduro
+  ou com solidez acima do limiar (a decisao de snapshot precisa do LLM)
+- near_threshold: solidez da ultima avaliacao LLM a menos de
+  threshold_margin do limiar de maturidade (SOLIDEZ_MATURITY_THRESHOLD)
+- structure_changed: claim ou contradicoes mudaram, ou proposicoes,
+  questoes abertas e evidencias variaram max_structural_delta itens ou mais
+
+Fora desses casos (reason "clear") o turno reaproveita metricas e
+maturidade da ultima avaliacao LLM da sessao. As proposicoes extraidas
+chegam sem solidez (avaliadas so pelo LLM), por isso a decisao nao usa
+a formula heuristica de solidez. Com o escalonamento desligado (padrao)
+todo turno escalona (reason "disabled").
+
+Niveis registrados por turno (process_turn, eventos do Observador):
+    heuristic - decisao local, reaproveita a ultima avaliacao LLM
+    cache     - avaliacao LLM memoizada (metrics_cache.py), sem chamada
+    llm       - avaliacao LLM executada
+
+Configuracao em core/config/agents/observer.yaml (observer_config):
+    metrics_tiering:
+      enabled: false
+      threshold_margin: 0.10
+      escalate_every_n_turns: 5
+      max_structural_delta: 2
+
+A formula heuristica (heuristic_solidez/heuristic_completude) continua
+servindo a ObservadorAPI para checks rapidos.
+
+"""
+
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TIER_HEURISTIC = "heuristic"
+TIER_CACHE = "cache"
+TIER_LLM = "llm"
+TIERS = (TIER_HEURISTIC, TIER_CACHE, TIER_LLM)
+
+# Limiar de solidez para "maduro" no evento do grafo (multi_agent_graph.py)
+SOLIDEZ_MATURITY_THRESHOLD = 0.70
+
+# Proposicao com solidez a partir deste valor conta como solida
+SOLID_PROPOSICAO_THRESHOLD = 0.6
+
+DEFAULT_TIERING_CONFIG = {
+    "enabled": False,
+    "threshold_margin": 0.10,
+    "escalate_every_n_turns": 5,
+    "max_structural_delta": 2,
+}
+
+# Contagens comparadas entre o turno atual e o da ultima avaliacao LLM
+STRUCTURAL_COUNT_FIELDS = ("proposicoes", "open_questions", "solid_grounds")
+
+DEFAULT_MAX_SESSIONS = 1024
+
+def _proposicao_solidez(proposicao: Any) -> Optional[float]:
+    """Solidez de uma proposicao em dict (None se nao avaliada)."""
+    return proposicao.get("solidez") if isinstance(proposicao, dict) else None
+
+def heuristic_solidez(cognitive_model: Dict[str, Any]) -> float:
+    """
+    Solidez estimada pela estrutura do CognitiveModel (sem LLM).
+
+    Formula simplificada (POC):
+    - Claim definido: base 20% (+5% se > 50 chars)
+    - Proposicoes solidas (>= 0.6): +15% cada (max 45%)
+    - Proposicoes frageis (< 0.6): -5% cada (max -25%)
+    - Open questions: -5% cada (max -15%)
+    - Contradictions: -10% cada (max -30%)
+
+    Args:
+        cognitive_model: CognitiveModel em formato dict.
+
+    Returns:
+        Solidez entre 0.0 e 1.0 (0.0 sem claim).
+
+    Example:
+        >>> heuristic_solidez({"claim": "X", "proposicoes": [{"texto": "P", "solidez": 0.8}]})
+        0.35
+    """
+    claim = cognitive_model.get("claim", "")
+    proposicoes = cognitive_model.get("proposicoes", [])
+    open_questions = cognitive_model.get("open_questions", [])
+    contradictions = cognitive_model.get("contradictions", [])
+
+    # Se nao tem claim, solidez = 0
+    if not claim:
+        return 0.0
+
+    # Separar proposicoes por solidez (nao avaliadas nao contam)
+    solidez_values = [_proposicao_solidez(p) for p in proposicoes]
+    solid_count = sum(1 for s in solidez_values if s is not None and s >= SOLID_PROPOSICAO_THRESHOLD)
+    fragile_count = sum(1 for s in solidez_values if s is not None and s < SOLID_PROPOSICAO_THRESHOLD)
+
+    score = 0.20
+    score += min(0.45, solid_count * 0.15)
+    score -= min(0.25, fragile_count * 0.05)
+    score -= min(0.15, len(open_questions) * 0.05)
+    score -= min(0.30, len(contradictions) * 0.10)
+
+    # Bonus: claim longo (> 50 chars) adiciona 5%
+    if len(claim) > 50:
+        score += 0.05
+
+    return max(0.0, min(1.0, score))
+
+def heuristic_completude(cognitive_model: Dict[str, Any]) -> float:
+    """
+    Completude estimada: proposicoes solidas / (solidas + questoes abertas).
+
+    Args:
+        cognitive_model: CognitiveModel em formato dict.
+
+    Returns:
+        Completude entre 0.0 e 1.0 (0.0 sem elementos).
+
+    Example:
+        >>> heuristic_completude({"proposicoes": [{"solidez": 0.8}], "open_questions": ["Q"]})
+        0.5
+    """
+    proposicoes = cognitive_model.get("proposicoes", [])
+    open_questions = cognitive_model.get("open_questions", [])
+
+    solid_count = sum(
+        1 for p in proposicoes
+        if _proposicao_solidez(p) is not None and _proposicao_solidez(p) >= SOLID_PROPOSICAO_THRESHOLD
+    )
+
+    total_elements = solid_count + len(open_questions)
+    if total_elements == 0:
+        return 0.0
+
+    return solid_count / total_elements
+
+def structural_signature(cognitive_model: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Resume a estrutura do CognitiveModel que pesa nas metricas.
+
+    Args:
+        cognitive_model: CognitiveModel em formato dict.
+
+    Returns:
+        Dict com claim e contagens de proposicoes, open_questions,
+        contradictions e solid_grounds.
+
+    Example:
+        >>> structural_signature({"claim": "X", "proposicoes": [{"texto": "P"}]})["proposicoes"]
+        1
+    """
+    signature = {"claim": cognitive_model.get("claim", "")}
+    for field in (*STRUCTURAL_COUNT_FIELDS, "contradictions"):
+        signature[field] = len(cognitive_model.get(field) or [])
+    return signature
+
+def reused_evaluation(baseline: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Avaliacao do turno a partir da ultima avaliacao LLM da sessao.
+
+    Args:
+        baseline: Resultado de MetricsTierTracker.baseline.
+
+    Returns:
+        Copia de metrics e maturity da avaliacao LLM, com mode "heuristic".
+    """
+    evaluation = copy.deepcopy(baseline["evaluation"])
+    evaluation["mode"] = TIER_HEURISTIC
+    return evaluation
+
+def tier_event_metadata(metrics_tier: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Campos de metadata de evento com o nivel das metricas do turno.
+
+    Args:
+        metrics_tier: metrics_tier retornado por process_turn (ou None).
+
+    Returns:
+        Dict com metrics_tier, metrics_tier_reason e metrics_baseline_turn
+        (vazio se metrics_tier for None).
+    """
+    if not metrics_tier:
+        return {}
+    return {
+        "metrics_tier": metrics_tier["tier"],
+        "metrics_tier_reason": metrics_tier["reason"],
+        "metrics_baseline_turn": metrics_tier["baseline_turn"]
+    }
+
+def get_tiering_config() -> Dict[str, Any]:
+    """
+    Retorna observer_config.metrics_tiering de observer.yaml com defaults.
+
+    Returns:
+        Dict com enabled, threshold_margin, escalate_every_n_turns e
+        max_structural_delta; o default (desligado) se a configuracao nao
+        puder ser lida.
+    """
+    from core.agents.memory.config_loader import load_agent_config
+
+    try:
+        observer_config = load_agent_config("observer").get("observer_config") or {}
+    except Exception as e:
+        logger.warning(f"observer.yaml indisponivel ({e}); escalonamento de metricas desligado")
+        return dict(DEFAULT_TIERING_CONFIG)
+
+    return {**DEFAULT_TIERING_CONFIG, **(observer_config.get("metrics_tiering") or {})}
+
+def decide_metrics_tier(
+    signature: Dict[str, Any],
+    turn_number: int,
+    baseline: Optional[Dict[str, Any]],
+    config: Dict[str, Any]
+) -> Tuple[bool, str]:
+    """
+    Decide se o turno escalona para a avaliacao LLM.
+
+    Args:
+        signature: structural_signature do CognitiveModel atual.
+        turn_number: Numero do turno atual.
+        baseline: Ultima avaliacao LLM da sessao (MetricsTierTracker.baseline)
+            ou None.
+        config: Resultado de get_tiering_config.
+
+    Returns:
+        Tupla (escalonar, motivo).
+
+    Example:
+        >>> decide_metrics_tier(signature, 3, tracker.baseline("session-1"), config)
+        (False, 'clear')
+    """
+    if not config.get("enabled"):
+        return True, "disabled"
+    if baseline is None:
+        return True, "no_baseline"
+    if turn_number - baseline["turn"] >= int(config["escalate_every_n_turns"]):
+        return True, "periodic"
+
+    solidez = baseline["evaluation"]["metrics"]["solidez"]
+    if baseline["evaluation"]["maturity"].get("is_mature") or solidez >= SOLIDEZ_MATURITY_THRESHOLD:
+        return True, "maturity_candidate"
+    if abs(solidez - SOLIDEZ_MATURITY_THRESHOLD) <= float(config["threshold_margin"]):
+        return True, "near_threshold"
+
+    previous = baseline["signature"]
+    delta = sum(abs(signature[field] - previous[field]) for field in STRUCTURAL_COUNT_FIELDS)
+    if (
+        signature["claim"] != previous["claim"] or
+        signature["contradictions"] != previous["contradictions"] or
+        delta >= int(config["max_structural_delta"])
+    ):
+        return True, "structure_changed"
+    return False, "clear"
+
+class MetricsTierTracker:
+    """
+    Ultima avaliacao LLM por sessao e contadores de niveis.
+
+    Thread-safe (workers do Observador processam sessoes em paralelo).
+
+    Example:
+        >>> tracker = MetricsTierTracker()
+        >>> tracker.record("session-1", 1, TIER_LLM, "no_baseline", evaluation, signature)
+        >>> tracker.baseline("session-1")["turn"]
+        1
+    """
+
+    def __init__(self, max_sessions: int = DEFAULT_MAX_SESSIONS):
+        self.max_sessions = max(1, max_sessions)
+        self._lock = threading.Lock()
+        self._baselines: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._tiers = {tier: 0 for tier in TIERS}
+        self._reasons: Dict[str, int] = {}
+
+    def baseline(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Ultima avaliacao LLM completa da sessao (inclusive memoizada).
+
+        Returns:
+            Dict com turn, evaluation e signature, ou None.
+        """
+        with self._lock:
+            return self._baselines.get(session_id)
+
+    def last_llm_turn(self, session_id: str) -> Optional[int]:
+        """Turno da ultima avaliacao LLM completa da sessao."""
+        baseline = self.baseline(session_id)
+        return baseline["turn"] if baseline is not None else None
+
+    def record(
+        self,
+        session_id: str,
+        turn_number: int,
+        tier: str,
+        reason: str,
+        evaluation: Optional[Dict[str, Any]] = None,
+        signature: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Registra o nivel usado em um turno.
+
+        Args:
+            session_id: Sessao do turno.
+            turn_number: Numero do turno.
+            tier: TIER_HEURISTIC, TIER_CACHE ou TIER_LLM.
+            reason: Motivo de decide_metrics_tier.
+            evaluation: Avaliacao LLM completa do turno (vira a referencia
+                da sessao); None mantem a referencia anterior.
+            signature: structural_signature do turno (com evaluation).
+        """
+        with self._lock:
+            self._tiers[tier] += 1
+            self._reasons[reason] = self._reasons.get(reason, 0) + 1
+            if evaluation is None:
+                return
+            self._baselines[session_id] = {
+                "turn": turn_number,
+                "evaluation": copy.deepcopy(evaluation),
+                "signature": signature
+            }
+            self._baselines.move_to_end(session_id)
+            while len(self._baselines) > self.max_sessions:
+                self._baselines.popitem(last=False)
+
+    def reset(self, session_id: str) -> None:
+        """Esquece a sessao (proximo turno volta a escalonar)."""
+        with self._lock:
+            self._baselines.pop(session_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna contadores de niveis.
+
+        Returns:
+            Dict com turns, tiers (turnos por nivel), reasons (turnos por
+            motivo) e llm_avoided_rate (fracao sem chamada LLM).
+        """
+        with self._lock:
+            turns = sum(self._tiers.values())
+            avoided = self._tiers[TIER_HEURISTIC] + self._tiers[TIER_CACHE]
+            return {
+                "turns": turns,
+                "tiers": dict(self._tiers),
+                "reasons": dict(self._reasons),
+                "llm_avoided_rate": avoided / turns if turns else 0.0,
+            }
+
+# Rastreador global (criado no primeiro uso, ver get_metrics_tier_tracker)
+_tier_tracker: Optional[MetricsTierTracker] = None
+_tier_tracker_lock = threading.Lock()
+
+def get_metrics_tier_tracker() -> MetricsTierTracker:
+    """Retorna o rastreador de niveis global (criado no primeiro uso)."""
+    global _tier_tracker
+
+    if _tier_tracker is None:
+        with _tier_tracker_lock:
+            if _tier_tracker is None:
+                _tier_tracker = MetricsTierTracker()
+
+    return _tier_tracker
+
+def set_metrics_tier_tracker(tracker: Optional[MetricsTierTracker]) -> None:
+    """
+    Substitui o rastreador de niveis global.
+
+    Args:
+        tracker: Novo rastreador, ou None para recriar no proximo uso.
+    """
+    global _tier_tracker
+    _tier_tracker = tracker
+
+def get_metrics_tier_stats() -> Dict[str, Any]:
+    """
+    Contadores de niveis das metricas do Observador (ver MetricsTierTracker.get_stats).
+
+    Example:
+        >>> get_metrics_tier_stats()["llm_avoided_rate"]
+        0.6
+    """
+    return get_metrics_tier_tracker().get_stats()
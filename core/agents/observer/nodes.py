@@ -12,11 +12,24 @@ monitorando a conversa e catalogando a evolucao do raciocinio.
 import logging
 import time
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List
 
 from .state import ObserverState, ObserverInsight, create_initial_observer_state
 from .extractors import extract_all
-from .metrics import calculate_metrics, evaluate_maturity
+from .metrics import calculate_metrics, evaluate_argument, get_metrics_mode, is_evaluation_complete
+from .metrics_cache import get_metrics_cache, make_metrics_key
+from .metrics_tiers import (
+    TIER_CACHE,
+    TIER_HEURISTIC,
+    TIER_LLM,
+    decide_metrics_tier,
+    get_metrics_tier_tracker,
+    get_tiering_config,
+    reused_evaluation,
+    structural_signature,
+    tier_event_metadata,
+)
+from .prompts import RECOMMENDED_MODEL
 from .concept_pipeline import persist_concepts_batch
 
 from core.agents.models.proposition import Proposicao
@@ -37,7 +50,8 @@ def process_turn(
     calculate_metrics_flag: bool = True,
     # Parametros para persistencia de conceitos (Epic 10.4)
     persist_concepts_flag: bool = True,
-    idea_id: Optional[str] = None
+    idea_id: Optional[str] = None,
+    should_stop: Optional[Callable[[], bool]] = None
 ) -> Dict[str, Any]:
     """
     Processa um turno completo e atualiza o CognitiveModel.
@@ -65,6 +79,9 @@ def process_turn(
         calculate_metrics_flag: Se deve calcular metricas (default True).
         persist_concepts_flag: Se deve persistir conceitos no catalogo (default True).
         idea_id: ID da Idea para criar link N:N (opcional).
+        should_stop: Consultado antes de persistir conceitos e publicar
+            eventos; True = turno obsoleto (worker pool), sem efeitos
+            colaterais (opcional).
 
     Returns:
         Dict com:
@@ -72,9 +89,13 @@ def process_turn(
         - extracted: Informacoes extraidas neste turno
         - metrics: Metricas calculadas (solidez, completude)
         - maturity: Avaliacao de maturidade
+        - metrics_cached: True se metricas/maturidade vieram do memo (sem LLM)
+        - metrics_tier: Nivel usado (heuristic, cache ou llm), motivo e
+          turno da avaliacao LLM usada (baseline_turn)
         - processing_time_ms: Tempo de processamento
         - skipped: Lista de etapas puladas (se houver)
         - persisted_concepts: Resumo da persistencia de conceitos (Epic 10.4)
+        - stale: True se should_stop interrompeu os efeitos colaterais
 
     Example:
         >>> result = process_turn(
@@ -120,9 +141,12 @@ def process_turn(
         conversation_history=conversation_history
     )
 
+    def _is_stale() -> bool:
+        return should_stop is not None and should_stop()
+
     # 2. Persistir conceitos no catalogo (Epic 10.4)
     persisted_concepts = None
-    if persist_concepts_flag and extracted.get("concepts"):
+    if persist_concepts_flag and extracted.get("concepts") and not _is_stale():
         logger.info(f"Persistindo {len(extracted['concepts'])} conceitos no catalogo...")
         persisted_concepts = persist_concepts_batch(
             concepts=extracted["concepts"],
@@ -139,39 +163,83 @@ def process_turn(
         extracted=extracted
     )
 
-    # 4. Calcular metricas (Epico 11.4: usando proposicoes unificadas)
-    metrics = calculate_metrics(
-        claim=cognitive_model.get("claim", ""),
-        claims=extracted.get("claims", []),
-        proposicoes=cognitive_model.get("proposicoes", []),
-        open_questions=cognitive_model.get("open_questions", []),
-        contradictions=cognitive_model.get("contradictions", []),
-        context=cognitive_model.get("context", {}),
-        solid_grounds=cognitive_model.get("solid_grounds", [])
-    )
+    # 4-5. Calcular metricas e avaliar maturidade (Epico 11.4: usando proposicoes
+    # unificadas). Modo em observer.yaml: tres chamadas ou uma chamada fundida
+    metrics_inputs = {
+        "claim": cognitive_model.get("claim", ""),
+        "claims": extracted.get("claims", []),
+        "proposicoes": cognitive_model.get("proposicoes", []),
+        "open_questions": cognitive_model.get("open_questions", []),
+        "contradictions": cognitive_model.get("contradictions", []),
+        "context": cognitive_model.get("context", {}),
+        "solid_grounds": cognitive_model.get("solid_grounds", [])
+    }
 
-    # 5. Avaliar maturidade (via LLM com contexto completo)
-    # Extrair textos das proposicoes para passar ao avaliador
-    prop_texts = [
-        p.get("texto", "") if isinstance(p, dict) else p.texto
-        for p in cognitive_model.get("proposicoes", [])
-    ]
-    maturity = evaluate_maturity(
-        solidez=metrics["solidez"],
-        completude=metrics["completude"],
-        open_questions=cognitive_model.get("open_questions", []),
-        contradictions=cognitive_model.get("contradictions", []),
-        claims=extracted.get("claims", []),
-        proposicoes=cognitive_model.get("proposicoes", [])
+    # Decisao local: o turno precisa do LLM ou reaproveita a ultima
+    # avaliacao LLM da sessao? (ver metrics_tiers.py)
+    tier_session = session_id or "default"
+    tier_tracker = get_metrics_tier_tracker()
+    signature = structural_signature(cognitive_model)
+    baseline = tier_tracker.baseline(tier_session)
+    escalate, tier_reason = decide_metrics_tier(
+        signature=signature,
+        turn_number=turn_number,
+        baseline=baseline,
+        config=get_tiering_config()
     )
 
-    # 6. Publicar eventos (se session_id fornecido)
-    if session_id:
+    metrics_cached = False
+    if not escalate:
+        evaluation = reused_evaluation(baseline)
+        tier = TIER_HEURISTIC
+        tier_tracker.record(tier_session, turn_number, tier, tier_reason)
+    else:
+        # Entradas identicas a um turno anterior da sessao reutilizam a
+        # avaliacao memoizada, sem chamadas LLM (ver metrics_cache.py)
+        metrics_mode = get_metrics_mode()
+        metrics_cache = get_metrics_cache()
+        cache_key = make_metrics_key(metrics_mode, RECOMMENDED_MODEL, **metrics_inputs)
+
+        evaluation = metrics_cache.get(tier_session, cache_key)
+        metrics_cached = evaluation is not None
+        evaluation_complete = True
+        if metrics_cached:
+            logger.info("Metricas reutilizadas do memo (CognitiveModel inalterado)")
+        else:
+            evaluation = evaluate_argument(**metrics_inputs, mode=metrics_mode)
+            evaluation_complete = is_evaluation_complete(evaluation)
+            if evaluation_complete:
+                metrics_cache.put(tier_session, cache_key, evaluation)
+        tier = TIER_CACHE if metrics_cached else TIER_LLM
+        # Avaliacao com fallback de erro nao vira referencia da sessao
+        tier_tracker.record(
+            tier_session, turn_number, tier, tier_reason,
+            evaluation=evaluation if evaluation_complete else None,
+            signature=signature
+        )
+        baseline = tier_tracker.baseline(tier_session)
+
+    metrics_tier = {
+        "tier": tier,
+        "reason": tier_reason,
+        "baseline_turn": baseline["turn"] if baseline is not None else None
+    }
+    logger.info(f"Metricas: nivel {tier} ({tier_reason})")
+    metrics = evaluation["metrics"]
+    maturity = evaluation["maturity"]
+
+    # 6. Publicar eventos (se session_id fornecido e o turno nao ficou obsoleto)
+    stale = _is_stale()
+    if stale:
+        logger.info(f"Turno {turn_number} obsoleto: eventos nao publicados")
+    elif session_id:
         _publish_cognitive_model_event(
             session_id=session_id,
             cognitive_model=cognitive_model,
             metrics=metrics,
-            turn_number=turn_number
+            turn_number=turn_number,
+            maturity=maturity,
+            metrics_tier=metrics_tier
         )
 
     # Calcular tempo de processamento
@@ -189,10 +257,13 @@ def process_turn(
         "extracted": extracted,
         "metrics": metrics,
         "maturity": maturity,
+        "metrics_cached": metrics_cached,
+        "metrics_tier": metrics_tier,
         "processing_time_ms": processing_time_ms,
         "turn_number": turn_number,
         "skipped": skipped,  # Etapas puladas (para Agentic RAG)
-        "persisted_concepts": persisted_concepts  # Resumo da persistencia (Epic 10.4)
+        "persisted_concepts": persisted_concepts,  # Resumo da persistencia (Epic 10.4)
+        "stale": stale
     }
 
 def _merge_cognitive_model(
@@ -293,7 +364,9 @@ def _publish_cognitive_model_event(
     session_id: str,
     cognitive_model: Dict[str, Any],
     metrics: Dict[str, Any],
-    turn_number: int
+    turn_number: int,
+    maturity: Optional[Dict[str, Any]] = None,
+    metrics_tier: Optional[Dict[str, Any]] = None
 ) -> None:
     """
     Publica evento CognitiveModelUpdatedEvent no EventBus.
@@ -305,6 +378,8 @@ def _publish_cognitive_model_event(
         cognitive_model: CognitiveModel atualizado.
         metrics: Metricas calculadas.
         turn_number: Numero do turno.
+        maturity: Maturidade ja avaliada no turno (evita nova chamada LLM).
+        metrics_tier: Nivel das metricas do turno (registrado no metadata).
     """
     try:
         from core.utils.event_bus import get_event_bus
@@ -312,15 +387,16 @@ def _publish_cognitive_model_event(
 
         event_bus = get_event_bus()
 
-        # Avaliar maturidade para o evento (via LLM)
-        maturity = evaluate_maturity(
-            solidez=metrics["solidez"],
-            completude=metrics["completude"],
-            open_questions=cognitive_model.get("open_questions", []),
-            contradictions=cognitive_model.get("contradictions", []),
-            claims=[cognitive_model.get("claim", "")] if cognitive_model.get("claim") else [],
-            proposicoes=cognitive_model.get("proposicoes", [])
-        )
+        # Avaliar maturidade para o evento (via LLM) se o turno nao a trouxe
+        if maturity is None:
+            maturity = evaluate_maturity(
+                solidez=metrics["solidez"],
+                completude=metrics["completude"],
+                open_questions=cognitive_model.get("open_questions", []),
+                contradictions=cognitive_model.get("contradictions", []),
+                claims=[cognitive_model.get("claim", "")] if cognitive_model.get("claim") else [],
+                proposicoes=cognitive_model.get("proposicoes", [])
+            )
 
         # Publicar evento especifico do CognitiveModel (Epico 10.2)
         # Epico 11.5: usa 'proposicoes_count'
@@ -337,7 +413,8 @@ def _publish_cognitive_model_event(
             is_mature=maturity["is_mature"],
             metadata={
                 "claim": cognitive_model.get("claim", "")[:100],  # Truncar para nao poluir evento
-                "maturity_reason": maturity.get("reason", "")
+                "maturity_reason": maturity.get("reason", ""),
+                **tier_event_metadata(metrics_tier)
             }
         )
 
@@ -356,6 +356,86 @@ CRITERIOS DE MATURIDADE (contextuais, nao rigidos):
 - Momento faz sentido como registro evolutivo
 """
 
+# =============================================================================
+# PROMPT: AVALIACAO FUNDIDA - SOLIDEZ + COMPLETUDE + MATURIDADE (modo "fused")
+# =============================================================================
+
+EVALUATE_FUSED_PROMPT = """Voce e o Observador (Mente Analitica) do sistema Paper Agent.
+
+FILOSOFIA EPISTEMOLOGICA:
+- Nao existe verdade absoluta, apenas narrativas com diferentes graus de SUSTENTACAO
+- Proposicoes tem SOLIDEZ (nao sao "verdadeiras" ou "falsas")
+- Sistema nao julga verdade, MAPEIA sustentacao
+
+TAREFA:
+Avalie o argumento em TRES dimensoes, nesta ordem:
+1. SOLIDEZ: quao bem fundamentado esta o argumento
+2. COMPLETUDE: quanto do argumento esta desenvolvido
+3. MATURIDADE: se, dadas a solidez e a completude que voce avaliou, o
+   argumento esta maduro para um snapshot (marco evolutivo)
+
+CLAIM CENTRAL:
+{claim}
+
+CLAIMS EXTRAIDOS:
+{claims}
+
+PROPOSICOES (fundamentos do argumento com solidez variável):
+{fundamentos}
+
+CONTRADICOES DETECTADAS:
+{contradictions}
+
+QUESTOES ABERTAS:
+{open_questions}
+
+CONTEXTO DO ARGUMENTO:
+{context}
+
+EVIDENCIAS BIBLIOGRAFICAS (se existirem):
+{solid_grounds}
+
+ANALISE CONTEXTUAL:
+Solidez - as proposicoes REALMENTE sustentam o claim? A logica e coerente?
+Proposicoes fracas ou contradicoes graves enfraquecem o argumento?
+Completude - os claims estao bem articulados? O raciocinio tem começo, meio
+e fim? O contexto esta definido (dominio, populacao, metricas)?
+Maturidade - o argumento tem identidade propria? As questoes abertas sao
+bloqueadoras ou exploratorias? Faz sentido registrar este momento?
+
+RETORNE APENAS JSON:
+{{
+    "solidez": {{
+        "solidez": 0.65,
+        "analysis": "Explicacao de como avaliou a solidez",
+        "strengths": ["ponto forte 1"],
+        "weaknesses": ["ponto fraco 1"],
+        "critical_gaps": ["lacuna critica se houver"]
+    }},
+    "completude": {{
+        "completude": 0.55,
+        "analysis": "Explicacao de como avaliou a completude",
+        "developed_aspects": ["aspecto desenvolvido 1"],
+        "missing_aspects": ["aspecto faltante 1"],
+        "next_steps_suggested": ["proximo passo 1"]
+    }},
+    "maturity": {{
+        "is_mature": false,
+        "confidence": 0.75,
+        "reason": "Explicacao contextual da decisao",
+        "blocking_issues": ["questao bloqueadora se houver"],
+        "recommendation": "Criar snapshot" ou "Continuar desenvolvimento"
+    }}
+}}
+
+ESCALAS (solidez e completude):
+- 0.0-0.2: sem sustentacao / embrionario
+- 0.2-0.4: fragil / parcial
+- 0.4-0.6: em construcao / em desenvolvimento
+- 0.6-0.8: solido / quase completo
+- 0.8-1.0: muito solido / completo
+"""
+
 # =============================================================================
 # PROMPT: DETECCAO DE VARIACAO VS MUDANCA REAL (Epico 13.1)
 # =============================================================================
@@ -551,5 +631,8 @@ MAX_EXTRACTION_TOKENS = 500
 # Maximo de tokens para avaliacao de metricas
 MAX_METRICS_TOKENS = 800
 
+# Maximo de tokens para avaliacao fundida (solidez + completude + maturidade)
+MAX_FUSED_METRICS_TOKENS = 1500
+
 # Threshold de confianca para reportar contradicoes
 CONTRADICTION_CONFIDENCE_THRESHOLD = 0.80
@@ -0,0 +1,507 @@
+"""
+Indices vetoriais plugaveis do Catalogo de Conceitos.
+
+ConceptCatalog delega a busca por similaridade a um VectorIndex:
+
+- ChromaVectorIndex: collection do ChromaDB (HNSW, persistencia propria)
+- NumpyVectorIndex: matriz float32 normalizada em memoria, busca
+  por forca bruta (matmul). Para catalogos de ate ~100k conceitos, uma
+  multiplicacao 100k x 384 custa poucos ms e evita o startup do cliente
+  e o overhead por query do ChromaDB.
+
+Similaridade retornada: cosseno limitado a [0, 1] (o mesmo que
+1 - distancia cosseno do ChromaDB com hnsw:space=cosine).
+
+Persistencia do NumpyVectorIndex ({path}/):
+    vectors.npy   matriz (capacidade x dims) aberta via memory-map; cresce
+                  dobrando a capacidade
+    ids.jsonl     sidecar append-only: {"id", "metadata"} por linha e
+                  {"delete": id} para remocoes; define quantas linhas de
+                  vectors.npy sao validas (linhas alem disso sao ignoradas)
+
+Remocoes e upserts deixam tombstones (linhas mortas); a mascara de linhas
+vivas e mantida por add/delete. Ao carregar, se os tombstones passam de
+COMPACT_TOMBSTONE_RATIO das linhas, os dois arquivos sao reescritos so com
+as linhas vivas (compact).
+
+O NumpyVectorIndex assume um unico processo escritor por diretorio.
+
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .embeddings import normalize_rows, similarity_matrix
+
+logger = logging.getLogger(__name__)
+
+# Backends selecionaveis por nome (ex: variavel OBSERVER_VECTOR_BACKEND)
+VECTOR_BACKEND_CHROMA = "chroma"
+VECTOR_BACKEND_NUMPY = "numpy"
+AVAILABLE_VECTOR_BACKENDS = (VECTOR_BACKEND_CHROMA, VECTOR_BACKEND_NUMPY)
+
+# Fracao de tombstones a partir da qual o NumpyVectorIndex compacta ao carregar
+COMPACT_TOMBSTONE_RATIO = 0.25
+
+# Resultado por query: (id, similaridade, metadados)
+VectorHit = Tuple[str, float, Dict[str, Any]]
+
+class VectorIndex:
+    """
+    Interface de indice vetorial usada pelo ConceptCatalog.
+
+    Subclasses implementam add, query, delete, count, get_embeddings e
+    reset; upsert tem implementacao padrao (delete + add).
+    """
+
+    def add(
+        self,
+        ids: Sequence[str],
+        embeddings: Sequence[Sequence[float]],
+        metadatas: Sequence[Dict[str, Any]]
+    ) -> None:
+        """
+        Adiciona vetores ao indice.
+
+        Args:
+            ids: IDs dos vetores (ID do conceito).
+            embeddings: Vetores (mesma dimensao).
+            metadatas: Metadados por vetor (label, essence).
+        """
+        raise NotImplementedError
+
+    def upsert(
+        self,
+        ids: Sequence[str],
+        embeddings: Sequence[Sequence[float]],
+        metadatas: Sequence[Dict[str, Any]]
+    ) -> None:
+        """
+        Adiciona ou substitui vetores (idempotente por ID).
+
+        Args:
+            ids: IDs dos vetores.
+            embeddings: Vetores (mesma dimensao).
+            metadatas: Metadados por vetor.
+        """
+        self.delete(ids)
+        self.add(ids, embeddings, metadatas)
+
+    def query(self, embeddings: Sequence[Sequence[float]], top_k: int) -> List[List[VectorHit]]:
+        """
+        Busca os top_k vetores mais similares para cada query.
+
+        Args:
+            embeddings: Vetores das queries.
+            top_k: Numero maximo de resultados por query.
+
+        Returns:
+            Uma lista de (id, similaridade, metadados) por query, da maior
+            para a menor similaridade.
+        """
+        raise NotImplementedError
+
+    def delete(self, ids: Sequence[str]) -> None:
+        """
+        Remove vetores do indice (IDs inexistentes sao ignorados).
+
+        Args:
+            ids: IDs a remover.
+        """
+        raise NotImplementedError
+
+    def count(self) -> int:
+        """
+        Retorna o numero de vetores no indice.
+
+        Returns:
+            Quantidade de vetores.
+        """
+        raise NotImplementedError
+
+    def get_embeddings(self, ids: Sequence[str]) -> Dict[str, List[float]]:
+        """
+        Retorna os vetores armazenados para os IDs (inexistentes ficam de fora).
+
+        Args:
+            ids: IDs a buscar.
+
+        Returns:
+            Dict id -> vetor.
+        """
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        """Remove todos os vetores (usado na reconstrucao do indice)."""
+        raise NotImplementedError
+
+class ChromaVectorIndex(VectorIndex):
+    """
+    Indice vetorial sobre uma collection do ChromaDB (padrao).
+
+    Args:
+        path: Diretorio de persistencia do ChromaDB.
+        collection_name: Nome da collection. Default: "concepts".
+    """
+
+    def __init__(self, path: str, collection_name: str = "concepts"):
+        import chromadb
+        from chromadb.config import Settings
+
+        self.path = path
+        self.collection_name = collection_name
+        self.client = chromadb.PersistentClient(
+            path=path,
+            settings=Settings(anonymized_telemetry=False)
+        )
+        self._open_collection()
+
+    def _open_collection(self) -> None:
+        self.collection = self.client.get_or_create_collection(
+            name=self.collection_name,
+            metadata={
+                "description": "Biblioteca global de conceitos",
+                "hnsw:space": "cosine"  # Usar distancia cosseno (mais intuitivo)
+            }
+        )
+
+        logger.debug(f"ChromaDB collection '{self.collection_name}' inicializada")
+
+    def add(self, ids, embeddings, metadatas) -> None:
+        self.collection.add(ids=list(ids), embeddings=list(embeddings), metadatas=list(metadatas))
+
+    def count(self) -> int:
+        # Garantir que count() retorna um int (pode ser None ou MagicMock em testes)
+        try:
+            collection_count = self.collection.count()
+            if not isinstance(collection_count, int):
+                collection_count = 0
+        except (AttributeError, TypeError):
+            collection_count = 0
+        return collection_count
+
+    def query(self, embeddings, top_k: int) -> List[List[VectorHit]]:
+        if len(embeddings) == 0:
+            return []
+
+        n_results = min(top_k, max(self.count(), 1))
+        results = self.collection.query(
+            query_embeddings=list(embeddings),
+            n_results=n_results,
+            include=["metadatas", "distances"]
+        )
+
+        all_hits: List[List[VectorHit]] = [[] for _ in embeddings]
+        all_metadatas = results.get("metadatas") or []
+        for row, ids in enumerate((results["ids"] or [])[:len(all_hits)]):
+            metadatas = all_metadatas[row] if row < len(all_metadatas) else None
+            metadatas = metadatas or [{}] * len(ids)
+            for i, concept_id in enumerate(ids):
+                # Distancia cosseno: 0 = identico, 1 = ortogonal, 2 = oposto
+                # Similaridade = 1 - distancia
+                similarity = max(0.0, min(1.0, 1 - results["distances"][row][i]))
+                all_hits[row].append((concept_id, similarity, metadatas[i] or {}))
+        return all_hits
+
+    def upsert(self, ids, embeddings, metadatas) -> None:
+        self.collection.upsert(ids=list(ids), embeddings=list(embeddings), metadatas=list(metadatas))
+
+    def delete(self, ids) -> None:
+        self.collection.delete(ids=list(ids))
+
+    def get_embeddings(self, ids) -> Dict[str, List[float]]:
+        if not ids:
+            return {}
+        results = self.collection.get(ids=list(ids), include=["embeddings"])
+        embeddings = results.get("embeddings")
+        if embeddings is None:
+            return {}
+        return {
+            concept_id: [float(value) for value in embedding]
+            for concept_id, embedding in zip(results["ids"], embeddings)
+        }
+
+    def reset(self) -> None:
+        self.client.delete_collection(self.collection_name)
+        self._open_collection()
+
+class NumpyVectorIndex(VectorIndex):
+    """
+    Indice vetorial em NumPy: busca por forca bruta sobre matriz normalizada.
+
+    Args:
+        path: Diretorio com vectors.npy e ids.jsonl (criado se necessario).
+        initial_capacity: Linhas reservadas ao criar vectors.npy. Default: 1024
+
+    Example:
+        >>> index = NumpyVectorIndex("data/vectors")
+        >>> index.add(["c1"], [[1.0, 0.0]], [{"label": "Cooperacao"}])
+        >>> index.query([[0.9, 0.1]], top_k=1)
+        [[('c1', 0.99..., {'label': 'Cooperacao'})]]
+    """
+
+    VECTORS_FILENAME = "vectors.npy"
+    IDS_FILENAME = "ids.jsonl"
+
+    def __init__(self, path: str, initial_capacity: int = 1024):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.initial_capacity = initial_capacity
+
+        self._lock = threading.RLock()
+        self._vectors_path = self.path / self.VECTORS_FILENAME
+        self._ids_path = self.path / self.IDS_FILENAME
+
+        # Linha i de _matrix pertence a _ids[i] (None = removido); _live[i]
+        # espelha _ids[i] is not None (capacidade >= len(_ids))
+        self._matrix: Optional[np.ndarray] = None
+        self._ids: List[Optional[str]] = []
+        self._metadatas: List[Dict[str, Any]] = []
+        self._row_by_id: Dict[str, int] = {}
+        self._live = np.zeros(0, dtype=bool)
+        self._load()
+
+    def _load(self) -> None:
+        """Carrega sidecar e abre vectors.npy via memory-map."""
+        if self._ids_path.exists():
+            with open(self._ids_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Linha final incompleta (escrita interrompida)
+                        continue
+                    if "delete" in entry:
+                        row = self._row_by_id.pop(entry["delete"], None)
+                        if row is not None:
+                            self._ids[row] = None
+                    else:
+                        # ID repetido (upsert): a linha anterior vira tombstone
+                        previous = self._row_by_id.get(entry["id"])
+                        if previous is not None:
+                            self._ids[previous] = None
+                        self._row_by_id[entry["id"]] = len(self._ids)
+                        self._ids.append(entry["id"])
+                        self._metadatas.append(entry.get("metadata") or {})
+
+        if self._vectors_path.exists():
+            self._matrix = np.load(self._vectors_path, mmap_mode="r+")
+            if self._matrix.shape[0] < len(self._ids):
+                raise ValueError(
+                    f"{self._vectors_path} tem {self._matrix.shape[0]} linhas, "
+                    f"sidecar referencia {len(self._ids)}"
+                )
+
+        self._live = np.zeros(len(self._ids), dtype=bool)
+        self._live[list(self._row_by_id.values())] = True
+
+        tombstones = len(self._ids) - len(self._row_by_id)
+        if self._matrix is not None and tombstones and tombstones >= COMPACT_TOMBSTONE_RATIO * len(self._ids):
+            self.compact()
+
+    def _grow_live(self, rows: int) -> None:
+        """Garante mascara de linhas vivas com pelo menos rows posicoes."""
+        if self._live.shape[0] < rows:
+            grown = np.zeros(max(rows, self._live.shape[0] * 2), dtype=bool)
+            grown[:self._live.shape[0]] = self._live
+            self._live = grown
+
+    def compact(self) -> None:
+        """
+        Reescreve vectors.npy e ids.jsonl apenas com as linhas vivas.
+
+        Chamado ao carregar quando ha muitos tombstones; pode ser chamado
+        apos remocoes em massa (ex: consolidate_concepts). Os dois arquivos
+        sao gravados em temporarios e trocados via os.replace; uma queda
+        entre as duas trocas exige rebuild_index.
+        """
+        with self._lock:
+            if self._matrix is None:
+                return
+            used = len(self._ids)
+            rows = np.flatnonzero(self._live[:used])
+            if len(rows) == used:
+                return
+
+            dims = self._matrix.shape[1]
+            capacity = max(self.initial_capacity, len(rows))
+            vectors_tmp = self._vectors_path.with_name(f"{self.VECTORS_FILENAME}.{os.getpid()}.tmp")
+            ids_tmp = self._ids_path.with_name(f"{self.IDS_FILENAME}.{os.getpid()}.tmp")
+
+            compacted = np.lib.format.open_memmap(vectors_tmp, mode="w+", dtype=np.float32, shape=(capacity, dims))
+            compacted[:len(rows)] = self._matrix[rows]
+            compacted.flush()
+            del compacted
+
+            ids = [self._ids[row] for row in rows]
+            metadatas = [self._metadatas[row] for row in rows]
+            with open(ids_tmp, "w", encoding="utf-8") as f:
+                for concept_id, metadata in zip(ids, metadatas):
+                    f.write(json.dumps({"id": concept_id, "metadata": metadata}, ensure_ascii=False) + "\n")
+
+            self._matrix = None
+            os.replace(vectors_tmp, self._vectors_path)
+            os.replace(ids_tmp, self._ids_path)
+            self._matrix = np.load(self._vectors_path, mmap_mode="r+")
+
+            self._ids = ids
+            self._metadatas = metadatas
+            self._row_by_id = {concept_id: row for row, concept_id in enumerate(ids)}
+            self._live = np.zeros(capacity, dtype=bool)
+            self._live[:len(ids)] = True
+            logger.info(f"Indice vetorial compactado: {used - len(ids)} tombstones removidos")
+
+    def _ensure_capacity(self, rows: int, dims: int) -> None:
+        """Garante espaco para rows linhas; dobra a capacidade copiando o arquivo."""
+        if self._matrix is not None:
+            if self._matrix.shape[1] != dims:
+                raise ValueError(f"Dimensao {dims} difere do indice ({self._matrix.shape[1]})")
+            if self._matrix.shape[0] >= rows:
+                return
+
+        capacity = max(self.initial_capacity, rows)
+        if self._matrix is not None:
+            capacity = max(capacity, self._matrix.shape[0] * 2)
+
+        tmp_path = self._vectors_path.with_name(f"{self.VECTORS_FILENAME}.{os.getpid()}.tmp")
+        grown = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float32, shape=(capacity, dims))
+        if self._matrix is not None:
+            used = len(self._ids)
+            grown[:used] = self._matrix[:used]
+        grown.flush()
+        del grown
+        self._matrix = None
+        os.replace(tmp_path, self._vectors_path)
+        self._matrix = np.load(self._vectors_path, mmap_mode="r+")
+
+    def add(self, ids, embeddings, metadatas) -> None:
+        if not ids:
+            return
+
+        vectors = normalize_rows(embeddings)
+        with self._lock:
+            start = len(self._ids)
+            self._ensure_capacity(start + len(ids), vectors.shape[1])
+
+            # Vetores primeiro, sidecar depois: linhas sem entrada no sidecar
+            # (queda no meio do add) sao ignoradas na proxima carga
+            self._matrix[start:start + len(ids)] = vectors
+            self._matrix.flush()
+            self._grow_live(start + len(ids))
+
+            with open(self._ids_path, "a", encoding="utf-8") as f:
+                for concept_id, metadata in zip(ids, metadatas):
+                    f.write(json.dumps({"id": concept_id, "metadata": metadata}, ensure_ascii=False) + "\n")
+
+            for offset, (concept_id, metadata) in enumerate(zip(ids, metadatas)):
+                previous = self._row_by_id.get(concept_id)
+                if previous is not None:
+                    self._ids[previous] = None
+                    self._live[previous] = False
+                self._row_by_id[concept_id] = start + offset
+                self._live[start + offset] = True
+                self._ids.append(concept_id)
+                self._metadatas.append(dict(metadata or {}))
+
+    def query(self, embeddings, top_k: int) -> List[List[VectorHit]]:
+        if not len(embeddings):
+            return []
+
+        queries = normalize_rows(embeddings)
+        with self._lock:
+            used = len(self._ids)
+            if self._matrix is None or used == 0 or not self._row_by_id:
+                return [[] for _ in range(queries.shape[0])]
+
+            # (queries x dims) @ (dims x linhas) -> similaridade cosseno
+            scores = similarity_matrix(queries, self._matrix[:used])
+            live = self._live[:used]
+            scores[:, ~live] = -np.inf
+
+            k = min(top_k, len(self._row_by_id))
+            if k < used:
+                candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            else:
+                candidates = np.tile(np.arange(used), (queries.shape[0], 1))
+
+            all_hits: List[List[VectorHit]] = []
+            for row in range(queries.shape[0]):
+                order = candidates[row][np.argsort(-scores[row, candidates[row]])]
+                hits = []
+                for column in order:
+                    if not live[column]:
+                        continue
+                    similarity = float(max(0.0, min(1.0, scores[row, column])))
+                    hits.append((self._ids[column], similarity, self._metadatas[column]))
+                all_hits.append(hits[:k])
+            return all_hits
+
+    def upsert(self, ids, embeddings, metadatas) -> None:
+        # add ja substitui IDs existentes (linha antiga vira tombstone)
+        self.add(ids, embeddings, metadatas)
+
+    def delete(self, ids) -> None:
+        with self._lock:
+            removed = [concept_id for concept_id in ids if concept_id in self._row_by_id]
+            if not removed:
+                return
+            with open(self._ids_path, "a", encoding="utf-8") as f:
+                for concept_id in removed:
+                    f.write(json.dumps({"delete": concept_id}) + "\n")
+            for concept_id in removed:
+                row = self._row_by_id.pop(concept_id)
+                self._ids[row] = None
+                self._live[row] = False
+
+    def count(self) -> int:
+        with self._lock:
+            return len(self._row_by_id)
+
+    def get_embeddings(self, ids) -> Dict[str, List[float]]:
+        with self._lock:
+            return {
+                concept_id: self._matrix[self._row_by_id[concept_id]].tolist()
+                for concept_id in ids
+                if concept_id in self._row_by_id
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._matrix = None
+            for file_path in (self._vectors_path, self._ids_path):
+                if file_path.exists():
+                    file_path.unlink()
+            self._ids = []
+            self._metadatas = []
+            self._row_by_id = {}
+            self._live = np.zeros(0, dtype=bool)
+
+def create_vector_index(backend: str, path: str) -> VectorIndex:
+    """
+    Cria indice vetorial a partir do nome do backend.
+
+    Args:
+        backend: "chroma" (padrao) ou "numpy".
+        path: Diretorio de persistencia do indice.
+
+    Returns:
+        VectorIndex configurado.
+
+    Raises:
+        ValueError: Se backend nao for reconhecido.
+    """
+    backend = backend.lower()
+    if backend == VECTOR_BACKEND_CHROMA:
+        return ChromaVectorIndex(path)
+    if backend == VECTOR_BACKEND_NUMPY:
+        return NumpyVectorIndex(path)
+    raise ValueError(
+        f"Backend vetorial desconhecido: '{backend}'. "
+        f"Opcoes: {', '.join(AVAILABLE_VECTOR_BACKENDS)}"
+    )
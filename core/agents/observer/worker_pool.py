@@ -0,0 +1,430 @@
+"""
+Pool de workers do Observador com fila por sessao.
+
+Antes, cada turno do Orquestrador criava uma thread daemon propria: sem
+limite de threads (nem de chamadas LLM concorrentes) e sem como descartar
+um processamento obsoleto quando o usuario enviava a proxima mensagem.
+ObserverWorkerPool substitui isso:
+
+- Numero fixo de workers (criados no primeiro submit)
+- No maximo um processamento por sessao; a fila de cada sessao guarda
+  apenas o turno mais recente (um turno pendente substituido conta como
+  "dropped")
+- Um novo turno cancela o processamento em andamento da mesma sessao
+- Timeout por processamento
+- Nenhum turno e perdido: o payload (ex: mensagem do usuario) de um job
+  descartado, cancelado ou expirado passa para o proximo job da sessao,
+  que recebe em job.payloads todas as entradas desde o ultimo resultado
+  aplicado
+
+Cancelamento e timeout sao cooperativos: uma chamada LLM em andamento nao
+e interrompida, mas a funcao do job consulta job.should_stop() antes de
+aplicar o resultado, e o pool registra o job como "cancelled"/"timed_out".
+
+Metricas em get_stats(): profundidade da fila, tempo de espera na fila,
+tempo de execucao, descartes, cancelamentos, timeouts e falhas.
+
+Configuracao por ambiente (get_observer_worker_pool):
+    - OBSERVER_MAX_WORKERS: workers simultaneos (default: 2)
+    - OBSERVER_TIMEOUT_SECONDS: timeout por processamento (default: 60)
+
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 2
+DEFAULT_TIMEOUT_SECONDS = 60.0
+
+# Estados de um ObserverJob
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+JOB_DROPPED = "dropped"
+JOB_CANCELLED = "cancelled"
+JOB_TIMED_OUT = "timed_out"
+
+class ObserverJob:
+    """
+    Processamento de um turno do Observador.
+
+    Args:
+        session_id: Sessao do turno (chave da fila).
+        turn_number: Numero do turno.
+        func: Funcao executada pelo worker; recebe o proprio job.
+        timeout_seconds: Tempo maximo de execucao (None = sem limite).
+        payload: Entrada do turno (ex: mensagem do usuario). job.payloads
+            acumula, em ordem, as entradas de turnos anteriores da sessao
+            que nao chegaram a ter resultado aplicado.
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        turn_number: int,
+        func: Callable[["ObserverJob"], Any],
+        timeout_seconds: Optional[float] = None,
+        payload: Any = None
+    ):
+        self.session_id = session_id
+        self.turn_number = turn_number
+        self.func = func
+        self.timeout_seconds = timeout_seconds
+        self.payloads: List[Any] = [payload] if payload is not None else []
+        self.status = JOB_QUEUED
+        self.error: Optional[str] = None
+        self.submitted_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._cancel_event = threading.Event()
+        self._done_event = threading.Event()
+
+    def cancel(self) -> None:
+        """Solicita cancelamento (o resultado sera descartado)."""
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """True se o cancelamento foi solicitado."""
+        return self._cancel_event.is_set()
+
+    @property
+    def expired(self) -> bool:
+        """True se a execucao passou do timeout."""
+        if self.timeout_seconds is None or self.started_at is None:
+            return False
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return end - self.started_at > self.timeout_seconds
+
+    def should_stop(self) -> bool:
+        """
+        Indica se o resultado deve ser descartado (cancelado ou expirado).
+
+        Returns:
+            True se a funcao do job nao deve aplicar o resultado.
+        """
+        return self.cancelled or self.expired
+
+    @property
+    def wait_seconds(self) -> Optional[float]:
+        """Tempo na fila ate o inicio da execucao."""
+        if self.started_at is None:
+            return None
+        return self.started_at - self.submitted_at
+
+    @property
+    def run_seconds(self) -> Optional[float]:
+        """Tempo de execucao (None se nao terminou)."""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Aguarda o fim do job (executado, descartado ou cancelado).
+
+        Args:
+            timeout: Segundos maximos de espera (None = sem limite).
+
+        Returns:
+            True se o job terminou.
+        """
+        return self._done_event.wait(timeout)
+
+    def _finish(self, status: str) -> None:
+        self.status = status
+        self._done_event.set()
+
+class ObserverWorkerPool:
+    """
+    Executor compartilhado do Observador, com fila coalescente por sessao.
+
+    Args:
+        max_workers: Numero de workers (processamentos simultaneos).
+        timeout_seconds: Timeout por processamento (None = sem limite).
+
+    Example:
+        >>> pool = ObserverWorkerPool(max_workers=2, timeout_seconds=60)
+        >>> job = pool.submit("session-1", 3, run_observer)
+        >>> job.wait(timeout=90)
+        True
+        >>> pool.get_stats()["completed"]
+        1
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, timeout_seconds: Optional[float] = DEFAULT_TIMEOUT_SECONDS):
+        self.max_workers = max(1, int(max_workers))
+        self.timeout_seconds = timeout_seconds
+
+        self._condition = threading.Condition()
+        self._ready: Deque[str] = deque()
+        self._pending: Dict[str, ObserverJob] = {}
+        self._running: Dict[str, ObserverJob] = {}
+        # Payloads de jobs sem resultado aplicado, aguardando o proximo submit
+        self._carry: Dict[str, List[Any]] = {}
+        self._workers = []
+        self._shutdown = False
+
+        self._counters = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "dropped": 0,
+            "cancelled": 0,
+            "timed_out": 0,
+        }
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._run_total = 0.0
+        self._run_max = 0.0
+        self._runs = 0
+
+    def submit(
+        self,
+        session_id: str,
+        turn_number: int,
+        func: Callable[[ObserverJob], Any],
+        payload: Any = None
+    ) -> ObserverJob:
+        """
+        Enfileira o turno, substituindo o pendente e cancelando o em execucao
+        da mesma sessao (os payloads deles passam para o novo job).
+
+        Args:
+            session_id: Sessao do turno.
+            turn_number: Numero do turno.
+            func: Funcao executada pelo worker (recebe o job).
+            payload: Entrada do turno (acumulada em job.payloads).
+
+        Returns:
+            ObserverJob enfileirado.
+
+        Raises:
+            RuntimeError: Se o pool foi encerrado.
+        """
+        job = ObserverJob(session_id, turn_number, func, self.timeout_seconds, payload)
+
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("ObserverWorkerPool encerrado")
+
+            self._counters["submitted"] += 1
+            previous = self._pending.get(session_id)
+            running = self._running.get(session_id)
+            job.payloads = self._carry.pop(session_id, []) + job.payloads
+
+            if previous is not None:
+                # Turno pendente obsoleto: a sessao ja esta agendada, e o
+                # novo job processa tambem a entrada dele
+                job.payloads = previous.payloads + job.payloads
+                previous._finish(JOB_DROPPED)
+                self._counters["dropped"] += 1
+                logger.debug(f"Turno {previous.turn_number} descartado (session: {session_id})")
+            elif running is None:
+                self._ready.append(session_id)
+
+            if running is not None:
+                running.cancel()
+
+            self._pending[session_id] = job
+            self._start_workers()
+            self._condition.notify()
+
+        return job
+
+    def cancel(self, session_id: str) -> bool:
+        """
+        Cancela o turno pendente e o em execucao de uma sessao.
+
+        Args:
+            session_id: Sessao a cancelar.
+
+        Returns:
+            True se havia algo a cancelar.
+        """
+        with self._condition:
+            pending = self._pending.pop(session_id, None)
+            if pending is not None:
+                if session_id in self._ready:
+                    self._ready.remove(session_id)
+                pending.cancel()
+                pending._finish(JOB_CANCELLED)
+                self._counters["cancelled"] += 1
+            running = self._running.get(session_id)
+            if running is not None:
+                running.cancel()
+            return pending is not None or running is not None
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Encerra o pool: descarta turnos pendentes e para os workers.
+
+        Args:
+            wait: Aguarda os workers terminarem o processamento atual.
+            timeout: Segundos maximos de espera por worker.
+        """
+        with self._condition:
+            self._shutdown = True
+            for job in self._pending.values():
+                job.cancel()
+                job._finish(JOB_CANCELLED)
+                self._counters["cancelled"] += 1
+            self._pending.clear()
+            self._ready.clear()
+            for job in self._running.values():
+                job.cancel()
+            self._condition.notify_all()
+            workers = list(self._workers)
+
+        if wait:
+            for worker in workers:
+                worker.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna metricas do pool.
+
+        Returns:
+            Dict com workers, queue_depth, running, contadores (submitted,
+            completed, failed, dropped, cancelled, timed_out) e tempos de
+            espera/execucao em ms (avg e max).
+        """
+        with self._condition:
+            runs = self._runs
+            return {
+                "workers": self.max_workers,
+                "queue_depth": len(self._pending),
+                "running": len(self._running),
+                **self._counters,
+                "wait_ms_avg": (self._wait_total / runs * 1000) if runs else 0.0,
+                "wait_ms_max": self._wait_max * 1000,
+                "run_ms_avg": (self._run_total / runs * 1000) if runs else 0.0,
+                "run_ms_max": self._run_max * 1000,
+            }
+
+    def _start_workers(self) -> None:
+        # Chamado com _condition adquirido
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(
+                target=self._worker_loop, daemon=True, name=f"observer-worker-{len(self._workers) + 1}"
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._condition:
+                while not self._ready and not self._shutdown:
+                    self._condition.wait()
+                if self._shutdown:
+                    return
+                session_id = self._ready.popleft()
+                if session_id in self._running:
+                    # Reenfileirada ao fim da execucao atual
+                    continue
+                job = self._pending.pop(session_id, None)
+                if job is None:
+                    continue
+                self._running[session_id] = job
+                job.status = JOB_RUNNING
+                job.started_at = time.monotonic()
+
+            status = self._run(job)
+
+            with self._condition:
+                job.finished_at = time.monotonic()
+                self._running.pop(session_id, None)
+                if status == JOB_DONE:
+                    if job.cancelled:
+                        status = JOB_CANCELLED
+                    elif job.expired:
+                        status = JOB_TIMED_OUT
+                self._record(job, status)
+                if status in (JOB_CANCELLED, JOB_TIMED_OUT) and job.payloads:
+                    # Resultado descartado: entradas vao para o proximo job
+                    pending = self._pending.get(session_id)
+                    if pending is not None:
+                        pending.payloads = job.payloads + pending.payloads
+                    elif not self._shutdown:
+                        self._carry[session_id] = job.payloads + self._carry.get(session_id, [])
+                if session_id in self._pending:
+                    # Turno mais recente chegou durante a execucao
+                    self._ready.append(session_id)
+                    self._condition.notify()
+            job._finish(status)
+
+    def _run(self, job: ObserverJob) -> str:
+        try:
+            job.func(job)
+            return JOB_DONE
+        except Exception as e:
+            job.error = str(e)
+            logger.error(f"❌ Erro no worker do Observer (session: {job.session_id}): {e}")
+            return JOB_FAILED
+
+    def _record(self, job: ObserverJob, status: str) -> None:
+        # Chamado com _condition adquirido
+        counter = {
+            JOB_DONE: "completed",
+            JOB_FAILED: "failed",
+            JOB_CANCELLED: "cancelled",
+            JOB_TIMED_OUT: "timed_out",
+        }[status]
+        self._counters[counter] += 1
+
+        wait, run = job.wait_seconds, job.run_seconds
+        self._runs += 1
+        self._wait_total += wait
+        self._wait_max = max(self._wait_max, wait)
+        self._run_total += run
+        self._run_max = max(self._run_max, run)
+
+# Pool global (criado no primeiro uso, ver get_observer_worker_pool)
+_worker_pool: Optional[ObserverWorkerPool] = None
+_worker_pool_lock = threading.Lock()
+
+def get_observer_worker_pool() -> ObserverWorkerPool:
+    """
+    Retorna o pool global do Observador (criado no primeiro uso).
+
+    Returns:
+        ObserverWorkerPool configurado por OBSERVER_MAX_WORKERS e
+        OBSERVER_TIMEOUT_SECONDS ("0" = sem timeout).
+    """
+    global _worker_pool
+
+    if _worker_pool is None:
+        with _worker_pool_lock:
+            if _worker_pool is None:
+                max_workers = int(os.getenv("OBSERVER_MAX_WORKERS", DEFAULT_MAX_WORKERS))
+                timeout = float(os.getenv("OBSERVER_TIMEOUT_SECONDS", DEFAULT_TIMEOUT_SECONDS))
+                _worker_pool = ObserverWorkerPool(max_workers, timeout if timeout > 0 else None)
+
+    return _worker_pool
+
+def set_observer_worker_pool(pool: Optional[ObserverWorkerPool]) -> None:
+    """
+    Substitui o pool global do Observador.
+
+    Args:
+        pool: Novo pool, ou None para recriar a partir do ambiente no
+            proximo uso.
+    """
+    global _worker_pool
+    _worker_pool = pool
+
+def get_observer_worker_stats() -> Dict[str, Any]:
+    """
+    Retorna metricas do pool global do Observador.
+
+    Returns:
+        Dict de ObserverWorkerPool.get_stats().
+    """
+    return get_observer_worker_pool().get_stats()
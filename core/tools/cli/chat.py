@@ -26,6 +26,7 @@ sys.path.insert(0, str(project_root))
 
 from core.agents.multi_agent_graph import create_multi_agent_graph, create_initial_multi_agent_state
 from core.agents.memory.memory_manager import MemoryManager
+from core.agents.observer.embeddings import warmup_embedding_model
 from core.utils.event_bus import get_event_bus
 from dotenv import load_dotenv
 
@@ -113,6 +114,8 @@ def run_cli(verbose=False):
     # Criar grafo uma vez
     print("🔧 Inicializando sistema multi-agente...")
     graph = create_multi_agent_graph()
+    # Modelo de embeddings do Observer carrega em background durante o primeiro input
+    warmup_embedding_model()
     print("✅ Sistema pronto!")
     print(f"📁 Eventos salvos em: {event_bus.events_dir}\n")
 
@@ -1,22 +1,33 @@
 """
 EventBus para comunicação entre CLI/Graph e Dashboard.
 
-Este módulo gerencia publicação e consumo de eventos usando arquivos JSON
-temporários. Fornece canal de comunicação entre processo principal (CLI/Graph)
+Este módulo gerencia publicação e consumo de eventos usando arquivos JSONL
+temporários (append-only). Fornece canal de comunicação entre processo principal (CLI/Graph)
 e Dashboard Streamlit.
 
 Estrutura modular:
 - core.py: Classe base com persistência (EventBusCore)
+- storage.py: Backends de armazenamento (JSONL append-only, JSON legado)
+- sqlite_storage.py: Backend SQLite indexado (WAL)
+- manifest.py: Manifesto de sessões (listagem e resumos)
 - publishers.py: Métodos publish_* (EventBusPublishers)
 - readers.py: Métodos get_* e list_* (EventBusReaders)
+- subscriptions.py: Assinaturas push (EventBusSubscriptions, Subscription)
 - singleton.py: Classe EventBus completa e função get_event_bus()
+- aggregates.py: Agregados incrementais por sessão/turno
+- locking.py: Locks entre processos para escrita nos arquivos de sessão
+- writer.py: BatchedEventWriter (modo async_writes)
+- tail.py: SessionTail (leitura incremental via read_since)
+- retention.py: Retenção, arquivamento .json.gz e compactação
 
 Data: 2025-12-XX
 """
 
 # Importar classe EventBus e função get_event_bus para manter compatibilidade
 from .singleton import EventBus, get_event_bus
+from .tail import SessionTail
+from .subscriptions import Subscription, ALL_SESSIONS
 
 # Exportar tudo para manter compatibilidade com imports existentes
-__all__ = ['EventBus', 'get_event_bus']
+__all__ = ['EventBus', 'get_event_bus', 'SessionTail', 'Subscription', 'ALL_SESSIONS']
 
@@ -0,0 +1,156 @@
+"""
+Agregados incrementais por sessão do EventBus.
+
+Mantidos a cada publicação (junto do manifesto), permitem que Dashboard,
+backstage e chat leiam totais de tokens, custo e duração em O(1), sem somar
+todos os agent_completed da sessão a cada render.
+
+Estrutura (dict serializável em JSON):
+    {
+        "totals": {tokens_input, tokens_output, tokens_total, cost, duration,
+                   max_duration, agent_calls, errors},
+        "by_agent": {agent_name: {mesmos campos de totals}},
+        "turn": {number, started_at, agents, + campos de totals},
+        "cognitive": {turn_number, solidez, completude, is_mature, updated_at} | None,
+        "last_agent_started": str | None,
+        "last_agent_completed": str | None
+    }
+
+Fronteira de turno:
+    metadata["turn_number"] do agent_started (publicado por instrument_node).
+    Para eventos sem esse campo, um agent_started do orchestrator abre novo
+    turno, exceto quando vem logo após o methodologist (o grafo volta ao
+    orchestrator dentro do mesmo turno).
+"""
+
+from typing import Any, Dict, Optional
+
+# Agente de entrada de cada turno no grafo multi-agente
+TURN_ENTRY_AGENT = "orchestrator"
+
+# Agente após o qual o grafo retorna ao orchestrator no mesmo turno
+_SAME_TURN_PREDECESSOR = "methodologist"
+
+def _empty_totals() -> Dict[str, Any]:
+    return {
+        "tokens_input": 0,
+        "tokens_output": 0,
+        "tokens_total": 0,
+        "cost": 0.0,
+        "duration": 0.0,
+        "max_duration": 0.0,
+        "agent_calls": 0,
+        "errors": 0,
+    }
+
+def _empty_turn(number: int, started_at: Optional[str] = None) -> Dict[str, Any]:
+    return {"number": number, "started_at": started_at, "agents": [], **_empty_totals()}
+
+def empty_aggregates() -> Dict[str, Any]:
+    """
+    Retorna agregados de uma sessão sem eventos.
+
+    Returns:
+        Dict: Estrutura descrita no docstring do módulo
+    """
+    return {
+        "totals": _empty_totals(),
+        "by_agent": {},
+        "turn": _empty_turn(0),
+        "cognitive": None,
+        "last_agent_started": None,
+        "last_agent_completed": None,
+    }
+
+def _add_completed(totals: Dict[str, Any], event: Dict[str, Any]) -> None:
+    tokens_input = event.get("tokens_input", 0) or 0
+    tokens_output = event.get("tokens_output", 0) or 0
+    duration = event.get("duration", 0.0) or 0.0
+    totals["tokens_input"] += tokens_input
+    totals["tokens_output"] += tokens_output
+    totals["tokens_total"] += event.get("tokens_total", tokens_input + tokens_output) or 0
+    totals["cost"] += event.get("cost", 0.0) or 0.0
+    totals["duration"] += duration
+    totals["max_duration"] = max(totals["max_duration"], duration)
+    totals["agent_calls"] += 1
+
+def _starts_new_turn(aggregates: Dict[str, Any], event: Dict[str, Any]) -> Optional[int]:
+    """Retorna o número do novo turno aberto por agent_started (ou None)."""
+    current = aggregates["turn"]["number"]
+    explicit = (event.get("metadata") or {}).get("turn_number")
+    if explicit is not None:
+        return int(explicit) if int(explicit) != current else None
+
+    if event.get("agent_name") != TURN_ENTRY_AGENT:
+        return None
+    if current and aggregates.get("last_agent_started") == _SAME_TURN_PREDECESSOR:
+        return None
+    return current + 1
+
+def apply_event(aggregates: Dict[str, Any], event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Incorpora um evento aos agregados (altera e retorna o mesmo dict).
+
+    Args:
+        aggregates (Dict): Agregados atuais (ver empty_aggregates)
+        event (Dict): Evento recém-publicado
+
+    Returns:
+        Dict: Agregados atualizados
+
+    Example:
+        >>> aggregates = empty_aggregates()
+        >>> apply_event(aggregates, {"event_type": "agent_completed",
+        ...     "agent_name": "orchestrator", "tokens_total": 150, "cost": 0.001})
+        >>> aggregates["totals"]["tokens_total"]
+        150
+    """
+    event_type = event.get("event_type")
+    agent_name = event.get("agent_name", "unknown")
+
+    if event_type == "agent_started":
+        new_turn = _starts_new_turn(aggregates, event)
+        if new_turn is not None:
+            aggregates["turn"] = _empty_turn(new_turn, event.get("timestamp"))
+        aggregates["last_agent_started"] = agent_name
+
+    elif event_type == "agent_completed":
+        _add_completed(aggregates["totals"], event)
+        agent_totals = aggregates["by_agent"].setdefault(agent_name, _empty_totals())
+        _add_completed(agent_totals, event)
+        _add_completed(aggregates["turn"], event)
+        aggregates["turn"]["agents"].append(agent_name)
+        aggregates["last_agent_completed"] = agent_name
+
+    elif event_type == "agent_error":
+        aggregates["totals"]["errors"] += 1
+        aggregates["by_agent"].setdefault(agent_name, _empty_totals())["errors"] += 1
+        aggregates["turn"]["errors"] += 1
+
+    elif event_type == "cognitive_model_updated":
+        aggregates["cognitive"] = {
+            "turn_number": event.get("turn_number"),
+            "solidez": event.get("solidez"),
+            "completude": event.get("completude"),
+            "is_mature": event.get("is_mature", False),
+            "updated_at": event.get("timestamp"),
+        }
+
+    return aggregates
+
+def aggregate_events(events: Any) -> Dict[str, Any]:
+    """
+    Calcula agregados a partir de uma sequência completa de eventos.
+
+    Usado para sessões fora do manifesto (streaming, sem materializar a lista).
+
+    Args:
+        events (Iterable[Dict]): Eventos da sessão em ordem
+
+    Returns:
+        Dict: Agregados da sessão
+    """
+    aggregates = empty_aggregates()
+    for event in events:
+        apply_event(aggregates, event)
+    return aggregates
@@ -2,32 +2,98 @@
 Core da classe EventBus - Gerenciamento de arquivos e persistência.
 
 Este módulo contém a classe base EventBus com métodos privados para
-carregar e salvar eventos em arquivos JSON.
+carregar e salvar eventos. O formato físico é delegado a um backend
+de armazenamento (ver storage.py); o padrão é JSONL append-only.
 """
 
-import json
 import logging
+import sqlite3
 import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional
+
+from .storage import EventStorage, JsonEventStorage, JsonlEventStorage, migrate_json_to_jsonl
+from .sqlite_storage import SqliteEventStorage
+from .manifest import SessionManifest, MANIFEST_FILENAME
+from .writer import BatchedEventWriter
 
 logger = logging.getLogger(__name__)
 
+# Backends selecionáveis por nome (ex: variável EVENT_BUS_BACKEND)
+BACKEND_JSONL = "jsonl"
+BACKEND_SQLITE = "sqlite"
+BACKEND_JSON = "json"
+AVAILABLE_BACKENDS = (BACKEND_JSONL, BACKEND_SQLITE, BACKEND_JSON)
+
+# Nome do arquivo do backend SQLite dentro de events_dir
+SQLITE_DB_FILENAME = "events.db"
+
+def create_event_storage(backend: str, events_dir: Path, fsync: bool = False) -> EventStorage:
+    """
+    Cria backend de armazenamento a partir do nome.
+
+    Args:
+        backend (str): "jsonl" (padrão), "sqlite" ou "json" (legado)
+        events_dir (Path): Diretório de eventos
+        fsync (bool): Força escrita durável a cada evento
+
+    Returns:
+        EventStorage: Backend configurado
+
+    Raises:
+        ValueError: Se backend não for reconhecido
+    """
+    backend = backend.lower()
+    if backend == BACKEND_JSONL:
+        return JsonlEventStorage(events_dir, fsync=fsync)
+    if backend == BACKEND_SQLITE:
+        return SqliteEventStorage(events_dir / SQLITE_DB_FILENAME, fsync=fsync)
+    if backend == BACKEND_JSON:
+        return JsonEventStorage(events_dir)
+    raise ValueError(
+        f"Backend de eventos desconhecido: '{backend}'. "
+        f"Opções: {', '.join(AVAILABLE_BACKENDS)}"
+    )
+
 class EventBusCore:
     """
     Classe base do EventBus com funcionalidades de persistência.
 
-    Gerencia carregamento e salvamento de eventos em arquivos JSON.
-    Cada sessão tem seu próprio arquivo.
+    Gerencia carregamento e salvamento de eventos através de um
+    EventStorage. Cada sessão tem seu próprio arquivo. Um SessionManifest
+    (manifest.db em events_dir) é atualizado a cada evento publicado.
     """
 
-    def __init__(self, events_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        events_dir: Optional[Path] = None,
+        storage: Optional[EventStorage] = None,
+        backend: str = BACKEND_JSONL,
+        fsync: bool = False,
+        migrate_legacy: bool = True,
+        async_writes: bool = False,
+        writer_options: Optional[Dict[str, Any]] = None
+    ):
         """
         Inicializa EventBusCore.
 
         Args:
             events_dir (Path, optional): Diretório para armazenar eventos.
                 Default: {temp_dir}/paper-agent-events (multiplataforma)
+            storage (EventStorage, optional): Backend de armazenamento já
+                construído. Tem precedência sobre backend.
+            backend (str): Nome do backend criado em events_dir quando storage
+                não é informado: "jsonl" (padrão), "sqlite" ou "json" (legado)
+            fsync (bool): Força escrita durável a cada evento. Default: False
+            migrate_legacy (bool): Converte arquivos legados .json para JSONL
+                na inicialização do backend jsonl (no-op quando não há
+                arquivos legados). Default: True
+            async_writes (bool): Publica via BatchedEventWriter (thread em
+                background, fila limitada, gravação em lote por sessão).
+                Default: False (gravação síncrona)
+            writer_options (Dict, optional): Parâmetros do BatchedEventWriter
+                (max_queue_size, max_batch_size, flush_interval, block_on_full)
         """
         if events_dir is None:
             # Usar diretório temp do sistema operacional (funciona em Windows, Linux, Mac)
@@ -37,9 +103,31 @@ class EventBusCore:
             self.events_dir = events_dir
 
         self.events_dir.mkdir(parents=True, exist_ok=True)
-        logger.info(f"EventBus inicializado: {self.events_dir}")
 
-    def _get_event_file(self, session_id: str) -> Path:
+        if storage is None:
+            if migrate_legacy and backend.lower() == BACKEND_JSONL:
+                migrate_json_to_jsonl(self.events_dir, fsync=fsync)
+            storage = create_event_storage(backend, self.events_dir, fsync=fsync)
+        self.storage = storage
+
+        self.manifest = SessionManifest(self.events_dir / MANIFEST_FILENAME, fsync=fsync)
+        self.manifest.initialize(self.storage)
+
+        # Acorda leitores bloqueados em wait_for_events() no mesmo processo
+        self._new_events = threading.Condition()
+
+        # Assinaturas push: entregues por EventBusSubscriptions._dispatch_event
+        # (ver subscriptions.py); lista copy-on-write
+        self._subscriptions: List[Any] = []
+        self._subscriptions_lock = threading.Lock()
+
+        self._writer: Optional[BatchedEventWriter] = None
+        if async_writes:
+            self._writer = BatchedEventWriter(self._persist_events, **(writer_options or {}))
+
+        logger.info(f"EventBus inicializado: {self.events_dir} ({type(self.storage).__name__})")
+
+    def _get_event_file(self, session_id: str) -> Optional[Path]:
         """
         Retorna caminho do arquivo de eventos para uma sessão.
 
@@ -47,9 +135,112 @@ class EventBusCore:
             session_id (str): ID da sessão
 
         Returns:
-            Path: Caminho do arquivo JSON
+            Path | None: Caminho do arquivo de eventos (None no backend SQLite)
+        """
+        return self.storage.get_event_file(session_id)
+
+    def _append_event(self, session_id: str, event: Dict[str, Any]) -> None:
+        """
+        Anexa um evento à sessão sem reler os eventos anteriores.
+
+        Com async_writes, apenas enfileira no BatchedEventWriter e entrega às
+        assinaturas já na thread do publisher (momento da publicação), nunca
+        na thread do escritor: um callback que lê o barramento faz flush
+        normalmente em vez de esperar pela própria fila.
+
+        Args:
+            session_id (str): ID da sessão
+            event (Dict): Evento serializado
+        """
+        if self._writer is not None:
+            if self._writer.submit(session_id, event) and self._subscriptions:
+                self._dispatch_event(session_id, event)
+            return
+
+        try:
+            self._persist_events(session_id, [event])
+        except (IOError, sqlite3.Error) as e:
+            logger.error(f"Erro ao salvar eventos de {session_id}: {e}")
+
+    def _persist_events(self, session_id: str, events: List[Dict[str, Any]]) -> None:
         """
-        return self.events_dir / f"events-{session_id}.json"
+        Grava um lote de eventos de uma sessão e avisa leitores/assinantes.
+
+        Usado diretamente no modo síncrono e como sink do BatchedEventWriter
+        (no modo assíncrono as assinaturas já receberam os eventos em
+        _append_event).
+
+        Args:
+            session_id (str): ID da sessão
+            events (List[Dict]): Eventos em ordem de publicação
+
+        Raises:
+            IOError | sqlite3.Error: Falha ao gravar no backend
+        """
+        self.storage.append_many(session_id, events)
+
+        try:
+            self.manifest.record_events(session_id, events)
+        except sqlite3.Error as e:
+            logger.warning(f"Erro ao atualizar manifesto de {session_id}: {e}")
+
+        self._notify_new_events()
+        if self._writer is None and self._subscriptions:
+            for event in events:
+                self._dispatch_event(session_id, event)
+
+    def _await_pending_writes(self) -> None:
+        """Garante que leituras no mesmo processo vejam eventos ainda na fila."""
+        # Na thread do escritor o flush esperaria pela própria fila (timeout)
+        if self._writer is not None and self._writer.pending and not self._writer.is_writer_thread():
+            self._writer.flush()
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Grava eventos enfileirados pelo modo async_writes.
+
+        Args:
+            timeout (float, optional): Espera máxima em segundos
+
+        Returns:
+            bool: True se não há eventos pendentes ao retornar
+        """
+        if self._writer is None:
+            return True
+        return self._writer.flush(timeout)
+
+    def close(self) -> None:
+        """Grava eventos pendentes e encerra o escritor em background, se houver."""
+        if self._writer is not None:
+            self._writer.close()
+
+    def get_writer_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Retorna contadores do escritor em background.
+
+        Returns:
+            Dict | None: queue_depth, max_queue_depth, pending, enqueued,
+                written, dropped, batches, write_errors (None no modo síncrono)
+        """
+        return self._writer.get_stats() if self._writer is not None else None
+
+    def _notify_new_events(self) -> None:
+        """Sinaliza leitores em wait_for_events() que há eventos novos."""
+        with self._new_events:
+            self._new_events.notify_all()
+
+    def _iter_events(self, session_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Itera sobre eventos de uma sessão sem materializar a lista.
+
+        Args:
+            session_id (str): ID da sessão
+
+        Yields:
+            Dict: Evento em formato dict
+        """
+        self._await_pending_writes()
+        return self.storage.iter_events(session_id)
 
     def _load_events(self, session_id: str) -> Dict[str, Any]:
         """
@@ -61,37 +252,30 @@ class EventBusCore:
         Returns:
             Dict: Estrutura {"session_id": str, "events": list}
         """
-        file_path = self._get_event_file(session_id)
-
-        if not file_path.exists():
-            return {
-                "session_id": session_id,
-                "events": []
-            }
-
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            logger.warning(f"Erro ao carregar eventos de {session_id}: {e}")
-            return {
-                "session_id": session_id,
-                "events": []
-            }
+        self._await_pending_writes()
+        return {
+            "session_id": session_id,
+            "events": self.storage.read_events(session_id)
+        }
 
     def _save_events(self, session_id: str, data: Dict[str, Any]) -> None:
         """
-        Salva eventos no arquivo da sessão.
+        Substitui todos os eventos da sessão.
+
+        Não é usado no caminho de publicação (ver _append_event).
 
         Args:
             session_id (str): ID da sessão
             data (Dict): Estrutura {"session_id": str, "events": list}
         """
-        file_path = self._get_event_file(session_id)
-
+        events = data.get("events", [])
+        self._await_pending_writes()
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-        except IOError as e:
+            self.storage.replace_events(session_id, events)
+            self.manifest.remove(session_id)
+            self.manifest.record_events(session_id, events)
+        except (IOError, sqlite3.Error) as e:
             logger.error(f"Erro ao salvar eventos de {session_id}: {e}")
+            return
 
+        self._notify_new_events()
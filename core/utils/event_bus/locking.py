@@ -0,0 +1,209 @@
+"""
+Locks advisory entre processos para os backends em arquivo do EventBus.
+
+Vários processos (Streamlit, Reflex, CLI, threads do Observer) podem
+publicar na mesma sessão. Toda escrita em arquivo de sessão acontece com
+lock exclusivo sobre o próprio arquivo:
+
+- fcntl.flock em POSIX, msvcrt.locking no Windows
+- após obter o lock, confere se o descritor ainda aponta para o arquivo do
+  caminho (rewrite via os.replace ou remoção trocam o inode); se não,
+  reabre e tenta de novo
+
+Leituras completas não usam lock: JSONL tolera linha final incompleta e
+rewrites usam arquivo temporário + os.replace (troca atômica). Leituras
+incrementais por offset (read_since) usam lock compartilhado (locked_read)
+para nunca observar um append pela metade.
+
+No Windows um arquivo aberto não pode ser substituído nem removido, então
+os.replace/unlink de locked_rewrite/locked_unlink acontecem logo após
+liberar o lock (janela mínima, aceitável para o Dashboard local).
+"""
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, Tuple
+
+# Em POSIX é possível trocar/remover o arquivo ainda travado
+_SWAP_WHILE_LOCKED = os.name != "nt"
+
+if os.name == "nt":  # pragma: no cover - exercitado apenas no Windows
+    import msvcrt
+
+    def _lock(f: IO) -> None:
+        # Lock do primeiro byte como mutex do arquivo; LK_LOCK desiste após
+        # ~10s, então repete até conseguir
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+    def _unlock(f: IO) -> None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    # msvcrt não tem lock compartilhado: leitores usam o mesmo mutex
+    _lock_shared = _lock
+else:
+    import fcntl
+
+    def _lock(f: IO) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _lock_shared(f: IO) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+
+    def _unlock(f: IO) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+def _is_current(f: IO, path: Path) -> bool:
+    """True se o descritor aberto ainda é o arquivo presente em path."""
+    try:
+        path_stat = os.stat(path)
+    except FileNotFoundError:
+        return False
+    fd_stat = os.fstat(f.fileno())
+    return (fd_stat.st_ino, fd_stat.st_dev) == (path_stat.st_ino, path_stat.st_dev)
+
+@contextmanager
+def locked_file(path: Path, mode: str = "a") -> Iterator[IO]:
+    """
+    Abre arquivo de sessão com lock exclusivo entre processos.
+
+    O arquivo é criado se não existir. Modos "a"/"ab" para append e "a+"
+    para ler e reescrever (o conteúdo lido reflete todas as escritas
+    anteriores que obtiveram o lock).
+
+    Args:
+        path (Path): Arquivo de eventos da sessão
+        mode (str): Modo de abertura sem truncamento ("a", "ab", "a+"). Default: "a"
+
+    Yields:
+        IO: Arquivo aberto e travado (liberado ao sair do bloco)
+
+    Example:
+        >>> with locked_file(Path("/tmp/paper-agent-events/events-s1.jsonl")) as f:
+        ...     f.write('{"event_type": "agent_started"}\\n')
+    """
+    encoding = None if "b" in mode else "utf-8"
+    while True:
+        f = open(path, mode, encoding=encoding)
+        try:
+            _lock(f)
+        except BaseException:
+            f.close()
+            raise
+        if _is_current(f, path):
+            break
+        # Arquivo trocado/removido enquanto esperávamos: reabrir
+        _unlock(f)
+        f.close()
+
+    try:
+        yield f
+    finally:
+        try:
+            f.flush()
+            _unlock(f)
+        finally:
+            f.close()
+
+@contextmanager
+def locked_read(path: Path) -> Iterator[IO]:
+    """
+    Abre arquivo de sessão para leitura binária com lock compartilhado.
+
+    Vários leitores podem manter o lock ao mesmo tempo; escritores (lock
+    exclusivo) esperam, então o conteúdo visível nunca contém um append
+    pela metade. Ao contrário de locked_file, não cria o arquivo.
+
+    Args:
+        path (Path): Arquivo de eventos da sessão
+
+    Yields:
+        IO: Arquivo aberto em "rb" e travado (liberado ao sair do bloco)
+
+    Raises:
+        FileNotFoundError: Se o arquivo não existir
+
+    Example:
+        >>> with locked_read(Path("/tmp/paper-agent-events/events-s1.jsonl")) as f:
+        ...     f.seek(cursor)
+        ...     chunk = f.read()
+    """
+    while True:
+        f = open(path, "rb")
+        try:
+            _lock_shared(f)
+        except BaseException:
+            f.close()
+            raise
+        if _is_current(f, path):
+            break
+        # Arquivo trocado/removido enquanto esperávamos: reabrir
+        _unlock(f)
+        f.close()
+
+    try:
+        yield f
+    finally:
+        try:
+            _unlock(f)
+        finally:
+            f.close()
+
+@contextmanager
+def locked_rewrite(path: Path) -> Iterator[Tuple[IO, Path]]:
+    """
+    Reescreve arquivo de sessão atomicamente, com lock entre processos.
+
+    O bloco recebe o arquivo atual travado (modo "a+", para leitura do
+    conteúdo vigente) e o caminho temporário onde escrever a nova versão.
+    Ao sair sem exceção, o temporário substitui o arquivo via os.replace;
+    se o temporário não for criado, nada muda.
+
+    Args:
+        path (Path): Arquivo de eventos da sessão
+
+    Yields:
+        Tuple[IO, Path]: (arquivo atual travado, caminho temporário)
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with locked_file(path, "a+") as current:
+        try:
+            yield current, tmp_path
+        except BaseException:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+        if _SWAP_WHILE_LOCKED and tmp_path.exists():
+            os.replace(tmp_path, path)
+    if not _SWAP_WHILE_LOCKED and tmp_path.exists():
+        os.replace(tmp_path, path)
+
+def locked_unlink(path: Path) -> bool:
+    """
+    Remove arquivo de sessão sem perder appends concorrentes.
+
+    Escritores que esperavam o lock percebem a troca de inode e recriam o
+    arquivo, em vez de escrever no arquivo removido.
+
+    Args:
+        path (Path): Arquivo de eventos da sessão
+
+    Returns:
+        bool: True se o arquivo existia
+    """
+    if not path.exists():
+        return False
+
+    with locked_file(path, "a"):
+        if _SWAP_WHILE_LOCKED:
+            os.unlink(path)
+    if not _SWAP_WHILE_LOCKED:
+        os.unlink(path)
+    return True
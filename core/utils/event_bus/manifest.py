@@ -0,0 +1,434 @@
+"""
+Manifesto de sessões do EventBus.
+
+Índice pequeno (uma linha por sessão) mantido incrementalmente pelo publisher.
+Permite listar sessões ativas e montar o resumo de uma sessão sem abrir os
+arquivos de eventos.
+
+Schema (SQLite, modo WAL):
+    sessions(session_id, first_timestamp, last_timestamp, last_event_epoch,
+             event_count, first_event_type, last_event_type, user_input,
+             status, final_status, archived_at)
+    - idx_sessions_last_event (last_event_epoch): list_active_sessions faz
+      range scan apenas sobre sessões dentro da janela de idade
+    - archived_at: sessão arquivada pela retenção (eventos em archive/,
+      entrada e agregados continuam consultáveis)
+    session_aggregates(session_id, payload)
+    - agregados de tokens/custo/duração/turno em JSON (ver aggregates.py),
+      atualizados na mesma transação que a linha de sessions
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence
+
+from .sqlite_storage import open_wal_connection
+from .aggregates import apply_event, empty_aggregates
+
+logger = logging.getLogger(__name__)
+
+# Nome do arquivo do manifesto dentro de events_dir
+MANIFEST_FILENAME = "manifest.db"
+
+MANIFEST_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    first_timestamp TEXT,
+    last_timestamp TEXT,
+    last_event_epoch REAL NOT NULL,
+    event_count INTEGER NOT NULL DEFAULT 0,
+    first_event_type TEXT,
+    last_event_type TEXT,
+    user_input TEXT,
+    status TEXT NOT NULL DEFAULT 'active',
+    final_status TEXT,
+    archived_at REAL
+);
+
+CREATE INDEX IF NOT EXISTS idx_sessions_last_event
+    ON sessions(last_event_epoch);
+
+CREATE TABLE IF NOT EXISTS session_aggregates (
+    session_id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS manifest_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_MANIFEST_COLUMNS = (
+    "session_id", "first_timestamp", "last_timestamp", "last_event_epoch",
+    "event_count", "first_event_type", "last_event_type", "user_input",
+    "status", "final_status", "archived_at"
+)
+
+def _timestamp_to_epoch(timestamp: Optional[str]) -> float:
+    """
+    Converte timestamp ISO 8601 (com sufixo Z) em epoch.
+
+    Args:
+        timestamp (str): Timestamp do evento
+
+    Returns:
+        float: Epoch em segundos (agora, se o timestamp for inválido)
+    """
+    try:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).timestamp()
+    except (ValueError, AttributeError):
+        return time.time()
+
+def summarize_events(events: Sequence[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Calcula a entrada de manifesto para um lote contíguo de eventos.
+
+    Args:
+        events (Sequence[Dict]): Eventos em ordem de publicação
+
+    Returns:
+        Dict | None: Campos da tabela sessions (sem session_id) ou None se vazio
+    """
+    if not events:
+        return None
+
+    first_event = events[0]
+    last_event = events[-1]
+    first_type = first_event.get("event_type")
+    last_type = last_event.get("event_type")
+    completed = last_type == "session_completed"
+
+    return {
+        "first_timestamp": first_event.get("timestamp"),
+        "last_timestamp": last_event.get("timestamp"),
+        "last_event_epoch": _timestamp_to_epoch(last_event.get("timestamp")),
+        "event_count": len(events),
+        "first_event_type": first_type,
+        "last_event_type": last_type,
+        "user_input": first_event.get("user_input") if first_type == "session_started" else None,
+        "status": "completed" if completed else "active",
+        "final_status": last_event.get("final_status", "unknown") if completed else None,
+    }
+
+def manifest_entry_to_summary(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Converte linha do manifesto no formato de get_session_summary().
+
+    Args:
+        entry (Dict): Linha da tabela sessions
+
+    Returns:
+        Dict: Resumo da sessão
+    """
+    return {
+        "session_id": entry["session_id"],
+        "total_events": entry["event_count"],
+        "status": entry["status"],
+        "final_status": entry["final_status"],
+        "started_at": entry["first_timestamp"],
+        "last_event_at": entry["last_timestamp"],
+        "last_event_type": entry["last_event_type"],
+        "user_input": entry["user_input"],
+        "archived": entry.get("archived_at") is not None
+    }
+
+class SessionManifest:
+    """
+    Índice de sessões mantido a cada publicação.
+
+    Atualizar o manifesto custa O(log sessões) por evento (upsert por chave
+    primária). Listar sessões recentes é um range scan no índice de
+    last_event_epoch, proporcional ao número de sessões retornadas.
+
+    Args:
+        db_path (Path): Caminho do arquivo SQLite do manifesto
+        fsync (bool): synchronous=FULL se True
+
+    Example:
+        >>> manifest = SessionManifest(Path("/tmp/paper-agent-events/manifest.db"))
+        >>> manifest.record_events("s1", [{"event_type": "session_started", ...}])
+        >>> manifest.get("s1")["event_count"]
+        1
+    """
+
+    def __init__(self, db_path: Path, fsync: bool = False):
+        self.db_path = Path(db_path)
+        self._lock = threading.RLock()
+        self.conn = open_wal_connection(self.db_path, fsync=fsync)
+        self.conn.executescript(MANIFEST_SCHEMA_SQL)
+        self._ensure_columns()
+
+    def _ensure_columns(self) -> None:
+        # Manifestos criados antes da retenção não têm archived_at
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(sessions)")}
+        if "archived_at" not in columns:
+            try:
+                self.conn.execute("ALTER TABLE sessions ADD COLUMN archived_at REAL")
+            except sqlite3.OperationalError:
+                # Outro processo adicionou a coluna entre a checagem e o ALTER
+                pass
+
+    def close(self) -> None:
+        """Fecha a conexão SQLite."""
+        with self._lock:
+            self.conn.close()
+
+    def compact(self) -> None:
+        """Recupera espaço do manifesto (checkpoint do WAL + VACUUM)."""
+        with self._lock:
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self.conn.execute("VACUUM")
+
+    def record_events(self, session_id: str, events: Sequence[Dict[str, Any]]) -> None:
+        """
+        Incorpora um lote de eventos recém-publicados ao manifesto.
+
+        Campos "first_*" e user_input são mantidos da primeira inserção;
+        os demais refletem o último evento do lote. Os agregados da sessão
+        são atualizados na mesma transação (segura entre processos).
+
+        Args:
+            session_id (str): ID da sessão
+            events (Sequence[Dict]): Eventos publicados, em ordem
+        """
+        delta = summarize_events(events)
+        if delta is None:
+            return
+
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._upsert(session_id, delta)
+                aggregates = self.get_aggregates(session_id) or empty_aggregates()
+                for event in events:
+                    apply_event(aggregates, event)
+                self._store_aggregates(session_id, aggregates)
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def _store_aggregates(self, session_id: str, aggregates: Dict[str, Any]) -> None:
+        with self._lock:
+            self.conn.execute(
+                "INSERT INTO session_aggregates (session_id, payload) VALUES (?, ?) "
+                "ON CONFLICT(session_id) DO UPDATE SET payload = excluded.payload",
+                (session_id, json.dumps(aggregates, ensure_ascii=False, separators=(",", ":")))
+            )
+
+    def get_aggregates(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retorna os agregados incrementais de uma sessão.
+
+        Args:
+            session_id (str): ID da sessão
+
+        Returns:
+            Dict | None: Agregados (ver aggregates.py) ou None se ausente
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT payload FROM session_aggregates WHERE session_id = ?",
+                (session_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _upsert(self, session_id: str, delta: Dict[str, Any]) -> None:
+        with self._lock:
+            self.conn.execute(
+                """
+                INSERT INTO sessions (
+                    session_id, first_timestamp, last_timestamp, last_event_epoch,
+                    event_count, first_event_type, last_event_type, user_input,
+                    status, final_status
+                ) VALUES (
+                    :session_id, :first_timestamp, :last_timestamp, :last_event_epoch,
+                    :event_count, :first_event_type, :last_event_type, :user_input,
+                    :status, :final_status
+                )
+                ON CONFLICT(session_id) DO UPDATE SET
+                    last_timestamp = excluded.last_timestamp,
+                    last_event_epoch = excluded.last_event_epoch,
+                    event_count = sessions.event_count + excluded.event_count,
+                    last_event_type = excluded.last_event_type,
+                    status = excluded.status,
+                    final_status = excluded.final_status,
+                    archived_at = NULL
+                """,
+                {"session_id": session_id, **delta}
+            )
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retorna a entrada de uma sessão.
+
+        Args:
+            session_id (str): ID da sessão
+
+        Returns:
+            Dict | None: Linha da tabela sessions ou None se ausente
+        """
+        with self._lock:
+            row = self.conn.execute(
+                f"SELECT {', '.join(_MANIFEST_COLUMNS)} FROM sessions WHERE session_id = ?",
+                (session_id,)
+            ).fetchone()
+        return dict(zip(_MANIFEST_COLUMNS, row)) if row else None
+
+    def list_sessions(
+        self,
+        max_age_minutes: Optional[float] = None,
+        status: Optional[str] = None,
+        include_archived: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Lista entradas do manifesto, da mais recente para a mais antiga.
+
+        Args:
+            max_age_minutes (float, optional): Idade máxima do último evento
+                (None = todas)
+            status (str, optional): Filtra por status ("active", "completed")
+            include_archived (bool): Inclui sessões arquivadas. Default: False
+
+        Returns:
+            List[Dict]: Linhas da tabela sessions
+        """
+        conditions = []
+        params: List[Any] = []
+        if not include_archived:
+            conditions.append("archived_at IS NULL")
+        if max_age_minutes is not None:
+            conditions.append("last_event_epoch >= ?")
+            params.append(time.time() - max_age_minutes * 60)
+        if status is not None:
+            conditions.append("status = ?")
+            params.append(status)
+
+        sql = f"SELECT {', '.join(_MANIFEST_COLUMNS)} FROM sessions"
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+        sql += " ORDER BY last_event_epoch DESC"
+
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [dict(zip(_MANIFEST_COLUMNS, row)) for row in rows]
+
+    def mark_archived(self, session_id: str, archived_at: Optional[float] = None) -> bool:
+        """
+        Marca sessão como arquivada (eventos movidos para archive/).
+
+        Args:
+            session_id (str): ID da sessão
+            archived_at (float, optional): Epoch do arquivamento (default: agora)
+
+        Returns:
+            bool: True se havia entrada
+        """
+        with self._lock:
+            cursor = self.conn.execute(
+                "UPDATE sessions SET archived_at = ? WHERE session_id = ?",
+                (archived_at if archived_at is not None else time.time(), session_id)
+            )
+        return cursor.rowcount > 0
+
+    def remove(self, session_id: str) -> bool:
+        """
+        Remove a entrada de uma sessão.
+
+        Args:
+            session_id (str): ID da sessão
+
+        Returns:
+            bool: True se havia entrada
+        """
+        with self._lock:
+            self.conn.execute("DELETE FROM session_aggregates WHERE session_id = ?", (session_id,))
+            cursor = self.conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+        return cursor.rowcount > 0
+
+    def is_empty(self) -> bool:
+        """Retorna True se o manifesto não tem nenhuma sessão."""
+        with self._lock:
+            row = self.conn.execute("SELECT 1 FROM sessions LIMIT 1").fetchone()
+        return row is None
+
+    def initialize(self, storage: Any) -> bool:
+        """
+        Indexa sessões já existentes na primeira abertura do manifesto.
+
+        Executa uma única vez por arquivo de manifesto: a verificação e a
+        reconstrução acontecem dentro de BEGIN IMMEDIATE, então processos
+        que inicializam juntos não reconstroem em paralelo (o que contaria
+        em dobro eventos publicados durante a inicialização).
+
+        Args:
+            storage (EventStorage): Backend de onde ler as sessões
+
+        Returns:
+            bool: True se esta chamada inicializou o manifesto
+        """
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.conn.execute(
+                    "SELECT value FROM manifest_meta WHERE key = 'initialized'"
+                ).fetchone()
+                if row is None:
+                    if self.is_empty() and storage.list_sessions():
+                        self.rebuild(storage)
+                    self.conn.execute(
+                        "INSERT INTO manifest_meta (key, value) VALUES ('initialized', ?)",
+                        (str(time.time()),)
+                    )
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        return row is None
+
+    def rebuild(self, storage: Any) -> int:
+        """
+        Reconstrói o manifesto a partir do armazenamento de eventos.
+
+        Usado quando o manifesto é criado sobre um diretório que já tem
+        sessões (ex: após migração ou remoção do arquivo do manifesto).
+
+        Args:
+            storage (EventStorage): Backend de onde ler as sessões
+
+        Returns:
+            int: Número de sessões indexadas
+        """
+        indexed = 0
+        for session_id in storage.list_sessions():
+            # Streaming: apenas primeiro e último evento definem a entrada;
+            # agregados são acumulados no mesmo passe
+            first_event = None
+            last_event = None
+            total_events = 0
+            aggregates = empty_aggregates()
+            for event in storage.iter_events(session_id):
+                if first_event is None:
+                    first_event = event
+                last_event = event
+                total_events += 1
+                apply_event(aggregates, event)
+
+            self.remove(session_id)
+            if first_event is None:
+                continue
+
+            delta = summarize_events([first_event, last_event])
+            delta["event_count"] = total_events
+            self._upsert(session_id, delta)
+            self._store_aggregates(session_id, aggregates)
+            indexed += 1
+
+        logger.info(f"Manifesto do EventBus reconstruído: {indexed} sessão(ões)")
+        return indexed
@@ -49,9 +49,7 @@ class EventBusPublishers:
             >>> bus.publish_event(event)
         """
         session_id = event.session_id
-        data = self._load_events(session_id)
-        data["events"].append(event.model_dump())
-        self._save_events(session_id, data)
+        self._append_event(session_id, event.model_dump())
         logger.debug(f"Evento publicado: {event.event_type} para {session_id}")
 
     def publish_agent_started(
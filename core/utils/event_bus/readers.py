@@ -5,10 +5,13 @@ Este módulo contém todos os métodos get_* e list_* que leem eventos
 do barramento de eventos.
 """
 
-import json
 import logging
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timezone
+import time
+from typing import List, Optional, Dict, Any, Sequence, Tuple
+
+from .manifest import manifest_entry_to_summary, summarize_events
+from .aggregates import aggregate_events
+from .retention import get_archive_path, load_archived_session
 
 logger = logging.getLogger(__name__)
 
@@ -41,10 +44,182 @@ class EventBusReaders:
         data = self._load_events(session_id)
         return data.get("events", [])
 
+    def get_last_events(
+        self,
+        session_id: str,
+        event_type: str,
+        limit: int = 1,
+        agent_name: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Obtém os últimos N eventos de um tipo (ex: últimos agent_completed).
+
+        No backend SQLite a consulta usa o índice (session_id, event_type);
+        nos backends em arquivo é feito streaming mantendo só N eventos.
+
+        Args:
+            session_id (str): ID da sessão
+            event_type (str): Tipo do evento (ex: "agent_completed")
+            limit (int): Quantidade máxima de eventos. Default: 1
+            agent_name (str, optional): Filtra por agente
+
+        Returns:
+            List[Dict]: Eventos em ordem cronológica (o mais recente por último)
+
+        Example:
+            >>> bus = EventBus()
+            >>> bus.get_last_events("session-1", "agent_completed", limit=2)
+            [{...}, {...}]
+        """
+        self._await_pending_writes()
+        rows = self.storage.query(
+            session_id,
+            event_types=[event_type],
+            agent_name=agent_name,
+            limit=limit,
+            newest_first=True
+        )
+        return [event for _, event in rows]
+
+    def get_events_by_type(
+        self,
+        session_id: str,
+        event_types: Sequence[str],
+        agent_name: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Obtém todos os eventos da sessão de determinados tipos.
+
+        Args:
+            session_id (str): ID da sessão
+            event_types (Sequence[str]): Tipos aceitos
+            agent_name (str, optional): Filtra por agente
+
+        Returns:
+            List[Dict]: Eventos em ordem cronológica
+
+        Example:
+            >>> bus = EventBus()
+            >>> bus.get_events_by_type("session-1", ["agent_completed"])
+            [{...}, ...]
+        """
+        self._await_pending_writes()
+        rows = self.storage.query(session_id, event_types=event_types, agent_name=agent_name)
+        return [event for _, event in rows]
+
+    def get_events_since(
+        self,
+        session_id: str,
+        since_seq: int,
+        event_types: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Obtém eventos publicados após uma posição (seq) da sessão.
+
+        Args:
+            session_id (str): ID da sessão
+            since_seq (int): Último seq já processado (0 = desde o início)
+            event_types (Sequence[str], optional): Tipos aceitos (None = todos)
+
+        Returns:
+            List[Dict]: Eventos com seq > since_seq, em ordem cronológica
+
+        Example:
+            >>> bus = EventBus()
+            >>> seq = bus.get_latest_seq("session-1")
+            >>> bus.publish_agent_started("session-1", "orchestrator")
+            >>> len(bus.get_events_since("session-1", seq))
+            1
+        """
+        self._await_pending_writes()
+        rows = self.storage.query(session_id, event_types=event_types, since_seq=since_seq)
+        return [event for _, event in rows]
+
+    def read_since(self, session_id: str, cursor: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Lê apenas os eventos novos desde a última leitura (tail incremental).
+
+        O cursor é opaco (offset em bytes no JSONL, seq no SQLite/JSON) e deve
+        ser guardado pelo chamador entre leituras. O custo é proporcional aos
+        eventos novos, não ao tamanho da sessão.
+
+        Args:
+            session_id (str): ID da sessão
+            cursor (int): Cursor retornado pela leitura anterior (0 = início)
+
+        Returns:
+            Tuple[List[Dict], int]: Eventos novos em ordem cronológica e o
+                novo cursor (igual ao anterior se não houver eventos novos)
+
+        Example:
+            >>> bus = EventBus()
+            >>> events, cursor = bus.read_since("session-1")
+            >>> bus.publish_agent_started("session-1", "orchestrator")
+            >>> new_events, cursor = bus.read_since("session-1", cursor)
+            >>> len(new_events)
+            1
+        """
+        self._await_pending_writes()
+        return self.storage.read_since(session_id, cursor)
+
+    def wait_for_events(
+        self,
+        session_id: str,
+        cursor: int = 0,
+        timeout: float = 5.0,
+        poll_interval: float = 0.25
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Bloqueia até haver eventos novos após o cursor ou o timeout expirar.
+
+        Publicações no mesmo processo acordam o leitor imediatamente; eventos
+        escritos por outro processo (ex: CLI) são detectados por polling a
+        cada poll_interval segundos.
+
+        Args:
+            session_id (str): ID da sessão
+            cursor (int): Cursor retornado pela leitura anterior (0 = início)
+            timeout (float): Espera máxima em segundos. Default: 5.0
+            poll_interval (float): Intervalo de verificação entre processos
+
+        Returns:
+            Tuple[List[Dict], int]: Como read_since(); lista vazia se o
+                timeout expirar sem eventos novos
+
+        Example:
+            >>> bus = EventBus()
+            >>> events, cursor = bus.wait_for_events("session-1", cursor, timeout=2.0)
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            events, new_cursor = self.read_since(session_id, cursor)
+            remaining = deadline - time.monotonic()
+            if events or remaining <= 0:
+                return events, new_cursor
+
+            with self._new_events:
+                self._new_events.wait(min(poll_interval, remaining))
+
+    def get_latest_seq(self, session_id: str) -> int:
+        """
+        Obtém o seq do último evento da sessão.
+
+        Args:
+            session_id (str): ID da sessão
+
+        Returns:
+            int: seq do último evento (0 se sessão vazia/inexistente)
+        """
+        self._await_pending_writes()
+        return self.storage.latest_seq(session_id)
+
     def list_active_sessions(self, max_age_minutes: Optional[int] = 60) -> List[str]:
         """
         Lista IDs de sessões ativas (com eventos recentes).
 
+        Consulta o manifesto de sessões: custo proporcional ao número de
+        sessões dentro da janela, não ao total de arquivos/eventos.
+
         Args:
             max_age_minutes (int, optional): Idade máxima em minutos para considerar
                 sessão como ativa. None = listar todas. Default: 60 minutos.
@@ -60,46 +235,43 @@ class EventBusReaders:
             >>> "session-1" in sessions
             True
         """
-        if not self.events_dir.exists():
-            return []
-
-        sessions_with_time = []
-        now = datetime.now(timezone.utc)
-
-        for file_path in self.events_dir.glob("events-*.json"):
-            # Extrair session_id do nome do arquivo: events-{session_id}.json
-            session_id = file_path.stem.replace("events-", "")
-
-            # Obter timestamp do último evento
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                events = data.get('events', [])
-                if not events:
-                    continue
-
-                # Último evento
-                last_event = events[-1]
-                last_time_str = last_event.get('timestamp', '')
-                last_time = datetime.fromisoformat(last_time_str.replace('Z', '+00:00'))
-
-                # Calcular idade em minutos
-                age_minutes = (now - last_time).total_seconds() / 60
-
-                # Filtrar por idade se especificado
-                if max_age_minutes is None or age_minutes <= max_age_minutes:
-                    sessions_with_time.append((session_id, last_time))
+        self._await_pending_writes()
+        # Range scan no índice do manifesto: proporcional às sessões retornadas
+        return [entry["session_id"] for entry in self.manifest.list_sessions(max_age_minutes)]
+
+    def list_session_summaries(
+        self,
+        max_age_minutes: Optional[int] = 60,
+        status: Optional[str] = None,
+        include_archived: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Lista resumos de sessões direto do manifesto (sem abrir eventos).
 
-            except Exception as e:
-                logger.warning(f"Erro ao ler sessão {session_id}: {e}")
-                continue
+        Args:
+            max_age_minutes (int, optional): Idade máxima do último evento.
+                None = listar todas. Default: 60 minutos.
+            status (str, optional): Filtra por status ("active", "completed")
+            include_archived (bool): Inclui sessões arquivadas pela retenção
+                (ver retention.py). Default: False
 
-        # Ordenar do mais recente para o mais antigo
-        sessions_with_time.sort(key=lambda x: x[1], reverse=True)
+        Returns:
+            List[Dict]: Resumos no formato de get_session_summary(), do mais
+                recente para o mais antigo
 
-        # Retornar apenas os IDs
-        return [session_id for session_id, _ in sessions_with_time]
+        Example:
+            >>> bus = EventBus()
+            >>> bus.publish_session_started("session-1", "Test 1")
+            >>> bus.list_session_summaries(status="active")[0]["user_input"]
+            'Test 1'
+        """
+        self._await_pending_writes()
+        return [
+            manifest_entry_to_summary(entry)
+            for entry in self.manifest.list_sessions(
+                max_age_minutes, status=status, include_archived=include_archived
+            )
+        ]
 
     def clear_session(self, session_id: str) -> bool:
         """
@@ -119,19 +291,77 @@ class EventBusReaders:
             >>> bus.clear_session("session-1")
             False
         """
-        file_path = self._get_event_file(session_id)
-
-        if file_path.exists():
-            file_path.unlink()
+        self._await_pending_writes()
+        removed_entry = self.manifest.remove(session_id)
+        archive_path = get_archive_path(self.events_dir, session_id)
+        removed_archive = archive_path.exists()
+        if removed_archive:
+            archive_path.unlink()
+        if self.storage.delete_session(session_id) or removed_entry or removed_archive:
             logger.debug(f"Arquivo de eventos removido: {session_id}")
             return True
 
         return False
 
+    def get_session_aggregates(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtém agregados incrementais da sessão (tokens, custo, duração, turno).
+
+        Mantidos a cada publicação no manifesto: a leitura é O(1), sem somar
+        os agent_completed da sessão. Ver aggregates.py para a estrutura.
+
+        Args:
+            session_id (str): ID da sessão
+
+        Returns:
+            Dict | None: {"totals", "by_agent", "turn", "cognitive",
+                "last_agent_started", "last_agent_completed"} ou None se a
+                sessão não existir
+
+        Example:
+            >>> bus = EventBus()
+            >>> bus.publish_agent_started("s1", "orchestrator")
+            >>> bus.publish_agent_completed("s1", "orchestrator", summary="ok", tokens_total=150, cost=0.001)
+            >>> aggregates = bus.get_session_aggregates("s1")
+            >>> aggregates["totals"]["tokens_total"]
+            150
+            >>> aggregates["by_agent"]["orchestrator"]["agent_calls"]
+            1
+        """
+        self._await_pending_writes()
+        aggregates = self.manifest.get_aggregates(session_id)
+        if aggregates is not None:
+            return aggregates
+
+        # Sessão fora do manifesto: calcular em streaming
+        if not self.storage.session_exists(session_id):
+            return None
+        return aggregate_events(self._iter_events(session_id))
+
+    def get_archived_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Lê sessão arquivada pela retenção (eventos fora do backend).
+
+        Args:
+            session_id (str): ID da sessão
+
+        Returns:
+            Dict | None: {"session_id", "archived_at", "summary", "aggregates",
+                "events"} ou None se a sessão não foi arquivada
+
+        Example:
+            >>> archived = bus.get_archived_session("session-1")
+            >>> archived["summary"]["total_events"]
+            12
+        """
+        return load_archived_session(self.events_dir, session_id)
+
     def get_session_summary(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
         Obtém resumo de uma sessão (primeiro e último evento, total de eventos).
 
+        Respondido pelo manifesto de sessões, sem ler os eventos.
+
         Args:
             session_id (str): ID da sessão
 
@@ -148,29 +378,25 @@ class EventBusReaders:
             >>> summary["status"]
             'active'
         """
-        events = self.get_session_events(session_id)
-
-        if not events:
+        self._await_pending_writes()
+        entry = self.manifest.get(session_id)
+        if entry is not None:
+            return manifest_entry_to_summary(entry)
+
+        # Sessão fora do manifesto (ex: escrita por processo antigo):
+        # streaming mantendo apenas primeiro e último evento em memória
+        first_event = None
+        last_event = None
+        total_events = 0
+        for event in self._iter_events(session_id):
+            if first_event is None:
+                first_event = event
+            last_event = event
+            total_events += 1
+
+        if first_event is None:
             return None
 
-        first_event = events[0]
-        last_event = events[-1]
-
-        # Determinar status da sessão
-        if last_event.get("event_type") == "session_completed":
-            status = "completed"
-            final_status = last_event.get("final_status", "unknown")
-        else:
-            status = "active"
-            final_status = None
-
-        return {
-            "session_id": session_id,
-            "total_events": len(events),
-            "status": status,
-            "final_status": final_status,
-            "started_at": first_event.get("timestamp"),
-            "last_event_at": last_event.get("timestamp"),
-            "user_input": first_event.get("user_input") if first_event.get("event_type") == "session_started" else None
-        }
-
+        delta = summarize_events([first_event, last_event])
+        delta["event_count"] = total_events
+        return manifest_entry_to_summary({"session_id": session_id, **delta})
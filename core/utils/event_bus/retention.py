@@ -0,0 +1,321 @@
+"""
+Retenção, arquivamento e compactação do diretório de eventos.
+
+Sem retenção, {temp}/paper-agent-events cresce indefinidamente. Este módulo
+aplica uma RetentionPolicy (idade máxima, número máximo de sessões, tamanho
+máximo) às sessões do manifesto:
+
+- sessões frias (fora da política) são gravadas em
+  {events_dir}/archive/events-{session_id}.json.gz com resumo, agregados e
+  eventos, e então removidas do backend
+- a entrada do manifesto é mantida com archived_at preenchido: resumo e
+  agregados continuam consultáveis (get_session_summary,
+  get_session_aggregates); list_sessions omite arquivadas por padrão
+- compactação: temporários órfãos, VACUUM do SQLite/manifesto
+
+Sessões com evento nos últimos min_idle_minutes nunca são selecionadas (uma
+sessão em andamento não perde eventos publicados durante o arquivamento).
+Se uma sessão arquivada receber novos eventos, a entrada volta a ativa e os
+eventos antigos permanecem no arquivo; um novo arquivamento acrescenta os
+eventos novos aos já arquivados (o arquivo nunca é sobrescrito com menos).
+
+Execução:
+    - CLI: python scripts/core/prune_events.py
+    - Periódica no processo: RetentionTask (iniciada por get_event_bus()
+      quando EVENT_BUS_RETENTION_INTERVAL_MINUTES está definida)
+"""
+
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .manifest import manifest_entry_to_summary
+
+logger = logging.getLogger(__name__)
+
+# Subdiretório de events_dir com as sessões arquivadas
+ARCHIVE_DIRNAME = "archive"
+
+@dataclass
+class RetentionPolicy:
+    """
+    Limites de retenção do diretório de eventos (None = sem limite).
+
+    Attributes:
+        max_age_days (float, optional): Arquiva sessões sem eventos há mais tempo
+        max_sessions (int, optional): Mantém apenas as N sessões mais recentes
+        max_bytes (int, optional): Arquiva as mais antigas até caber no limite
+        min_idle_minutes (float): Nunca seleciona sessões com evento mais
+            recente que isso. Default: 10
+        archive (bool): Grava .json.gz antes de remover; False descarta os
+            eventos (a entrada do manifesto é removida). Default: True
+    """
+
+    max_age_days: Optional[float] = None
+    max_sessions: Optional[int] = None
+    max_bytes: Optional[int] = None
+    min_idle_minutes: float = 10.0
+    archive: bool = True
+
+    @classmethod
+    def from_env(cls) -> "RetentionPolicy":
+        """
+        Cria política a partir das variáveis EVENT_BUS_RETENTION_*.
+
+        Variáveis:
+            EVENT_BUS_RETENTION_MAX_AGE_DAYS, EVENT_BUS_RETENTION_MAX_SESSIONS,
+            EVENT_BUS_RETENTION_MAX_MB, EVENT_BUS_RETENTION_MIN_IDLE_MINUTES,
+            EVENT_BUS_RETENTION_ARCHIVE (true/false)
+
+        Returns:
+            RetentionPolicy: Política configurada
+        """
+        def _number(name: str, cast: Any) -> Optional[Any]:
+            value = os.getenv(name)
+            return cast(value) if value not in (None, "") else None
+
+        max_mb = _number("EVENT_BUS_RETENTION_MAX_MB", float)
+        min_idle = _number("EVENT_BUS_RETENTION_MIN_IDLE_MINUTES", float)
+        return cls(
+            max_age_days=_number("EVENT_BUS_RETENTION_MAX_AGE_DAYS", float),
+            max_sessions=_number("EVENT_BUS_RETENTION_MAX_SESSIONS", int),
+            max_bytes=int(max_mb * 1024 * 1024) if max_mb is not None else None,
+            min_idle_minutes=min_idle if min_idle is not None else cls.min_idle_minutes,
+            archive=os.getenv("EVENT_BUS_RETENTION_ARCHIVE", "true").lower() in ("1", "true", "yes"),
+        )
+
+    def is_unbounded(self) -> bool:
+        """True se nenhum limite está configurado."""
+        return self.max_age_days is None and self.max_sessions is None and self.max_bytes is None
+
+def get_archive_path(events_dir: Path, session_id: str) -> Path:
+    """
+    Retorna caminho do arquivo compactado de uma sessão.
+
+    Args:
+        events_dir (Path): Diretório de eventos
+        session_id (str): ID da sessão
+
+    Returns:
+        Path: {events_dir}/archive/events-{session_id}.json.gz
+    """
+    return Path(events_dir) / ARCHIVE_DIRNAME / f"events-{session_id}.json.gz"
+
+def load_archived_session(events_dir: Path, session_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Lê sessão arquivada.
+
+    Args:
+        events_dir (Path): Diretório de eventos
+        session_id (str): ID da sessão
+
+    Returns:
+        Dict | None: {"session_id", "archived_at", "summary", "aggregates",
+            "events"} ou None se não houver arquivo
+
+    Example:
+        >>> archived = load_archived_session(bus.events_dir, "session-1")
+        >>> len(archived["events"])
+        42
+    """
+    archive_path = get_archive_path(events_dir, session_id)
+    if not archive_path.exists():
+        return None
+    with gzip.open(archive_path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+def select_sessions(
+    entries: List[Dict[str, Any]],
+    sizes: Dict[str, int],
+    policy: RetentionPolicy,
+    now: Optional[float] = None
+) -> List[str]:
+    """
+    Escolhe sessões que violam a política, da mais antiga para a mais nova.
+
+    Args:
+        entries (List[Dict]): Entradas não arquivadas do manifesto
+        sizes (Dict[str, int]): Bytes ocupados por sessão
+        policy (RetentionPolicy): Limites a aplicar
+        now (float, optional): Epoch de referência (default: agora)
+
+    Returns:
+        List[str]: IDs das sessões a arquivar/remover
+    """
+    now = time.time() if now is None else now
+    idle_cutoff = now - policy.min_idle_minutes * 60
+    oldest_first = sorted(entries, key=lambda entry: entry["last_event_epoch"])
+
+    selected: List[str] = []
+    kept_count = len(oldest_first)
+    kept_bytes = sum(sizes.get(entry["session_id"], 0) for entry in oldest_first)
+
+    for entry in oldest_first:
+        epoch = entry["last_event_epoch"]
+        if epoch > idle_cutoff:
+            # Ordenadas por idade: as seguintes também estão ativas
+            break
+
+        too_old = (
+            policy.max_age_days is not None
+            and epoch < now - policy.max_age_days * 86400
+        )
+        too_many = policy.max_sessions is not None and kept_count > policy.max_sessions
+        too_big = policy.max_bytes is not None and kept_bytes > policy.max_bytes
+        if not (too_old or too_many or too_big):
+            break
+
+        selected.append(entry["session_id"])
+        kept_count -= 1
+        kept_bytes -= sizes.get(entry["session_id"], 0)
+
+    return selected
+
+def _write_archive(archive_path: Path, payload: Dict[str, Any]) -> int:
+    """Grava o .json.gz via temporário + os.replace; retorna bytes gravados."""
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = archive_path.with_name(f"{archive_path.name}.{os.getpid()}.tmp")
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False)
+    os.replace(tmp_path, archive_path)
+    return archive_path.stat().st_size
+
+def run_retention(
+    event_bus: Any,
+    policy: RetentionPolicy,
+    dry_run: bool = False,
+    compact: bool = True
+) -> Dict[str, Any]:
+    """
+    Aplica a política de retenção às sessões do EventBus.
+
+    Args:
+        event_bus (EventBus): Barramento cujo diretório será podado
+        policy (RetentionPolicy): Limites a aplicar
+        dry_run (bool): Apenas reporta o que seria feito. Default: False
+        compact (bool): Compacta backend e manifesto ao final. Default: True
+
+    Returns:
+        Dict: {"selected": [ids], "archived": int, "deleted": int,
+            "bytes_freed": int, "archive_bytes": int, "dry_run": bool}
+
+    Example:
+        >>> report = run_retention(get_event_bus(), RetentionPolicy(max_age_days=7))
+        >>> report["archived"]
+        3
+    """
+    event_bus.flush()
+    storage = event_bus.storage
+    manifest = event_bus.manifest
+
+    entries = manifest.list_sessions()
+    sizes = {entry["session_id"]: storage.session_size(entry["session_id"]) for entry in entries}
+    selected = select_sessions(entries, sizes, policy)
+
+    report: Dict[str, Any] = {
+        "selected": selected,
+        "archived": 0,
+        "deleted": 0,
+        "bytes_freed": sum(sizes[session_id] for session_id in selected),
+        "archive_bytes": 0,
+        "dry_run": dry_run,
+    }
+    if dry_run:
+        return report
+
+    for session_id in selected:
+        if policy.archive:
+            # Sessão reativada e arquivada de novo: eventos já arquivados vêm primeiro
+            try:
+                previous = load_archived_session(event_bus.events_dir, session_id)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Arquivo de {session_id} ilegível, sessão mantida no backend: {e}")
+                continue
+            events = previous["events"] if previous else []
+            events.extend(storage.iter_events(session_id))
+
+            entry = manifest.get(session_id)
+            archived_at = time.time()
+            payload = {
+                "session_id": session_id,
+                "archived_at": archived_at,
+                "summary": manifest_entry_to_summary(entry) if entry else None,
+                "aggregates": manifest.get_aggregates(session_id),
+                "events": events,
+            }
+            report["archive_bytes"] += _write_archive(
+                get_archive_path(event_bus.events_dir, session_id), payload
+            )
+            storage.delete_session(session_id)
+            manifest.mark_archived(session_id, archived_at)
+            report["archived"] += 1
+        else:
+            storage.delete_session(session_id)
+            manifest.remove(session_id)
+            report["deleted"] += 1
+
+    if compact:
+        storage.compact()
+        manifest.compact()
+
+    logger.info(
+        f"Retenção do EventBus: {report['archived']} arquivada(s), "
+        f"{report['deleted']} removida(s), {report['bytes_freed']} bytes liberados"
+    )
+    return report
+
+class RetentionTask:
+    """
+    Executa run_retention periodicamente em thread daemon.
+
+    Args:
+        event_bus (EventBus): Barramento a podar
+        policy (RetentionPolicy): Limites a aplicar
+        interval_seconds (float): Intervalo entre execuções
+
+    Example:
+        >>> task = RetentionTask(bus, RetentionPolicy(max_sessions=200), 3600)
+        >>> task.start()
+        >>> task.stop()
+    """
+
+    def __init__(self, event_bus: Any, policy: RetentionPolicy, interval_seconds: float):
+        self.event_bus = event_bus
+        self.policy = policy
+        self.interval_seconds = interval_seconds
+        self.last_report: Optional[Dict[str, Any]] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Inicia a thread (idempotente)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="event-bus-retention", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Sinaliza parada e aguarda a thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def run_once(self) -> Optional[Dict[str, Any]]:
+        """Executa uma rodada; falhas são registradas e não interrompem a tarefa."""
+        try:
+            self.last_report = run_retention(self.event_bus, self.policy)
+        except Exception as e:
+            logger.warning(f"Falha na retenção do EventBus: {e}")
+            return None
+        return self.last_report
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            self.run_once()
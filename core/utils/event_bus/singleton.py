@@ -6,38 +6,43 @@ global única do EventBus.
 """
 
 import logging
+import os
 from typing import Optional
 
 from .core import EventBusCore
 from .publishers import EventBusPublishers
 from .readers import EventBusReaders
+from .subscriptions import EventBusSubscriptions
+from .retention import RetentionPolicy, RetentionTask
 
 logger = logging.getLogger(__name__)
 
 # Classe EventBus completa combinando todos os mixins
-class EventBus(EventBusCore, EventBusPublishers, EventBusReaders):
+class EventBus(EventBusCore, EventBusPublishers, EventBusReaders, EventBusSubscriptions):
     r"""
     Barramento de eventos baseado em arquivos temporários.
 
-    Publica eventos em arquivos JSON temporários que podem ser lidos pelo
-    Dashboard Streamlit em tempo real. Cada sessão tem seu próprio arquivo.
+    Publica eventos em arquivos JSONL temporários (append-only) que podem ser
+    lidos pelo Dashboard Streamlit em tempo real. Cada sessão tem seu próprio
+    arquivo.
 
     Estrutura do arquivo:
-        {temp_dir}/paper-agent-events/events-{session_id}.json
+        {temp_dir}/paper-agent-events/events-{session_id}.jsonl
         Onde {temp_dir} é:
         - Windows: C:\Users\{user}\AppData\Local\Temp\
         - Linux: /tmp/
         - Mac: /var/folders/.../
 
-        Conteúdo:
-        {
-            "session_id": "cli-session-abc123",
-            "events": [
-                {...},  # AgentStartedEvent
-                {...},  # AgentCompletedEvent
-                ...
-            ]
-        }
+        Conteúdo (um evento por linha):
+        {...}  # AgentStartedEvent
+        {...}  # AgentCompletedEvent
+        ...
+
+    Arquivos legados events-{session_id}.json são migrados automaticamente
+    na inicialização (ver storage.migrate_json_to_jsonl).
+
+    Consumidores no mesmo processo podem receber eventos no momento da
+    publicação via subscribe() (callbacks ou filas asyncio).
 
     Example:
         >>> bus = EventBus()
@@ -57,10 +62,20 @@ class EventBus(EventBusCore, EventBusPublishers, EventBusReaders):
 # Instância global do EventBus (singleton pattern)
 _event_bus_instance: Optional[EventBus] = None
 
+# Retenção periódica da instância global (EVENT_BUS_RETENTION_INTERVAL_MINUTES)
+_retention_task: Optional[RetentionTask] = None
+
 def get_event_bus() -> EventBus:
     """
     Retorna instância global do EventBus (singleton).
 
+    O backend de armazenamento é escolhido pela variável de ambiente
+    EVENT_BUS_BACKEND ("jsonl" padrão, "sqlite" ou "json"). Com
+    EVENT_BUS_ASYNC_WRITES=true, publish_* enfileira e uma thread em
+    background grava em lote (ver writer.py). Com
+    EVENT_BUS_RETENTION_INTERVAL_MINUTES, uma RetentionTask aplica
+    RetentionPolicy.from_env() periodicamente (ver retention.py).
+
     Returns:
         EventBus: Instância única do EventBus
 
@@ -70,8 +85,19 @@ def get_event_bus() -> EventBus:
         >>> bus1 is bus2
         True
     """
-    global _event_bus_instance
+    global _event_bus_instance, _retention_task
     if _event_bus_instance is None:
-        _event_bus_instance = EventBus()
+        backend = os.getenv("EVENT_BUS_BACKEND", "jsonl")
+        async_writes = os.getenv("EVENT_BUS_ASYNC_WRITES", "false").lower() in ("1", "true", "yes")
+        _event_bus_instance = EventBus(backend=backend, async_writes=async_writes)
+
+        interval = os.getenv("EVENT_BUS_RETENTION_INTERVAL_MINUTES")
+        if interval:
+            policy = RetentionPolicy.from_env()
+            if policy.is_unbounded():
+                logger.warning("EVENT_BUS_RETENTION_INTERVAL_MINUTES sem limites configurados; retenção desativada")
+            else:
+                _retention_task = RetentionTask(_event_bus_instance, policy, float(interval) * 60)
+                _retention_task.start()
     return _event_bus_instance
 
@@ -0,0 +1,260 @@
+"""
+Backend SQLite do EventBus.
+
+Armazena todos os eventos em uma única tabela indexada, permitindo que
+Dashboard e backstage consultem exatamente o que renderizam (ex: "últimos
+N agent_completed da sessão") sem desserializar a sessão inteira.
+
+Schema:
+    events(session_id, seq, event_type, agent_name, timestamp, payload)
+    - PRIMARY KEY (session_id, seq)
+    - idx_events_session_type (session_id, event_type, seq)
+    - idx_events_timestamp (timestamp)
+
+O banco usa journal WAL: leitores (Dashboard) não bloqueiam o escritor
+(grafo/Observer) e vice-versa, inclusive entre processos.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .storage import EventStorage
+
+logger = logging.getLogger(__name__)
+
+EVENTS_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS events (
+    session_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    event_type TEXT NOT NULL,
+    agent_name TEXT,
+    timestamp TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (session_id, seq)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_events_session_type
+    ON events(session_id, event_type, seq);
+
+CREATE INDEX IF NOT EXISTS idx_events_timestamp
+    ON events(timestamp);
+"""
+
+def open_wal_connection(
+    db_path: Path,
+    fsync: bool = False,
+    busy_timeout_ms: int = 5000
+) -> sqlite3.Connection:
+    """
+    Abre conexão SQLite em modo WAL com transações explícitas.
+
+    Compartilhada pelos componentes do EventBus que usam SQLite (backend
+    de eventos e manifesto de sessões).
+
+    Args:
+        db_path (Path): Caminho do arquivo SQLite
+        fsync (bool): synchronous=FULL se True, NORMAL caso contrário
+        busy_timeout_ms (int): Espera máxima por lock de outro processo
+
+    Returns:
+        sqlite3.Connection: Conexão com isolation_level=None (autocommit;
+            use BEGIN IMMEDIATE/COMMIT para agrupar escritas)
+    """
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(
+        str(db_path),
+        check_same_thread=False,
+        isolation_level=None,
+        timeout=busy_timeout_ms / 1000
+    )
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute(f"PRAGMA synchronous = {'FULL' if fsync else 'NORMAL'}")
+    conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+    return conn
+
+class SqliteEventStorage(EventStorage):
+    """
+    Backend de eventos em SQLite (modo WAL).
+
+    A conexão é compartilhada entre threads e protegida por lock; a atribuição
+    de seq acontece dentro de transação BEGIN IMMEDIATE, o que a torna segura
+    também entre processos que compartilham o mesmo arquivo.
+
+    Args:
+        db_path (Path): Caminho do arquivo SQLite
+        fsync (bool): Se True, usa synchronous=FULL (durável a cada commit);
+            caso contrário synchronous=NORMAL, suficiente em modo WAL.
+        busy_timeout_ms (int): Espera máxima por lock de outro processo
+
+    Example:
+        >>> storage = SqliteEventStorage(Path("/tmp/paper-agent-events/events.db"))
+        >>> storage.append("s1", {"event_type": "agent_started", "agent_name": "orchestrator"})
+        >>> storage.query("s1", event_types=["agent_started"])
+        [(1, {...})]
+    """
+
+    def __init__(self, db_path: Path, fsync: bool = False, busy_timeout_ms: int = 5000):
+        self.db_path = Path(db_path)
+        self._lock = threading.RLock()
+        self.conn = open_wal_connection(self.db_path, fsync=fsync, busy_timeout_ms=busy_timeout_ms)
+        self.conn.executescript(EVENTS_SCHEMA_SQL)
+
+    def close(self) -> None:
+        """Fecha a conexão SQLite."""
+        with self._lock:
+            self.conn.close()
+
+    def append(self, session_id: str, event: Dict[str, Any]) -> None:
+        self.append_many(session_id, [event])
+
+    def append_many(self, session_id: str, events: Iterable[Dict[str, Any]]) -> None:
+        events = list(events)
+        if not events:
+            return
+
+        with self._lock:
+            try:
+                self.conn.execute("BEGIN IMMEDIATE")
+                self._insert_events(session_id, events)
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def _insert_events(self, session_id: str, events: List[Dict[str, Any]]) -> None:
+        """Insere eventos após o maior seq da sessão (chamar dentro de transação)."""
+        row = self.conn.execute(
+            "SELECT COALESCE(MAX(seq), 0) FROM events WHERE session_id = ?",
+            (session_id,)
+        ).fetchone()
+        next_seq = row[0] + 1
+        self.conn.executemany(
+            "INSERT INTO events (session_id, seq, event_type, agent_name, timestamp, payload) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    session_id,
+                    next_seq + offset,
+                    event.get("event_type", "unknown"),
+                    event.get("agent_name"),
+                    event.get("timestamp", ""),
+                    json.dumps(event, ensure_ascii=False, separators=(",", ":"))
+                )
+                for offset, event in enumerate(events)
+            ]
+        )
+
+    def _fetch(self, sql: str, params: Sequence[Any]) -> List[Tuple[int, Dict[str, Any]]]:
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        results = []
+        for seq, payload in rows:
+            try:
+                results.append((seq, json.loads(payload)))
+            except json.JSONDecodeError as e:
+                logger.warning(f"Evento seq={seq} inválido no SQLite: {e}")
+        return results
+
+    def iter_events(self, session_id: str) -> Iterator[Dict[str, Any]]:
+        for _, event in self._fetch(
+            "SELECT seq, payload FROM events WHERE session_id = ? ORDER BY seq",
+            (session_id,)
+        ):
+            yield event
+
+    def read_last_event(self, session_id: str) -> Optional[Dict[str, Any]]:
+        rows = self._fetch(
+            "SELECT seq, payload FROM events WHERE session_id = ? ORDER BY seq DESC LIMIT 1",
+            (session_id,)
+        )
+        return rows[0][1] if rows else None
+
+    def query(
+        self,
+        session_id: str,
+        event_types: Optional[Sequence[str]] = None,
+        agent_name: Optional[str] = None,
+        since_seq: int = 0,
+        limit: Optional[int] = None,
+        newest_first: bool = False
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        conditions = ["session_id = ?", "seq > ?"]
+        params: List[Any] = [session_id, since_seq]
+
+        if event_types:
+            placeholders = ", ".join("?" for _ in event_types)
+            conditions.append(f"event_type IN ({placeholders})")
+            params.extend(event_types)
+        if agent_name is not None:
+            conditions.append("agent_name = ?")
+            params.append(agent_name)
+
+        sql = (
+            f"SELECT seq, payload FROM events WHERE {' AND '.join(conditions)} "
+            f"ORDER BY seq {'DESC' if newest_first else 'ASC'}"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        rows = self._fetch(sql, params)
+        if newest_first:
+            rows.reverse()
+        return rows
+
+    def latest_seq(self, session_id: str) -> int:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT COALESCE(MAX(seq), 0) FROM events WHERE session_id = ?",
+                (session_id,)
+            ).fetchone()
+        return row[0]
+
+    def replace_events(self, session_id: str, events: List[Dict[str, Any]]) -> None:
+        # DELETE + INSERT na mesma transação: em caso de erro a sessão antiga fica intacta
+        with self._lock:
+            try:
+                self.conn.execute("BEGIN IMMEDIATE")
+                self.conn.execute("DELETE FROM events WHERE session_id = ?", (session_id,))
+                if events:
+                    self._insert_events(session_id, events)
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def list_sessions(self) -> List[str]:
+        with self._lock:
+            rows = self.conn.execute("SELECT DISTINCT session_id FROM events").fetchall()
+        return [row[0] for row in rows]
+
+    def session_exists(self, session_id: str) -> bool:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM events WHERE session_id = ? LIMIT 1",
+                (session_id,)
+            ).fetchone()
+        return row is not None
+
+    def delete_session(self, session_id: str) -> bool:
+        with self._lock:
+            cursor = self.conn.execute("DELETE FROM events WHERE session_id = ?", (session_id,))
+        return cursor.rowcount > 0
+
+    def session_size(self, session_id: str) -> int:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT COALESCE(SUM(LENGTH(payload)), 0) FROM events WHERE session_id = ?",
+                (session_id,)
+            ).fetchone()
+        return row[0]
+
+    def compact(self) -> None:
+        with self._lock:
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self.conn.execute("VACUUM")
@@ -0,0 +1,669 @@
+"""
+Backends de armazenamento do EventBus.
+
+Este módulo isola o formato físico dos eventos da API pública do EventBus.
+EventBusCore delega toda leitura e escrita para uma instância de EventStorage.
+
+Backends disponíveis:
+- JsonlEventStorage: um evento JSON por linha, escrita append-only (padrão)
+- JsonEventStorage: formato legado {"session_id", "events": [...]}, reescrito
+  a cada evento (mantido para compatibilidade e migração)
+- SqliteEventStorage: tabela SQLite indexada (ver sqlite_storage.py)
+
+Concorrência entre processos:
+    Escritas nos backends em arquivo usam lock advisory por arquivo de
+    sessão (ver locking.py); o SQLite serializa escritas com BEGIN IMMEDIATE.
+    Vários processos podem publicar na mesma sessão sem perder eventos.
+
+Sequência (seq):
+    Cada evento tem uma posição 1-based dentro da sessão. Nos backends em
+    arquivo, seq é a posição do evento válido no arquivo; no SQLite, é a
+    coluna seq da tabela. Consultas tipadas (query, latest_seq) usam seq
+    para paginação incremental.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .locking import locked_file, locked_read, locked_rewrite, locked_unlink
+
+logger = logging.getLogger(__name__)
+
+# Idade mínima para compact() remover temporários órfãos de rewrite
+STALE_TMP_SECONDS = 3600
+
+class EventStorage:
+    """
+    Interface base dos backends de armazenamento de eventos.
+
+    Subclasses devem implementar append, iter_events, list_sessions,
+    session_exists e delete_session. Os demais métodos têm implementação
+    padrão baseada nesses primitivos e podem ser sobrescritos quando o
+    backend consegue responder de forma mais barata.
+    """
+
+    def append(self, session_id: str, event: Dict[str, Any]) -> None:
+        """
+        Persiste um evento ao final da sessão.
+
+        Args:
+            session_id (str): ID da sessão
+            event (Dict): Evento serializado (model_dump)
+        """
+        raise NotImplementedError
+
+    def append_many(self, session_id: str, events: Iterable[Dict[str, Any]]) -> None:
+        """
+        Persiste vários eventos da mesma sessão, preservando a ordem.
+
+        Args:
+            session_id (str): ID da sessão
+            events (Iterable[Dict]): Eventos serializados
+        """
+        for event in events:
+            self.append(session_id, event)
+
+    def iter_events(self, session_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Itera sobre os eventos de uma sessão em ordem de publicação.
+
+        Args:
+            session_id (str): ID da sessão
+
+        Yields:
+            Dict: Evento em formato dict
+        """
+        raise NotImplementedError
+
+    def read_events(self, session_id: str) -> List[Dict[str, Any]]:
+        """
+        Retorna todos os eventos de uma sessão.
+
+        Args:
+            session_id (str): ID da sessão
+
+        Returns:
+            List[Dict]: Eventos em ordem de publicação
+        """
+        return list(self.iter_events(session_id))
+
+    def read_last_event(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retorna o último evento de uma sessão.
+
+        Args:
+            session_id (str): ID da sessão
+
+        Returns:
+            Dict | None: Último evento ou None se a sessão estiver vazia
+        """
+        last_event = None
+        for event in self.iter_events(session_id):
+            last_event = event
+        return last_event
+
+    def query(
+        self,
+        session_id: str,
+        event_types: Optional[Sequence[str]] = None,
+        agent_name: Optional[str] = None,
+        since_seq: int = 0,
+        limit: Optional[int] = None,
+        newest_first: bool = False
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Consulta eventos de uma sessão com filtros.
+
+        A implementação padrão faz streaming e filtra em Python, mantendo em
+        memória apenas os eventos selecionados. Backends indexados sobrescrevem.
+
+        Args:
+            session_id (str): ID da sessão
+            event_types (Sequence[str], optional): Tipos aceitos (None = todos)
+            agent_name (str, optional): Filtra por agent_name
+            since_seq (int): Retorna apenas eventos com seq > since_seq
+            limit (int, optional): Máximo de eventos retornados
+            newest_first (bool): Se True, seleciona os mais recentes
+
+        Returns:
+            List[Tuple[int, Dict]]: Pares (seq, evento) em ordem de seq
+                (o limite é aplicado no início ou no fim conforme newest_first)
+        """
+        types = set(event_types) if event_types else None
+
+        if newest_first and limit is not None:
+            selected: Any = deque(maxlen=limit)
+        else:
+            selected = []
+
+        for seq, event in enumerate(self.iter_events(session_id), start=1):
+            if seq <= since_seq:
+                continue
+            if types is not None and event.get("event_type") not in types:
+                continue
+            if agent_name is not None and event.get("agent_name") != agent_name:
+                continue
+            selected.append((seq, event))
+            if not newest_first and limit is not None and len(selected) >= limit:
+                break
+
+        return list(selected)
+
+    def read_since(self, session_id: str, cursor: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Lê apenas os eventos publicados após um cursor.
+
+        O cursor é opaco para o chamador: na implementação padrão é o seq do
+        último evento lido; backends podem usar outra posição (ex: offset em
+        bytes). Cursor 0 sempre significa "desde o início". Se o cursor
+        estiver além do fim da sessão (sessão removida/reescrita), a leitura
+        recomeça do início.
+
+        Args:
+            session_id (str): ID da sessão
+            cursor (int): Cursor retornado pela chamada anterior (0 = início)
+
+        Returns:
+            Tuple[List[Dict], int]: Eventos novos e o cursor para a próxima chamada
+        """
+        rows = self.query(session_id, since_seq=cursor)
+        if rows:
+            return [event for _, event in rows], rows[-1][0]
+
+        latest = self.latest_seq(session_id) if cursor else 0
+        if latest < cursor:
+            return self.read_since(session_id, 0)
+        return [], cursor
+
+    def latest_seq(self, session_id: str) -> int:
+        """
+        Retorna o seq do último evento da sessão (0 se vazia).
+
+        Args:
+            session_id (str): ID da sessão
+
+        Returns:
+            int: Número de eventos da sessão
+        """
+        return sum(1 for _ in self.iter_events(session_id))
+
+    def get_event_file(self, session_id: str) -> Optional[Path]:
+        """
+        Retorna arquivo físico da sessão, quando o backend usa um por sessão.
+
+        Args:
+            session_id (str): ID da sessão
+
+        Returns:
+            Path | None: Caminho do arquivo ou None (backends não baseados em arquivo)
+        """
+        return None
+
+    def replace_events(self, session_id: str, events: List[Dict[str, Any]]) -> None:
+        """
+        Substitui todos os eventos de uma sessão (usado por migração).
+
+        Args:
+            session_id (str): ID da sessão
+            events (List[Dict]): Nova lista completa de eventos
+        """
+        self.delete_session(session_id)
+        self.append_many(session_id, events)
+
+    def list_sessions(self) -> List[str]:
+        """
+        Lista IDs de todas as sessões armazenadas.
+
+        Returns:
+            List[str]: IDs das sessões (sem ordem garantida)
+        """
+        raise NotImplementedError
+
+    def session_exists(self, session_id: str) -> bool:
+        """
+        Verifica se há armazenamento para a sessão.
+
+        Args:
+            session_id (str): ID da sessão
+
+        Returns:
+            bool: True se a sessão existe
+        """
+        raise NotImplementedError
+
+    def delete_session(self, session_id: str) -> bool:
+        """
+        Remove todos os eventos de uma sessão.
+
+        Args:
+            session_id (str): ID da sessão
+
+        Returns:
+            bool: True se algo foi removido, False se não existia
+        """
+        raise NotImplementedError
+
+    def session_size(self, session_id: str) -> int:
+        """
+        Retorna o espaço ocupado pelos eventos da sessão (usado pela retenção).
+
+        Args:
+            session_id (str): ID da sessão
+
+        Returns:
+            int: Tamanho aproximado em bytes (0 se a sessão não existir)
+        """
+        file_path = self.get_event_file(session_id)
+        if file_path is None or not file_path.exists():
+            return 0
+        return file_path.stat().st_size
+
+    def compact(self) -> None:
+        """
+        Recupera espaço após remoções (no-op por padrão).
+        """
+
+class _FileEventStorage(EventStorage):
+    """
+    Base comum dos backends que usam um arquivo por sessão.
+
+    Attributes:
+        events_dir (Path): Diretório dos arquivos de eventos
+        suffix (str): Extensão dos arquivos (definida pela subclasse)
+    """
+
+    suffix = ""
+
+    def __init__(self, events_dir: Path):
+        self.events_dir = Path(events_dir)
+        self.events_dir.mkdir(parents=True, exist_ok=True)
+
+    def get_event_file(self, session_id: str) -> Path:
+        """
+        Retorna caminho do arquivo de eventos para uma sessão.
+
+        Args:
+            session_id (str): ID da sessão
+
+        Returns:
+            Path: Caminho do arquivo
+        """
+        return self.events_dir / f"events-{session_id}{self.suffix}"
+
+    def list_sessions(self) -> List[str]:
+        if not self.events_dir.exists():
+            return []
+        prefix_len = len("events-")
+        return [
+            file_path.name[prefix_len:-len(self.suffix)]
+            for file_path in self.events_dir.glob(f"events-*{self.suffix}")
+            if file_path.name.endswith(self.suffix)
+        ]
+
+    def session_exists(self, session_id: str) -> bool:
+        return self.get_event_file(session_id).exists()
+
+    def delete_session(self, session_id: str) -> bool:
+        return locked_unlink(self.get_event_file(session_id))
+
+    def compact(self) -> None:
+        # Temporários de rewrites interrompidos (processo morto antes do os.replace)
+        cutoff = time.time() - STALE_TMP_SECONDS
+        for tmp_path in self.events_dir.glob(f"events-*{self.suffix}.*.tmp"):
+            try:
+                if tmp_path.stat().st_mtime < cutoff:
+                    tmp_path.unlink()
+            except FileNotFoundError:
+                continue
+
+class JsonlEventStorage(_FileEventStorage):
+    """
+    Backend append-only: um evento JSON por linha.
+
+    Publicar um evento custa O(1): a linha é anexada ao final do arquivo
+    sem ler nem reescrever os eventos anteriores. Leituras fazem streaming
+    linha a linha; linhas corrompidas ou incompletas (ex: escrita
+    interrompida) são ignoradas com warning.
+
+    Estrutura do arquivo:
+        {events_dir}/events-{session_id}.jsonl
+        {"session_id": "...", "event_type": "session_started", ...}
+        {"session_id": "...", "event_type": "agent_started", ...}
+
+    Leituras incrementais (read_since) usam como cursor o offset em bytes
+    da próxima linha a consumir; latest_seq guarda a contagem já feita por
+    sessão e só examina o trecho novo do arquivo.
+
+    Args:
+        events_dir (Path): Diretório dos arquivos de eventos
+        fsync (bool): Se True, chama os.fsync após cada escrita (durável
+            contra queda de energia, porém mais lento). Default: False
+    """
+
+    suffix = ".jsonl"
+
+    def __init__(self, events_dir: Path, fsync: bool = False):
+        super().__init__(events_dir)
+        self.fsync = fsync
+        # session_id -> (inode, offset contado, eventos válidos até o offset)
+        self._seq_index: Dict[str, Tuple[int, int, int]] = {}
+        self._seq_lock = threading.Lock()
+
+    @staticmethod
+    def _encode(event: Dict[str, Any]) -> str:
+        return json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+    def _write(self, session_id: str, payload: str) -> None:
+        # Lock garante que linhas de processos diferentes não se intercalem
+        with locked_file(self.get_event_file(session_id), 'a') as f:
+            f.write(payload)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+
+    def append(self, session_id: str, event: Dict[str, Any]) -> None:
+        self._write(session_id, self._encode(event))
+
+    def append_many(self, session_id: str, events: Iterable[Dict[str, Any]]) -> None:
+        payload = "".join(self._encode(event) for event in events)
+        if payload:
+            self._write(session_id, payload)
+
+    def iter_events(self, session_id: str) -> Iterator[Dict[str, Any]]:
+        file_path = self.get_event_file(session_id)
+        if not file_path.exists():
+            return
+
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f, start=1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as e:
+                        logger.warning(
+                            f"Linha {line_number} inválida em eventos de {session_id}: {e}"
+                        )
+        except IOError as e:
+            logger.warning(f"Erro ao carregar eventos de {session_id}: {e}")
+
+    def read_last_event(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Lê apenas a última linha do arquivo (seek a partir do final).
+
+        Custo independe do tamanho da sessão.
+        """
+        file_path = self.get_event_file(session_id)
+        if not file_path.exists():
+            return None
+
+        try:
+            with open(file_path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                position = f.tell()
+                block_size = 4096
+                buffer = b""
+                while position > 0:
+                    read_size = min(block_size, position)
+                    position -= read_size
+                    f.seek(position)
+                    buffer = f.read(read_size) + buffer
+                    lines = [line for line in buffer.split(b"\n") if line.strip()]
+                    # Precisa de pelo menos uma linha completa (ou ter chegado ao início)
+                    if len(lines) > 1 or (lines and position == 0):
+                        for raw_line in reversed(lines):
+                            try:
+                                return json.loads(raw_line.decode('utf-8'))
+                            except (json.JSONDecodeError, UnicodeDecodeError):
+                                continue
+                        return None
+        except IOError as e:
+            logger.warning(f"Erro ao ler último evento de {session_id}: {e}")
+        return None
+
+    def _read_tail(self, session_id: str, offset: int) -> Tuple[int, int, bytes]:
+        """
+        Lê, sob lock compartilhado, as linhas completas a partir de offset.
+
+        Offset além do fim ou fora de início de linha (arquivo removido ou
+        reescrito desde a última leitura) recomeça do byte 0.
+
+        Returns:
+            Tuple[int, int, bytes]: (inode, offset efetivo, linhas completas)
+
+        Raises:
+            FileNotFoundError: Se a sessão não tiver arquivo
+        """
+        with locked_read(self.get_event_file(session_id)) as f:
+            stat = os.fstat(f.fileno())
+            if offset > stat.st_size:
+                offset = 0
+            elif offset > 0:
+                f.seek(offset - 1)
+                if f.read(1) != b"\n":
+                    offset = 0
+            f.seek(offset)
+            chunk = f.read(stat.st_size - offset)
+
+        # Linha final sem newline ainda está sendo escrita (ou foi interrompida)
+        return stat.st_ino, offset, chunk[:chunk.rfind(b"\n") + 1]
+
+    def _decode_lines(self, session_id: str, chunk: bytes) -> List[Dict[str, Any]]:
+        events = []
+        for raw_line in chunk.split(b"\n"):
+            if not raw_line.strip():
+                continue
+            try:
+                events.append(json.loads(raw_line.decode("utf-8")))
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                logger.warning(f"Linha inválida em eventos de {session_id}: {e}")
+        return events
+
+    def read_since(self, session_id: str, cursor: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Lê a partir do offset em bytes do cursor, sem reler o prefixo.
+
+        Custo proporcional aos bytes novos. Só linhas completas são
+        consumidas; uma linha em escrita fica para a próxima chamada.
+        """
+        try:
+            _, offset, chunk = self._read_tail(session_id, cursor)
+        except FileNotFoundError:
+            return [], 0
+        except IOError as e:
+            logger.warning(f"Erro ao ler eventos novos de {session_id}: {e}")
+            return [], cursor
+        return self._decode_lines(session_id, chunk), offset + len(chunk)
+
+    def latest_seq(self, session_id: str) -> int:
+        """
+        Conta eventos válidos examinando só o trecho novo desde a última chamada.
+
+        A contagem anterior vale enquanto o arquivo for o mesmo (inode) e não
+        encolher; rewrite ou remoção fazem a contagem recomeçar do início.
+        """
+        with self._seq_lock:
+            inode, offset, count = self._seq_index.get(session_id, (-1, 0, 0))
+        try:
+            current_inode, start, chunk = self._read_tail(session_id, offset)
+            if current_inode != inode or start != offset:
+                # Contagem era de outro arquivo: refaz desde o início
+                count = 0
+                if start != 0:
+                    current_inode, start, chunk = self._read_tail(session_id, 0)
+        except FileNotFoundError:
+            with self._seq_lock:
+                self._seq_index.pop(session_id, None)
+            return 0
+
+        count += len(self._decode_lines(session_id, chunk))
+        with self._seq_lock:
+            self._seq_index[session_id] = (current_inode, start + len(chunk), count)
+        return count
+
+    def delete_session(self, session_id: str) -> bool:
+        with self._seq_lock:
+            self._seq_index.pop(session_id, None)
+        return super().delete_session(session_id)
+
+    def replace_events(self, session_id: str, events: List[Dict[str, Any]]) -> None:
+        with locked_rewrite(self.get_event_file(session_id)) as (_, tmp_path):
+            self._write_file(tmp_path, events)
+
+    def prepend_events(self, session_id: str, events: List[Dict[str, Any]]) -> None:
+        """
+        Insere eventos antes dos existentes, atomicamente (usado na migração).
+
+        Args:
+            session_id (str): ID da sessão
+            events (List[Dict]): Eventos mais antigos que os do arquivo
+        """
+        with locked_rewrite(self.get_event_file(session_id)) as (current, tmp_path):
+            current.seek(0)
+            existing = current.read()
+            self._write_file(tmp_path, events, existing)
+
+    def _write_file(self, file_path: Path, events: List[Dict[str, Any]], tail: str = "") -> None:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            for event in events:
+                f.write(self._encode(event))
+            f.write(tail)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+
+class JsonEventStorage(_FileEventStorage):
+    """
+    Backend legado: documento JSON único por sessão.
+
+    Cada append lê o arquivo inteiro e o reescreve (custo O(eventos da sessão)).
+    Mantido apenas para compatibilidade e como origem da migração para JSONL.
+
+    Estrutura do arquivo:
+        {events_dir}/events-{session_id}.json
+        {"session_id": "...", "events": [{...}, {...}]}
+    """
+
+    suffix = ".json"
+
+    def _load(self, session_id: str) -> Dict[str, Any]:
+        file_path = self.get_event_file(session_id)
+
+        if not file_path.exists():
+            return {"session_id": session_id, "events": []}
+
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Erro ao carregar eventos de {session_id}: {e}")
+            return {"session_id": session_id, "events": []}
+
+    def _rewrite(self, session_id: str, events: Iterable[Dict[str, Any]], keep_existing: bool) -> None:
+        # Read-modify-write sob lock: escritores concorrentes (inclusive de
+        # outros processos) são serializados e nenhum evento se perde
+        try:
+            with locked_rewrite(self.get_event_file(session_id)) as (current, tmp_path):
+                data = {"session_id": session_id, "events": []}
+                if keep_existing:
+                    current.seek(0)
+                    content = current.read()
+                    if content.strip():
+                        data = json.loads(content)
+                data["events"].extend(events)
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.error(f"Erro ao salvar eventos de {session_id}: {e}")
+
+    def append(self, session_id: str, event: Dict[str, Any]) -> None:
+        self.append_many(session_id, [event])
+
+    def append_many(self, session_id: str, events: Iterable[Dict[str, Any]]) -> None:
+        self._rewrite(session_id, events, keep_existing=True)
+
+    def iter_events(self, session_id: str) -> Iterator[Dict[str, Any]]:
+        yield from self._load(session_id).get("events", [])
+
+    def replace_events(self, session_id: str, events: List[Dict[str, Any]]) -> None:
+        self._rewrite(session_id, events, keep_existing=False)
+
+# Sufixo da cópia preservada do .json migrado (fora do padrão events-*.json)
+MIGRATED_SUFFIX = ".migrated"
+
+def _write_migrated_copy(source_file: Path, content: str) -> None:
+    """Grava cópia do .json legado em {nome}.migrated via temporário + os.replace."""
+    copy_path = source_file.with_name(source_file.name + MIGRATED_SUFFIX)
+    tmp_path = copy_path.with_name(f"{copy_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_path, copy_path)
+
+def migrate_json_to_jsonl(
+    events_dir: Path,
+    remove_source: bool = True,
+    fsync: bool = False
+) -> Dict[str, int]:
+    """
+    Converte arquivos legados events-{session_id}.json para JSONL.
+
+    Migração one-shot e idempotente: sessões que já possuem arquivo .jsonl
+    recebem os eventos legados antes dos existentes (o arquivo .json é
+    sempre mais antigo que o .jsonl, criado após a troca de backend).
+    O .json migrado sempre sai do padrão events-*.json (removido ou, com
+    remove_source=False, preservado como events-{session_id}.json.migrated),
+    então execuções seguintes e a migração automática do EventBus não
+    reaplicam os mesmos eventos. Arquivos legados ilegíveis são mantidos no
+    lugar.
+
+    Args:
+        events_dir (Path): Diretório dos arquivos de eventos
+        remove_source (bool): Remove o .json após migrar; False guarda uma
+            cópia em .json.migrated. Default: True
+        fsync (bool): Repassado ao JsonlEventStorage de destino
+
+    Returns:
+        Dict[str, int]: session_id -> número de eventos migrados
+
+    Example:
+        >>> migrated = migrate_json_to_jsonl(Path("/tmp/paper-agent-events"))
+        >>> migrated
+        {'cli-session-abc123': 12}
+    """
+    legacy = JsonEventStorage(events_dir)
+    target = JsonlEventStorage(events_dir, fsync=fsync)
+    migrated: Dict[str, int] = {}
+
+    for session_id in legacy.list_sessions():
+        source_file = legacy.get_event_file(session_id)
+        try:
+            # Lock no arquivo legado: se vários processos iniciam juntos,
+            # apenas um migra; os demais encontram o arquivo já esvaziado
+            with locked_file(source_file, 'a+') as f:
+                f.seek(0)
+                content = f.read()
+                events = json.loads(content).get("events", []) if content.strip() else None
+                if events is not None:
+                    target.prepend_events(session_id, events)
+                    migrated[session_id] = len(events)
+                    if not remove_source:
+                        _write_migrated_copy(source_file, content)
+                    f.truncate(0)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Sessão legada {session_id} não migrada: {e}")
+            continue
+
+        locked_unlink(source_file)
+
+    if migrated:
+        logger.info(f"EventBus: {len(migrated)} sessão(ões) migrada(s) de JSON para JSONL")
+
+    return migrated
@@ -0,0 +1,184 @@
+"""
+Assinaturas push do EventBus (mesmo processo).
+
+Além de persistir, cada evento publicado é entregue no momento da
+publicação a callbacks registrados ou a filas asyncio, sem polling dos
+arquivos de eventos. Consumidores em outro processo (ex: Dashboard) continuam
+usando read_since()/wait_for_events().
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# session_id especial que recebe eventos de todas as sessões
+ALL_SESSIONS = "*"
+
+class Subscription:
+    """
+    Assinatura registrada via EventBus.subscribe().
+
+    A entrega acontece na thread que publicou o evento: callbacks devem ser
+    rápidos (delegar trabalho pesado). Exceções no callback são registradas
+    em log e não afetam o publisher nem outras assinaturas.
+
+    Para filas asyncio, o evento é agendado no loop dono da fila com
+    call_soon_threadsafe; fila cheia descarta o evento (contado em dropped).
+
+    Attributes:
+        session_id (str): Sessão assinada ou "*" para todas
+        event_types (set | None): Tipos entregues (None = todos)
+        delivered (int): Eventos entregues
+        dropped (int): Eventos descartados (fila cheia ou loop encerrado)
+    """
+
+    def __init__(
+        self,
+        bus: Any,
+        session_id: str,
+        event_types: Optional[Sequence[str]] = None,
+        callback: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        queue: Optional[Any] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ):
+        self._bus = bus
+        self.session_id = session_id
+        self.event_types = set(event_types) if event_types else None
+        self.callback = callback
+        self.queue = queue
+        self.loop = loop
+        self.active = True
+        self.delivered = 0
+        self.dropped = 0
+
+    def matches(self, session_id: str, event: Dict[str, Any]) -> bool:
+        """Retorna True se o evento deve ser entregue a esta assinatura."""
+        if self.session_id != ALL_SESSIONS and self.session_id != session_id:
+            return False
+        return self.event_types is None or event.get("event_type") in self.event_types
+
+    def deliver(self, event: Dict[str, Any]) -> None:
+        """Entrega o evento ao callback ou à fila."""
+        if self.callback is not None:
+            try:
+                self.callback(event)
+                self.delivered += 1
+            except Exception as e:
+                logger.exception(f"Erro em callback de assinatura ({self.session_id}): {e}")
+            return
+
+        if self.loop is None:
+            self._put(event)
+            return
+
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # Loop encerrado: a assinatura não tem mais consumidor
+            self.dropped += 1
+            self.unsubscribe()
+
+    def _put(self, event: Dict[str, Any]) -> None:
+        try:
+            self.queue.put_nowait(event)
+            self.delivered += 1
+        except Exception as e:  # asyncio.QueueFull / queue.Full
+            self.dropped += 1
+            logger.warning(f"Evento descartado na assinatura ({self.session_id}): {e!r}")
+
+    def unsubscribe(self) -> None:
+        """Cancela a assinatura (idempotente)."""
+        self._bus.unsubscribe(self)
+
+class EventBusSubscriptions:
+    """
+    Mixin com assinaturas push (subscribe/unsubscribe).
+
+    Requer os atributos _subscriptions e _subscriptions_lock criados por
+    EventBusCore, que chama _dispatch_event() após persistir cada evento
+    (modo síncrono) ou ao enfileirá-lo no escritor (async_writes).
+    """
+
+    def subscribe(
+        self,
+        session_id: str = ALL_SESSIONS,
+        event_types: Optional[Sequence[str]] = None,
+        callback: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        queue: Optional[Any] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> Subscription:
+        """
+        Registra consumidor de eventos entregues no momento da publicação.
+
+        Informe exatamente um entre callback e queue. Para asyncio.Queue, o
+        loop é detectado automaticamente quando subscribe() é chamado de
+        dentro de uma coroutine; caso contrário, informe loop explicitamente
+        (ou use queue.Queue, que é thread-safe).
+
+        Args:
+            session_id (str): ID da sessão ou "*" para todas. Default: "*"
+            event_types (Sequence[str], optional): Tipos entregues (None = todos)
+            callback (Callable, optional): Função chamada com o evento (dict)
+            queue (asyncio.Queue | queue.Queue, optional): Fila de destino
+            loop (AbstractEventLoop, optional): Loop dono da asyncio.Queue
+
+        Returns:
+            Subscription: Handle com unsubscribe() e contadores
+
+        Raises:
+            ValueError: Se nenhum ou ambos entre callback e queue forem informados
+
+        Example:
+            >>> bus = EventBus()
+            >>> sub = bus.subscribe("session-1", ["agent_started"], callback=print)
+            >>> bus.publish_agent_started("session-1", "orchestrator")
+            {'event_type': 'agent_started', ...}
+            >>> sub.unsubscribe()
+        """
+        if (callback is None) == (queue is None):
+            raise ValueError("Informe exatamente um entre callback e queue")
+
+        if queue is not None and loop is None and isinstance(queue, asyncio.Queue):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                raise ValueError("asyncio.Queue requer loop (ou subscribe dentro de uma coroutine)")
+
+        subscription = Subscription(
+            self, session_id, event_types=event_types,
+            callback=callback, queue=queue, loop=loop
+        )
+        with self._subscriptions_lock:
+            self._subscriptions = [*self._subscriptions, subscription]
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> bool:
+        """
+        Remove uma assinatura.
+
+        Args:
+            subscription (Subscription): Handle retornado por subscribe()
+
+        Returns:
+            bool: True se a assinatura estava registrada
+        """
+        with self._subscriptions_lock:
+            subscription.active = False
+            if subscription not in self._subscriptions:
+                return False
+            self._subscriptions = [s for s in self._subscriptions if s is not subscription]
+        return True
+
+    def _dispatch_event(self, session_id: str, event: Dict[str, Any]) -> None:
+        """
+        Entrega evento recém-persistido às assinaturas compatíveis.
+
+        A lista é substituída (copy-on-write) em subscribe/unsubscribe, então
+        a iteração não precisa de lock e callbacks podem cancelar assinaturas.
+        """
+        subscriptions: List[Subscription] = self._subscriptions
+        for subscription in subscriptions:
+            if subscription.active and subscription.matches(session_id, event):
+                subscription.deliver(event)
@@ -0,0 +1,54 @@
+"""
+Tail incremental de uma sessão do EventBus.
+
+Mantém cursor e eventos já lidos entre chamadas, para consumidores que
+re-renderizam periodicamente (Dashboard, backstage) fazerem trabalho
+proporcional apenas aos eventos novos.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+class SessionTail:
+    """
+    Acumula eventos de uma sessão lendo apenas o que mudou desde o refresh anterior.
+
+    Args:
+        session_id (str): ID da sessão acompanhada
+        event_types (Sequence[str], optional): Tipos mantidos em memória
+            (None = todos). Eventos de outros tipos avançam o cursor mas
+            são descartados.
+
+    Example:
+        >>> tail = SessionTail("session-1")
+        >>> events = tail.refresh(get_event_bus())   # lê tudo na primeira vez
+        >>> events = tail.refresh(get_event_bus())   # depois, só o que é novo
+    """
+
+    def __init__(self, session_id: str, event_types: Optional[Sequence[str]] = None):
+        self.session_id = session_id
+        self.event_types = set(event_types) if event_types else None
+        self.cursor = 0
+        self.events: List[Dict[str, Any]] = []
+
+    def refresh(self, bus: Any) -> List[Dict[str, Any]]:
+        """
+        Incorpora eventos publicados desde o último refresh.
+
+        Se o cursor retroceder (sessão removida/reescrita), o acumulado é
+        descartado e a sessão é relida do início.
+
+        Args:
+            bus (EventBus): Instância usada para leitura
+
+        Returns:
+            List[Dict]: Todos os eventos acumulados (filtrados por tipo)
+        """
+        new_events, cursor = bus.read_since(self.session_id, self.cursor)
+        if cursor < self.cursor:
+            self.events = []
+        self.cursor = cursor
+
+        if self.event_types is not None:
+            new_events = [e for e in new_events if e.get("event_type") in self.event_types]
+        self.events.extend(new_events)
+        return self.events
@@ -0,0 +1,250 @@
+"""
+Escritor em background do EventBus.
+
+Modo opcional em que publish_* apenas enfileira o evento: uma thread
+dedicada drena uma fila limitada, agrupa eventos por sessão e grava cada
+grupo com uma única chamada (append_many + atualização do manifesto).
+Tira a escrita em disco do caminho crítico do grafo e do Observer.
+
+Política de flush:
+    - tamanho: max_batch_size eventos pendentes
+    - tempo: flush_interval segundos desde o primeiro evento pendente
+    - explícito: flush() (leitores no mesmo processo) e close() (atexit)
+
+Backpressure:
+    Com a fila cheia, o evento é descartado (block_on_full=False, padrão) ou
+    o publisher espera até block_timeout segundos. Descartes são contados
+    em get_stats()["dropped"].
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Função que grava um lote de eventos de uma sessão
+BatchSink = Callable[[str, List[Dict[str, Any]]], None]
+
+class _Flush:
+    """Marcador de flush explícito na fila (sinaliza done após gravar)."""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+_STOP = object()
+
+class BatchedEventWriter:
+    """
+    Thread que grava eventos em lote, agrupados por sessão.
+
+    A ordem dos eventos é preservada dentro de cada sessão.
+
+    Args:
+        sink (Callable[[str, List[Dict]], None]): Grava um lote de uma sessão
+        max_queue_size (int): Capacidade da fila. Default: 10000
+        max_batch_size (int): Eventos pendentes que disparam flush. Default: 256
+        flush_interval (float): Espera máxima (s) de um evento pendente. Default: 0.05
+        block_on_full (bool): Se True, publisher espera por espaço na fila em
+            vez de descartar. Default: False
+        block_timeout (float): Espera máxima (s) com block_on_full. Default: 1.0
+
+    Example:
+        >>> writer = BatchedEventWriter(lambda sid, events: print(sid, len(events)))
+        >>> writer.submit("s1", {"event_type": "agent_started"})
+        >>> writer.flush()
+        s1 1
+        >>> writer.get_stats()["queue_depth"]
+        0
+    """
+
+    def __init__(
+        self,
+        sink: BatchSink,
+        max_queue_size: int = 10000,
+        max_batch_size: int = 256,
+        flush_interval: float = 0.05,
+        block_on_full: bool = False,
+        block_timeout: float = 1.0
+    ):
+        self.sink = sink
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.block_on_full = block_on_full
+        self.block_timeout = block_timeout
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._stats_lock = threading.Lock()
+        self._enqueued = 0
+        self._written = 0
+        self._dropped = 0
+        self._batches = 0
+        self._write_errors = 0
+        self._max_queue_depth = 0
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._run, name="event-bus-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, session_id: str, event: Dict[str, Any]) -> bool:
+        """
+        Enfileira um evento para gravação.
+
+        Args:
+            session_id (str): ID da sessão
+            event (Dict): Evento serializado
+
+        Returns:
+            bool: True se enfileirado, False se descartado (fila cheia ou
+                escritor encerrado)
+        """
+        if self._closed:
+            with self._stats_lock:
+                self._dropped += 1
+            return False
+
+        # Contabiliza antes do put: pending nunca fica negativo se a thread
+        # gravar o evento antes do retorno de put()
+        with self._stats_lock:
+            self._enqueued += 1
+
+        try:
+            if self.block_on_full:
+                self._queue.put((session_id, event), timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait((session_id, event))
+        except queue.Full:
+            with self._stats_lock:
+                self._enqueued -= 1
+                self._dropped += 1
+                dropped = self._dropped
+            logger.warning(f"Fila do EventBus cheia: evento descartado ({dropped} no total)")
+            return False
+
+        depth = self._queue.qsize()
+        with self._stats_lock:
+            if depth > self._max_queue_depth:
+                self._max_queue_depth = depth
+        return True
+
+    @property
+    def pending(self) -> int:
+        """Eventos enfileirados ainda não gravados (inclui lote em montagem)."""
+        with self._stats_lock:
+            return self._enqueued - self._written - self._write_errors
+
+    def is_writer_thread(self) -> bool:
+        """True se chamado de dentro da thread do escritor (ex: pelo sink)."""
+        return threading.current_thread() is self._thread
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Grava tudo que foi enfileirado até agora e espera a conclusão.
+
+        Args:
+            timeout (float, optional): Espera máxima em segundos (None = sem limite)
+
+        Returns:
+            bool: True se o flush terminou dentro do timeout
+        """
+        if self._closed or not self._thread.is_alive() or self.is_writer_thread():
+            return False
+
+        marker = _Flush()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Grava eventos pendentes e encerra a thread (idempotente).
+
+        Registrado em atexit para não perder eventos ao final do processo.
+
+        Args:
+            timeout (float, optional): Espera máxima pela thread
+        """
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.error("Fila do EventBus cheia ao encerrar: eventos pendentes podem ser perdidos")
+            return
+        self._thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna contadores de backpressure e throughput.
+
+        Returns:
+            Dict: queue_depth, max_queue_depth, pending, enqueued, written,
+                dropped, batches, write_errors
+        """
+        with self._stats_lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "max_queue_depth": self._max_queue_depth,
+                "pending": self._enqueued - self._written - self._write_errors,
+                "enqueued": self._enqueued,
+                "written": self._written,
+                "dropped": self._dropped,
+                "batches": self._batches,
+                "write_errors": self._write_errors,
+            }
+
+    def _run(self) -> None:
+        pending: Dict[str, List[Dict[str, Any]]] = {}
+        pending_count = 0
+        deadline: Optional[float] = None
+
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                self._write_pending(pending)
+                return
+
+            if isinstance(item, _Flush):
+                self._write_pending(pending)
+                pending, pending_count, deadline = {}, 0, None
+                item.done.set()
+                continue
+
+            if item is not None:
+                session_id, event = item
+                pending.setdefault(session_id, []).append(event)
+                pending_count += 1
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            if pending_count >= self.max_batch_size or (
+                deadline is not None and time.monotonic() >= deadline
+            ):
+                self._write_pending(pending)
+                pending, pending_count, deadline = {}, 0, None
+
+    def _write_pending(self, pending: Dict[str, List[Dict[str, Any]]]) -> None:
+        for session_id, events in pending.items():
+            try:
+                self.sink(session_id, events)
+            except Exception as e:
+                logger.error(f"Erro ao gravar lote de {session_id} ({len(events)} eventos): {e}")
+                with self._stats_lock:
+                    self._write_errors += len(events)
+                continue
+            with self._stats_lock:
+                self._written += len(events)
+                self._batches += 1
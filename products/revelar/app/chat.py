@@ -35,6 +35,7 @@ project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 import streamlit as st
+from core.agents.observer.embeddings import warmup_embedding_model
 from products.revelar.app.components import (
     render_chat_input,
     render_chat_history,
@@ -105,6 +106,9 @@ def main():
         - Consumir eventos do EventBus via polling (1s)
         - Exibir métricas reais (tokens, custo, tempo)
     """
+    # Modelo de embeddings do Observer carrega em background (idempotente entre reruns)
+    warmup_embedding_model()
+
     apply_custom_styles()
 
     # Título
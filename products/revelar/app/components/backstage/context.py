@@ -53,22 +53,17 @@ def _get_session_accumulated_cost(session_id: str) -> Dict[str, Any]:
     """
     try:
         bus = get_event_bus()
-        events = bus.get_session_events(session_id)
+        # Agregados incrementais do EventBus: leitura O(1), sem somar eventos
+        aggregates = bus.get_session_aggregates(session_id)
 
-        # Filtrar eventos "agent_completed"
-        completed_events = [e for e in events if e.get("event_type") == "agent_completed"]
-
-        if not completed_events:
+        if not aggregates:
             return {"cost": 0.0, "tokens": 0, "num_events": 0}
 
-        # Somar custos e tokens
-        total_cost = sum(e.get("cost", 0.0) for e in completed_events)
-        total_tokens = sum(e.get("tokens_total", 0) for e in completed_events)
-
+        totals = aggregates["totals"]
         return {
-            "cost": total_cost,
-            "tokens": total_tokens,
-            "num_events": len(completed_events)
+            "cost": totals["cost"],
+            "tokens": totals["tokens_total"],
+            "num_events": totals["agent_calls"]
         }
 
     except Exception as e:
@@ -88,10 +83,7 @@ def _get_session_events_details(session_id: str) -> List[Dict[str, Any]]:
     """
     try:
         bus = get_event_bus()
-        events = bus.get_session_events(session_id)
-
-        # Filtrar eventos "agent_completed"
-        completed_events = [e for e in events if e.get("event_type") == "agent_completed"]
+        completed_events = bus.get_events_by_type(session_id, ["agent_completed"])
 
         details = []
         for event in completed_events:
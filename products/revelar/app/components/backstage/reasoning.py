@@ -31,7 +31,7 @@ def render_backstage(session_id: str) -> None:
         - Histórico de agentes anteriores
 
     Integração:
-        - EventBus: Busca eventos via get_session_events()
+        - EventBus: Busca último agent_completed via get_last_events()
     """
     with st.expander("📊 Bastidores", expanded=False):
         # Buscar reasoning mais recente
@@ -80,15 +80,13 @@ def _get_latest_reasoning(session_id: str) -> Optional[Dict[str, Any]]:
     """
     try:
         bus = get_event_bus()
-        events = bus.get_session_events(session_id)
 
-        # Filtrar apenas eventos "agent_completed" (têm reasoning completo)
-        completed_events = [e for e in events if e.get("event_type") == "agent_completed"]
+        # Último evento "agent_completed" (tem reasoning completo)
+        completed_events = bus.get_last_events(session_id, "agent_completed", limit=1)
 
         if not completed_events:
             return None
 
-        # Pegar último evento
         latest_event = completed_events[-1]
 
         # Extrair reasoning do metadata
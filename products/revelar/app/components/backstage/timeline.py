@@ -15,7 +15,7 @@ import logging
 from typing import Dict, Any, List
 from datetime import datetime
 
-from core.utils.event_bus import get_event_bus
+from core.utils.event_bus import get_event_bus, SessionTail
 from core.utils.currency import format_currency
 from .constants import AGENT_EMOJIS
 
@@ -25,6 +25,36 @@ logger = logging.getLogger(__name__)
 OBSERVER_EMOJI = "👁️"
 CLARIFICATION_EMOJI = "❓"
 
+# Tipos de evento renderizados pela timeline (demais tipos não são lidos)
+DETECTION_EVENT_TYPES = ("variation_detected", "direction_change_confirmed", "clarity_checkpoint")
+CLARIFICATION_EVENT_TYPES = ("clarification_requested", "clarification_resolved")
+TIMELINE_EVENT_TYPES = (
+    "agent_completed",
+    "cognitive_model_updated",
+    *DETECTION_EVENT_TYPES,
+    *CLARIFICATION_EVENT_TYPES,
+)
+
+def _get_timeline_events(session_id: str) -> List[Dict[str, Any]]:
+    """
+    Retorna eventos da timeline lendo apenas o que mudou desde o último rerun.
+
+    O SessionTail (cursor + eventos acumulados) fica em st.session_state,
+    então cada refresh custa O(eventos novos).
+
+    Args:
+        session_id: ID da sessão ativa
+
+    Returns:
+        Lista de eventos de TIMELINE_EVENT_TYPES em ordem cronológica
+    """
+    tails = st.session_state.setdefault("timeline_tails", {})
+    tail = tails.get(session_id)
+    if tail is None:
+        tail = SessionTail(session_id, event_types=TIMELINE_EVENT_TYPES)
+        tails[session_id] = tail
+    return tail.refresh(get_event_bus())
+
 def render_agent_timeline(session_id: str) -> None:
     """
     Renderiza histórico com últimos 2 agentes anteriores (Épico 3.3).
@@ -39,8 +69,7 @@ def render_agent_timeline(session_id: str) -> None:
         - Link "Ver histórico" abre modal com lista completa
     """
     try:
-        bus = get_event_bus()
-        events = bus.get_session_events(session_id)
+        events = _get_timeline_events(session_id)
 
         # Filtrar apenas eventos "agent_completed"
         completed_events = [e for e in events if e.get("event_type") == "agent_completed"]
@@ -80,23 +109,13 @@ def render_agent_timeline(session_id: str) -> None:
 
         # Seção de Detecção de Mudanças (Épico 13.5)
         # Mostra eventos de variação, mudança de direção e checkpoints de clareza
-        detection_events = [
-            e for e in events
-            if e.get("event_type") in [
-                "variation_detected",
-                "direction_change_confirmed",
-                "clarity_checkpoint"
-            ]
-        ]
+        detection_events = [e for e in events if e.get("event_type") in DETECTION_EVENT_TYPES]
         if detection_events:
             render_observer_detection_events(detection_events)
 
         # Seção de Esclarecimentos (Épico 14)
         # Mostra perguntas de esclarecimento e suas respostas
-        clarification_events = [
-            e for e in events
-            if e.get("event_type") in ("clarification_requested", "clarification_resolved")
-        ]
+        clarification_events = [e for e in events if e.get("event_type") in CLARIFICATION_EVENT_TYPES]
         if clarification_events:
             render_clarification_section(clarification_events)
 
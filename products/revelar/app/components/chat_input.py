@@ -16,8 +16,9 @@ Status: Épico 14.4 - Feedback Visual Forte
 
 import streamlit as st
 import logging
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional
 
 # Imports do backend
 from core.agents.multi_agent_graph import create_multi_agent_graph
@@ -26,6 +27,34 @@ from core.utils.event_bus import get_event_bus
 
 logger = logging.getLogger(__name__)
 
+# Último agent_started por sessão, atualizado por assinatura push do EventBus
+# no momento da publicação (o grafo roda neste mesmo processo). A entrada sai
+# ao fim do turno; o LRU limita sessões cujo turno nunca terminou aqui
+# (eventos de outras abas ou processos)
+MAX_ACTIVE_AGENT_SESSIONS = 256
+_active_agents: "OrderedDict[str, str]" = OrderedDict()
+_active_agents_lock = threading.RLock()
+_active_agent_subscription = None
+
+def _ensure_active_agent_subscription() -> None:
+    """Registra (uma vez por processo) a assinatura que acompanha agent_started."""
+    global _active_agent_subscription
+    with _active_agents_lock:
+        if _active_agent_subscription is not None:
+            return
+
+        def _on_agent_started(event: dict) -> None:
+            session_id = event.get("session_id", "")
+            with _active_agents_lock:
+                _active_agents[session_id] = event.get("agent_name", "default")
+                _active_agents.move_to_end(session_id)
+                while len(_active_agents) > MAX_ACTIVE_AGENT_SESSIONS:
+                    _active_agents.popitem(last=False)
+
+        _active_agent_subscription = get_event_bus().subscribe(
+            event_types=["agent_started"], callback=_on_agent_started
+        )
+
 def render_chat_input(session_id: str) -> None:
     """
     Renderiza input de chat e processa mensagens do usuário.
@@ -195,11 +224,15 @@ def _get_active_agent(session_id: str) -> str:
              ou "default" se nenhum evento encontrado
     """
     try:
-        bus = get_event_bus()
-        events = bus.get_session_events(session_id)
+        _ensure_active_agent_subscription()
+        with _active_agents_lock:
+            active_agent = _active_agents.get(session_id)
+        if active_agent:
+            return active_agent
 
-        # Buscar último evento "agent_started" (agente que começou mas não terminou)
-        started_events = [e for e in events if e.get("event_type") == "agent_started"]
+        # Sem evento recebido neste processo (ex: após restart): consultar EventBus
+        bus = get_event_bus()
+        started_events = bus.get_last_events(session_id, "agent_started", limit=1)
 
         if started_events:
             last_started = started_events[-1]
@@ -295,6 +328,9 @@ def _process_user_message(user_input: str, session_id: str) -> None:
         st.session_state.processing = False
         st.session_state.pending_message = None
         st.session_state.pending_session_id = None
+        # Turno concluído: agente ativo só interessa durante o processamento
+        with _active_agents_lock:
+            _active_agents.pop(session_id, None)
 
     # Re-renderizar interface (force update)
     st.rerun()
@@ -362,47 +398,31 @@ def _get_latest_metrics(session_id: str) -> dict:
     Nota:
         Consolida métricas de todos os agentes executados no último turno.
         Se múltiplos agentes foram chamados (ex: orchestrator → structurer),
-        soma tokens/custo e usa duração total.
+        soma tokens/custo e usa a maior duração. Lê os agregados incrementais
+        do EventBus (O(1)); a fronteira de turno vem do agent_started.
     """
     try:
         bus = get_event_bus()
-        events = bus.get_session_events(session_id)
-
-        # Filtrar apenas eventos "agent_completed" do último turno
-        # (assumir que último turno = eventos após último "agent_started" do orchestrator)
-        completed_events = [e for e in events if e.get("event_type") == "agent_completed"]
+        aggregates = bus.get_session_aggregates(session_id)
+        turn = aggregates["turn"] if aggregates else None
 
-        if not completed_events:
+        if not turn or not turn["agent_calls"]:
             logger.warning(f"Nenhum evento agent_completed encontrado para {session_id}")
             return {"tokens": None, "cost": None, "duration": None}
 
-        # Consolidar métricas (soma tokens/custo, max duration)
-        total_tokens_input = 0
-        total_tokens_output = 0
-        total_cost = 0.0
-        max_duration = 0.0
-
-        # Pegar apenas eventos do último turno (últimos N eventos - heurística: últimos 5)
-        recent_events = completed_events[-5:]
-
-        for event in recent_events:
-            total_tokens_input += event.get("tokens_input", 0)
-            total_tokens_output += event.get("tokens_output", 0)
-            total_cost += event.get("cost", 0.0)
-            max_duration = max(max_duration, event.get("duration", 0.0))
-
-        total_tokens = total_tokens_input + total_tokens_output
-
-        logger.debug(f"Métricas consolidadas: {total_tokens} tokens, ${total_cost:.4f}, {max_duration:.2f}s")
+        logger.debug(
+            f"Métricas do turno {turn['number']}: {turn['tokens_total']} tokens, "
+            f"${turn['cost']:.4f}, {turn['max_duration']:.2f}s"
+        )
 
         return {
             "tokens": {
-                "input": total_tokens_input,
-                "output": total_tokens_output,
-                "total": total_tokens
+                "input": turn["tokens_input"],
+                "output": turn["tokens_output"],
+                "total": turn["tokens_input"] + turn["tokens_output"]
             },
-            "cost": total_cost,
-            "duration": max_duration
+            "cost": turn["cost"],
+            "duration": turn["max_duration"]
         }
 
     except Exception as e:
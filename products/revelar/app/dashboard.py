@@ -20,7 +20,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 import streamlit as st
-from core.utils.event_bus import get_event_bus
+from core.utils.event_bus import get_event_bus, SessionTail
 from core.utils.currency import format_currency
 
 # === CONFIGURAÇÃO ===
@@ -91,6 +91,26 @@ def get_agent_color(agent_name: str) -> str:
     }
     return colors.get(agent_name, "#9B9B9B")
 
+def get_session_events_incremental(session_id: str) -> List[Dict[str, Any]]:
+    """
+    Retorna eventos da sessão lendo apenas o que foi publicado desde o último refresh.
+
+    O SessionTail de cada sessão fica em st.session_state; a cada rerun só os
+    eventos novos são lidos (EventBus.read_since), em vez da sessão inteira.
+
+    Args:
+        session_id (str): ID da sessão
+
+    Returns:
+        List[Dict]: Todos os eventos da sessão em ordem cronológica
+    """
+    tails = st.session_state.setdefault("event_tails", {})
+    tail = tails.get(session_id)
+    if tail is None:
+        tail = SessionTail(session_id)
+        tails[session_id] = tail
+    return tail.refresh(get_event_bus())
+
 # === COMPONENTES DA UI ===
 
 def render_header():
@@ -190,10 +210,9 @@ def render_session_summary(summary: Dict[str, Any]):
     # Argumento Focal Implícito (Épico 7 - reconstruído do histórico)
     # Buscar último evento do orquestrador para exibir análise contextual
     bus = get_event_bus()
-    events = bus.get_session_events(session_id)
-    orchestrator_events = [e for e in events
-                          if e.get("event_type") == "agent_completed"
-                          and e.get("agent_name") == "orchestrator"]
+    orchestrator_events = bus.get_last_events(
+        session_id, "agent_completed", limit=1, agent_name="orchestrator"
+    )
 
     if orchestrator_events:
         last_orchestrator = orchestrator_events[-1]
@@ -349,44 +368,26 @@ def render_event_stats(events: List[Dict[str, Any]]):
     if total_tokens > 0:
         st.metric("🔢 Total de tokens", total_tokens)
 
-def render_consolidated_metrics(events: List[Dict[str, Any]]):
+def render_consolidated_metrics(aggregates: Optional[Dict[str, Any]]):
     """
     Renderiza métricas consolidadas por agente e totais da sessão (Épico 8.3).
 
     Args:
-        events (List[Dict]): Lista de eventos
+        aggregates (Dict | None): Agregados incrementais da sessão
+            (EventBus.get_session_aggregates)
     """
     st.subheader("💰 Métricas Consolidadas")
 
-    # Coletar métricas por agente
-    agent_metrics = {}
-    total_tokens = 0
-    total_cost = 0.0
-    total_duration = 0.0
-
-    for event in events:
-        if event.get("event_type") == "agent_completed":
-            agent_name = event.get("agent_name", "unknown")
-            tokens = event.get("tokens_total", 0)
-            cost = event.get("cost", 0.0)
-            duration = event.get("duration", 0.0)
-
-            if agent_name not in agent_metrics:
-                agent_metrics[agent_name] = {
-                    "tokens": 0,
-                    "cost": 0.0,
-                    "duration": 0.0,
-                    "count": 0
-                }
-
-            agent_metrics[agent_name]["tokens"] += tokens
-            agent_metrics[agent_name]["cost"] += cost
-            agent_metrics[agent_name]["duration"] += duration
-            agent_metrics[agent_name]["count"] += 1
-
-            total_tokens += tokens
-            total_cost += cost
-            total_duration += duration
+    agent_metrics = {
+        agent_name: {
+            "tokens": metrics["tokens_total"],
+            "cost": metrics["cost"],
+            "duration": metrics["duration"],
+            "count": metrics["agent_calls"]
+        }
+        for agent_name, metrics in (aggregates or {}).get("by_agent", {}).items()
+        if metrics["agent_calls"]
+    }
 
     if not agent_metrics:
         st.info("Nenhuma métrica disponível ainda.")
@@ -408,6 +409,11 @@ def render_consolidated_metrics(events: List[Dict[str, Any]]):
     st.divider()
 
     # Totais da sessão
+    totals = aggregates["totals"]
+    total_tokens = totals["tokens_total"]
+    total_cost = totals["cost"]
+    total_duration = totals["duration"]
+
     st.markdown("**Totais da Sessão:**")
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -466,7 +472,7 @@ def main():
     if selected_session:
         # Obter dados da sessão
         summary = event_bus.get_session_summary(selected_session)
-        events = event_bus.get_session_events(selected_session)
+        events = get_session_events_incremental(selected_session)
 
         # Layout principal
         col1, col2 = st.columns([2, 1])
@@ -485,7 +491,7 @@ def main():
 
             # Métricas consolidadas (Épico 8.3)
             st.divider()
-            render_consolidated_metrics(events)
+            render_consolidated_metrics(event_bus.get_session_aggregates(selected_session))
 
             # Botões de ação
             st.divider()
@@ -496,6 +502,7 @@ def main():
 
             if st.button("🗑️ Limpar sessão", use_container_width=True, type="secondary"):
                 event_bus.clear_session(selected_session)
+                st.session_state.get("event_tails", {}).pop(selected_session, None)
                 st.success("Sessão limpa com sucesso!")
                 st.rerun()
     else:
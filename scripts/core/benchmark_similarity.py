@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark da similaridade cosseno do Observador.
+
+Compara, para uma query contra N vetores (e para um lote de queries):
+    loop      calculate_similarity() chamado N vezes (listas Python)
+    matriz    similarity_matrix() sobre linhas pré-normalizadas
+    top-k     top_k_similar() (matmul + argpartition)
+
+Uso:
+    python scripts/core/benchmark_similarity.py
+    python scripts/core/benchmark_similarity.py --size 50000 --queries 32
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+# Adicionar raiz do projeto ao path
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.agents.observer.embeddings import (
+    calculate_similarity,
+    normalize_rows,
+    similarity_matrix,
+    top_k_similar,
+)
+
+def _best_ms(func, repeat):
+    """Menor tempo (ms) entre repeat execuções."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def main():
+    """Ponto de entrada do script."""
+    parser = argparse.ArgumentParser(description="Microbenchmark de similaridade cosseno")
+    parser.add_argument("--size", type=int, default=10000, help="Vetores comparados (default: 10000)")
+    parser.add_argument("--dims", type=int, default=384, help="Dimensão (default: 384)")
+    parser.add_argument("--queries", type=int, default=16, help="Queries no lote (default: 16)")
+    parser.add_argument("--top-k", type=int, default=5, help="k de top_k_similar (default: 5)")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetições (menor tempo)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    raw = rng.normal(size=(args.size, args.dims)).astype(np.float32)
+    raw_queries = rng.normal(size=(args.queries, args.dims)).astype(np.float32)
+
+    # Formato dos chamadores antigos: listas Python
+    vectors_list = raw.tolist()
+    query_list = raw_queries[0].tolist()
+
+    matrix = normalize_rows(raw)
+    queries = normalize_rows(raw_queries)
+
+    # O loop é ordens de grandeza mais lento: uma execução basta
+    loop_ms = _best_ms(lambda: [calculate_similarity(query_list, v) for v in vectors_list], 1)
+    # (nome, queries equivalentes ao loop, ms); normalize_rows sem equivalente
+    results = [
+        ("loop (1 query)", 1, loop_ms),
+        ("matriz (1 query)", 1, _best_ms(lambda: similarity_matrix(queries[:1], matrix), args.repeat)),
+        ("top-k (1 query)", 1, _best_ms(lambda: top_k_similar(queries[0], matrix, args.top_k), args.repeat)),
+        (f"matriz ({args.queries} queries)", args.queries,
+         _best_ms(lambda: similarity_matrix(queries, matrix), args.repeat)),
+        (f"top-k ({args.queries} queries)", args.queries,
+         _best_ms(lambda: top_k_similar(queries, matrix, args.top_k), args.repeat)),
+        ("normalize_rows", 0, _best_ms(lambda: normalize_rows(raw), args.repeat)),
+    ]
+
+    print(f"📊 {args.size} vetores x {args.dims} dims\n")
+    print(f"{'operação':<24} {'ms':>10} {'vs loop':>9}")
+    for name, query_count, ms in results:
+        speedup = f"{loop_ms * query_count / ms:>8.0f}x" if query_count else f"{'-':>9}"
+        print(f"{name:<24} {ms:>10.3f} {speedup}")
+
+if __name__ == "__main__":
+    main()
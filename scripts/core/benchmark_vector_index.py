@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Compara latência de inserção e busca top-k entre os índices vetoriais.
+
+Gera vetores aleatórios normalizados (dimensão do all-MiniLM-L6-v2 por
+padrão), insere em lotes em cada backend e mede queries top-k unitárias.
+Cada backend usa um diretório temporário próprio (dados reais intocados).
+
+Uso:
+    python scripts/core/benchmark_vector_index.py
+    python scripts/core/benchmark_vector_index.py --size 20000 --queries 500
+    python scripts/core/benchmark_vector_index.py --backends numpy --dims 768
+"""
+
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Adicionar raiz do projeto ao path
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.agents.observer.vector_index import AVAILABLE_VECTOR_BACKENDS, create_vector_index
+
+def _percentile_ms(samples, percentile):
+    return float(np.percentile(samples, percentile)) * 1000
+
+def benchmark_backend(backend, vectors, queries, batch_size, top_k):
+    """
+    Mede inserção e busca de um backend.
+
+    Args:
+        backend: Nome do backend ("chroma" ou "numpy").
+        vectors: Matriz (n x dims) a inserir.
+        queries: Matriz (q x dims) de queries.
+        batch_size: Vetores por chamada de add.
+        top_k: Resultados por query.
+
+    Returns:
+        Dict com insert_s, insert_per_s, query_p50_ms, query_p95_ms.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        index = create_vector_index(backend, str(Path(tmp_dir) / backend))
+
+        start = time.perf_counter()
+        for offset in range(0, len(vectors), batch_size):
+            batch = vectors[offset:offset + batch_size]
+            ids = [f"c{offset + i}" for i in range(len(batch))]
+            index.add(ids, batch.tolist(), [{"label": concept_id} for concept_id in ids])
+        insert_s = time.perf_counter() - start
+
+        # Aquecimento (primeira query carrega estruturas internas)
+        index.query([queries[0].tolist()], top_k)
+
+        samples = []
+        for query in queries:
+            start = time.perf_counter()
+            index.query([query.tolist()], top_k)
+            samples.append(time.perf_counter() - start)
+
+    return {
+        "insert_s": insert_s,
+        "insert_per_s": len(vectors) / insert_s if insert_s else 0.0,
+        "query_p50_ms": _percentile_ms(samples, 50),
+        "query_p95_ms": _percentile_ms(samples, 95),
+    }
+
+def main():
+    """Ponto de entrada do script."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark de inserção e top-k dos índices vetoriais do catálogo"
+    )
+    parser.add_argument("--size", type=int, default=5000, help="Vetores inseridos (default: 5000)")
+    parser.add_argument("--dims", type=int, default=384, help="Dimensão dos vetores (default: 384)")
+    parser.add_argument("--queries", type=int, default=200, help="Queries medidas (default: 200)")
+    parser.add_argument("--batch-size", type=int, default=500, help="Vetores por add (default: 500)")
+    parser.add_argument("--top-k", type=int, default=5, help="Resultados por query (default: 5)")
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=AVAILABLE_VECTOR_BACKENDS,
+        default=list(AVAILABLE_VECTOR_BACKENDS),
+        help="Backends comparados (default: todos)"
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Semente dos vetores aleatórios")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    vectors = rng.normal(size=(args.size, args.dims)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    queries = rng.normal(size=(args.queries, args.dims)).astype(np.float32)
+
+    print(f"📊 {args.size} vetores x {args.dims} dims, {args.queries} queries top-{args.top_k}\n")
+    print(f"{'backend':<8} {'insert (s)':>11} {'vetores/s':>11} {'p50 (ms)':>9} {'p95 (ms)':>9}")
+
+    for backend in args.backends:
+        try:
+            result = benchmark_backend(backend, vectors, queries, args.batch_size, args.top_k)
+        except ImportError as e:
+            print(f"{backend:<8} ⚠️  indisponível ({e})")
+            continue
+
+        print(
+            f"{backend:<8} {result['insert_s']:>11.2f} {result['insert_per_s']:>11.0f} "
+            f"{result['query_p50_ms']:>9.2f} {result['query_p95_ms']:>9.2f}"
+        )
+
+if __name__ == "__main__":
+    main()
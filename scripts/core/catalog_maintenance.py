@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Manutenção offline do catálogo de conceitos do Observador.
+
+Comandos:
+    rebuild      Reconstrói o índice vetorial a partir do concepts.db
+    export       Exporta conceitos + vetores para um bundle (JSONL + .npy)
+    import       Importa um bundle (merge por ID)
+    seed         Carrega vocabulário semente (um label por linha, com deduplicação)
+    consolidate  Funde quase-duplicatas (similaridade >= 0.80) num conceito canônico
+
+Uso:
+    python scripts/core/catalog_maintenance.py rebuild --workers 4 [--resume]
+    python scripts/core/catalog_maintenance.py export data/catalog-bundle
+    python scripts/core/catalog_maintenance.py import data/catalog-bundle [--reembed]
+    python scripts/core/catalog_maintenance.py seed vocabulario.txt
+    python scripts/core/catalog_maintenance.py consolidate --dry-run [--threshold 0.85]
+    python scripts/core/catalog_maintenance.py --backend numpy rebuild
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# Adicionar raiz do projeto ao path
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.agents.observer.catalog import (
+    DEFAULT_CHROMA_PATH,
+    DEFAULT_SQLITE_PATH,
+    DEFAULT_VECTOR_BACKEND,
+    SIMILARITY_THRESHOLD_SAME,
+    ConceptCatalog,
+)
+from core.agents.observer.catalog_maintenance import (
+    consolidate_concepts,
+    export_bundle,
+    import_bundle,
+    import_labels,
+    rebuild_index,
+)
+from core.agents.observer.vector_index import AVAILABLE_VECTOR_BACKENDS
+
+def _print_progress(processed, total):
+    if total:
+        print(f"\r   {processed}/{total} ({processed / total:.0%})", end="", flush=True)
+    else:
+        print(f"\r   {processed}", end="", flush=True)
+
+def _print_report(report):
+    print()
+    print(
+        f"✅ {report['processed']} conceitos em {report['seconds']:.1f}s "
+        f"({report['per_second']:.0f}/s)"
+    )
+
+def main():
+    """Ponto de entrada do script."""
+    parser = argparse.ArgumentParser(
+        description="Reconstrução do índice vetorial e import/export do catálogo de conceitos"
+    )
+    parser.add_argument("--sqlite-path", default=DEFAULT_SQLITE_PATH, help="Banco do catálogo")
+    parser.add_argument("--chroma-path", default=DEFAULT_CHROMA_PATH, help="Diretório do ChromaDB")
+    parser.add_argument(
+        "--backend",
+        choices=AVAILABLE_VECTOR_BACKENDS,
+        default=DEFAULT_VECTOR_BACKEND,
+        help="Índice vetorial (default: OBSERVER_VECTOR_BACKEND ou chroma)"
+    )
+    parser.add_argument("--batch-size", type=int, default=256, help="Conceitos por bloco (default: 256)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    rebuild_parser = subparsers.add_parser("rebuild", help="Reconstrói o índice vetorial")
+    rebuild_parser.add_argument("--workers", type=int, default=2, help="Threads de embedding (default: 2)")
+    rebuild_parser.add_argument("--resume", action="store_true", help="Continua do último checkpoint")
+
+    export_parser = subparsers.add_parser("export", help="Exporta bundle")
+    export_parser.add_argument("bundle_dir", type=Path)
+
+    import_parser = subparsers.add_parser("import", help="Importa bundle")
+    import_parser.add_argument("bundle_dir", type=Path)
+    import_parser.add_argument("--reembed", action="store_true", help="Ignora vetores do bundle")
+
+    seed_parser = subparsers.add_parser("seed", help="Carrega vocabulário semente")
+    seed_parser.add_argument("labels_file", type=Path, help="Arquivo texto, um label por linha")
+
+    consolidate_parser = subparsers.add_parser("consolidate", help="Funde quase-duplicatas")
+    consolidate_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=SIMILARITY_THRESHOLD_SAME,
+        help=f"Similaridade mínima (default: {SIMILARITY_THRESHOLD_SAME})"
+    )
+    consolidate_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Apenas lista os clusters que seriam fundidos"
+    )
+
+    args = parser.parse_args()
+
+    if args.command in ("rebuild", "export", "consolidate") and not Path(args.sqlite_path).exists():
+        print(f"❌ Catálogo não existe: {args.sqlite_path}")
+        sys.exit(1)
+
+    catalog = ConceptCatalog(
+        chroma_path=args.chroma_path,
+        sqlite_path=args.sqlite_path,
+        vector_backend=args.backend
+    )
+
+    try:
+        if args.command == "rebuild":
+            print(f"🔧 Reconstruindo índice {args.backend} a partir de {args.sqlite_path}")
+            report = rebuild_index(
+                catalog,
+                batch_size=args.batch_size,
+                workers=args.workers,
+                resume=args.resume,
+                progress=_print_progress
+            )
+            if report["resumed_from"]:
+                print(f"\n   (retomado após {report['resumed_from']})", end="")
+            _print_report(report)
+
+        elif args.command == "export":
+            print(f"📦 Exportando para {args.bundle_dir}")
+            report = export_bundle(catalog, args.bundle_dir, batch_size=args.batch_size, progress=_print_progress)
+            _print_report(report)
+            if report["reembedded"]:
+                print(f"   {report['reembedded']} sem vetor no índice (embedados novamente)")
+
+        elif args.command == "import":
+            if not (args.bundle_dir / "manifest.json").exists():
+                print(f"❌ Bundle inválido (sem manifest.json): {args.bundle_dir}")
+                sys.exit(1)
+            print(f"📥 Importando {args.bundle_dir}")
+            report = import_bundle(
+                catalog,
+                args.bundle_dir,
+                batch_size=args.batch_size,
+                reembed=args.reembed,
+                progress=_print_progress
+            )
+            _print_report(report)
+            print(f"   {report['imported']} novos, {report['skipped']} já existiam")
+
+        elif args.command == "seed":
+            if not args.labels_file.exists():
+                print(f"❌ Arquivo não existe: {args.labels_file}")
+                sys.exit(1)
+            print(f"🌱 Carregando vocabulário de {args.labels_file}")
+            with open(args.labels_file, "r", encoding="utf-8") as f:
+                report = import_labels(catalog, f, batch_size=args.batch_size, progress=_print_progress)
+            _print_report(report)
+            print(f"   {report['new_count']} novos, {report['merged_count']} fundidos a conceitos existentes")
+
+        elif args.command == "consolidate":
+            report = consolidate_concepts(
+                catalog,
+                threshold=args.threshold,
+                dry_run=args.dry_run,
+                batch_size=args.batch_size
+            )
+            if not report["clusters"]:
+                print(f"✅ Nenhuma quase-duplicata entre {report['concepts']} conceitos.")
+                return
+
+            for cluster in report["clusters"]:
+                print(f"   • {cluster['canonical']['label']}")
+                for duplicate in cluster["duplicates"]:
+                    print(f"       ← {duplicate['label']} ({duplicate['similarity']:.2f})")
+
+            if args.dry_run:
+                print(f"🔎 {report['merged']} conceito(s) seriam fundidos em {len(report['clusters'])} cluster(s)")
+                return
+
+            print(
+                f"✅ {report['merged']} conceito(s) fundidos em {len(report['clusters'])} cluster(s), "
+                f"{report['variations_added']} variations, {report['links_moved']} links movidos"
+            )
+    finally:
+        catalog.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Comparação offline dos modos de métricas do Observador.
+
+Reavalia CognitiveModels gravados pelos dois caminhos de
+core/agents/observer/metrics.py e reporta:
+    - chamadas LLM e tokens (entrada/saída) de cada modo, e a economia do fused
+    - concordância dos scores: diferença absoluta média de solidez e
+      completude, e percentual de turnos com o mesmo is_mature
+    - falhas do modo fused (resposta sem as três seções)
+
+Modos:
+    separate  calculate_metrics + evaluate_maturity (3 chamadas)
+    fused     evaluate_metrics_fused (1 chamada)
+
+Fontes de sessões gravadas:
+    --db      tabela arguments do banco da aplicação (default: data/data.db)
+    --input   JSONL com um CognitiveModel por linha (claim, claims,
+              proposicoes, open_questions, contradictions, context,
+              solid_grounds)
+
+As métricas usam temperature > 0: parte da discordância é ruído do próprio
+modelo. Faz chamadas reais à API (requer ANTHROPIC_API_KEY).
+
+Uso:
+    python scripts/core/compare_metrics_modes.py --limit 20
+    python scripts/core/compare_metrics_modes.py --input sessoes.jsonl --output relatorio.json
+"""
+
+import sys
+import json
+import sqlite3
+import argparse
+from pathlib import Path
+from statistics import mean
+
+# Adicionar raiz do projeto ao path
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+
+from core.agents.observer import metrics
+from core.agents.observer.metrics import (
+    METRICS_MODE_FUSED,
+    METRICS_MODE_SEPARATE,
+    calculate_metrics,
+    evaluate_maturity,
+    evaluate_metrics_fused,
+)
+from core.agents.observer.prompts import RECOMMENDED_MODEL
+from core.utils.token_extractor import extract_tokens_and_cost
+
+DEFAULT_DB_PATH = project_root / "data" / "data.db"
+
+ARGUMENT_JSON_FIELDS = ("proposicoes", "open_questions", "contradictions", "solid_grounds", "context")
+
+class UsageRecorder:
+    """Envolve invoke_with_retry de metrics.py e acumula tokens por modo."""
+
+    def __init__(self):
+        self.original = metrics.invoke_with_retry
+        self.mode = None
+        self.totals = {
+            mode: {"calls": 0, "tokens_input": 0, "tokens_output": 0, "cost": 0.0}
+            for mode in (METRICS_MODE_SEPARATE, METRICS_MODE_FUSED)
+        }
+
+    def __enter__(self):
+        metrics.invoke_with_retry = self._invoke
+        return self
+
+    def __exit__(self, *exc):
+        metrics.invoke_with_retry = self.original
+
+    def _invoke(self, llm, messages, agent_name, **kwargs):
+        response = self.original(llm=llm, messages=messages, agent_name=agent_name, **kwargs)
+        usage = extract_tokens_and_cost(response, RECOMMENDED_MODEL)
+        totals = self.totals[self.mode]
+        totals["calls"] += 1
+        totals["tokens_input"] += usage["tokens_input"]
+        totals["tokens_output"] += usage["tokens_output"]
+        totals["cost"] += usage["cost"]
+        return response
+
+def load_from_db(db_path, limit):
+    """Argumentos mais recentes da tabela arguments."""
+    conn = sqlite3.connect(str(db_path))
+    conn.row_factory = sqlite3.Row
+    rows = conn.execute(
+        f"SELECT id, claim, {', '.join(ARGUMENT_JSON_FIELDS)} FROM arguments "
+        "ORDER BY created_at DESC LIMIT ?",
+        (limit,)
+    ).fetchall()
+    conn.close()
+
+    records = []
+    for row in rows:
+        record = {"id": row["id"], "claim": row["claim"]}
+        for field in ARGUMENT_JSON_FIELDS:
+            record[field] = json.loads(row[field]) if row[field] else None
+        records.append(record)
+    return records
+
+def load_from_jsonl(path, limit):
+    """CognitiveModels de um arquivo JSONL (uma linha por turno)."""
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, start=1):
+            if line.strip():
+                record = json.loads(line)
+                record.setdefault("id", f"linha-{number}")
+                records.append(record)
+            if len(records) >= limit:
+                break
+    return records
+
+def _arguments(record):
+    claim = record.get("claim") or ""
+    return {
+        "claim": claim,
+        "claims": record.get("claims") or ([claim] if claim else []),
+        "proposicoes": record.get("proposicoes") or [],
+        "open_questions": record.get("open_questions") or [],
+        "contradictions": record.get("contradictions") or [],
+        "context": record.get("context") or {},
+        "solid_grounds": record.get("solid_grounds") or [],
+    }
+
+def evaluate_record(record, recorder):
+    """Avalia um CognitiveModel nos dois modos."""
+    args = _arguments(record)
+
+    recorder.mode = METRICS_MODE_SEPARATE
+    separate = calculate_metrics(**args)
+    separate_maturity = evaluate_maturity(
+        solidez=separate["solidez"],
+        completude=separate["completude"],
+        open_questions=args["open_questions"],
+        contradictions=args["contradictions"],
+        claims=args["claims"],
+        proposicoes=args["proposicoes"]
+    )
+
+    recorder.mode = METRICS_MODE_FUSED
+    try:
+        fused = evaluate_metrics_fused(**args)
+    except Exception as e:
+        return {"id": record["id"], "fused_error": str(e)}
+
+    return {
+        "id": record["id"],
+        "separate": {
+            "solidez": separate["solidez"],
+            "completude": separate["completude"],
+            "is_mature": bool(separate_maturity["is_mature"]),
+        },
+        "fused": {
+            "solidez": fused["metrics"]["solidez"],
+            "completude": fused["metrics"]["completude"],
+            "is_mature": bool(fused["maturity"]["is_mature"]),
+        },
+    }
+
+def summarize(results, totals):
+    """Agrega economia de tokens e concordância dos scores."""
+    compared = [r for r in results if "fused_error" not in r]
+    separate, fused = totals[METRICS_MODE_SEPARATE], totals[METRICS_MODE_FUSED]
+    separate_tokens = separate["tokens_input"] + separate["tokens_output"]
+    fused_tokens = fused["tokens_input"] + fused["tokens_output"]
+
+    summary = {
+        "records": len(results),
+        "compared": len(compared),
+        "fused_failures": len(results) - len(compared),
+        "usage": totals,
+        "token_savings_pct": (1 - fused_tokens / separate_tokens) * 100 if separate_tokens else None,
+    }
+    if compared:
+        summary["agreement"] = {
+            "solidez_mean_abs_diff": mean(abs(r["separate"]["solidez"] - r["fused"]["solidez"]) for r in compared),
+            "completude_mean_abs_diff": mean(abs(r["separate"]["completude"] - r["fused"]["completude"]) for r in compared),
+            "is_mature_agreement_pct": 100 * mean(
+                r["separate"]["is_mature"] == r["fused"]["is_mature"] for r in compared
+            ),
+        }
+    return summary
+
+def print_summary(summary):
+    """Imprime o relatório no terminal."""
+    print(f"\n📊 {summary['compared']}/{summary['records']} turnos comparados "
+          f"({summary['fused_failures']} falhas do fused)\n")
+    print(f"{'modo':<10} {'chamadas':>9} {'tokens in':>10} {'tokens out':>11} {'custo US$':>10}")
+    for mode, usage in summary["usage"].items():
+        print(f"{mode:<10} {usage['calls']:>9} {usage['tokens_input']:>10} "
+              f"{usage['tokens_output']:>11} {usage['cost']:>10.4f}")
+    if summary["token_savings_pct"] is not None:
+        print(f"\n💰 Economia de tokens do fused: {summary['token_savings_pct']:.1f}%")
+    agreement = summary.get("agreement")
+    if agreement:
+        print(f"🎯 |Δ solidez| médio: {agreement['solidez_mean_abs_diff']:.3f}")
+        print(f"🎯 |Δ completude| médio: {agreement['completude_mean_abs_diff']:.3f}")
+        print(f"🎯 is_mature igual: {agreement['is_mature_agreement_pct']:.0f}%")
+
+def main():
+    """Ponto de entrada do script."""
+    parser = argparse.ArgumentParser(description="Compara modos de métricas do Observador (separate vs fused)")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--db", default=str(DEFAULT_DB_PATH), help="Banco com a tabela arguments (default: data/data.db)")
+    source.add_argument("--input", help="JSONL com um CognitiveModel por linha")
+    parser.add_argument("--limit", type=int, default=20, help="Máximo de turnos avaliados (default: 20)")
+    parser.add_argument("--output", help="Salva resultados por turno e resumo em JSON")
+    args = parser.parse_args()
+
+    load_dotenv()
+
+    records = load_from_jsonl(args.input, args.limit) if args.input else load_from_db(args.db, args.limit)
+    if not records:
+        print("❌ Nenhuma sessão gravada encontrada")
+        return 1
+
+    results = []
+    with UsageRecorder() as recorder:
+        for index, record in enumerate(records, start=1):
+            print(f"[{index}/{len(records)}] {record['id']}")
+            results.append(evaluate_record(record, recorder))
+
+    summary = summarize(results, recorder.totals)
+    print_summary(summary)
+
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps({"summary": summary, "results": results}, ensure_ascii=False, indent=2),
+            encoding="utf-8"
+        )
+        print(f"\n📁 Relatório salvo em: {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
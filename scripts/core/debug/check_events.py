@@ -14,7 +14,6 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from core.utils.event_bus import get_event_bus
-import json
 import tempfile
 
 def main():
@@ -40,26 +39,22 @@ def main():
 
     # Listar arquivos de eventos
     if bus.events_dir.exists():
-        event_files = list(bus.events_dir.glob("events-*.json"))
+        event_files = list(bus.events_dir.glob("events-*.jsonl"))
         print(f"📋 Total de arquivos de eventos: {len(event_files)}")
         print()
 
         if event_files:
             print("Arquivos encontrados:")
             for file in sorted(event_files, key=lambda f: f.stat().st_mtime, reverse=True):
-                # Ler arquivo
-                with open(file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                session_id = data.get('session_id', 'unknown')
-                events = data.get('events', [])
+                session_id = file.name[len("events-"):-len(".jsonl")]
+                summary = bus.get_session_summary(session_id) or {}
 
                 # Timestamp do último evento
-                last_event_time = events[-1]['timestamp'] if events else 'N/A'
+                last_event_time = summary.get('last_event_at') or 'N/A'
 
                 print(f"   • {file.name}")
                 print(f"     Session ID: {session_id}")
-                print(f"     Eventos: {len(events)}")
+                print(f"     Eventos: {summary.get('total_events', 0)}")
                 print(f"     Último evento: {last_event_time}")
                 print()
         else:
@@ -95,15 +90,13 @@ def main():
         print("✅ Evento publicado com sucesso!")
 
         # Verificar se arquivo foi criado
-        test_file = bus.events_dir / f"events-{test_session}.json"
+        test_file = bus.events_dir / f"events-{test_session}.jsonl"
         if test_file.exists():
             print(f"✅ Arquivo criado: {test_file}")
 
             # Ler conteúdo
-            with open(test_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            print(f"   Eventos no arquivo: {len(data.get('events', []))}")
+            events = bus.get_session_events(test_session)
+            print(f"   Eventos no arquivo: {len(events)}")
         else:
             print(f"❌ Arquivo não foi criado: {test_file}")
     except Exception as e:
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Migra arquivos de eventos legados do EventBus (JSON) para JSONL append-only.
+
+O EventBus já migra automaticamente na inicialização; este script permite
+executar a migração de forma explícita (ex: antes de copiar logs) e
+inspecionar o resultado.
+
+Uso:
+    python scripts/core/migrate_events.py [--events-dir DIR] [--keep-source] [--fsync]
+"""
+
+import sys
+import argparse
+import tempfile
+from pathlib import Path
+
+# Adicionar raiz do projeto ao path
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.utils.event_bus.storage import migrate_json_to_jsonl
+
+def main():
+    """Ponto de entrada do script."""
+    parser = argparse.ArgumentParser(
+        description="Migra eventos legados (events-*.json) para JSONL"
+    )
+    parser.add_argument(
+        "--events-dir",
+        type=Path,
+        default=Path(tempfile.gettempdir()) / "paper-agent-events",
+        help="Diretório de eventos (default: {temp}/paper-agent-events)"
+    )
+    parser.add_argument(
+        "--keep-source",
+        action="store_true",
+        help="Mantém cópia dos .json originais (events-*.json.migrated) após migrar"
+    )
+    parser.add_argument(
+        "--fsync",
+        action="store_true",
+        help="Força fsync nos arquivos JSONL gerados"
+    )
+    args = parser.parse_args()
+
+    if not args.events_dir.exists():
+        print(f"❌ Diretório de eventos não existe: {args.events_dir}")
+        sys.exit(1)
+
+    migrated = migrate_json_to_jsonl(
+        args.events_dir,
+        remove_source=not args.keep_source,
+        fsync=args.fsync
+    )
+
+    if not migrated:
+        print("✅ Nenhum arquivo legado encontrado.")
+        return
+
+    for session_id, count in sorted(migrated.items()):
+        print(f"   • {session_id}: {count} evento(s)")
+    print(f"✅ {len(migrated)} sessão(ões) migrada(s) para JSONL")
+
+if __name__ == "__main__":
+    main()
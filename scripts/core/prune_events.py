@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Aplica retenção ao diretório de eventos do EventBus.
+
+Sessões fora da política (idade, quantidade ou tamanho) são arquivadas em
+{events_dir}/archive/events-{session_id}.json.gz; resumo e agregados
+continuam no manifesto. Ao final, backend e manifesto são compactados.
+
+Uso:
+    python scripts/core/prune_events.py --max-age-days 7 [--dry-run]
+    python scripts/core/prune_events.py --max-sessions 200 --max-mb 500
+    python scripts/core/prune_events.py --max-age-days 30 --no-archive
+"""
+
+import sys
+import argparse
+import tempfile
+from pathlib import Path
+
+# Adicionar raiz do projeto ao path
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.utils.event_bus import EventBus
+from core.utils.event_bus.core import AVAILABLE_BACKENDS, BACKEND_JSONL
+from core.utils.event_bus.retention import RetentionPolicy, run_retention
+
+def main():
+    """Ponto de entrada do script."""
+    parser = argparse.ArgumentParser(
+        description="Arquiva/remove sessões antigas do EventBus e compacta o armazenamento"
+    )
+    parser.add_argument(
+        "--events-dir",
+        type=Path,
+        default=Path(tempfile.gettempdir()) / "paper-agent-events",
+        help="Diretório de eventos (default: {temp}/paper-agent-events)"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=AVAILABLE_BACKENDS,
+        default=BACKEND_JSONL,
+        help="Backend de armazenamento (default: jsonl)"
+    )
+    parser.add_argument("--max-age-days", type=float, help="Idade máxima do último evento")
+    parser.add_argument("--max-sessions", type=int, help="Número máximo de sessões mantidas")
+    parser.add_argument("--max-mb", type=float, help="Tamanho máximo dos eventos mantidos (MB)")
+    parser.add_argument(
+        "--min-idle-minutes",
+        type=float,
+        default=RetentionPolicy.min_idle_minutes,
+        help="Protege sessões com evento recente (default: 10)"
+    )
+    parser.add_argument(
+        "--no-archive",
+        action="store_true",
+        help="Remove sessões sem gravar o .json.gz (entrada do manifesto também é removida)"
+    )
+    parser.add_argument(
+        "--no-compact",
+        action="store_true",
+        help="Não executa VACUUM/limpeza de temporários"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Apenas lista as sessões que seriam afetadas"
+    )
+    args = parser.parse_args()
+
+    if not args.events_dir.exists():
+        print(f"❌ Diretório de eventos não existe: {args.events_dir}")
+        sys.exit(1)
+
+    policy = RetentionPolicy(
+        max_age_days=args.max_age_days,
+        max_sessions=args.max_sessions,
+        max_bytes=int(args.max_mb * 1024 * 1024) if args.max_mb is not None else None,
+        min_idle_minutes=args.min_idle_minutes,
+        archive=not args.no_archive
+    )
+    if policy.is_unbounded():
+        print("❌ Informe ao menos um limite: --max-age-days, --max-sessions ou --max-mb")
+        sys.exit(1)
+
+    bus = EventBus(events_dir=args.events_dir, backend=args.backend)
+    report = run_retention(bus, policy, dry_run=args.dry_run, compact=not args.no_compact)
+
+    if not report["selected"]:
+        print("✅ Nenhuma sessão fora da política.")
+        return
+
+    for session_id in report["selected"]:
+        print(f"   • {session_id}")
+
+    freed_mb = report["bytes_freed"] / (1024 * 1024)
+    if args.dry_run:
+        print(f"🔎 {len(report['selected'])} sessão(ões) seriam afetadas ({freed_mb:.2f} MB)")
+        return
+
+    print(
+        f"✅ {report['archived']} arquivada(s), {report['deleted']} removida(s), "
+        f"{freed_mb:.2f} MB liberados ({report['archive_bytes'] / (1024 * 1024):.2f} MB em archive/)"
+    )
+
+if __name__ == "__main__":
+    main()
@@ -35,11 +35,15 @@ def get_events_file_path(session_id: str) -> Path:
         session_id: ID da sessão
         
     Returns:
-        Path: Caminho do arquivo JSON de eventos
+        Path: Caminho do arquivo JSONL de eventos (ou .json legado, se existir)
     """
     system_temp = Path(tempfile.gettempdir())
     events_dir = system_temp / "paper-agent-events"
-    return events_dir / f"events-{session_id}.json"
+    jsonl_file = events_dir / f"events-{session_id}.jsonl"
+    legacy_file = events_dir / f"events-{session_id}.json"
+    if not jsonl_file.exists() and legacy_file.exists():
+        return legacy_file
+    return jsonl_file
 
 def copy_eventbus_json(session_id: str, dest_dir: Path) -> bool:
     """
@@ -53,7 +57,7 @@ def copy_eventbus_json(session_id: str, dest_dir: Path) -> bool:
         bool: True se copiou com sucesso, False caso contrário
     """
     source_file = get_events_file_path(session_id)
-    dest_file = dest_dir / "events.json"
+    dest_file = dest_dir / f"events{source_file.suffix}"
     
     if not source_file.exists():
         print(f"⚠️  Arquivo de eventos não encontrado: {source_file}")
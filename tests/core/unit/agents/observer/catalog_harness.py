@@ -0,0 +1,91 @@
+"""
+Harness compartilhado dos testes de ConceptCatalog e concept_pipeline.
+
+Modelo de embeddings falso (vetores fixos por label), proxy do indice
+vetorial que conta queries/adds e construtor de catalogo temporario.
+Importar este modulo pula o modulo de teste quando o chromadb real nao
+esta disponivel. A fixture `model` fica em conftest.py.
+
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("chromadb", reason="chromadb not installed - skipping observer tests")
+
+import chromadb as _chromadb
+if not hasattr(_chromadb, "PersistentClient"):
+    pytest.skip(
+        "chromadb real indisponivel (sys.modules foi mockado por outro teste)",
+        allow_module_level=True,
+    )
+
+from core.agents.observer.catalog import ConceptCatalog
+
+# Vetores por label: "colaboracao"/"parceria" proximos de "cooperacao",
+# "eficiencia" proximo de "produtividade", "LLMs" ortogonal a todos
+VECTORS = {
+    "cooperacao": [1.0, 0.0, 0.0, 0.0],
+    "colaboracao": [0.99, 0.05, 0.0, 0.0],
+    "parceria": [0.95, 0.2, 0.0, 0.0],
+    "produtividade": [0.0, 0.0, 1.0, 0.0],
+    "eficiencia": [0.0, 0.05, 0.98, 0.0],
+    "LLMs": [0.0, 0.0, 0.0, 1.0],
+}
+
+class CountingModel:
+    """Modelo falso que registra cada chamada a encode."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts):
+        self.calls.append(list(texts))
+        return np.array([VECTORS[text] for text in texts], dtype=np.float32)
+
+    @property
+    def encoded(self):
+        """Labels passados ao modelo, na ordem (um por forward pass)."""
+        return [text for call in self.calls for text in call]
+
+class CountingIndex:
+    """Proxy do indice vetorial que conta queries e adds."""
+
+    def __init__(self, index):
+        self._index = index
+        self.queries = 0
+        self.adds = 0
+
+    def query(self, *args, **kwargs):
+        self.queries += 1
+        return self._index.query(*args, **kwargs)
+
+    def add(self, *args, **kwargs):
+        self.adds += 1
+        return self._index.add(*args, **kwargs)
+
+    def reset(self):
+        """Zera os contadores (apos popular o catalogo)."""
+        self.queries = 0
+        self.adds = 0
+
+    def __getattr__(self, name):
+        return getattr(self._index, name)
+
+def make_catalog(path):
+    """
+    Cria ConceptCatalog em `path` com o indice embrulhado em CountingIndex.
+
+    Args:
+        path: Diretorio (pathlib.Path) para chroma/ e concepts.db
+
+    Returns:
+        ConceptCatalog cujo `_index` conta queries e adds
+
+    """
+    concept_catalog = ConceptCatalog(
+        chroma_path=str(path / "chroma"),
+        sqlite_path=str(path / "concepts.db")
+    )
+    concept_catalog._index = CountingIndex(concept_catalog._index)
+    return concept_catalog
@@ -0,0 +1,24 @@
+"""
+Fixtures compartilhadas dos testes do Observer.
+
+"""
+
+import pytest
+
+@pytest.fixture
+def model(monkeypatch):
+    """
+    Modelo de embeddings falso com cache desativado.
+
+    Toda chamada chega ao modelo, entao `model.calls` conta forward passes.
+    Requer que o modulo de teste importe catalog_harness (guarda do chromadb).
+
+    """
+    from catalog_harness import CountingModel
+    from core.agents.observer import embeddings
+    from core.agents.observer.embedding_cache import EmbeddingCache
+
+    counting_model = CountingModel()
+    monkeypatch.setattr(embeddings, "_embedding_model", counting_model)
+    monkeypatch.setattr(embeddings, "_embedding_cache", EmbeddingCache(max_memory_items=0))
+    return counting_model
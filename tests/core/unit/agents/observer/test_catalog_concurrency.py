@@ -0,0 +1,141 @@
+"""
+Testes de concorrencia do ConceptCatalog.
+
+Valida modo WAL, escritas concorrentes de varias threads (como as threads
+observer-{session}-{turn}) sem "database is locked" nem variacoes
+perdidas, e leituras que nao esperam pela conexao de escrita.
+
+"""
+
+import gc
+import sqlite3
+import threading
+
+import numpy as np
+import pytest
+
+from core.agents.observer.catalog import ConceptCatalog
+
+THREADS = 8
+CONCEPTS_PER_THREAD = 25
+
+@pytest.fixture
+def catalog(tmp_path):
+    """Catalogo com indice NumPy (sem ChromaDB nem modelo)."""
+    concept_catalog = ConceptCatalog(
+        chroma_path=str(tmp_path / "chroma"),
+        sqlite_path=str(tmp_path / "concepts.db"),
+        vector_backend="numpy"
+    )
+    yield concept_catalog
+    concept_catalog.close()
+
+def _run_threads(target, count=THREADS):
+    errors = []
+
+    def wrapper(worker):
+        try:
+            target(worker)
+        except Exception as e:  # registrado para o assert no final
+            errors.append(e)
+
+    threads = [threading.Thread(target=wrapper, args=(worker,)) for worker in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=60)
+    return errors
+
+def test_wal_mode(catalog):
+    """Testa journal_mode=wal nas conexoes de escrita e leitura."""
+    assert catalog._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert catalog._read_conn().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+def test_concurrent_writes_and_reads(catalog):
+    """Testa threads criando conceitos, variacoes e links em paralelo."""
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(THREADS, CONCEPTS_PER_THREAD, 16)).tolist()
+
+    def worker(index):
+        for i in range(CONCEPTS_PER_THREAD):
+            concept_id = catalog.save_concept(
+                f"conceito-{index}-{i}", embedding=vectors[index][i], known_match=None
+            )
+            catalog.add_variation(concept_id, f"variacao-{index}-{i}")
+            catalog.link_idea_concept(f"idea-{index}", concept_id)
+            assert catalog.get_concept_by_id(concept_id) is not None
+            catalog.find_concept_by_label(f"conceito-{index}-{i}")
+
+    errors = _run_threads(worker)
+
+    assert errors == []
+    stats = catalog.get_stats()
+    assert stats["concepts"] == THREADS * CONCEPTS_PER_THREAD
+    assert stats["variations"] == THREADS * CONCEPTS_PER_THREAD
+    assert stats["idea_links"] == THREADS * CONCEPTS_PER_THREAD
+
+def test_no_lost_variations(catalog):
+    """Testa read-modify-write do JSON de variacoes sob concorrencia."""
+    concept_id = catalog.save_concept("cooperacao", embedding=[1.0, 0.0], known_match=None)
+
+    errors = _run_threads(lambda worker: [
+        catalog.add_variation(concept_id, f"variacao-{worker}-{i}") for i in range(10)
+    ])
+
+    assert errors == []
+    assert len(catalog.get_concept_by_id(concept_id).variations) == THREADS * 10
+
+def test_reads_do_not_wait_for_writer(catalog):
+    """Testa leitura em outra thread enquanto a conexao de escrita esta ocupada."""
+    concept_id = catalog.save_concept("cooperacao", embedding=[1.0, 0.0], known_match=None)
+    result = {}
+
+    with catalog._write_lock:
+        # Transacao de escrita aberta e nao confirmada
+        catalog._conn.execute("BEGIN IMMEDIATE")
+        catalog._conn.execute("UPDATE concepts SET essence = 'pendente' WHERE id = ?", (concept_id,))
+
+        reader = threading.Thread(
+            target=lambda: result.update(concept=catalog.get_concept_by_id(concept_id))
+        )
+        reader.start()
+        reader.join(timeout=5)
+        catalog._conn.rollback()
+
+    assert not reader.is_alive()
+    assert result["concept"].essence is None
+
+def test_close_closes_thread_readers(catalog):
+    """Testa que close() fecha conexoes de leitura de threads ainda vivas."""
+    ready = threading.Barrier(3)
+    release = threading.Event()
+
+    def worker(index):
+        catalog.count_concepts()
+        ready.wait()
+        release.wait(timeout=10)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    ready.wait()
+    readers = list(catalog._readers)
+
+    catalog.close()
+    release.set()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert len(readers) == 2
+    with pytest.raises(sqlite3.ProgrammingError):
+        readers[0].execute("SELECT 1")
+
+def test_dead_thread_readers_are_closed(catalog):
+    """Testa que conexoes de leitura de threads encerradas nao se acumulam."""
+    for _ in range(3):
+        _run_threads(lambda worker: catalog.count_concepts(), count=4)
+    gc.collect()
+
+    assert catalog._readers == set()
+    assert catalog.count_concepts() == 0
+    assert len(catalog._readers) == 1
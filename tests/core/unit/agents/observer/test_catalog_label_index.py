@@ -0,0 +1,100 @@
+"""
+Testes do fast path por label normalizado do ConceptCatalog.
+
+Valida normalizacao, curto-circuito sem modelo nem ChromaDB para labels e
+variations conhecidos, migracao de bancos antigos e hit rate em get_stats().
+
+"""
+
+import sqlite3
+
+import pytest
+
+from catalog_harness import VECTORS, make_catalog
+from core.agents.observer.catalog import ConceptCatalog, normalize_label
+from core.agents.observer.concept_pipeline import persist_concepts, persist_concepts_batch
+
+@pytest.fixture
+def catalog(tmp_path, model):
+    """Catalogo com 'cooperacao' (variation 'colaboracao') e contador de queries."""
+    concept_catalog = make_catalog(tmp_path)
+    concept_id = concept_catalog.save_concept("cooperacao", embedding=VECTORS["cooperacao"], known_match=None)
+    concept_catalog.add_variation(concept_id, "colaboracao")
+    concept_catalog._index.reset()
+    concept_catalog.concept_id = concept_id
+    model.calls.clear()
+    return concept_catalog
+
+def test_normalize_label():
+    """Testa case-folding, remocao de acentos e espacos."""
+    assert normalize_label("  Cooperação   entre AGENTES ") == "cooperacao entre agentes"
+
+def test_save_concept_short_circuits(catalog, model):
+    """Testa que label conhecido (com acento/caixa) nao usa modelo nem HNSW."""
+    concept_id = catalog.save_concept("Cooperação")
+
+    assert concept_id == catalog.concept_id
+    assert model.calls == []
+    assert catalog._index.queries == 0
+    assert "Cooperação" in catalog.get_concept_by_id(concept_id).variations
+
+def test_variation_hit(catalog, model):
+    """Testa resolucao por variation conhecida."""
+    assert catalog.find_concept_by_label("COLABORAÇÃO").id == catalog.concept_id
+    assert catalog.find_concept_by_label("LLMs") is None
+
+def test_pipeline_fast_path(catalog, model):
+    """Testa persist_concepts e persist_concepts_batch com labels conhecidos."""
+    single = persist_concepts(["Colaboracao"], catalog=catalog)
+    batch = persist_concepts_batch(["cooperacao", "LLMs", "llms"], catalog=catalog)
+
+    assert single[0].concept_id == catalog.concept_id
+    assert single[0].similarity == 1.0
+    assert model.calls == [["LLMs"]]
+    assert batch["new_count"] == 1
+    assert batch["details"][0]["merged_with"] == "cooperacao"
+    assert batch["details"][2]["merged_with"] == "LLMs"
+
+def test_known_variation_hit_does_not_write(catalog, monkeypatch):
+    """Testa que hit de variation ja registrada nao chama add_variation (sem escrita)."""
+    added = []
+    monkeypatch.setattr(catalog, "add_variation", lambda concept_id, variation: added.append(variation))
+
+    catalog.save_concept("colaboracao")
+    persist_concepts(["colaboracao", "cooperacao"], catalog=catalog)
+    persist_concepts_batch(["colaboracao", "Cooperação"], catalog=catalog)
+
+    assert added == ["Cooperação"]
+
+def test_stats_hit_rate(catalog):
+    """Testa contadores do fast path em get_stats()."""
+    catalog.find_concepts_by_labels(["cooperacao", "colaboração", "LLMs", "outro"])
+
+    stats = catalog.get_stats()
+    assert stats["label_lookups"] == 4
+    assert stats["label_hits"] == 2
+    assert stats["label_hit_rate"] == pytest.approx(0.5)
+
+def test_migrates_existing_database(tmp_path, model):
+    """Testa preenchimento das colunas normalizadas em banco antigo."""
+    sqlite_path = tmp_path / "concepts.db"
+    conn = sqlite3.connect(sqlite_path)
+    conn.executescript("""
+        CREATE TABLE concepts (
+            id TEXT PRIMARY KEY, label TEXT NOT NULL, essence TEXT, variations TEXT,
+            chroma_id TEXT, created_at TEXT, updated_at TEXT
+        );
+        CREATE TABLE concept_variations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, concept_id TEXT NOT NULL,
+            variation TEXT NOT NULL, created_at TEXT, UNIQUE(concept_id, variation)
+        );
+        INSERT INTO concepts (id, label, variations) VALUES ('c1', 'Cooperação', '[]');
+        INSERT INTO concept_variations (concept_id, variation) VALUES ('c1', 'Parceria');
+    """)
+    conn.commit()
+    conn.close()
+
+    catalog = ConceptCatalog(chroma_path=str(tmp_path / "chroma"), sqlite_path=str(sqlite_path))
+
+    assert catalog.find_concept_by_label("cooperacao").id == "c1"
+    assert catalog.find_concept_by_label("parceria").id == "c1"
@@ -0,0 +1,219 @@
+"""
+Testes da manutencao offline do catalogo (rebuild, export/import, seed,
+consolidacao de quase-duplicatas).
+
+Usa o indice NumPy e um modelo falso deterministico (vetor derivado do
+hash do label), sem ChromaDB nem sentence-transformers.
+
+"""
+
+import hashlib
+
+import numpy as np
+import pytest
+
+from core.agents.observer import embeddings
+from core.agents.observer.catalog import Concept, ConceptCatalog
+from core.agents.observer.catalog_maintenance import (
+    consolidate_concepts,
+    export_bundle,
+    find_duplicate_clusters,
+    split_by_canonical,
+    get_checkpoint_path,
+    import_bundle,
+    import_labels,
+    rebuild_index,
+)
+from core.agents.observer.embedding_cache import EmbeddingCache
+from core.agents.observer.embedding_model import EmbeddingModelManager
+
+LABELS = [f"conceito {i}" for i in range(10)]
+
+def _vector(text):
+    seed = int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16)
+    return np.random.default_rng(seed).normal(size=8).astype(np.float32)
+
+class HashModel:
+    """Modelo falso: vetor aleatorio com semente no hash do texto."""
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts):
+        self.encoded.extend(texts)
+        return np.array([_vector(text) for text in texts])
+
+@pytest.fixture
+def model(monkeypatch):
+    """Modelo falso com cache desativado."""
+    hash_model = HashModel()
+    monkeypatch.setattr(embeddings, "_embedding_model", hash_model)
+    monkeypatch.setattr(embeddings, "_embedding_cache", EmbeddingCache(max_memory_items=0))
+    return hash_model
+
+def _catalog(path):
+    return ConceptCatalog(
+        chroma_path=str(path / "chroma"),
+        sqlite_path=str(path / "concepts.db"),
+        vector_backend="numpy"
+    )
+
+@pytest.fixture
+def catalog(tmp_path, model):
+    """Catalogo com LABELS (variacao em 'conceito 0')."""
+    concept_catalog = _catalog(tmp_path / "origem")
+    ids = concept_catalog.add_concepts([(label, None, _vector(label).tolist()) for label in LABELS])
+    concept_catalog.add_variation(ids[0], "variacao 0")
+    model.encoded.clear()
+    yield concept_catalog
+    concept_catalog.close()
+
+def _top_label(catalog, label):
+    return catalog.find_similar_by_vector(_vector(label).tolist(), top_k=1)[0].concept.label
+
+def test_rebuild_index(catalog, model):
+    """Testa reconstrucao completa de indice esvaziado."""
+    catalog.vector_index.reset()
+
+    report = rebuild_index(catalog, batch_size=3, workers=2)
+
+    assert report["processed"] == report["total"] == len(LABELS)
+    assert catalog.vector_index.count() == len(LABELS)
+    assert sorted(model.encoded) == sorted(LABELS)
+    assert _top_label(catalog, "conceito 7") == "conceito 7"
+    assert not get_checkpoint_path(catalog).exists()
+
+def test_rebuild_resume(catalog, model):
+    """Testa retomada do checkpoint apos interrupcao."""
+
+    def interrupt(processed, total):
+        if processed >= 3:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        rebuild_index(catalog, batch_size=3, workers=1, progress=interrupt)
+    assert get_checkpoint_path(catalog).exists()
+    model.encoded.clear()
+
+    report = rebuild_index(catalog, batch_size=3, workers=1, resume=True)
+
+    assert report["resumed_from"] is not None
+    assert report["processed"] == len(LABELS)
+    assert len(model.encoded) == len(LABELS) - 3
+    assert catalog.vector_index.count() == len(LABELS)
+
+def test_export_import_roundtrip(catalog, model, tmp_path):
+    """Testa bundle: mesmos IDs e variacoes, vetores reaproveitados."""
+    bundle_dir = tmp_path / "bundle"
+    exported = export_bundle(catalog, bundle_dir, batch_size=4)
+    target = _catalog(tmp_path / "destino")
+
+    imported = import_bundle(target, bundle_dir, batch_size=4)
+    again = import_bundle(target, bundle_dir)
+
+    assert exported["processed"] == len(LABELS)
+    assert exported["reembedded"] == 0
+    assert imported["imported"] == len(LABELS)
+    assert again["imported"] == 0 and again["skipped"] == len(LABELS)
+    assert model.encoded == []
+
+    original = {c.id: c for c in catalog.get_all_concepts()}
+    copied = {c.id: c for c in target.get_all_concepts()}
+    assert copied.keys() == original.keys()
+    assert target.find_concept_by_label("Variacao 0").label == "conceito 0"
+    assert _top_label(target, "conceito 4") == "conceito 4"
+    target.close()
+
+def test_import_reembeds_other_model(catalog, model, tmp_path, monkeypatch):
+    """Testa regeneracao dos vetores quando o bundle veio de outro modelo."""
+    bundle_dir = tmp_path / "bundle"
+    export_bundle(catalog, bundle_dir)
+    monkeypatch.setattr(embeddings, "_model_manager", EmbeddingModelManager("outro-modelo"))
+    target = _catalog(tmp_path / "destino")
+
+    report = import_bundle(target, bundle_dir)
+
+    assert report["reembedded"] == len(LABELS)
+    assert sorted(model.encoded) == sorted(LABELS)
+    target.close()
+
+def test_import_labels(tmp_path, model):
+    """Testa vocabulario semente com repeticoes e linhas vazias."""
+    target = _catalog(tmp_path)
+
+    report = import_labels(target, ["LLMs\n", "\n", "llms", "Cooperacao", "cooperação"], batch_size=2)
+
+    assert report["processed"] == 4
+    assert report["new_count"] == 2
+    assert target.count_concepts() == 2
+    target.close()
+
+def test_find_duplicate_clusters_blockwise():
+    """Testa clusters iguais com blocos pequenos (pares entre blocos)."""
+    rng = np.random.default_rng(1)
+    base = rng.normal(size=(6, 16))
+    matrix = np.vstack([base, base[[0, 3]] + 0.01, base[[0]] + 0.02])
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+
+    expected = [[0, 6, 8], [3, 7]]
+    assert find_duplicate_clusters(matrix, 0.95) == expected
+    assert find_duplicate_clusters(matrix, 0.95, block_size=2) == expected
+
+def test_split_by_canonical_breaks_chains():
+    """Testa cadeia A~B~C sem A~C: C fica fora do grupo de A e forma o proprio."""
+    angles = np.radians([0, 30, 60, 85])
+    matrix = np.column_stack([np.cos(angles), np.sin(angles)])
+
+    assert find_duplicate_clusters(matrix, 0.85) == [[0, 1, 2, 3]]
+    assert split_by_canonical([0, 1, 2, 3], matrix, 0.85) == [(0, [1]), (2, [3])]
+
+@pytest.fixture
+def duplicated_catalog(tmp_path, model):
+    """Catalogo com 'cooperacao' (mais antigo), duas quase-duplicatas e 'LLMs'."""
+    concept_catalog = _catalog(tmp_path / "duplicados")
+    records = [
+        ("c-coop", "cooperacao", [1.0, 0.0, 0.0, 0.0], "2025-01-01"),
+        ("c-colab", "colaboracao", [0.98, 0.1, 0.0, 0.0], "2025-01-02"),
+        ("c-parc", "parceria", [0.95, 0.2, 0.0, 0.0], "2025-01-03"),
+        ("c-llm", "LLMs", [0.0, 0.0, 0.0, 1.0], "2025-01-04"),
+    ]
+    concept_catalog.import_concepts([
+        Concept(id=cid, label=label, created_at=created, variations=["trabalho em equipe"] if cid == "c-parc" else [])
+        for cid, label, _, created in records
+    ])
+    concept_catalog.vector_index.add(
+        [cid for cid, *_ in records],
+        [vector for _, _, vector, _ in records],
+        [{"label": label} for _, label, _, _ in records]
+    )
+    concept_catalog.link_idea_concepts("idea-1", ["c-coop", "c-colab"])
+    concept_catalog.link_idea_concepts("idea-2", ["c-parc", "c-llm"])
+    yield concept_catalog
+    concept_catalog.close()
+
+def test_consolidate_dry_run(duplicated_catalog):
+    """Testa relatorio sem alterar o catalogo."""
+    report = consolidate_concepts(duplicated_catalog, dry_run=True)
+
+    assert report["merged"] == 2
+    cluster = report["clusters"][0]
+    assert cluster["canonical"]["id"] == "c-coop"
+    assert [d["id"] for d in cluster["duplicates"]] == ["c-colab", "c-parc"]
+    assert all(d["similarity"] >= 0.8 for d in cluster["duplicates"])
+    assert duplicated_catalog.count_concepts() == 4
+
+def test_consolidate_merges_clusters(duplicated_catalog):
+    """Testa fusao: variations, links movidos e duplicados removidos."""
+    report = consolidate_concepts(duplicated_catalog)
+
+    assert report["merged"] == 2
+    assert report["links_moved"] == 1
+    assert duplicated_catalog.count_concepts() == 2
+    assert duplicated_catalog.vector_index.count() == 2
+
+    canonical = duplicated_catalog.get_concept_by_id("c-coop")
+    assert canonical.variations == ["colaboracao", "parceria", "trabalho em equipe"]
+    assert duplicated_catalog.find_concept_by_label("Parceria").id == "c-coop"
+    assert {c.id for c in duplicated_catalog.get_concepts_for_idea("idea-1")} == {"c-coop"}
+    assert {c.id for c in duplicated_catalog.get_concepts_for_idea("idea-2")} == {"c-coop", "c-llm"}
+    assert consolidate_concepts(duplicated_catalog)["clusters"] == []
@@ -0,0 +1,65 @@
+"""
+Testes das consultas em lote do ConceptCatalog.
+
+Valida que a busca por similaridade carrega os hits do SQLite numa unica
+consulta (sem N+1), o modo sem SQLite (metadados do ChromaDB) e
+find_similar_concepts_many.
+
+"""
+
+import pytest
+
+from catalog_harness import VECTORS, make_catalog
+
+@pytest.fixture
+def catalog(tmp_path, model):
+    """Catalogo com tres conceitos e rastreamento do SQL de leitura."""
+    concept_catalog = make_catalog(tmp_path)
+    concept_catalog.add_concepts([
+        ("cooperacao", "trabalho conjunto", VECTORS["cooperacao"]),
+        ("parceria", None, VECTORS["parceria"]),
+        ("produtividade", None, VECTORS["produtividade"]),
+    ])
+    model.calls.clear()
+
+    statements = []
+    concept_catalog._read_conn().set_trace_callback(statements.append)
+    concept_catalog.statements = statements
+    return concept_catalog
+
+def _concept_selects(statements):
+    return [sql for sql in statements if "FROM concepts" in sql]
+
+def test_hits_hydrated_with_single_select(catalog):
+    """Testa uma consulta SQLite para todos os hits da busca."""
+    similar = catalog.find_similar_by_vector(VECTORS["colaboracao"], top_k=3)
+
+    assert [s.concept.label for s in similar] == ["cooperacao", "parceria", "produtividade"]
+    assert similar[0].concept.essence == "trabalho conjunto"
+    assert len(_concept_selects(catalog.statements)) == 1
+
+def test_hydrate_false_skips_sqlite(catalog):
+    """Testa montagem dos Concepts direto dos metadados do ChromaDB."""
+    similar = catalog.find_similar_by_vectors([VECTORS["colaboracao"]], top_k=2, hydrate=False)[0]
+
+    assert [s.concept.label for s in similar] == ["cooperacao", "parceria"]
+    assert similar[0].concept.essence == "trabalho conjunto"
+    assert _concept_selects(catalog.statements) == []
+
+def test_find_similar_concepts_many(catalog, model):
+    """Testa busca de varios labels: um encode, uma query, um SELECT."""
+    results = catalog.find_similar_concepts_many(["colaboracao", "eficiencia"], top_k=1, threshold=0.8)
+
+    assert model.calls == [["colaboracao", "eficiencia"]]
+    assert [r[0].concept.label for r in results] == ["cooperacao", "produtividade"]
+    assert len(_concept_selects(catalog.statements)) == 1
+
+def test_get_concepts_by_ids(catalog):
+    """Testa carga de varios conceitos por ID, ignorando inexistentes."""
+    ids = [c.id for c in catalog.get_all_concepts()]
+    catalog.statements.clear()
+
+    concepts = catalog.get_concepts_by_ids(ids + ["inexistente", ids[0]])
+
+    assert set(concepts) == set(ids)
+    assert len(_concept_selects(catalog.statements)) == 1
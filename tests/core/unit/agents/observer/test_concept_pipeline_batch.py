@@ -0,0 +1,59 @@
+"""
+Testes do modo batch de persist_concepts_batch.
+
+Valida um forward pass, uma query multi-vetor, um add no ChromaDB para os
+conceitos novos, dedup intra-lote e equivalencia com persist_concepts().
+
+"""
+
+from catalog_harness import VECTORS, make_catalog
+from core.agents.observer.concept_pipeline import persist_concepts, persist_concepts_batch
+
+def test_batch_uses_single_embedding_query_and_add(model, tmp_path):
+    """Testa um encode, uma query e um add para o lote inteiro."""
+    catalog = make_catalog(tmp_path)
+    catalog.save_concept("cooperacao", embedding=VECTORS["cooperacao"], known_match=None)
+    catalog._index.reset()
+
+    result = persist_concepts_batch(
+        ["colaboracao", "produtividade", "eficiencia", "LLMs"],
+        idea_id="idea-1",
+        catalog=catalog
+    )
+
+    assert model.calls == [["colaboracao", "produtividade", "eficiencia", "LLMs"]]
+    assert catalog._index.queries == 1
+    assert catalog._index.adds == 1
+
+    assert result["total"] == 4
+    assert result["new_count"] == 2
+    assert result["merged_count"] == 2
+
+    details = result["details"]
+    assert details[0]["merged_with"] == "cooperacao"
+    # eficiencia se funde com produtividade, criada no mesmo lote
+    assert details[2]["merged_with"] == "produtividade"
+    assert details[2]["concept_id"] == details[1]["concept_id"]
+    assert "eficiencia" in catalog.get_concept_by_id(details[1]["concept_id"]).variations
+
+    assert len(catalog.get_concepts_for_idea("idea-1")) == 3
+
+def test_batch_matches_sequential_results(model, tmp_path):
+    """Testa que o lote produz a mesma deduplicacao que o caminho unitario."""
+    labels = ["cooperacao", "produtividade", "colaboracao", "eficiencia", "LLMs", "cooperacao"]
+
+    sequential = persist_concepts(labels, catalog=make_catalog(tmp_path / "seq"))
+    batch = persist_concepts_batch(labels, catalog=make_catalog(tmp_path / "batch"))
+
+    assert [(r.is_new, r.merged_with) for r in sequential] == [
+        (d["is_new"], d["merged_with"]) for d in batch["details"]
+    ]
+
+def test_empty_batch(model, tmp_path):
+    """Testa lote vazio sem tocar modelo nem catalogo."""
+    catalog = make_catalog(tmp_path)
+    result = persist_concepts_batch([], catalog=catalog)
+
+    assert result["total"] == 0
+    assert model.calls == []
+    assert catalog._index.queries == 0
@@ -0,0 +1,46 @@
+"""
+Testes de regressao do caminho embed-once da persistencia de conceitos.
+
+Conta invocacoes do modelo de embeddings (modelo falso, sem cache) e
+queries no ChromaDB: cada conceito deve custar um forward pass e uma busca.
+
+"""
+
+import pytest
+
+from catalog_harness import VECTORS, make_catalog
+from core.agents.observer.concept_pipeline import persist_concepts
+
+@pytest.fixture
+def catalog(tmp_path):
+    """ConceptCatalog em diretorio temporario com contador de queries."""
+    return make_catalog(tmp_path)
+
+def test_one_embedding_and_one_query_per_concept(model, catalog):
+    """Testa que cada conceito custa um forward pass e uma query."""
+    results = persist_concepts(["cooperacao", "produtividade", "colaboracao"], catalog=catalog)
+
+    assert model.encoded == ["cooperacao", "produtividade", "colaboracao"]
+    assert catalog._index.queries == 3
+
+    assert [r.is_new for r in results] == [True, True, False]
+    assert results[2].merged_with == "cooperacao"
+    assert results[2].concept_id == results[0].concept_id
+    assert "colaboracao" in catalog.get_concept_by_id(results[0].concept_id).variations
+
+def test_save_concept_without_match_embeds_once(model, catalog):
+    """Testa save_concept sem embedding: um forward pass (antes eram dois)."""
+    catalog.save_concept("cooperacao")
+
+    assert model.encoded == ["cooperacao"]
+    assert catalog._index.queries == 1
+
+def test_find_similar_by_vector(model, catalog):
+    """Testa busca por vetor sem passar pelo modelo."""
+    concept_id = catalog.save_concept("cooperacao", embedding=VECTORS["cooperacao"], known_match=None)
+
+    similar = catalog.find_similar_by_vector(VECTORS["colaboracao"], top_k=1)
+
+    assert model.encoded == []
+    assert similar[0].concept.id == concept_id
+    assert similar[0].similarity > 0.99
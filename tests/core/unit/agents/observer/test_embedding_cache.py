@@ -0,0 +1,124 @@
+"""
+Testes unitarios para o cache de embeddings do Observador.
+
+Valida LRU em memoria, persistencia em disco entre instancias, eviction
+por tamanho, contadores e a integracao com generate_embedding e
+generate_embeddings_batch (modelo falso que conta chamadas).
+
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("chromadb", reason="chromadb not installed - skipping observer tests")
+
+from core.agents.observer import embeddings
+from core.agents.observer.embedding_cache import EmbeddingCache, normalize_text
+
+MODEL = "test-model"
+
+def _vector(seed, dims=8):
+    return np.random.default_rng(seed).random(dims, dtype=np.float32)
+
+class FakeModel:
+    """Modelo que gera vetores deterministicos e registra as chamadas."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts):
+        self.calls.append(list(texts))
+        return np.stack([_vector(sum(map(ord, text))) for text in texts])
+
+class TestEmbeddingCache:
+    """Testes para EmbeddingCache."""
+
+    def test_memory_and_disk_tiers(self, tmp_path):
+        """Testa hit em memoria e, apos reabrir, hit em disco."""
+        db_path = tmp_path / "cache.db"
+        cache = EmbeddingCache(db_path)
+        cache.put(MODEL, "cooperacao", _vector(1))
+
+        assert np.array_equal(cache.get(MODEL, "cooperacao"), _vector(1))
+        assert cache.get_stats()["memory_hits"] == 1
+        cache.close()
+
+        reopened = EmbeddingCache(db_path)
+        assert np.array_equal(reopened.get(MODEL, "cooperacao"), _vector(1))
+        assert reopened.get(MODEL, "outro") is None
+
+        stats = reopened.get_stats()
+        assert stats["disk_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(0.5)
+
+    def test_key_includes_model(self):
+        """Testa que o mesmo texto em outro modelo e miss."""
+        cache = EmbeddingCache()
+        cache.put(MODEL, "cooperacao", _vector(1))
+        assert cache.get("other-model", "cooperacao") is None
+
+    def test_memory_lru_eviction(self):
+        """Testa que o LRU descarta o menos usado recentemente."""
+        cache = EmbeddingCache(max_memory_items=2)
+        cache.put(MODEL, "a", _vector(1))
+        cache.put(MODEL, "b", _vector(2))
+        cache.get(MODEL, "a")
+        cache.put(MODEL, "c", _vector(3))
+
+        assert cache.get(MODEL, "b") is None
+        assert cache.get(MODEL, "a") is not None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_disk_eviction_by_size(self, tmp_path):
+        """Testa eviction em disco ao exceder max_disk_bytes."""
+        vector_bytes = _vector(0).nbytes
+        cache = EmbeddingCache(tmp_path / "cache.db", max_memory_items=1, max_disk_bytes=vector_bytes * 4)
+        for n in range(6):
+            cache.put(MODEL, f"texto {n}", _vector(n))
+
+        stats = cache.get_stats()
+        assert stats["disk_bytes"] <= vector_bytes * 4
+        assert stats["evictions"] > 0
+        # Mais recente continua em disco
+        assert cache.get(MODEL, "texto 5") is not None
+
+    def test_normalize_text(self):
+        """Testa normalizacao de espacos."""
+        assert normalize_text("  cooperacao \n entre   agentes ") == "cooperacao entre agentes"
+
+class TestGenerateEmbeddingWithCache:
+    """Testes de generate_embedding/generate_embeddings_batch com cache."""
+
+    @pytest.fixture
+    def fake_model(self, monkeypatch):
+        """Substitui modelo e cache globais por instancias de teste."""
+        model = FakeModel()
+        monkeypatch.setattr(embeddings, "_embedding_model", model)
+        monkeypatch.setattr(embeddings, "_embedding_cache", EmbeddingCache())
+        return model
+
+    def test_repeated_label_skips_model(self, fake_model):
+        """Testa que o segundo pedido do mesmo label nao chama o modelo."""
+        first = embeddings.generate_embedding("cooperacao")
+        second = embeddings.generate_embedding(" cooperacao ")
+
+        assert first == second
+        assert len(fake_model.calls) == 1
+
+    def test_batch_encodes_only_unique_misses(self, fake_model):
+        """Testa que o lote codifica apenas textos novos, sem repeticao."""
+        embeddings.generate_embedding("cooperacao")
+        result = embeddings.generate_embeddings_batch(["cooperacao", "LLMs", "LLMs", "produtividade"])
+
+        assert len(result) == 4
+        assert result[1] == result[2]
+        assert fake_model.calls[-1] == ["LLMs", "produtividade"]
+        assert embeddings.get_embedding_cache_stats()["memory_hits"] == 1
+
+    def test_cached_vector_matches_model_output(self, fake_model):
+        """Testa que o vetor em cache e identico ao do modelo."""
+        computed = embeddings.generate_embeddings_batch(["cooperacao"])[0]
+        cached = embeddings.generate_embeddings_batch(["cooperacao"])[0]
+
+        assert computed == cached == _vector(sum(map(ord, "cooperacao"))).tolist()
@@ -0,0 +1,160 @@
+"""
+Testes do gerenciador do modelo de embeddings (embedding_model.py).
+
+Valida carregamento unico sob concorrencia, warmup em background,
+configuracao (diretorio local, device, batch_size) e a integracao com
+generate_embeddings_batch. Usa um loader falso, sem sentence-transformers.
+
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from core.agents.observer import embeddings
+from core.agents.observer.embedding_cache import EmbeddingCache
+from core.agents.observer.embedding_model import EmbeddingModelManager
+
+class FakeModel:
+    """Modelo falso que registra os argumentos do encode."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, **kwargs):
+        self.calls.append((list(texts), kwargs))
+        return np.array([[float(len(text)), 1.0] for text in texts], dtype=np.float32)
+
+class SlowLoader:
+    """Loader lento que conta carregamentos (simula SentenceTransformer)."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.loads = []
+        self.model = FakeModel()
+
+    def __call__(self, source, device):
+        self.loads.append((source, device))
+        time.sleep(self.delay)
+        return self.model
+
+def test_concurrent_get_loads_once():
+    """Testa 8 threads disputando o primeiro uso: um unico carregamento."""
+    loader = SlowLoader()
+    manager = EmbeddingModelManager("modelo", loader=loader)
+    barrier = threading.Barrier(8)
+    models = []
+
+    def worker():
+        barrier.wait()
+        models.append(manager.get())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loader.loads) == 1
+    assert len(models) == 8 and all(model is loader.model for model in models)
+    assert manager.get_stats()["load_count"] == 1
+
+def test_warmup_background():
+    """Testa warmup em thread daemon, idempotente, sem recarregar depois."""
+    loader = SlowLoader()
+    manager = EmbeddingModelManager("modelo", loader=loader)
+
+    thread = manager.warmup()
+
+    assert thread.daemon and manager.warmup() is thread
+    assert manager.wait_until_loaded(timeout=5)
+    thread.join(timeout=5)
+    manager.get()
+    assert len(loader.loads) == 1
+    assert loader.model.calls[0][0] == ["warmup"]
+    assert manager.get_stats()["load_seconds"] > 0
+
+def test_warmup_failure_is_logged(caplog):
+    """Testa falha no warmup sem excecao; get() tenta de novo."""
+
+    def failing_loader(source, device):
+        raise ImportError("sentence_transformers ausente")
+
+    manager = EmbeddingModelManager("modelo", loader=failing_loader)
+
+    manager.warmup(background=False)
+
+    assert "Warmup do modelo de embeddings falhou" in caplog.text
+    assert not manager.is_loaded
+    assert "ausente" in manager.get_stats()["last_error"]
+    with pytest.raises(ImportError):
+        manager.get()
+
+def test_model_path_device_and_batch_size(tmp_path):
+    """Testa diretorio local, device e batch_size repassados."""
+    loader = SlowLoader(delay=0)
+    manager = EmbeddingModelManager(
+        "modelo", model_path=str(tmp_path), device="cpu", batch_size=4, loader=loader
+    )
+
+    manager.encode(["a", "bb"])
+
+    assert loader.loads == [(str(tmp_path), "cpu")]
+    texts, kwargs = loader.model.calls[0]
+    assert texts == ["a", "bb"]
+    assert kwargs["batch_size"] == 4 and kwargs["show_progress_bar"] is False
+
+def test_missing_model_path_falls_back_to_name(tmp_path):
+    """Testa diretorio inexistente: carrega pelo nome do modelo."""
+    loader = SlowLoader(delay=0)
+    manager = EmbeddingModelManager("modelo", model_path=str(tmp_path / "nao-existe"), loader=loader)
+
+    manager.get()
+
+    assert loader.loads == [("modelo", None)]
+
+def test_from_env(monkeypatch, tmp_path):
+    """Testa configuracao por OBSERVER_EMBEDDING_*."""
+    monkeypatch.setenv("OBSERVER_EMBEDDING_MODEL_PATH", str(tmp_path))
+    monkeypatch.setenv("OBSERVER_EMBEDDING_DEVICE", "cuda")
+    monkeypatch.setenv("OBSERVER_EMBEDDING_BATCH_SIZE", "128")
+
+    manager = EmbeddingModelManager.from_env("modelo", loader=SlowLoader(delay=0))
+
+    assert manager.source == str(tmp_path)
+    assert manager.device == "cuda"
+    assert manager.batch_size == 128
+
+def test_generate_embeddings_uses_manager(monkeypatch):
+    """Testa generate_embeddings_batch e warmup via gerenciador global."""
+    loader = SlowLoader(delay=0)
+    manager = EmbeddingModelManager("modelo", batch_size=16, loader=loader)
+    monkeypatch.setattr(embeddings, "_embedding_model", None)
+    monkeypatch.setattr(embeddings, "_model_manager", manager)
+    monkeypatch.setattr(embeddings, "_embedding_cache", EmbeddingCache(max_memory_items=0))
+    monkeypatch.setenv("OBSERVER_EMBEDDING_PRELOAD", "true")
+
+    embeddings.preload_embedding_model().join(timeout=5)
+    vectors = embeddings.generate_embeddings_batch(["ab", "abc"])
+
+    assert vectors == [[2.0, 1.0], [3.0, 1.0]]
+    assert len(loader.loads) == 1
+    assert loader.model.calls[-1] == (["ab", "abc"], {
+        "batch_size": 16, "convert_to_numpy": True, "show_progress_bar": False
+    })
+    assert embeddings.get_embedding_model_stats()["loaded"] is True
+
+def test_local_model_has_own_cache_key(monkeypatch, tmp_path):
+    """Testa cache e get_model_name pela identidade do modelo local, nao DEFAULT_MODEL."""
+    cache = EmbeddingCache(max_memory_items=10)
+    cache.put_many(embeddings.DEFAULT_MODEL, [("ab", np.array([9.0, 9.0], dtype=np.float32))])
+    manager = EmbeddingModelManager(embeddings.DEFAULT_MODEL, model_path=str(tmp_path), loader=SlowLoader(delay=0))
+    monkeypatch.setattr(embeddings, "_embedding_model", None)
+    monkeypatch.setattr(embeddings, "_model_manager", manager)
+    monkeypatch.setattr(embeddings, "_embedding_cache", cache)
+
+    assert embeddings.get_model_name() == str(tmp_path.resolve())
+    assert embeddings.generate_embeddings_batch(["ab"]) == [[2.0, 1.0]]
+    assert EmbeddingModelManager("modelo", model_path=str(tmp_path / "ausente")).identity == "modelo"
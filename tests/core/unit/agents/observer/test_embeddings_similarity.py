@@ -0,0 +1,76 @@
+"""
+Testes da API de similaridade em lote (embeddings.py).
+
+Valida normalize_rows, equivalencia de similarity_matrix com
+calculate_similarity, top_k_similar e o retorno NumPy de
+generate_embeddings_batch.
+
+"""
+
+import numpy as np
+import pytest
+
+from core.agents.observer import embeddings
+from core.agents.observer.embedding_cache import EmbeddingCache
+from core.agents.observer.embeddings import (
+    calculate_similarity,
+    generate_embedding,
+    generate_embeddings_batch,
+    normalize_rows,
+    similarity_matrix,
+    top_k_similar,
+)
+
+@pytest.fixture
+def vectors():
+    """20 vetores aleatorios (8 dims) normalizados."""
+    return normalize_rows(np.random.default_rng(7).normal(size=(20, 8)))
+
+def test_normalize_rows():
+    """Testa norma 1, float32 e linhas nulas."""
+    matrix = normalize_rows([[3.0, 4.0], [0.0, 0.0]])
+
+    assert matrix.dtype == np.float32
+    np.testing.assert_allclose(matrix, [[0.6, 0.8], [0.0, 0.0]])
+    assert normalize_rows([1.0, 0.0]).shape == (1, 2)
+
+def test_similarity_matrix_matches_pairwise(vectors):
+    """Testa equivalencia com calculate_similarity par a par."""
+    scores = similarity_matrix(vectors[:3], vectors)
+
+    assert scores.shape == (3, 20)
+    assert scores.dtype == np.float32
+    for i in range(3):
+        for j in range(20):
+            assert scores[i, j] == pytest.approx(calculate_similarity(vectors[i], vectors[j]), abs=1e-5)
+    assert similarity_matrix(vectors).shape == (20, 20)
+
+def test_top_k_similar(vectors):
+    """Testa top-k para query unica e para varias queries."""
+    indices, scores = top_k_similar(vectors[4], vectors, k=3)
+    expected = np.argsort(-(vectors @ vectors[4]))[:3]
+
+    assert indices.tolist() == expected.tolist()
+    assert indices[0] == 4 and scores[0] == pytest.approx(1.0)
+    assert list(scores) == sorted(scores, reverse=True)
+
+    batch_indices, batch_scores = top_k_similar(vectors[[4, 9]], vectors, k=50)
+    assert batch_indices.shape == batch_scores.shape == (2, 20)
+    assert batch_indices[1, 0] == 9
+
+def test_generate_embeddings_as_numpy(monkeypatch):
+    """Testa retorno float32 sem conversao para listas."""
+
+    class FakeModel:
+        def encode(self, texts):
+            return np.array([[float(len(text)), 1.0] for text in texts], dtype=np.float32)
+
+    monkeypatch.setattr(embeddings, "_embedding_model", FakeModel())
+    monkeypatch.setattr(embeddings, "_embedding_cache", EmbeddingCache(max_memory_items=0))
+
+    matrix = generate_embeddings_batch(["ab", "abc"], as_numpy=True)
+
+    assert isinstance(matrix, np.ndarray) and matrix.dtype == np.float32
+    assert matrix.tolist() == generate_embeddings_batch(["ab", "abc"])
+    assert generate_embedding("ab", as_numpy=True).tolist() == [2.0, 1.0]
+    assert generate_embeddings_batch([], as_numpy=True).shape[0] == 0
@@ -0,0 +1,174 @@
+"""
+Testes do memo de metricas do Observador (metrics_cache.py).
+
+Valida chave canonica, LRU por sessao, nivel SQLite, avaliacoes com
+fallback fora do memo e process_turn sem chamadas de metricas quando o
+CognitiveModel nao muda. Extratores e avaliacao sao substituidos por falsos.
+
+"""
+
+import sqlite3
+
+import pytest
+
+from core.agents.observer import metrics_cache, nodes
+from core.agents.observer.metrics import EVALUATION_ERROR_PREFIX, is_evaluation_complete
+from core.agents.observer.metrics_cache import MetricsCache, make_metrics_key
+
+EVALUATION = {
+    "metrics": {
+        "solidez": 0.6,
+        "completude": 0.4,
+        "solidez_details": {"analysis": "ok"},
+        "completude_details": {"analysis": "ok"},
+    },
+    "maturity": {"is_mature": False, "confidence": 0.7, "reason": "faltam evidencias"},
+    "mode": "separate",
+}
+
+FIELDS = {
+    "claim": "LLMs aumentam produtividade",
+    "claims": [],
+    "proposicoes": [{"texto": "Equipes usam LLMs", "solidez": 0.8}],
+    "context": {"domain": "software", "population": "devs"},
+}
+
+def test_key_is_canonical_and_content_sensitive():
+    """Testa chave independente da ordem de chaves e sensivel a conteudo/modo."""
+    key = make_metrics_key("separate", "model", **FIELDS)
+    reordered = {
+        "context": {"population": "devs", "domain": "software"},
+        "proposicoes": FIELDS["proposicoes"],
+        "claims": [],
+        "claim": FIELDS["claim"],
+    }
+
+    assert make_metrics_key("separate", "model", **reordered) == key
+    assert make_metrics_key("fused", "model", **FIELDS) != key
+    assert make_metrics_key("separate", "model", **{**FIELDS, "claims": ["novo"]}) != key
+
+def test_lru_per_session():
+    """Testa limite por sessao, isolamento entre sessoes e limite de sessoes."""
+    cache = MetricsCache(max_items_per_session=2, max_sessions=2)
+    for key in ("a", "b"):
+        cache.put("s1", key, {"key": key})
+    cache.get("s1", "a")
+    cache.put("s1", "c", {"key": "c"})
+
+    assert cache.get("s1", "b") is None
+    assert cache.get("s1", "a") == {"key": "a"}
+    assert cache.get("s2", "a") is None
+
+    cache.put("s2", "x", {})
+    cache.put("s3", "y", {})
+
+    assert cache.get("s1", "a") is None
+    stats = cache.get_stats()
+    assert stats["sessions"] == 2
+    assert stats["evictions"] == 3
+
+def test_disk_tier_survives_restart(tmp_path):
+    """Testa leitura do SQLite por nova instancia e limite por sessao no disco."""
+    path = tmp_path / "metrics_cache.db"
+    cache = MetricsCache(path, max_items_per_session=2)
+    for key in ("a", "b", "c"):
+        cache.put("s1", key, {**EVALUATION, "key": key})
+    cache.close()
+
+    reopened = MetricsCache(path, max_items_per_session=2)
+
+    assert reopened.get("s1", "c")["metrics"]["solidez"] == 0.6
+    assert reopened.get("s1", "a") is None
+    assert reopened.get_stats()["disk_hits"] == 1
+    reopened.close()
+
+def _broken_disk_cache(path):
+    """Memo em disco cuja tabela some por fora (erro do SQLite nas consultas)."""
+    cache = MetricsCache(path)
+    with sqlite3.connect(str(path)) as conn:
+        conn.execute("DROP TABLE metrics_memo")
+    return cache
+
+def test_sqlite_error_degrades_to_memory(tmp_path):
+    """Testa erro do SQLite em get/put: aviso, nivel em disco desligado e memo em memoria."""
+    cache = _broken_disk_cache(tmp_path / "metrics_cache.db")
+
+    assert cache.get("s1", "a") is None
+    cache.put("s1", "a", EVALUATION)
+
+    assert cache.get("s1", "a") == EVALUATION
+    stats = cache.get_stats()
+    assert stats["disk_errors"] == 1
+    assert stats["disk_path"] is None
+
+def test_fallback_evaluation_is_incomplete():
+    """Testa deteccao de avaliacao com fallback de erro."""
+    failed = {**EVALUATION, "maturity": {"reason": f"{EVALUATION_ERROR_PREFIX}: timeout"}}
+
+    assert is_evaluation_complete(EVALUATION)
+    assert not is_evaluation_complete(failed)
+
+@pytest.fixture
+def fake_turn(monkeypatch):
+    """process_turn com extracao fixa, avaliacao contada e memo isolado."""
+    calls = []
+    extraction = {"claims": [], "concepts": [], "fundamentos": [], "contradictions": [], "open_questions": []}
+    evaluation = {"value": EVALUATION}
+
+    def fake_evaluate(**kwargs):
+        calls.append(kwargs)
+        return evaluation["value"]
+
+    monkeypatch.setattr(nodes, "extract_all", lambda **kwargs: extraction)
+    monkeypatch.setattr(nodes, "evaluate_argument", fake_evaluate)
+    monkeypatch.setattr(nodes, "get_metrics_mode", lambda: "separate")
+    monkeypatch.setattr(metrics_cache, "_metrics_cache", MetricsCache())
+
+    def run(previous=None):
+        return nodes.process_turn(
+            user_input="ok, entendi",
+            conversation_history=[],
+            previous_cognitive_model=previous,
+            persist_concepts_flag=False
+        )
+
+    return run, calls, evaluation
+
+def test_unchanged_model_skips_llm(fake_turn):
+    """Testa segundo turno com CognitiveModel identico reutilizando o memo."""
+    run, calls, _ = fake_turn
+
+    first = run()
+    second = run(previous=first["cognitive_model"])
+
+    assert len(calls) == 1
+    assert first["metrics_cached"] is False
+    assert second["metrics_cached"] is True
+    assert second["metrics"] == first["metrics"]
+    assert second["maturity"] == first["maturity"]
+
+def test_fallback_not_memoized(fake_turn):
+    """Testa nova avaliacao apos fallback de erro no turno anterior."""
+    run, calls, evaluation = fake_turn
+    evaluation["value"] = {
+        **EVALUATION,
+        "maturity": {"is_mature": False, "reason": f"{EVALUATION_ERROR_PREFIX}: timeout"},
+    }
+
+    first = run()
+    second = run(previous=first["cognitive_model"])
+
+    assert len(calls) == 2
+    assert second["metrics_cached"] is False
+
+def test_sqlite_error_keeps_turn_result(fake_turn, monkeypatch, tmp_path):
+    """Testa process_turn com memo em disco quebrado: turno segue com as metricas do LLM."""
+    run, calls, _ = fake_turn
+    monkeypatch.setattr(metrics_cache, "_metrics_cache", _broken_disk_cache(tmp_path / "metrics_cache.db"))
+
+    first = run()
+    second = run(previous=first["cognitive_model"])
+
+    assert len(calls) == 1
+    assert first["metrics"]["solidez"] == 0.6
+    assert second["metrics_cached"] is True
@@ -0,0 +1,92 @@
+"""
+Testes do modo concorrente de calculate_metrics (metrics.py).
+
+Valida que solidez e completude ficam em voo simultaneamente, que o
+formato do resultado e o mesmo do modo sequencial e que a falha de uma
+chamada nao afeta a outra. invoke_with_retry e substituido por um falso.
+
+"""
+
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from core.agents.observer import metrics
+from core.agents.observer.metrics import calculate_metrics
+
+RESPONSES = {
+    "observer_solidez": {"solidez": 0.6, "analysis": "ok", "strengths": ["a"]},
+    "observer_completude": {"completude": 0.4, "analysis": "ok", "missing_aspects": ["b"]},
+}
+
+ARGS = {
+    "claim": "LLMs aumentam produtividade",
+    "claims": ["LLMs aumentam produtividade"],
+    "proposicoes": [{"texto": "Equipes usam LLMs", "solidez": 0.8}],
+    "open_questions": ["Como medir?"],
+    "contradictions": [],
+    "llm": object(),
+}
+
+def _fake_invoke(barrier=None, failing=None):
+    calls = []
+
+    def invoke(llm, messages, agent_name, **kwargs):
+        calls.append((agent_name, threading.current_thread().name))
+        if barrier is not None:
+            barrier.wait(timeout=2)
+        if agent_name == failing:
+            raise RuntimeError("LLM indisponivel")
+        return SimpleNamespace(content=json.dumps(RESPONSES[agent_name]))
+
+    return invoke, calls
+
+def test_concurrent_calls_overlap(monkeypatch):
+    """Testa solidez e completude em voo ao mesmo tempo (barreira de 2)."""
+    invoke, calls = _fake_invoke(barrier=threading.Barrier(2))
+    monkeypatch.setattr(metrics, "invoke_with_retry", invoke)
+
+    result = calculate_metrics(**ARGS, concurrent=True)
+
+    assert result["solidez"] == 0.6
+    assert result["completude"] == 0.4
+    threads = dict(calls)
+    assert threads["observer_solidez"].startswith("observer-metrics")
+    assert threads["observer_completude"] == threading.current_thread().name
+
+def test_same_shape_as_sequential(monkeypatch):
+    """Testa resultado identico nos dois modos."""
+    invoke, calls = _fake_invoke()
+    monkeypatch.setattr(metrics, "invoke_with_retry", invoke)
+
+    sequential = calculate_metrics(**ARGS, concurrent=False)
+    concurrent = calculate_metrics(**ARGS, concurrent=True)
+
+    assert concurrent == sequential
+    assert [name for name, _ in calls[:2]] == ["observer_solidez", "observer_completude"]
+
+@pytest.mark.parametrize("failing", ["observer_solidez", "observer_completude"])
+def test_error_isolation(monkeypatch, failing):
+    """Testa falha de uma chamada com fallback conservador so para ela."""
+    invoke, _ = _fake_invoke(failing=failing)
+    monkeypatch.setattr(metrics, "invoke_with_retry", invoke)
+
+    result = calculate_metrics(**ARGS, concurrent=True)
+
+    if failing == "observer_solidez":
+        assert result["solidez"] == 0.1 and result["completude"] == 0.4
+        assert "LLM indisponivel" in result["solidez_details"]["analysis"]
+    else:
+        assert result["completude"] == 0.1 and result["solidez"] == 0.6
+
+def test_env_disables_concurrency(monkeypatch):
+    """Testa OBSERVER_CONCURRENT_METRICS=false: tudo na thread atual."""
+    invoke, calls = _fake_invoke()
+    monkeypatch.setattr(metrics, "invoke_with_retry", invoke)
+    monkeypatch.setenv("OBSERVER_CONCURRENT_METRICS", "false")
+
+    calculate_metrics(**ARGS)
+
+    assert {thread for _, thread in calls} == {threading.current_thread().name}
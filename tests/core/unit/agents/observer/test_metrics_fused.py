@@ -0,0 +1,121 @@
+"""
+Testes do modo fundido de metricas (evaluate_metrics_fused/evaluate_argument).
+
+Valida uma unica chamada com o mesmo formato do modo separado, fallback
+para chamadas separadas, selecao do modo via observer.yaml e reuso da
+maturidade no evento do turno. invoke_with_retry e substituido por um falso.
+
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from core.agents.memory import config_loader
+from core.agents.observer import metrics, nodes
+from core.agents.observer.metrics import (
+    METRICS_MODE_FUSED,
+    METRICS_MODE_SEPARATE,
+    evaluate_argument,
+    evaluate_metrics_fused,
+    get_metrics_mode,
+)
+
+FUSED_RESPONSE = {
+    "solidez": {"solidez": 0.6, "analysis": "ok", "strengths": ["a"]},
+    "completude": {"completude": 1.4, "missing_aspects": ["b"]},
+    "maturity": {"is_mature": True, "confidence": 0.8, "reason": "pronto"},
+}
+
+SEPARATE_RESPONSES = {
+    "observer_solidez": {"solidez": 0.5},
+    "observer_completude": {"completude": 0.3},
+    "observer_maturity": {"is_mature": False, "confidence": 0.6},
+}
+
+ARGS = {
+    "claim": "LLMs aumentam produtividade",
+    "claims": ["LLMs aumentam produtividade"],
+    "proposicoes": [{"texto": "Equipes usam LLMs", "solidez": 0.8}],
+    "open_questions": ["Como medir?"],
+    "contradictions": [],
+    "llm": object(),
+}
+
+class FakeInvoke:
+    """Falso invoke_with_retry: registra agent_names e responde JSON fixo."""
+
+    def __init__(self):
+        self.calls = []
+        self.responses = {"observer_metrics_fused": FUSED_RESPONSE, **SEPARATE_RESPONSES}
+
+    def __call__(self, llm, messages, agent_name, **kwargs):
+        self.calls.append(agent_name)
+        return SimpleNamespace(content=json.dumps(self.responses[agent_name]))
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """Substitui invoke_with_retry em metrics.py."""
+    fake = FakeInvoke()
+    monkeypatch.setattr(metrics, "invoke_with_retry", fake)
+    return fake
+
+def test_fused_single_call_same_shape(fake_llm):
+    """Testa uma chamada e formato identico ao modo separado."""
+    fused = evaluate_argument(**ARGS, mode=METRICS_MODE_FUSED)
+    separate = evaluate_argument(**ARGS, mode=METRICS_MODE_SEPARATE)
+
+    assert fake_llm.calls[0] == "observer_metrics_fused"
+    assert sorted(fake_llm.calls[1:]) == ["observer_completude", "observer_maturity", "observer_solidez"]
+    assert fused["mode"] == METRICS_MODE_FUSED and separate["mode"] == METRICS_MODE_SEPARATE
+    assert fused["metrics"].keys() == separate["metrics"].keys()
+    assert fused["metrics"]["solidez_details"].keys() == separate["metrics"]["solidez_details"].keys()
+    assert fused["maturity"].keys() == separate["maturity"].keys()
+    assert fused["metrics"]["completude"] == 1.0
+    assert fused["maturity"]["is_mature"] is True
+
+def test_fused_falls_back_to_separate(fake_llm):
+    """Testa resposta sem secoes: ValueError direto, fallback via evaluate_argument."""
+    fake_llm.responses["observer_metrics_fused"] = {"solidez": 0.7}
+
+    with pytest.raises(ValueError, match="completude, maturity"):
+        evaluate_metrics_fused(**ARGS)
+
+    result = evaluate_argument(**ARGS, mode=METRICS_MODE_FUSED)
+
+    assert result["mode"] == METRICS_MODE_SEPARATE
+    assert result["metrics"]["solidez"] == 0.5
+    assert result["maturity"]["confidence"] == 0.6
+
+@pytest.mark.parametrize("configured, expected", [
+    ({"metrics_mode": "fused"}, METRICS_MODE_FUSED),
+    ({"metrics_mode": "tudo-junto"}, METRICS_MODE_SEPARATE),
+    ({}, METRICS_MODE_SEPARATE),
+])
+def test_mode_from_observer_yaml(monkeypatch, configured, expected):
+    """Testa observer_config.metrics_mode (invalido ou ausente = separate)."""
+    monkeypatch.setattr(config_loader, "load_agent_config", lambda name: {"observer_config": configured})
+
+    assert get_metrics_mode() == expected
+
+def test_shipped_config_is_separate():
+    """Testa observer.yaml versionado no modo padrao."""
+    assert get_metrics_mode() == METRICS_MODE_SEPARATE
+
+def test_turn_event_reuses_maturity(monkeypatch, fake_llm):
+    """Testa evento do turno sem nova chamada de maturidade."""
+    published = []
+    bus = SimpleNamespace(publish_cognitive_model_updated=lambda **kwargs: published.append(kwargs))
+    monkeypatch.setattr("core.utils.event_bus.get_event_bus", lambda: bus)
+
+    nodes._publish_cognitive_model_event(
+        session_id="session-1",
+        cognitive_model={"claim": ARGS["claim"]},
+        metrics={"solidez": 0.6, "completude": 0.5},
+        turn_number=1,
+        maturity={"is_mature": True}
+    )
+
+    assert fake_llm.calls == []
+    assert published and published[0]["is_mature"] is True
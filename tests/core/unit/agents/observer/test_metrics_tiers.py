@@ -0,0 +1,174 @@
+"""
+Testes das metricas em niveis do Observador (metrics_tiers.py).
+
+Valida a heuristica da ObservadorAPI, a decisao de escalonamento ancorada
+na ultima avaliacao LLM, os contadores de niveis e process_turn com a
+saida real de extract_all (proposicoes sem solidez). invoke_with_retry dos
+extratores e evaluate_argument sao substituidos por falsos.
+
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from core.agents.memory import config_loader
+from core.agents.observer import extractors, metrics_cache, metrics_tiers, nodes
+from core.agents.observer.api import ObservadorAPI
+from core.agents.observer.metrics_cache import MetricsCache
+from core.agents.observer.metrics_tiers import (
+    TIER_CACHE,
+    TIER_HEURISTIC,
+    TIER_LLM,
+    MetricsTierTracker,
+    decide_metrics_tier,
+    get_tiering_config,
+    heuristic_completude,
+    heuristic_solidez,
+)
+
+ENABLED = {"enabled": True, "threshold_margin": 0.10, "escalate_every_n_turns": 5, "max_structural_delta": 2}
+
+MODEL = {
+    "claim": "LLMs aumentam produtividade de desenvolvedores",
+    "proposicoes": [{"texto": "Equipes usam LLMs", "solidez": 0.8}, {"texto": "Mensuravel", "solidez": 0.3}],
+    "open_questions": ["Como medir?"],
+    "contradictions": [],
+}
+
+def _evaluation(solidez, is_mature=False):
+    return {
+        "metrics": {
+            "solidez": solidez,
+            "completude": 0.3,
+            "solidez_details": {"analysis": "ok"},
+            "completude_details": {"analysis": "ok"},
+        },
+        "maturity": {"is_mature": is_mature, "confidence": 0.7, "reason": "avaliado"},
+        "mode": "separate",
+    }
+
+def _baseline(solidez, is_mature=False, turn=1, **signature):
+    base = {"claim": "C", "proposicoes": 2, "open_questions": 1, "solid_grounds": 0, "contradictions": 0}
+    return {"turn": turn, "evaluation": _evaluation(solidez, is_mature), "signature": {**base, **signature}}
+
+SIGNATURE = {"claim": "C", "proposicoes": 2, "open_questions": 1, "solid_grounds": 0, "contradictions": 0}
+
+def test_heuristic_matches_observer_api():
+    """Testa heuristica identica a ObservadorAPI.get_solidez/get_completude."""
+    api = ObservadorAPI()
+    api._cognitive_model = MODEL
+
+    assert heuristic_solidez(MODEL) == pytest.approx(api.get_solidez()) == pytest.approx(0.25)
+    assert heuristic_completude(MODEL) == pytest.approx(api.get_completude()) == pytest.approx(0.5)
+
+@pytest.mark.parametrize("baseline, turn, signature, expected", [
+    (None, 1, SIGNATURE, (True, "no_baseline")),
+    (_baseline(0.3), 6, SIGNATURE, (True, "periodic")),
+    (_baseline(0.3, is_mature=True), 2, SIGNATURE, (True, "maturity_candidate")),
+    (_baseline(0.75), 2, SIGNATURE, (True, "maturity_candidate")),
+    (_baseline(0.65), 2, SIGNATURE, (True, "near_threshold")),
+    (_baseline(0.3), 2, {**SIGNATURE, "claim": "Outro"}, (True, "structure_changed")),
+    (_baseline(0.3), 2, {**SIGNATURE, "contradictions": 1}, (True, "structure_changed")),
+    (_baseline(0.3), 2, {**SIGNATURE, "proposicoes": 3, "open_questions": 2}, (True, "structure_changed")),
+    (_baseline(0.3), 2, {**SIGNATURE, "proposicoes": 3}, (False, "clear")),
+])
+def test_decide_metrics_tier(baseline, turn, signature, expected):
+    """Testa motivos de escalonamento e o caso sem LLM."""
+    assert decide_metrics_tier(signature, turn, baseline, ENABLED) == expected
+
+def test_disabled_always_escalates():
+    """Testa observer.yaml versionado (desligado) escalonando todo turno."""
+    config = get_tiering_config()
+
+    assert config["enabled"] is False
+    assert decide_metrics_tier(SIGNATURE, 2, _baseline(0.3), config) == (True, "disabled")
+
+def test_tracker_stats():
+    """Testa referencia LLM por sessao e taxa de chamadas evitadas."""
+    tracker = MetricsTierTracker()
+    tracker.record("s1", 1, TIER_LLM, "no_baseline", _evaluation(0.3), SIGNATURE)
+    tracker.record("s1", 2, TIER_HEURISTIC, "clear")
+    tracker.record("s1", 3, TIER_CACHE, "structure_changed", _evaluation(0.4), SIGNATURE)
+    tracker.record("s1", 4, TIER_LLM, "structure_changed")  # fallback: mantem referencia
+
+    stats = tracker.get_stats()
+
+    assert tracker.last_llm_turn("s1") == 3
+    assert tracker.baseline("s1")["evaluation"]["metrics"]["solidez"] == 0.4
+    assert tracker.last_llm_turn("s2") is None
+    assert stats["tiers"] == {TIER_HEURISTIC: 1, TIER_CACHE: 1, TIER_LLM: 2}
+    assert stats["llm_avoided_rate"] == 0.5
+
+@pytest.fixture
+def tiered_turn(monkeypatch):
+    """process_turn com extract_all real, escalonamento ligado e estado isolado."""
+    calls = []
+    published = []
+    evaluation = {"value": _evaluation(0.3)}
+
+    def fake_extract_llm(llm, messages, agent_name, **kwargs):
+        return SimpleNamespace(content=json.dumps(extraction["value"]))
+
+    def fake_evaluate(**kwargs):
+        calls.append(kwargs)
+        return evaluation["value"]
+
+    extraction = {"value": {}}
+    monkeypatch.setattr(extractors, "_get_llm", lambda: object())
+    monkeypatch.setattr(extractors, "invoke_with_retry", fake_extract_llm)
+    monkeypatch.setattr(nodes, "evaluate_argument", fake_evaluate)
+    monkeypatch.setattr(nodes, "get_metrics_mode", lambda: "separate")
+    monkeypatch.setattr(config_loader, "load_agent_config", lambda name: {"observer_config": {"metrics_tiering": ENABLED}})
+    monkeypatch.setattr(metrics_cache, "_metrics_cache", MetricsCache())
+    monkeypatch.setattr(metrics_tiers, "_tier_tracker", MetricsTierTracker())
+    bus = SimpleNamespace(publish_cognitive_model_updated=lambda **kwargs: published.append(kwargs))
+    monkeypatch.setattr("core.utils.event_bus.get_event_bus", lambda: bus)
+
+    def run(turn_number, previous, extracted):
+        extraction["value"] = extracted
+        return nodes.process_turn(
+            user_input="turno",
+            conversation_history=[],
+            previous_cognitive_model=previous,
+            session_id="session-1",
+            turn_number=turn_number,
+            persist_concepts_flag=False
+        )
+
+    return run, calls, published, evaluation
+
+def test_clear_turn_reuses_llm_metrics(tiered_turn):
+    """Testa proposicoes reais (solidez=None): turno "clear" publica a solidez do LLM."""
+    run, calls, published, _ = tiered_turn
+
+    first = run(1, None, {
+        "claims": ["LLMs aumentam produtividade de desenvolvedores"],
+        "proposicoes": ["Equipes usam LLMs", "Tarefas sao mensuraveis"],
+        "open_questions": ["Como medir?"],
+    })
+    second = run(2, first["cognitive_model"], {"claims": [], "proposicoes": ["Ha dados de sprint"]})
+    third = run(3, second["cognitive_model"], {
+        "contradictions": [{"claim_a": "a", "claim_b": "b", "explanation": "x", "confidence": 0.9}]
+    })
+
+    assert all(p["solidez"] is None for p in second["cognitive_model"]["proposicoes"])
+    assert len(calls) == 2
+    assert first["metrics_tier"] == {"tier": TIER_LLM, "reason": "no_baseline", "baseline_turn": 1}
+    assert second["metrics_tier"] == {"tier": TIER_HEURISTIC, "reason": "clear", "baseline_turn": 1}
+    assert second["metrics"]["solidez"] == 0.3
+    assert third["metrics_tier"]["reason"] == "structure_changed"
+    assert [event["metadata"]["metrics_tier"] for event in published] == [TIER_LLM, TIER_HEURISTIC, TIER_LLM]
+    assert published[1]["solidez"] == 0.3
+
+def test_near_threshold_keeps_escalating(tiered_turn):
+    """Testa ultima solidez LLM perto do limiar: maturidade reavaliada a cada turno."""
+    run, calls, _, evaluation = tiered_turn
+    evaluation["value"] = _evaluation(0.66)
+
+    first = run(1, None, {"claims": ["LLMs aumentam produtividade de desenvolvedores"]})
+    second = run(2, first["cognitive_model"], {})
+
+    assert len(calls) == 2
+    assert second["metrics_tier"]["reason"] == "near_threshold"
@@ -263,7 +263,8 @@ class TestConceptPipeline:
     def test_persist_concepts_creates_new(self, catalog):
         """Testa que conceitos novos sao criados."""
         with patch('core.agents.observer.concept_pipeline.generate_embedding') as mock_embed:
-            mock_embed.return_value = [0.1] * 384
+            # Vetores ortogonais: o mesmo embedding e usado na busca e no save
+            mock_embed.side_effect = [[1.0] + [0.0] * 383, [0.0, 1.0] + [0.0] * 382]
 
             results = persist_concepts(
                 ["conceito1", "conceito2"],
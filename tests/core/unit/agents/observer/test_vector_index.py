@@ -0,0 +1,172 @@
+"""
+Testes dos indices vetoriais do ConceptCatalog.
+
+Valida top-k, persistencia (memory-map + sidecar), crescimento de
+capacidade, remocao e compactacao no NumpyVectorIndex, paridade com ChromaVectorIndex e
+o catalogo com backend "numpy".
+
+"""
+
+import numpy as np
+import pytest
+
+from core.agents.observer import embeddings
+from core.agents.observer.embedding_cache import EmbeddingCache
+from core.agents.observer.vector_index import NumpyVectorIndex, create_vector_index
+
+VECTORS = {
+    "cooperacao": [1.0, 0.0, 0.0, 0.0],
+    "colaboracao": [0.99, 0.05, 0.0, 0.0],
+    "parceria": [0.95, 0.2, 0.0, 0.0],
+    "produtividade": [0.0, 0.0, 1.0, 0.0],
+    "LLMs": [0.0, 0.0, 0.0, 1.0],
+}
+
+def _fill(index, labels):
+    index.add(labels, [VECTORS[label] for label in labels], [{"label": label} for label in labels])
+
+def test_numpy_query_top_k(tmp_path):
+    """Testa ordenacao, similaridade e metadados do top-k."""
+    index = NumpyVectorIndex(str(tmp_path))
+    _fill(index, ["cooperacao", "parceria", "produtividade"])
+
+    hits = index.query([VECTORS["colaboracao"], VECTORS["LLMs"]], top_k=2)
+
+    assert [concept_id for concept_id, _, _ in hits[0]] == ["cooperacao", "parceria"]
+    assert hits[0][0][1] > 0.99
+    assert hits[0][0][2] == {"label": "cooperacao"}
+    assert all(similarity == 0.0 for _, similarity, _ in hits[1])
+
+def test_numpy_persists_and_grows(tmp_path):
+    """Testa recarga do disco apos crescer alem da capacidade inicial."""
+    index = NumpyVectorIndex(str(tmp_path), initial_capacity=2)
+    _fill(index, ["cooperacao", "parceria"])
+    _fill(index, ["produtividade"])
+
+    reloaded = NumpyVectorIndex(str(tmp_path))
+
+    assert reloaded.count() == 3
+    assert reloaded.query([VECTORS["produtividade"]], top_k=1)[0][0][0] == "produtividade"
+
+def test_numpy_delete(tmp_path):
+    """Testa remocao persistida via sidecar."""
+    index = NumpyVectorIndex(str(tmp_path))
+    _fill(index, ["cooperacao", "parceria", "LLMs"])
+    index.delete(["cooperacao", "inexistente"])
+
+    reloaded = NumpyVectorIndex(str(tmp_path))
+    hits = reloaded.query([VECTORS["cooperacao"]], top_k=5)
+
+    assert reloaded.count() == 2
+    assert [concept_id for concept_id, _, _ in hits[0]] == ["parceria", "LLMs"]
+
+def test_numpy_empty_index(tmp_path):
+    """Testa busca em indice vazio."""
+    assert NumpyVectorIndex(str(tmp_path)).query([VECTORS["LLMs"]], top_k=3) == [[]]
+
+def test_unknown_backend(tmp_path):
+    """Testa erro para backend desconhecido."""
+    with pytest.raises(ValueError, match="faiss"):
+        create_vector_index("faiss", str(tmp_path))
+
+def test_parity_with_chroma(tmp_path):
+    """Testa mesmos IDs e similaridades que o ChromaDB."""
+    chromadb = pytest.importorskip("chromadb")
+    if not hasattr(chromadb, "PersistentClient"):
+        pytest.skip("chromadb real indisponivel (sys.modules foi mockado por outro teste)")
+
+    rng = np.random.default_rng(42)
+    vectors = rng.normal(size=(50, 8)).tolist()
+    ids = [f"c{i}" for i in range(50)]
+    chroma = create_vector_index("chroma", str(tmp_path / "chroma"))
+    numpy_index = create_vector_index("numpy", str(tmp_path / "numpy"))
+    for index in (chroma, numpy_index):
+        index.add(ids, vectors, [{"label": concept_id} for concept_id in ids])
+
+    queries = rng.normal(size=(3, 8)).tolist()
+    expected = chroma.query(queries, top_k=5)
+    actual = numpy_index.query(queries, top_k=5)
+
+    for expected_hits, actual_hits in zip(expected, actual):
+        assert [h[0] for h in actual_hits] == [h[0] for h in expected_hits]
+        assert [h[1] for h in actual_hits] == pytest.approx([h[1] for h in expected_hits], abs=1e-4)
+
+def test_catalog_with_numpy_backend(tmp_path, monkeypatch):
+    """Testa ConceptCatalog com backend numpy (sem diretorio do ChromaDB)."""
+    from core.agents.observer.catalog import ConceptCatalog
+
+    class FakeModel:
+        def encode(self, texts):
+            return np.array([VECTORS[text] for text in texts], dtype=np.float32)
+
+    monkeypatch.setattr(embeddings, "_embedding_model", FakeModel())
+    monkeypatch.setattr(embeddings, "_embedding_cache", EmbeddingCache(max_memory_items=0))
+
+    catalog = ConceptCatalog(
+        chroma_path=str(tmp_path / "chroma"),
+        sqlite_path=str(tmp_path / "concepts.db"),
+        vector_backend="numpy"
+    )
+    concept_id = catalog.save_concept("cooperacao")
+    assert catalog.save_concept("colaboracao") == concept_id
+
+    similar = catalog.find_similar_concepts("parceria", threshold=0.9)
+    stats = catalog.get_stats()
+
+    assert similar[0].concept.id == concept_id
+    assert stats["chroma_vectors"] == 1
+    assert stats["vector_backend"] == "numpy"
+    assert (tmp_path / "vectors" / "vectors.npy").exists()
+    assert not (tmp_path / "chroma").exists()
+
+def test_numpy_upsert_get_reset(tmp_path):
+    """Testa upsert sem duplicatas apos recarga, get_embeddings e reset."""
+    index = NumpyVectorIndex(str(tmp_path))
+    _fill(index, ["cooperacao", "LLMs"])
+    index.upsert(["cooperacao"], [VECTORS["produtividade"]], [{"label": "cooperacao"}])
+
+    reloaded = NumpyVectorIndex(str(tmp_path))
+    hits = reloaded.query([VECTORS["produtividade"]], top_k=5)[0]
+
+    assert reloaded.count() == 2
+    assert [concept_id for concept_id, _, _ in hits] == ["cooperacao", "LLMs"]
+    assert reloaded.get_embeddings(["cooperacao", "outro"]) == {"cooperacao": VECTORS["produtividade"]}
+
+    reloaded.reset()
+    assert reloaded.count() == 0
+    assert NumpyVectorIndex(str(tmp_path)).count() == 0
+
+def test_numpy_live_mask_and_compaction(tmp_path):
+    """Testa mascara de vivas apos upsert/delete e compactacao dos tombstones ao recarregar."""
+    index = NumpyVectorIndex(str(tmp_path))
+    _fill(index, ["cooperacao", "parceria", "produtividade", "LLMs"])
+    index.upsert(["parceria"], [VECTORS["LLMs"]], [{"label": "parceria"}])
+    index.delete(["cooperacao"])
+
+    assert index._live[:5].tolist() == [False, False, True, True, True]
+    assert {h[0] for h in index.query([VECTORS["cooperacao"]], top_k=5)[0]} == {"parceria", "produtividade", "LLMs"}
+
+    reloaded = NumpyVectorIndex(str(tmp_path))
+
+    assert reloaded._ids == ["produtividade", "LLMs", "parceria"]
+    assert len((tmp_path / "ids.jsonl").read_text(encoding="utf-8").splitlines()) == 3
+    assert reloaded.get_embeddings(["parceria"]) == {"parceria": VECTORS["LLMs"]}
+    _fill(reloaded, ["cooperacao"])
+    assert reloaded.query([VECTORS["cooperacao"]], top_k=1)[0][0][0] == "cooperacao"
+    assert NumpyVectorIndex(str(tmp_path)).count() == 4
+
+def test_chroma_upsert_get_reset(tmp_path):
+    """Testa upsert, get_embeddings e reset no ChromaDB."""
+    chromadb = pytest.importorskip("chromadb")
+    if not hasattr(chromadb, "PersistentClient"):
+        pytest.skip("chromadb real indisponivel (sys.modules foi mockado por outro teste)")
+
+    index = create_vector_index("chroma", str(tmp_path))
+    _fill(index, ["cooperacao", "LLMs"])
+    index.upsert(["cooperacao"], [VECTORS["produtividade"]], [{"label": "cooperacao"}])
+
+    assert index.count() == 2
+    assert index.get_embeddings(["cooperacao"])["cooperacao"] == pytest.approx(VECTORS["produtividade"])
+
+    index.reset()
+    assert index.count() == 0
@@ -0,0 +1,212 @@
+"""
+Testes do pool de workers do Observador (worker_pool.py).
+
+Valida limite de workers, coalescencia por sessao (turno mais recente,
+com as entradas dos turnos descartados), cancelamento, timeout, falhas,
+metricas e process_turn sem efeitos colaterais em turno obsoleto.
+
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from core.agents.observer import nodes
+
+from core.agents.observer.worker_pool import (
+    JOB_CANCELLED,
+    JOB_DONE,
+    JOB_DROPPED,
+    JOB_FAILED,
+    JOB_TIMED_OUT,
+    ObserverWorkerPool,
+)
+
+@pytest.fixture
+def pool():
+    """Pool com 2 workers e timeout de 5s."""
+    worker_pool = ObserverWorkerPool(max_workers=2, timeout_seconds=5)
+    yield worker_pool
+    worker_pool.shutdown(wait=True, timeout=5)
+
+class Gate:
+    """Funcao de job que bloqueia ate release() e registra concorrencia."""
+
+    def __init__(self):
+        self.release_event = threading.Event()
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.started = []
+        self.payloads = []
+        self.applied = []
+
+    def __call__(self, job):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.started.append((job.session_id, job.turn_number))
+            self.payloads.append(list(job.payloads))
+        self.release_event.wait(5)
+        with self.lock:
+            self.active -= 1
+        if not job.should_stop():
+            self.applied.append((job.session_id, job.turn_number))
+
+    def release(self):
+        self.release_event.set()
+
+def _wait_started(gate, count):
+    deadline = time.monotonic() + 5
+    while len(gate.started) < count and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+def test_bounded_workers(pool):
+    """Testa no maximo max_workers processamentos simultaneos."""
+    gate = Gate()
+    jobs = [pool.submit(f"session-{i}", 1, gate) for i in range(6)]
+
+    _wait_started(gate, 2)
+    stats = pool.get_stats()
+    assert stats["running"] == 2 and stats["queue_depth"] == 4
+
+    gate.release()
+    assert all(job.wait(5) for job in jobs)
+    assert gate.max_active == 2
+    assert pool.get_stats()["completed"] == 6
+    assert pool.get_stats()["workers"] == len(pool._workers) == 2
+
+def test_coalesces_to_latest_turn(pool):
+    """Testa turno novo: pendentes descartados, em execucao cancelado."""
+    gate = Gate()
+    first = pool.submit("session", 1, gate)
+    _wait_started(gate, 1)
+
+    queued = [pool.submit("session", turn, gate) for turn in (2, 3)]
+    latest = pool.submit("session", 4, gate)
+    gate.release()
+
+    assert latest.wait(5) and first.wait(5)
+    assert [job.status for job in queued] == [JOB_DROPPED, JOB_DROPPED]
+    assert first.status == JOB_CANCELLED
+    assert latest.status == JOB_DONE
+    assert gate.started == [("session", 1), ("session", 4)]
+    assert gate.applied == [("session", 4)]
+    assert gate.max_active == 1
+
+    stats = pool.get_stats()
+    assert (stats["submitted"], stats["dropped"], stats["cancelled"], stats["completed"]) == (4, 2, 1, 1)
+
+def test_coalesced_job_carries_skipped_inputs(pool):
+    """Testa entradas do cancelado e dos descartados no job sobrevivente."""
+    gate = Gate()
+    first = pool.submit("session", 1, gate, payload="m1")
+    _wait_started(gate, 1)
+
+    for turn in (2, 3):
+        pool.submit("session", turn, gate, payload=f"m{turn}")
+    latest = pool.submit("session", 4, gate, payload="m4")
+    gate.release()
+
+    assert latest.wait(5) and first.wait(5)
+    assert gate.payloads == [["m1"], ["m1", "m2", "m3", "m4"]]
+
+def test_timed_out_inputs_go_to_next_job():
+    """Testa entrada de job expirado sem sucessor entregue ao proximo submit."""
+    pool = ObserverWorkerPool(max_workers=1, timeout_seconds=0.05)
+    seen = []
+
+    def slow(job):
+        seen.append(list(job.payloads))
+        time.sleep(0.1)
+
+    assert pool.submit("session", 1, slow, payload="m1").wait(5)
+    assert pool.submit("session", 2, lambda job: seen.append(list(job.payloads)), payload="m2").wait(5)
+
+    assert seen == [["m1"], ["m1", "m2"]]
+    pool.shutdown()
+
+def test_process_turn_stale_has_no_side_effects(monkeypatch):
+    """Testa turno obsoleto: sem persistencia de conceitos nem evento publicado."""
+    persisted, published = [], []
+    extraction = {"claims": ["X"], "concepts": ["c"], "proposicoes": [], "contradictions": [], "open_questions": []}
+    evaluation = {
+        "metrics": {"solidez": 0.5, "completude": 0.5, "solidez_details": {}, "completude_details": {}},
+        "maturity": {"is_mature": False, "reason": "ok"},
+        "mode": "separate",
+    }
+    monkeypatch.setattr(nodes, "extract_all", lambda **kwargs: extraction)
+    monkeypatch.setattr(nodes, "evaluate_argument", lambda **kwargs: evaluation)
+    monkeypatch.setattr(nodes, "persist_concepts_batch", lambda **kwargs: persisted.append(kwargs))
+    bus = SimpleNamespace(publish_cognitive_model_updated=lambda **kwargs: published.append(kwargs))
+    monkeypatch.setattr("core.utils.event_bus.get_event_bus", lambda: bus)
+
+    result = nodes.process_turn(
+        user_input="X",
+        conversation_history=[],
+        session_id="session-stale",
+        should_stop=lambda: True
+    )
+
+    assert result["stale"] is True
+    assert persisted == [] and published == []
+
+def test_cancel_session(pool):
+    """Testa cancelamento explicito de pendente e em execucao."""
+    gate = Gate()
+    running = pool.submit("session", 1, gate)
+    _wait_started(gate, 1)
+    pending = pool.submit("session", 2, gate)
+
+    assert pool.cancel("session")
+    gate.release()
+
+    assert running.wait(5) and pending.wait(5)
+    assert running.status == pending.status == JOB_CANCELLED
+    assert gate.applied == []
+    assert not pool.cancel("session")
+
+def test_timeout_discards_result():
+    """Testa resultado tardio descartado e contado como timed_out."""
+    pool = ObserverWorkerPool(max_workers=1, timeout_seconds=0.05)
+    applied = []
+
+    def slow(job):
+        time.sleep(0.1)
+        if not job.should_stop():
+            applied.append(job.turn_number)
+
+    job = pool.submit("session", 1, slow)
+
+    assert job.wait(5)
+    assert job.status == JOB_TIMED_OUT
+    assert applied == []
+    assert pool.get_stats()["timed_out"] == 1
+    pool.shutdown()
+
+def test_failure_counted_and_worker_survives(pool):
+    """Testa falha registrada sem derrubar o worker."""
+
+    def boom(job):
+        raise ValueError("erro simulado")
+
+    failed = pool.submit("a", 1, boom)
+    ok = pool.submit("b", 1, lambda job: None)
+
+    assert failed.wait(5) and ok.wait(5)
+    assert failed.status == JOB_FAILED and failed.error == "erro simulado"
+    assert ok.status == JOB_DONE
+
+    stats = pool.get_stats()
+    assert stats["failed"] == 1 and stats["completed"] == 1
+    assert stats["run_ms_max"] >= 0 and stats["wait_ms_avg"] >= 0
+
+def test_shutdown_rejects_new_jobs():
+    """Testa submit apos shutdown."""
+    pool = ObserverWorkerPool(max_workers=1)
+    pool.shutdown()
+
+    with pytest.raises(RuntimeError):
+        pool.submit("session", 1, lambda job: None)
@@ -0,0 +1,145 @@
+"""
+Testes unitários para agregados incrementais do EventBus.
+
+Valida totais por sessão e por agente, fronteira de turno (explícita e
+inferida), métricas cognitivas e leitura sem percorrer eventos.
+"""
+
+import pytest
+
+from core.utils.event_bus import EventBus
+from core.utils.event_bus.aggregates import apply_event, empty_aggregates
+from core.utils.event_bus.storage import JsonlEventStorage
+
+def _started(agent, turn_number=None):
+    metadata = {"turn_number": turn_number} if turn_number is not None else {}
+    return {"event_type": "agent_started", "agent_name": agent, "metadata": metadata}
+
+def _completed(agent, tokens_input=10, tokens_output=5, cost=0.01, duration=1.0):
+    return {
+        "event_type": "agent_completed", "agent_name": agent,
+        "tokens_input": tokens_input, "tokens_output": tokens_output,
+        "tokens_total": tokens_input + tokens_output, "cost": cost, "duration": duration
+    }
+
+class TestApplyEvent:
+    """Testes para apply_event."""
+
+    def test_totals_and_by_agent(self):
+        """Testa soma de tokens, custo e duração por sessão e por agente."""
+        aggregates = empty_aggregates()
+        for event in [_completed("orchestrator"), _completed("structurer", duration=3.0),
+                      _completed("orchestrator", cost=0.02)]:
+            apply_event(aggregates, event)
+
+        totals = aggregates["totals"]
+        assert totals["tokens_total"] == 45
+        assert totals["cost"] == pytest.approx(0.04)
+        assert totals["duration"] == pytest.approx(5.0)
+        assert totals["agent_calls"] == 3
+        assert aggregates["by_agent"]["orchestrator"]["agent_calls"] == 2
+        assert aggregates["by_agent"]["structurer"]["max_duration"] == pytest.approx(3.0)
+        assert aggregates["last_agent_completed"] == "orchestrator"
+
+    def test_inferred_turn_keeps_refinement_loop_in_same_turn(self):
+        """Testa orchestrator → structurer → methodologist → orchestrator num único turno."""
+        aggregates = empty_aggregates()
+        for agent in ["orchestrator", "structurer", "methodologist", "orchestrator"]:
+            apply_event(aggregates, _started(agent))
+            apply_event(aggregates, _completed(agent))
+
+        assert aggregates["turn"]["number"] == 1
+        assert aggregates["turn"]["agent_calls"] == 4
+
+        apply_event(aggregates, _started("orchestrator"))
+        apply_event(aggregates, _completed("orchestrator", tokens_input=1, tokens_output=1))
+
+        assert aggregates["turn"]["number"] == 2
+        assert aggregates["turn"]["tokens_total"] == 2
+        assert aggregates["turn"]["agents"] == ["orchestrator"]
+
+    def test_explicit_turn_number(self):
+        """Testa fronteira de turno vinda de metadata.turn_number."""
+        aggregates = empty_aggregates()
+        apply_event(aggregates, _started("orchestrator", turn_number=3))
+        apply_event(aggregates, _completed("orchestrator"))
+        apply_event(aggregates, _started("orchestrator", turn_number=3))
+        apply_event(aggregates, _completed("orchestrator"))
+
+        assert aggregates["turn"]["number"] == 3
+        assert aggregates["turn"]["agent_calls"] == 2
+
+        apply_event(aggregates, _started("orchestrator", turn_number=4))
+        assert aggregates["turn"]["agent_calls"] == 0
+
+    def test_errors_and_cognitive(self):
+        """Testa contagem de erros e última solidez/completude."""
+        aggregates = empty_aggregates()
+        apply_event(aggregates, {"event_type": "agent_error", "agent_name": "methodologist"})
+        apply_event(aggregates, {
+            "event_type": "cognitive_model_updated", "turn_number": 2,
+            "solidez": 0.4, "completude": 0.6, "is_mature": False,
+            "timestamp": "2025-01-01T00:00:00Z"
+        })
+
+        assert aggregates["totals"]["errors"] == 1
+        assert aggregates["by_agent"]["methodologist"]["errors"] == 1
+        assert aggregates["cognitive"]["solidez"] == 0.4
+        assert aggregates["cognitive"]["turn_number"] == 2
+
+@pytest.mark.parametrize("backend", ["jsonl", "sqlite"])
+class TestEventBusAggregates:
+    """Testes de get_session_aggregates()."""
+
+    @pytest.fixture
+    def event_bus(self, tmp_path, backend):
+        """Cria EventBus com uma sessão de exemplo."""
+        bus = EventBus(events_dir=tmp_path, backend=backend)
+        bus.publish_session_started("s1", "Teste")
+        bus.publish_agent_started("s1", "orchestrator", metadata={"turn_number": 1})
+        bus.publish_agent_completed("s1", "orchestrator", summary="ok",
+                                    tokens_input=100, tokens_output=50, tokens_total=150, cost=0.002)
+        bus.publish_agent_started("s1", "orchestrator", metadata={"turn_number": 2})
+        bus.publish_agent_completed("s1", "orchestrator", summary="ok",
+                                    tokens_input=10, tokens_output=5, tokens_total=15, cost=0.001)
+        bus.publish_cognitive_model_updated("s1", turn_number=2, solidez=0.5, completude=0.3)
+        return bus
+
+    def test_reads_without_scanning_events(self, event_bus, monkeypatch):
+        """Testa que a leitura não percorre os eventos da sessão."""
+        def fail(*args, **kwargs):
+            raise AssertionError("eventos não deveriam ser lidos")
+
+        monkeypatch.setattr(event_bus.storage, "iter_events", fail)
+        monkeypatch.setattr(event_bus.storage, "query", fail)
+
+        aggregates = event_bus.get_session_aggregates("s1")
+        assert aggregates["totals"]["tokens_total"] == 165
+        assert aggregates["totals"]["cost"] == pytest.approx(0.003)
+        assert aggregates["turn"]["number"] == 2
+        assert aggregates["turn"]["tokens_total"] == 15
+        assert aggregates["cognitive"]["solidez"] == 0.5
+
+    def test_missing_session(self, event_bus):
+        """Testa sessão inexistente."""
+        assert event_bus.get_session_aggregates("nope") is None
+
+    def test_clear_session_resets_aggregates(self, event_bus):
+        """Testa que clear_session descarta os agregados."""
+        event_bus.clear_session("s1")
+        event_bus.publish_agent_started("s1", "orchestrator")
+
+        assert event_bus.get_session_aggregates("s1")["totals"]["agent_calls"] == 0
+
+def test_rebuild_computes_aggregates(tmp_path):
+    """Testa agregados de sessões existentes antes do manifesto."""
+    JsonlEventStorage(tmp_path).append_many("s1", [
+        _started("orchestrator"), _completed("orchestrator"),
+        _started("structurer"), _completed("structurer")
+    ])
+
+    bus = EventBus(events_dir=tmp_path)
+    aggregates = bus.get_session_aggregates("s1")
+
+    assert aggregates["totals"]["agent_calls"] == 2
+    assert aggregates["turn"]["agents"] == ["orchestrator", "structurer"]
@@ -0,0 +1,74 @@
+"""
+Testes de concorrência entre processos do EventBus.
+
+N processos publicam M eventos cada na mesma sessão; nenhum evento pode se
+perder ou se intercalar, e a ordem de cada processo é preservada. Também
+verifica que o lock não degrada o throughput de um processo único.
+"""
+
+import multiprocessing
+import time
+import pytest
+
+from core.utils.event_bus import EventBus
+from core.utils.event_bus.storage import JsonlEventStorage
+
+PROCESSES = 4
+EVENTS_PER_PROCESS = 100
+SESSION_ID = "stress"
+
+def _publish_worker(events_dir, backend, worker_id, start_event):
+    """Processo filho: publica EVENTS_PER_PROCESS eventos na mesma sessão."""
+    bus = EventBus(events_dir=events_dir, backend=backend)
+    start_event.wait(10)
+    for n in range(EVENTS_PER_PROCESS):
+        bus.publish_agent_completed(
+            SESSION_ID, f"worker-{worker_id}", summary=str(n), tokens_total=n
+        )
+
+@pytest.mark.parametrize("backend", ["jsonl", "sqlite", "json"])
+def test_concurrent_processes_do_not_lose_events(tmp_path, backend):
+    """Testa N processos × M eventos na mesma sessão sem perda."""
+    ctx = multiprocessing.get_context("spawn")
+    start_event = ctx.Event()
+    workers = [
+        ctx.Process(target=_publish_worker, args=(tmp_path, backend, worker_id, start_event))
+        for worker_id in range(PROCESSES)
+    ]
+    for worker in workers:
+        worker.start()
+    start_event.set()
+    for worker in workers:
+        worker.join(60)
+        assert worker.exitcode == 0
+
+    bus = EventBus(events_dir=tmp_path, backend=backend)
+    events = bus.get_session_events(SESSION_ID)
+
+    assert len(events) == PROCESSES * EVENTS_PER_PROCESS
+    for worker_id in range(PROCESSES):
+        sequence = [int(e["summary"]) for e in events if e["agent_name"] == f"worker-{worker_id}"]
+        assert sequence == list(range(EVENTS_PER_PROCESS))
+
+    assert bus.get_session_summary(SESSION_ID)["total_events"] == PROCESSES * EVENTS_PER_PROCESS
+
+def test_locked_append_throughput(tmp_path):
+    """Testa que append com lock fica próximo de append sem lock."""
+    payload = JsonlEventStorage._encode({"event_type": "agent_started", "agent_name": "orchestrator"})
+    total = 2000
+
+    raw_file = tmp_path / "raw.jsonl"
+    start = time.perf_counter()
+    for _ in range(total):
+        with open(raw_file, "a", encoding="utf-8") as f:
+            f.write(payload)
+    raw_elapsed = time.perf_counter() - start
+
+    storage = JsonlEventStorage(tmp_path)
+    start = time.perf_counter()
+    for _ in range(total):
+        storage._write("s1", payload)
+    locked_elapsed = time.perf_counter() - start
+
+    assert sum(1 for _ in storage.iter_events("s1")) == total
+    assert locked_elapsed < raw_elapsed * 3 + 0.05
@@ -0,0 +1,165 @@
+"""
+Testes unitários para retenção e arquivamento do EventBus.
+
+Valida seleção por idade, quantidade e tamanho, proteção de sessões
+ativas, arquivo .json.gz consultável, manifesto preservado e a tarefa
+periódica.
+"""
+
+import time
+import pytest
+
+from core.utils.event_bus import EventBus
+from core.utils.event_bus.retention import (
+    RetentionPolicy,
+    RetentionTask,
+    get_archive_path,
+    run_retention,
+    select_sessions,
+)
+
+NOW = 1_700_000_000.0
+DAY = 86400
+
+def _entry(session_id, age_days):
+    return {"session_id": session_id, "last_event_epoch": NOW - age_days * DAY}
+
+class TestSelectSessions:
+    """Testes para select_sessions."""
+
+    def test_max_age(self):
+        """Testa seleção das sessões mais antigas que max_age_days."""
+        entries = [_entry("new", 1), _entry("old", 10), _entry("older", 20)]
+        selected = select_sessions(entries, {}, RetentionPolicy(max_age_days=7), now=NOW)
+        assert selected == ["older", "old"]
+
+    def test_max_sessions_keeps_most_recent(self):
+        """Testa que max_sessions mantém as N mais recentes."""
+        entries = [_entry(f"s{n}", n + 1) for n in range(5)]
+        selected = select_sessions(entries, {}, RetentionPolicy(max_sessions=2), now=NOW)
+        assert selected == ["s4", "s3", "s2"]
+
+    def test_max_bytes(self):
+        """Testa arquivamento das mais antigas até caber no limite."""
+        entries = [_entry("a", 3), _entry("b", 2), _entry("c", 1)]
+        sizes = {"a": 100, "b": 100, "c": 100}
+        selected = select_sessions(entries, sizes, RetentionPolicy(max_bytes=150), now=NOW)
+        assert selected == ["a", "b"]
+
+    def test_recent_sessions_are_protected(self):
+        """Testa que sessões com evento recente nunca são selecionadas."""
+        entries = [{"session_id": "live", "last_event_epoch": NOW - 60}, _entry("old", 1)]
+        policy = RetentionPolicy(max_sessions=0, min_idle_minutes=10)
+        assert select_sessions(entries, {}, policy, now=NOW) == ["old"]
+
+@pytest.mark.parametrize("backend", ["jsonl", "sqlite"])
+class TestRunRetention:
+    """Testes de run_retention() sobre um EventBus real."""
+
+    @pytest.fixture
+    def event_bus(self, tmp_path, backend):
+        """Cria EventBus com três sessões."""
+        bus = EventBus(events_dir=tmp_path, backend=backend)
+        for session_id in ["s1", "s2", "s3"]:
+            bus.publish_session_started(session_id, f"Pergunta {session_id}")
+            bus.publish_agent_completed(session_id, "orchestrator", summary="ok", tokens_total=10, cost=0.01)
+        return bus
+
+    def test_archives_and_keeps_manifest(self, event_bus):
+        """Testa arquivamento: eventos saem do backend, resumo e agregados ficam."""
+        policy = RetentionPolicy(max_sessions=1, min_idle_minutes=0)
+        report = run_retention(event_bus, policy)
+
+        assert report["archived"] == 2
+        assert report["bytes_freed"] > 0
+        archived_ids = report["selected"]
+        for session_id in archived_ids:
+            assert not event_bus.storage.session_exists(session_id)
+            assert get_archive_path(event_bus.events_dir, session_id).exists()
+            assert event_bus.get_session_summary(session_id)["archived"] is True
+            assert event_bus.get_session_aggregates(session_id)["totals"]["tokens_total"] == 10
+
+            archived = event_bus.get_archived_session(session_id)
+            assert [e["event_type"] for e in archived["events"]] == ["session_started", "agent_completed"]
+            assert archived["summary"]["user_input"] == f"Pergunta {session_id}"
+
+        listed = [s["session_id"] for s in event_bus.list_session_summaries(max_age_minutes=None)]
+        assert len(listed) == 1 and listed[0] not in archived_ids
+        assert len(event_bus.list_session_summaries(max_age_minutes=None, include_archived=True)) == 3
+
+    def test_dry_run_changes_nothing(self, event_bus):
+        """Testa que dry_run apenas reporta."""
+        report = run_retention(event_bus, RetentionPolicy(max_sessions=0, min_idle_minutes=0), dry_run=True)
+
+        assert len(report["selected"]) == 3
+        assert report["archived"] == 0
+        assert len(event_bus.list_session_summaries(max_age_minutes=None)) == 3
+
+    def test_no_archive_deletes(self, event_bus):
+        """Testa archive=False: sessão e entrada do manifesto são removidas."""
+        policy = RetentionPolicy(max_sessions=0, min_idle_minutes=0, archive=False)
+        report = run_retention(event_bus, policy)
+
+        assert report["deleted"] == 3
+        assert event_bus.get_session_summary("s1") is None
+        assert not (event_bus.events_dir / "archive").exists()
+
+    def test_new_events_reactivate_session(self, event_bus):
+        """Testa que evento novo em sessão arquivada a devolve à listagem."""
+        run_retention(event_bus, RetentionPolicy(max_sessions=0, min_idle_minutes=0))
+        event_bus.publish_agent_started("s1", "orchestrator")
+
+        summary = event_bus.get_session_summary("s1")
+        assert summary["archived"] is False
+        assert summary["total_events"] == 3
+
+    def test_rearchive_keeps_previous_events(self, event_bus):
+        """Testa que arquivar de novo uma sessão reativada acumula os eventos."""
+        policy = RetentionPolicy(max_sessions=0, min_idle_minutes=0)
+        run_retention(event_bus, policy)
+        event_bus.publish_agent_started("s1", "orchestrator")
+
+        report = run_retention(event_bus, policy)
+
+        assert report["selected"] == ["s1"]
+        archived = event_bus.get_archived_session("s1")
+        assert [e["event_type"] for e in archived["events"]] == [
+            "session_started", "agent_completed", "agent_started"
+        ]
+        assert event_bus.get_session_summary("s1")["archived"] is True
+
+    def test_clear_session_removes_archive(self, event_bus):
+        """Testa que clear_session também apaga o arquivo compactado."""
+        run_retention(event_bus, RetentionPolicy(max_sessions=0, min_idle_minutes=0))
+
+        assert event_bus.clear_session("s1") is True
+        assert event_bus.get_archived_session("s1") is None
+        assert event_bus.get_session_summary("s1") is None
+
+def test_retention_task_runs_periodically(tmp_path):
+    """Testa RetentionTask em thread de background."""
+    bus = EventBus(events_dir=tmp_path)
+    bus.publish_session_started("s1", "Teste")
+
+    task = RetentionTask(bus, RetentionPolicy(max_sessions=0, min_idle_minutes=0), interval_seconds=0.05)
+    task.start()
+    deadline = time.monotonic() + 2.0
+    while task.last_report is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    task.stop()
+
+    assert task.last_report["archived"] == 1
+    assert bus.get_archived_session("s1") is not None
+
+def test_policy_from_env(monkeypatch):
+    """Testa leitura das variáveis EVENT_BUS_RETENTION_*."""
+    monkeypatch.setenv("EVENT_BUS_RETENTION_MAX_AGE_DAYS", "7")
+    monkeypatch.setenv("EVENT_BUS_RETENTION_MAX_MB", "1")
+    monkeypatch.setenv("EVENT_BUS_RETENTION_ARCHIVE", "false")
+
+    policy = RetentionPolicy.from_env()
+
+    assert policy.max_age_days == 7.0
+    assert policy.max_bytes == 1024 * 1024
+    assert policy.max_sessions is None
+    assert policy.archive is False
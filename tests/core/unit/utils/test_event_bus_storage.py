@@ -0,0 +1,567 @@
+"""
+Testes unitários para backends de armazenamento do EventBus.
+
+Valida o backend JSONL append-only, leitura em streaming, migração
+de arquivos legados (JSON) para JSONL, o backend SQLite, o manifesto de
+sessões, as consultas tipadas e a leitura incremental (read_since)
+comuns a todos os backends.
+"""
+
+import json
+import pytest
+import tempfile
+import shutil
+import threading
+import time
+from pathlib import Path
+
+from core.utils.event_bus import EventBus, SessionTail
+from core.utils.event_bus.storage import (
+    JsonlEventStorage,
+    JsonEventStorage,
+    migrate_json_to_jsonl,
+)
+from core.utils.event_bus.sqlite_storage import SqliteEventStorage
+from core.utils.event_bus.manifest import SessionManifest, MANIFEST_FILENAME
+
+class TestJsonlEventStorage:
+    """Testes para JsonlEventStorage."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Cria diretório temporário para testes."""
+        temp_path = Path(tempfile.mkdtemp())
+        yield temp_path
+        if temp_path.exists():
+            shutil.rmtree(temp_path)
+
+    @pytest.fixture
+    def storage(self, temp_dir):
+        """Cria storage JSONL em diretório temporário."""
+        return JsonlEventStorage(temp_dir)
+
+    def test_append_writes_one_line_per_event(self, storage):
+        """Testa que cada evento ocupa exatamente uma linha."""
+        storage.append("s1", {"event_type": "a", "n": 1})
+        storage.append("s1", {"event_type": "b", "n": 2})
+
+        lines = storage.get_event_file("s1").read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])["n"] == 2
+
+    def test_append_does_not_rewrite_previous_events(self, storage):
+        """Testa que append não relê/reescreve o conteúdo anterior."""
+        storage.append("s1", {"n": 1})
+        first_content = storage.get_event_file("s1").read_bytes()
+
+        storage.append("s1", {"n": 2})
+        assert storage.get_event_file("s1").read_bytes().startswith(first_content)
+
+    def test_append_many_preserves_order(self, storage):
+        """Testa append em lote."""
+        storage.append_many("s1", [{"n": i} for i in range(5)])
+        assert [e["n"] for e in storage.iter_events("s1")] == [0, 1, 2, 3, 4]
+
+    def test_iter_events_skips_corrupted_lines(self, storage):
+        """Testa que linha truncada não invalida a sessão inteira."""
+        storage.append("s1", {"n": 1})
+        with open(storage.get_event_file("s1"), "a", encoding="utf-8") as f:
+            f.write('{"n": 2, "trunc\n')
+        storage.append("s1", {"n": 3})
+
+        assert [e["n"] for e in storage.iter_events("s1")] == [1, 3]
+
+    def test_read_last_event(self, storage):
+        """Testa leitura do último evento a partir do final do arquivo."""
+        storage.append_many("s1", [{"n": i, "pad": "x" * 3000} for i in range(10)])
+        assert storage.read_last_event("s1")["n"] == 9
+
+    def test_read_last_event_ignores_incomplete_tail(self, storage):
+        """Testa que escrita interrompida no final é ignorada."""
+        storage.append("s1", {"n": 1})
+        with open(storage.get_event_file("s1"), "a", encoding="utf-8") as f:
+            f.write('{"n": 2')
+        assert storage.read_last_event("s1")["n"] == 1
+
+    def test_read_last_event_missing_session(self, storage):
+        """Testa último evento de sessão inexistente."""
+        assert storage.read_last_event("nope") is None
+
+    def test_list_and_delete_sessions(self, storage):
+        """Testa listagem e remoção de sessões."""
+        storage.append("s1", {"n": 1})
+        storage.append("s2", {"n": 1})
+
+        assert sorted(storage.list_sessions()) == ["s1", "s2"]
+        assert storage.delete_session("s1") is True
+        assert storage.delete_session("s1") is False
+        assert storage.list_sessions() == ["s2"]
+
+    def test_read_since_ignores_incomplete_line(self, storage):
+        """Testa que linha ainda em escrita fica para a próxima leitura."""
+        storage.append("s1", {"n": 1})
+        with open(storage.get_event_file("s1"), "a", encoding="utf-8") as f:
+            f.write('{"n": 2')
+
+        events, cursor = storage.read_since("s1", 0)
+        assert events == [{"n": 1}]
+
+        with open(storage.get_event_file("s1"), "a", encoding="utf-8") as f:
+            f.write('}\n')
+        events, _ = storage.read_since("s1", cursor)
+        assert events == [{"n": 2}]
+
+    def test_read_since_and_latest_seq_skip_consumed_prefix(self, storage):
+        """Testa que o prefixo já lido não é relido (cursor em bytes, contagem incremental)."""
+        storage.append_many("s1", [{"n": 1}, {"n": 2}])
+        _, cursor = storage.read_since("s1", 0)
+        assert storage.latest_seq("s1") == 2
+
+        # Corrompe o prefixo no lugar (mesmo tamanho): só uma releitura o veria
+        file_path = storage.get_event_file("s1")
+        with open(file_path, "r+b") as f:
+            f.write(b"x" * (cursor - 1))
+        storage.append("s1", {"n": 3})
+
+        assert storage.read_since("s1", cursor) == ([{"n": 3}], file_path.stat().st_size)
+        assert storage.latest_seq("s1") == 3
+
+    def test_latest_seq_recounts_after_rewrite(self, storage):
+        """Testa contagem refeita quando o arquivo é reescrito ou removido."""
+        storage.append_many("s1", [{"n": 1}, {"n": 2}, {"n": 3}])
+        assert storage.latest_seq("s1") == 3
+
+        storage.replace_events("s1", [{"n": 1}])
+        assert storage.latest_seq("s1") == 1
+
+        storage.delete_session("s1")
+        assert storage.latest_seq("s1") == 0
+
+    def test_fsync_option(self, temp_dir):
+        """Testa que fsync=True continua persistindo normalmente."""
+        storage = JsonlEventStorage(temp_dir, fsync=True)
+        storage.append("s1", {"n": 1})
+        assert storage.read_events("s1") == [{"n": 1}]
+
+class TestJsonToJsonlMigration:
+    """Testes para migração de arquivos legados."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Cria diretório temporário para testes."""
+        temp_path = Path(tempfile.mkdtemp())
+        yield temp_path
+        if temp_path.exists():
+            shutil.rmtree(temp_path)
+
+    def _write_legacy(self, temp_dir, session_id, events):
+        legacy = JsonEventStorage(temp_dir)
+        legacy.replace_events(session_id, events)
+        return legacy.get_event_file(session_id)
+
+    def test_migrate_converts_and_removes_source(self, temp_dir):
+        """Testa conversão de .json para .jsonl."""
+        source = self._write_legacy(temp_dir, "s1", [{"n": 1}, {"n": 2}])
+
+        migrated = migrate_json_to_jsonl(temp_dir)
+
+        assert migrated == {"s1": 2}
+        assert not source.exists()
+        assert JsonlEventStorage(temp_dir).read_events("s1") == [{"n": 1}, {"n": 2}]
+
+    def test_migrate_keep_source(self, temp_dir):
+        """Testa opção de manter o arquivo original (como .json.migrated)."""
+        source = self._write_legacy(temp_dir, "s1", [{"n": 1}])
+        original = source.read_text(encoding="utf-8")
+        migrate_json_to_jsonl(temp_dir, remove_source=False)
+
+        kept = source.with_name(source.name + ".migrated")
+        assert not source.exists()
+        assert kept.read_text(encoding="utf-8") == original
+
+    def test_migrate_keep_source_is_idempotent(self, temp_dir):
+        """Testa migração repetida com remove_source=False e EventBus depois: sem duplicatas."""
+        self._write_legacy(temp_dir, "s1", [
+            {"session_id": "s1", "event_type": "session_started",
+             "timestamp": "2025-01-01T00:00:00Z", "user_input": "Teste"}
+        ])
+
+        assert migrate_json_to_jsonl(temp_dir, remove_source=False) == {"s1": 1}
+        assert migrate_json_to_jsonl(temp_dir, remove_source=False) == {}
+
+        assert len(EventBus(events_dir=temp_dir).get_session_events("s1")) == 1
+
+    def test_migrate_prepends_to_existing_jsonl(self, temp_dir):
+        """Testa que eventos legados vêm antes dos já existentes em JSONL."""
+        self._write_legacy(temp_dir, "s1", [{"n": 1}])
+        JsonlEventStorage(temp_dir).append("s1", {"n": 2})
+
+        migrate_json_to_jsonl(temp_dir)
+
+        assert [e["n"] for e in JsonlEventStorage(temp_dir).iter_events("s1")] == [1, 2]
+
+    def test_migrate_skips_corrupted_file(self, temp_dir):
+        """Testa que arquivo legado ilegível é mantido e ignorado."""
+        broken = temp_dir / "events-broken.json"
+        broken.write_text("{not json", encoding="utf-8")
+
+        assert migrate_json_to_jsonl(temp_dir) == {}
+        assert broken.exists()
+
+    def test_event_bus_migrates_on_init(self, temp_dir):
+        """Testa que EventBus migra sessões legadas ao inicializar."""
+        self._write_legacy(temp_dir, "legacy", [
+            {"session_id": "legacy", "event_type": "session_started",
+             "timestamp": "2025-01-01T00:00:00Z", "user_input": "Teste"}
+        ])
+
+        bus = EventBus(events_dir=temp_dir)
+
+        assert len(bus.get_session_events("legacy")) == 1
+        assert bus.get_session_summary("legacy")["user_input"] == "Teste"
+
+    def test_event_bus_with_legacy_storage(self, temp_dir):
+        """Testa que o backend legado continua utilizável via injeção."""
+        bus = EventBus(events_dir=temp_dir, storage=JsonEventStorage(temp_dir))
+        bus.publish_session_started("s1", "Teste")
+        bus.publish_agent_started("s1", "orchestrator")
+
+        data = json.loads((temp_dir / "events-s1.json").read_text(encoding="utf-8"))
+        assert len(data["events"]) == 2
+        assert bus.get_session_summary("s1")["total_events"] == 2
+
+class TestSqliteEventStorage:
+    """Testes para SqliteEventStorage."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Cria diretório temporário para testes."""
+        temp_path = Path(tempfile.mkdtemp())
+        yield temp_path
+        if temp_path.exists():
+            shutil.rmtree(temp_path)
+
+    @pytest.fixture
+    def storage(self, temp_dir):
+        """Cria storage SQLite em diretório temporário."""
+        storage = SqliteEventStorage(temp_dir / "events.db")
+        yield storage
+        storage.close()
+
+    def test_uses_wal_journal(self, storage):
+        """Testa que o banco está em modo WAL."""
+        mode = storage.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode.lower() == "wal"
+
+    def test_creates_indexes(self, storage):
+        """Testa criação dos índices de consulta."""
+        indexes = {
+            row[0] for row in storage.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        assert "idx_events_session_type" in indexes
+        assert "idx_events_timestamp" in indexes
+
+    def test_seq_is_per_session(self, storage):
+        """Testa que seq é sequencial e independente por sessão."""
+        storage.append_many("s1", [{"event_type": "a"}, {"event_type": "b"}])
+        storage.append("s2", {"event_type": "a"})
+        storage.append("s1", {"event_type": "c"})
+
+        assert [seq for seq, _ in storage.query("s1")] == [1, 2, 3]
+        assert storage.latest_seq("s2") == 1
+
+    def test_delete_session(self, storage):
+        """Testa remoção de sessão."""
+        storage.append("s1", {"event_type": "a"})
+        assert storage.delete_session("s1") is True
+        assert storage.delete_session("s1") is False
+        assert storage.read_events("s1") == []
+        assert storage.list_sessions() == []
+
+    def test_replace_events_renumbers_seq(self, storage):
+        """Testa que replace_events substitui a sessão e recomeça o seq."""
+        storage.append_many("s1", [{"event_type": "a"}, {"event_type": "b"}])
+        storage.replace_events("s1", [{"event_type": "c"}])
+
+        assert storage.query("s1") == [(1, {"event_type": "c"})]
+
+    def test_replace_events_is_atomic(self, storage):
+        """Testa que falha no insert desfaz o delete (sessão antiga intacta)."""
+        storage.append_many("s1", [{"event_type": "a"}, {"event_type": "b"}])
+
+        with pytest.raises(TypeError):
+            storage.replace_events("s1", [{"event_type": "c", "payload": object()}])
+
+        assert [e["event_type"] for e in storage.read_events("s1")] == ["a", "b"]
+        storage.append("s1", {"event_type": "d"})
+        assert storage.latest_seq("s1") == 3
+
+    def test_persistence_across_connections(self, temp_dir):
+        """Testa que eventos persistem entre instâncias."""
+        first = SqliteEventStorage(temp_dir / "events.db")
+        first.append("s1", {"event_type": "a", "n": 1})
+        first.close()
+
+        second = SqliteEventStorage(temp_dir / "events.db")
+        assert second.read_last_event("s1")["n"] == 1
+        second.close()
+
+class TestSessionManifest:
+    """Testes para SessionManifest e sua integração com o EventBus."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Cria diretório temporário para testes."""
+        temp_path = Path(tempfile.mkdtemp())
+        yield temp_path
+        if temp_path.exists():
+            shutil.rmtree(temp_path)
+
+    @pytest.fixture
+    def manifest(self, temp_dir):
+        """Cria manifesto em diretório temporário."""
+        manifest = SessionManifest(temp_dir / MANIFEST_FILENAME)
+        yield manifest
+        manifest.close()
+
+    def _event(self, event_type, timestamp, **extra):
+        return {"event_type": event_type, "timestamp": timestamp, **extra}
+
+    def test_record_events_is_incremental(self, manifest):
+        """Testa que contagem acumula e campos iniciais são preservados."""
+        manifest.record_events("s1", [
+            self._event("session_started", "2025-01-01T00:00:00Z", user_input="Ideia")
+        ])
+        manifest.record_events("s1", [
+            self._event("agent_started", "2025-01-01T00:00:05Z"),
+            self._event("agent_completed", "2025-01-01T00:00:09Z")
+        ])
+
+        entry = manifest.get("s1")
+        assert entry["event_count"] == 3
+        assert entry["user_input"] == "Ideia"
+        assert entry["first_timestamp"] == "2025-01-01T00:00:00Z"
+        assert entry["last_timestamp"] == "2025-01-01T00:00:09Z"
+        assert entry["last_event_type"] == "agent_completed"
+        assert entry["status"] == "active"
+
+    def test_session_completed_sets_status(self, manifest):
+        """Testa status e final_status após session_completed."""
+        manifest.record_events("s1", [
+            self._event("session_started", "2025-01-01T00:00:00Z"),
+            self._event("session_completed", "2025-01-01T00:01:00Z", final_status="approved")
+        ])
+        entry = manifest.get("s1")
+        assert entry["status"] == "completed"
+        assert entry["final_status"] == "approved"
+
+    def test_list_sessions_orders_and_filters_by_age(self, manifest):
+        """Testa ordenação pelo último evento e filtro de idade."""
+        manifest.record_events("old", [self._event("session_started", "2020-01-01T00:00:00Z")])
+        manifest.record_events("a", [self._event("session_started", "2099-01-01T00:00:00Z")])
+        manifest.record_events("b", [self._event("session_started", "2099-01-02T00:00:00Z")])
+
+        assert [e["session_id"] for e in manifest.list_sessions()] == ["b", "a", "old"]
+        assert [e["session_id"] for e in manifest.list_sessions(max_age_minutes=60)] == ["b", "a"]
+
+    def test_list_sessions_filters_by_status(self, manifest):
+        """Testa filtro por status."""
+        manifest.record_events("s1", [self._event("session_started", "2099-01-01T00:00:00Z")])
+        manifest.record_events("s2", [self._event("session_completed", "2099-01-01T00:00:00Z")])
+
+        assert [e["session_id"] for e in manifest.list_sessions(status="completed")] == ["s2"]
+
+    def test_rebuild_from_storage(self, temp_dir, manifest):
+        """Testa reconstrução do manifesto a partir de arquivos existentes."""
+        storage = JsonlEventStorage(temp_dir)
+        storage.append_many("s1", [
+            self._event("session_started", "2025-01-01T00:00:00Z", user_input="Teste"),
+            self._event("agent_started", "2025-01-01T00:00:01Z"),
+            self._event("agent_completed", "2025-01-01T00:00:02Z")
+        ])
+
+        assert manifest.rebuild(storage) == 1
+        entry = manifest.get("s1")
+        assert entry["event_count"] == 3
+        assert entry["user_input"] == "Teste"
+        assert entry["last_event_type"] == "agent_completed"
+
+    def test_event_bus_rebuilds_missing_manifest(self, temp_dir):
+        """Testa que EventBus indexa sessões existentes ao criar o manifesto."""
+        JsonlEventStorage(temp_dir).append(
+            "s1", self._event("session_started", "2025-01-01T00:00:00Z", user_input="Teste")
+        )
+
+        bus = EventBus(events_dir=temp_dir)
+
+        assert bus.manifest.get("s1")["event_count"] == 1
+
+    def test_summary_does_not_read_events(self, temp_dir, monkeypatch):
+        """Testa que get_session_summary e list_active_sessions usam só o manifesto."""
+        bus = EventBus(events_dir=temp_dir)
+        bus.publish_session_started("s1", "Teste")
+        bus.publish_agent_started("s1", "orchestrator")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("eventos não deveriam ser lidos")
+
+        monkeypatch.setattr(bus.storage, "iter_events", fail)
+        monkeypatch.setattr(bus.storage, "read_last_event", fail)
+
+        summary = bus.get_session_summary("s1")
+        assert summary["total_events"] == 2
+        assert summary["user_input"] == "Teste"
+        assert bus.list_active_sessions() == ["s1"]
+        assert bus.list_session_summaries()[0]["last_event_type"] == "agent_started"
+
+    def test_clear_session_removes_entry(self, temp_dir):
+        """Testa que clear_session remove a sessão do manifesto."""
+        bus = EventBus(events_dir=temp_dir)
+        bus.publish_session_started("s1", "Teste")
+
+        assert bus.clear_session("s1") is True
+        assert bus.manifest.get("s1") is None
+        assert bus.list_active_sessions() == []
+
+@pytest.mark.parametrize("backend", ["jsonl", "sqlite", "json"])
+class TestEventBusTypedQueries:
+    """Testes das consultas tipadas, comuns a todos os backends."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Cria diretório temporário para testes."""
+        temp_path = Path(tempfile.mkdtemp())
+        yield temp_path
+        if temp_path.exists():
+            shutil.rmtree(temp_path)
+
+    @pytest.fixture
+    def event_bus(self, temp_dir, backend):
+        """Cria EventBus com o backend parametrizado e uma sessão de exemplo."""
+        bus = EventBus(events_dir=temp_dir, backend=backend)
+        bus.publish_session_started("s1", "Teste")
+        for agent in ["orchestrator", "structurer", "orchestrator"]:
+            bus.publish_agent_started("s1", agent)
+            bus.publish_agent_completed("s1", agent, summary=f"{agent} ok", tokens_total=10)
+        return bus
+
+    def test_get_last_events(self, event_bus):
+        """Testa últimos N eventos de um tipo, em ordem cronológica."""
+        last_two = event_bus.get_last_events("s1", "agent_completed", limit=2)
+        assert [e["agent_name"] for e in last_two] == ["structurer", "orchestrator"]
+
+    def test_get_last_events_by_agent(self, event_bus):
+        """Testa filtro por agente."""
+        events = event_bus.get_last_events("s1", "agent_completed", limit=5, agent_name="orchestrator")
+        assert len(events) == 2
+        assert all(e["agent_name"] == "orchestrator" for e in events)
+
+    def test_get_events_by_type(self, event_bus):
+        """Testa seleção de múltiplos tipos."""
+        events = event_bus.get_events_by_type("s1", ["session_started", "agent_completed"])
+        assert [e["event_type"] for e in events] == [
+            "session_started", "agent_completed", "agent_completed", "agent_completed"
+        ]
+
+    def test_get_events_since(self, event_bus):
+        """Testa eventos publicados após um seq conhecido."""
+        seq = event_bus.get_latest_seq("s1")
+        assert seq == 7
+
+        event_bus.publish_agent_error("s1", "methodologist", error_message="boom")
+        event_bus.publish_agent_started("s1", "orchestrator")
+
+        new_events = event_bus.get_events_since("s1", seq)
+        assert [e["event_type"] for e in new_events] == ["agent_error", "agent_started"]
+        assert len(event_bus.get_events_since("s1", seq, event_types=["agent_error"])) == 1
+
+    def test_queries_on_missing_session(self, event_bus):
+        """Testa consultas em sessão inexistente."""
+        assert event_bus.get_last_events("nope", "agent_completed") == []
+        assert event_bus.get_events_since("nope", 0) == []
+        assert event_bus.get_latest_seq("nope") == 0
+
+    def test_readers_work_with_backend(self, event_bus):
+        """Testa leitores existentes sobre o backend."""
+        summary = event_bus.get_session_summary("s1")
+        assert summary["total_events"] == 7
+        assert summary["user_input"] == "Teste"
+        assert event_bus.list_active_sessions() == ["s1"]
+        assert event_bus.clear_session("s1") is True
+        assert event_bus.get_session_events("s1") == []
+
+@pytest.mark.parametrize("backend", ["jsonl", "sqlite", "json"])
+class TestEventBusReadSince:
+    """Testes de read_since/wait_for_events, comuns a todos os backends."""
+
+    @pytest.fixture
+    def event_bus(self, tmp_path, backend):
+        """Cria EventBus com o backend parametrizado."""
+        bus = EventBus(events_dir=tmp_path, backend=backend)
+        bus.publish_session_started("s1", "Teste")
+        bus.publish_agent_started("s1", "orchestrator")
+        return bus
+
+    def test_read_since_returns_only_new_events(self, event_bus):
+        """Testa leitura incremental com cursor."""
+        events, cursor = event_bus.read_since("s1")
+        assert [e["event_type"] for e in events] == ["session_started", "agent_started"]
+
+        assert event_bus.read_since("s1", cursor) == ([], cursor)
+
+        event_bus.publish_agent_completed("s1", "orchestrator", summary="ok")
+        events, new_cursor = event_bus.read_since("s1", cursor)
+        assert [e["event_type"] for e in events] == ["agent_completed"]
+        assert new_cursor > cursor
+
+    def test_read_since_missing_session(self, event_bus):
+        """Testa sessão inexistente."""
+        assert event_bus.read_since("nope") == ([], 0)
+
+    def test_read_since_restarts_after_clear(self, event_bus):
+        """Testa que cursor além do fim recomeça do início."""
+        _, cursor = event_bus.read_since("s1")
+        event_bus.clear_session("s1")
+        event_bus.publish_session_started("s1", "Nova")
+
+        events, _ = event_bus.read_since("s1", cursor)
+        assert [e["event_type"] for e in events] == ["session_started"]
+
+    def test_wait_for_events_wakes_on_publish(self, event_bus):
+        """Testa que publicação no mesmo processo acorda o leitor."""
+        _, cursor = event_bus.read_since("s1")
+
+        publisher = threading.Timer(
+            0.1, event_bus.publish_agent_completed, args=("s1", "orchestrator", "ok")
+        )
+        publisher.start()
+        start = time.monotonic()
+        events, _ = event_bus.wait_for_events("s1", cursor, timeout=5.0, poll_interval=10.0)
+        publisher.join()
+
+        assert [e["event_type"] for e in events] == ["agent_completed"]
+        assert time.monotonic() - start < 2.0
+
+    def test_wait_for_events_timeout(self, event_bus):
+        """Testa timeout sem eventos novos."""
+        _, cursor = event_bus.read_since("s1")
+        assert event_bus.wait_for_events("s1", cursor, timeout=0.1) == ([], cursor)
+
+    def test_session_tail_accumulates_and_filters(self, event_bus):
+        """Testa SessionTail com filtro de tipo e reset após limpeza."""
+        tail = SessionTail("s1", event_types=["agent_started"])
+        assert len(tail.refresh(event_bus)) == 1
+
+        event_bus.publish_agent_started("s1", "structurer")
+        assert [e["agent_name"] for e in tail.refresh(event_bus)] == ["orchestrator", "structurer"]
+
+        event_bus.clear_session("s1")
+        event_bus.publish_session_started("s1", "Nova")
+        assert tail.refresh(event_bus) == []
+
+def test_unknown_backend_raises(tmp_path):
+    """Testa erro claro para backend desconhecido."""
+    with pytest.raises(ValueError, match="Backend de eventos desconhecido"):
+        EventBus(events_dir=tmp_path, backend="redis")
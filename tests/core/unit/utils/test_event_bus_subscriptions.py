@@ -0,0 +1,135 @@
+"""
+Testes unitários para assinaturas push do EventBus.
+
+Valida entrega a callbacks e filas (asyncio e queue.Queue) no momento da
+publicação, filtros por sessão/tipo, isolamento de erros e cancelamento.
+"""
+
+import asyncio
+import queue
+import threading
+import pytest
+
+from core.utils.event_bus import EventBus
+
+class TestEventBusSubscriptions:
+    """Testes para EventBus.subscribe()."""
+
+    @pytest.fixture
+    def event_bus(self, tmp_path):
+        """Cria EventBus em diretório temporário."""
+        return EventBus(events_dir=tmp_path)
+
+    def test_callback_receives_events_at_publish_time(self, event_bus):
+        """Testa entrega síncrona ao callback."""
+        received = []
+        event_bus.subscribe("s1", callback=received.append)
+
+        event_bus.publish_agent_started("s1", "orchestrator")
+
+        assert [e["event_type"] for e in received] == ["agent_started"]
+        assert received[0]["agent_name"] == "orchestrator"
+
+    def test_filters_by_session_and_type(self, event_bus):
+        """Testa filtro por sessão e tipo de evento."""
+        received = []
+        event_bus.subscribe("s1", event_types=["agent_completed"], callback=received.append)
+
+        event_bus.publish_agent_started("s1", "orchestrator")
+        event_bus.publish_agent_completed("s2", "orchestrator", summary="outra sessão")
+        event_bus.publish_agent_completed("s1", "orchestrator", summary="ok")
+
+        assert [e["summary"] for e in received] == ["ok"]
+
+    def test_wildcard_receives_all_sessions(self, event_bus):
+        """Testa assinatura "*"."""
+        received = []
+        event_bus.subscribe("*", callback=received.append)
+
+        event_bus.publish_session_started("s1", "A")
+        event_bus.publish_session_started("s2", "B")
+
+        assert [e["session_id"] for e in received] == ["s1", "s2"]
+
+    def test_unsubscribe_stops_delivery(self, event_bus):
+        """Testa cancelamento da assinatura."""
+        received = []
+        subscription = event_bus.subscribe("s1", callback=received.append)
+        event_bus.publish_agent_started("s1", "orchestrator")
+
+        subscription.unsubscribe()
+        event_bus.publish_agent_started("s1", "structurer")
+
+        assert len(received) == 1
+        assert event_bus.unsubscribe(subscription) is False
+
+    def test_callback_error_is_isolated(self, event_bus):
+        """Testa que erro em um callback não afeta persistência nem outros."""
+        received = []
+
+        def broken(event):
+            raise RuntimeError("boom")
+
+        event_bus.subscribe("s1", callback=broken)
+        event_bus.subscribe("s1", callback=received.append)
+
+        event_bus.publish_agent_started("s1", "orchestrator")
+
+        assert len(received) == 1
+        assert len(event_bus.get_session_events("s1")) == 1
+
+    def test_callback_can_unsubscribe_during_dispatch(self, event_bus):
+        """Testa cancelamento de dentro do callback."""
+        received = []
+
+        def once(event):
+            received.append(event)
+            subscription.unsubscribe()
+
+        subscription = event_bus.subscribe("s1", callback=once)
+        event_bus.publish_agent_started("s1", "orchestrator")
+        event_bus.publish_agent_started("s1", "structurer")
+
+        assert len(received) == 1
+
+    def test_asyncio_queue_receives_events_from_other_thread(self, event_bus):
+        """Testa entrega a asyncio.Queue quando o publisher está em outra thread."""
+
+        async def consume():
+            events = asyncio.Queue()
+            event_bus.subscribe("s1", event_types=["agent_started"], queue=events)
+
+            publisher = threading.Thread(
+                target=event_bus.publish_agent_started, args=("s1", "orchestrator")
+            )
+            publisher.start()
+            event = await asyncio.wait_for(events.get(), timeout=2.0)
+            publisher.join()
+            return event
+
+        event = asyncio.run(consume())
+        assert event["agent_name"] == "orchestrator"
+
+    def test_full_queue_drops_event(self, event_bus):
+        """Testa que fila cheia descarta o evento sem bloquear o publisher."""
+        events = queue.Queue(maxsize=1)
+        subscription = event_bus.subscribe("s1", queue=events)
+
+        event_bus.publish_agent_started("s1", "orchestrator")
+        event_bus.publish_agent_started("s1", "structurer")
+
+        assert subscription.delivered == 1
+        assert subscription.dropped == 1
+        assert len(event_bus.get_session_events("s1")) == 2
+
+    def test_requires_exactly_one_target(self, event_bus):
+        """Testa validação de callback/queue."""
+        with pytest.raises(ValueError):
+            event_bus.subscribe("s1")
+        with pytest.raises(ValueError):
+            event_bus.subscribe("s1", callback=print, queue=queue.Queue())
+
+    def test_asyncio_queue_outside_loop_requires_loop(self, event_bus):
+        """Testa erro claro para asyncio.Queue sem loop."""
+        with pytest.raises(ValueError, match="loop"):
+            event_bus.subscribe("s1", queue=asyncio.Queue())
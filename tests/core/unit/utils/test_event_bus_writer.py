@@ -0,0 +1,178 @@
+"""
+Testes unitários para o escritor em background do EventBus.
+
+Valida agrupamento por sessão, política de flush (tamanho, tempo,
+explícito, encerramento), backpressure com contadores e o modo
+async_writes do EventBus.
+"""
+
+import threading
+import time
+import pytest
+
+from core.utils.event_bus import EventBus
+from core.utils.event_bus.writer import BatchedEventWriter
+
+class RecordingSink:
+    """Sink que registra lotes recebidos (opcionalmente bloqueando)."""
+
+    def __init__(self):
+        self.batches = []
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def __call__(self, session_id, events):
+        self.gate.wait(5.0)
+        self.batches.append((session_id, [e["n"] for e in events]))
+
+class TestBatchedEventWriter:
+    """Testes para BatchedEventWriter."""
+
+    @pytest.fixture
+    def sink(self):
+        """Sink de teste."""
+        return RecordingSink()
+
+    def test_coalesces_per_session(self, sink):
+        """Testa que eventos pendentes viram um lote por sessão, em ordem."""
+        writer = BatchedEventWriter(sink, flush_interval=10.0)
+        for n in range(3):
+            writer.submit("s1", {"n": n})
+        writer.submit("s2", {"n": 9})
+
+        assert writer.flush() is True
+        assert sorted(sink.batches) == [("s1", [0, 1, 2]), ("s2", [9])]
+        writer.close()
+
+    def test_flush_on_batch_size(self, sink):
+        """Testa flush ao atingir max_batch_size sem esperar o intervalo."""
+        writer = BatchedEventWriter(sink, max_batch_size=2, flush_interval=10.0)
+        writer.submit("s1", {"n": 1})
+        writer.submit("s1", {"n": 2})
+
+        deadline = time.monotonic() + 2.0
+        while not sink.batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert sink.batches == [("s1", [1, 2])]
+        writer.close()
+
+    def test_flush_on_interval(self, sink):
+        """Testa flush por tempo."""
+        writer = BatchedEventWriter(sink, flush_interval=0.05)
+        writer.submit("s1", {"n": 1})
+
+        deadline = time.monotonic() + 2.0
+        while not sink.batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert sink.batches == [("s1", [1])]
+        writer.close()
+
+    def test_close_writes_pending_events(self, sink):
+        """Testa que close() grava o que está pendente."""
+        writer = BatchedEventWriter(sink, flush_interval=10.0)
+        writer.submit("s1", {"n": 1})
+        writer.close()
+
+        assert sink.batches == [("s1", [1])]
+        assert writer.submit("s1", {"n": 2}) is False
+
+    def test_full_queue_drops_and_counts(self, sink):
+        """Testa backpressure: fila cheia descarta e contabiliza."""
+        sink.gate.clear()
+        writer = BatchedEventWriter(sink, max_queue_size=2, max_batch_size=1, flush_interval=10.0)
+
+        # Primeiro evento é retirado da fila e fica bloqueado no sink
+        writer.submit("s1", {"n": 0})
+        deadline = time.monotonic() + 2.0
+        while writer.get_stats()["queue_depth"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        results = [writer.submit("s1", {"n": n}) for n in range(1, 5)]
+        stats = writer.get_stats()
+
+        assert results == [True, True, False, False]
+        assert stats["dropped"] == 2
+        assert stats["queue_depth"] == 2
+        assert stats["max_queue_depth"] == 2
+
+        sink.gate.set()
+        writer.close()
+        assert writer.get_stats()["written"] == 3
+
+    def test_sink_error_is_counted(self):
+        """Testa que falha de gravação não derruba a thread."""
+        def broken(session_id, events):
+            raise IOError("disco cheio")
+
+        writer = BatchedEventWriter(broken, flush_interval=10.0)
+        writer.submit("s1", {"n": 1})
+        assert writer.flush() is True
+
+        stats = writer.get_stats()
+        assert stats["write_errors"] == 1
+        assert stats["pending"] == 0
+        writer.close()
+
+class TestEventBusAsyncWrites:
+    """Testes do EventBus com async_writes=True."""
+
+    @pytest.fixture
+    def event_bus(self, tmp_path):
+        """Cria EventBus com escritor em background."""
+        bus = EventBus(events_dir=tmp_path, async_writes=True, writer_options={"flush_interval": 10.0})
+        yield bus
+        bus.close()
+
+    def test_reads_see_queued_events(self, event_bus):
+        """Testa que leitores no mesmo processo veem eventos ainda na fila."""
+        event_bus.publish_session_started("s1", "Teste")
+        event_bus.publish_agent_started("s1", "orchestrator")
+
+        assert len(event_bus.get_session_events("s1")) == 2
+        assert event_bus.get_session_summary("s1")["total_events"] == 2
+        assert event_bus.get_last_events("s1", "agent_started")[0]["agent_name"] == "orchestrator"
+
+    def test_events_written_in_one_batch(self, event_bus):
+        """Testa que eventos publicados em sequência são gravados juntos."""
+        for agent in ["orchestrator", "structurer", "methodologist"]:
+            event_bus.publish_agent_started("s1", agent)
+        event_bus.flush()
+
+        stats = event_bus.get_writer_stats()
+        assert stats["written"] == 3
+        assert stats["batches"] == 1
+        assert stats["dropped"] == 0
+
+    def test_subscriptions_receive_at_publish_time(self, event_bus):
+        """Testa entrega às assinaturas no modo assíncrono antes da gravação do lote."""
+        received = []
+        event_bus.subscribe("s1", callback=received.append)
+        event_bus.publish_agent_started("s1", "orchestrator")
+
+        assert [e["event_type"] for e in received] == ["agent_started"]
+        event_bus.flush()
+        assert len(received) == 1
+
+    def test_callback_reading_bus_does_not_block(self, event_bus):
+        """Testa callback que lê o barramento: entrega na thread do publisher, sem esperar timeout."""
+        seen = []
+
+        def on_started(event):
+            seen.append((threading.current_thread().name, len(event_bus.get_session_events("s1"))))
+
+        event_bus.subscribe("s1", event_types=["agent_started"], callback=on_started)
+        start = time.monotonic()
+        event_bus.publish_agent_started("s1", "orchestrator")
+        assert event_bus.flush() is True
+
+        assert time.monotonic() - start < 1.0
+        assert seen == [(threading.current_thread().name, 1)]
+        assert event_bus._writer.flush(timeout=0.1) is True
+
+    def test_sync_mode_has_no_writer_stats(self, tmp_path):
+        """Testa que o modo padrão continua síncrono."""
+        bus = EventBus(events_dir=tmp_path)
+        assert bus.get_writer_stats() is None
+        assert bus.flush() is True